@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Boundary Validation Throughput Benchmark
+
+Measures validations/sec for L1 file-system events against the default
+l1_file_system_input schema:
+    - jsonschema.validate: the previous per-call path (metaschema check and a
+                           new validator on every call)
+    - validate_l1_input:   compiled, cached validator with the fast check
+    - validate_l1_many:    batch API, --batch events per call
+
+--invalid-ratio mixes in events that fail validation, which take the
+jsonschema error path in every scenario.
+
+Usage:
+    python test-environment/benchmarks/bench_boundary_validation.py [--events 20000] [--batch 100] [--invalid-ratio 0.0] [--json]
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+import uuid
+from pathlib import Path
+
+import jsonschema
+import structlog
+
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from tools.scribe.core.boundary_validator import create_boundary_validator
+
+
+def make_events(count, invalid_ratio):
+    invalid_every = int(1 / invalid_ratio) if invalid_ratio > 0 else 0
+    events = []
+    for i in range(count):
+        event = {
+            "event_id": str(uuid.uuid4()),
+            "type": "modified",
+            "file_path": f"/kb/standards/doc-{i}.md",
+            "timestamp": time.time(),
+        }
+        if invalid_every and i % invalid_every == 0:
+            event["type"] = "touched"
+        events.append(event)
+    return events
+
+
+def summarize(label, events, elapsed, valid):
+    return {
+        "name": label,
+        "validations_per_second": round(len(events) / elapsed),
+        "us_per_validation": round(elapsed / len(events) * 1e6, 3),
+        "valid": valid,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark boundary validation throughput.")
+    parser.add_argument("--events", type=int, default=20000, help="Events per scenario.")
+    parser.add_argument("--batch", type=int, default=100, help="Events per validate_l1_many call.")
+    parser.add_argument("--invalid-ratio", type=float, default=0.0, help="Fraction of events that fail validation.")
+    parser.add_argument("--json", action="store_true", help="Emit JSON instead of a table.")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.CRITICAL))
+
+    events = make_events(args.events, args.invalid_ratio)
+    validator = create_boundary_validator()
+    schema = validator.schemas["l1_file_system_input"]
+    results = []
+
+    start = time.perf_counter()
+    valid = 0
+    for event in events:
+        try:
+            jsonschema.validate(event, schema)
+            valid += 1
+        except jsonschema.ValidationError:
+            pass
+    results.append(summarize("jsonschema.validate", events, time.perf_counter() - start, valid))
+
+    start = time.perf_counter()
+    valid = sum(validator.validate_l1_input(event, "file_system").valid for event in events)
+    results.append(summarize("validate_l1_input", events, time.perf_counter() - start, valid))
+
+    start = time.perf_counter()
+    valid = 0
+    for offset in range(0, len(events), args.batch):
+        valid += sum(r.valid for r in validator.validate_l1_many(events[offset:offset + args.batch], "file_system"))
+    results.append(summarize(f"validate_l1_many(x{args.batch})", events, time.perf_counter() - start, valid))
+
+    if args.json:
+        print(json.dumps({"events": args.events, "invalid_ratio": args.invalid_ratio, "results": results}, indent=2))
+        return
+
+    print(f"{args.events} events, {args.invalid_ratio:.0%} invalid")
+    print(f"{'scenario':<24} {'validations/s':>14} {'us/validation':>14} {'valid':>7}")
+    for row in results:
+        print(f"{row['name']:<24} {row['validations_per_second']:>14} {row['us_per_validation']:>14} {row['valid']:>7}")
+
+
+if __name__ == "__main__":
+    main()
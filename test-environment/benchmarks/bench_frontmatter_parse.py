@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Frontmatter Parse Throughput Benchmark
+
+Measures how fast the repository's Markdown corpus can be split and parsed
+with the shared frontmatter library, compared against the previous per-tool
+approach (line splitting plus pure-Python yaml.safe_load).
+
+Usage:
+    python test-environment/benchmarks/bench_frontmatter_parse.py [--root .] [--rounds 5] [--json]
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import yaml
+
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from tools.scribe.utils.frontmatter_parser import (
+    YAML_SAFE_LOADER,
+    clear_frontmatter_cache,
+    frontmatter_cache_info,
+    split_frontmatter,
+)
+
+
+def load_corpus(root: Path):
+    documents = []
+    for path in sorted(root.rglob("*.md")):
+        if ".git" in path.parts:
+            continue
+        try:
+            documents.append(path.read_text(encoding="utf-8"))
+        except (OSError, UnicodeDecodeError):
+            continue
+    return documents
+
+
+def legacy_parse(content: str):
+    """Reference implementation mirroring the pre-consolidation tools."""
+    lines = content.splitlines(True)
+    if not lines or not lines[0].startswith("---"):
+        return None
+    for i, line in enumerate(lines[1:], start=1):
+        if line.startswith("---"):
+            try:
+                return yaml.safe_load("".join(lines[1:i]))
+            except yaml.YAMLError:
+                return None
+    return None
+
+
+def shared_parse(content: str):
+    try:
+        return split_frontmatter(content).parse(copy_result=False)
+    except yaml.YAMLError:
+        return None
+
+
+def run(label, parse, documents, rounds, before_round=None):
+    timings = []
+    for _ in range(rounds):
+        if before_round:
+            before_round()
+        start = time.perf_counter()
+        for content in documents:
+            parse(content)
+        timings.append(time.perf_counter() - start)
+    best = min(timings)
+    return {
+        "name": label,
+        "best_seconds": round(best, 4),
+        "docs_per_second": round(len(documents) / best, 1) if best else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark frontmatter parse throughput.")
+    parser.add_argument("--root", default=str(project_root), help="Directory to collect *.md files from.")
+    parser.add_argument("--rounds", type=int, default=5, help="Rounds per scenario; the best round is reported.")
+    parser.add_argument("--json", action="store_true", help="Emit JSON instead of a table.")
+    args = parser.parse_args()
+
+    documents = load_corpus(Path(args.root))
+    results = {
+        "documents": len(documents),
+        "yaml_loader": YAML_SAFE_LOADER.__name__,
+        "scenarios": [
+            run("legacy (splitlines + SafeLoader)", legacy_parse, documents, args.rounds),
+            run("shared, cold cache", shared_parse, documents, args.rounds, before_round=clear_frontmatter_cache),
+        ],
+    }
+    clear_frontmatter_cache()
+    for content in documents:
+        shared_parse(content)
+    results["scenarios"].append(run("shared, warm cache", shared_parse, documents, args.rounds))
+    results["cache"] = frontmatter_cache_info()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"Corpus: {results['documents']} documents, loader: {results['yaml_loader']}")
+    for scenario in results["scenarios"]:
+        print(f"  {scenario['name']:<34} {scenario['best_seconds']:>8.4f}s  {scenario['docs_per_second']:>10} docs/s")
+
+
+if __name__ == "__main__":
+    main()
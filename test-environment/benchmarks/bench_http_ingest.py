@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+HTTP Batch Ingest Load Test
+
+Serves tools/scribe/adapters/http_app.py with uvicorn on a local port and
+drives POST /ingest/events from concurrent httpx clients. Each scenario
+reports requests/sec, events/sec and request latency percentiles:
+    - single:     one event per request (JSON array of one)
+    - json-array: --batch events per request as a JSON array
+    - ndjson:     --batch events per request as NDJSON
+
+--invalid-ratio mixes in events that fail L1 validation and are rejected
+per item.
+
+Usage:
+    python test-environment/benchmarks/bench_http_ingest.py [--events 20000] [--batch 100] [--concurrency 16] [--invalid-ratio 0.0] [--json]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import sys
+import threading
+import time
+import uuid
+from pathlib import Path
+
+import httpx
+import structlog
+import uvicorn
+
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from tools.scribe.adapters.http_app import app
+from tools.scribe.adapters.http_validation import INGEST_ROUTE
+
+
+class EventCounter:
+    def __init__(self):
+        self.accepted = 0
+
+    def __call__(self, events):
+        self.accepted += len(events)
+
+
+def make_events(count, invalid_ratio):
+    invalid_every = int(1 / invalid_ratio) if invalid_ratio > 0 else 0
+    events = []
+    for i in range(count):
+        event = {
+            "event_id": str(uuid.uuid4()),
+            "type": "modified",
+            "file_path": f"/kb/standards/doc-{i}.md",
+            "timestamp": time.time(),
+        }
+        if invalid_every and i % invalid_every == 0:
+            event["type"] = "touched"
+        events.append(event)
+    return events
+
+
+def encode_requests(events, batch, body_format):
+    bodies = []
+    for offset in range(0, len(events), batch):
+        chunk = events[offset:offset + batch]
+        if body_format == "ndjson":
+            bodies.append(("\n".join(json.dumps(e) for e in chunk).encode(), "application/x-ndjson", len(chunk)))
+        else:
+            bodies.append((json.dumps(chunk).encode(), "application/json", len(chunk)))
+    return bodies
+
+
+def start_server():
+    config = uvicorn.Config(app, host="127.0.0.1", port=0, log_level="critical", access_log=False)
+    server = uvicorn.Server(config)
+    thread = threading.Thread(target=server.run, name="bench-uvicorn", daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    port = server.servers[0].sockets[0].getsockname()[1]
+    return server, thread, f"http://127.0.0.1:{port}"
+
+
+async def run_scenario(base_url, bodies, concurrency):
+    latencies = []
+    queue = list(reversed(bodies))
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=60.0,
+                                 limits=httpx.Limits(max_connections=concurrency)) as client:
+        async def worker():
+            while queue:
+                content, content_type, _ = queue.pop()
+                start = time.perf_counter()
+                response = await client.post(INGEST_ROUTE, content=content, headers={"content-type": content_type})
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return time.perf_counter() - start, latencies
+
+
+def summarize(name, bodies, elapsed, latencies, accepted):
+    events = sum(count for _, _, count in bodies)
+    ordered = sorted(latencies)
+    return {
+        "name": name,
+        "requests": len(bodies),
+        "events": events,
+        "accepted": accepted,
+        "requests_per_second": round(len(bodies) / elapsed),
+        "events_per_second": round(events / elapsed),
+        "p50_ms": round(statistics.median(ordered) * 1000, 3),
+        "p99_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000, 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the HTTP batch ingest route.")
+    parser.add_argument("--events", type=int, default=20000, help="Events per batched scenario.")
+    parser.add_argument("--single-events", type=int, default=2000, help="Events (= requests) for the single scenario.")
+    parser.add_argument("--batch", type=int, default=100, help="Events per batched request.")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent client requests.")
+    parser.add_argument("--invalid-ratio", type=float, default=0.0, help="Fraction of events that fail validation.")
+    parser.add_argument("--json", action="store_true", help="Emit JSON instead of a table.")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.CRITICAL))
+
+    counter = EventCounter()
+    app.state.event_sink = counter
+    server, thread, base_url = start_server()
+    results = []
+    try:
+        scenarios = [
+            ("single", encode_requests(make_events(args.single_events, args.invalid_ratio), 1, "json-array")),
+            (f"json-array(x{args.batch})", encode_requests(make_events(args.events, args.invalid_ratio), args.batch, "json-array")),
+            (f"ndjson(x{args.batch})", encode_requests(make_events(args.events, args.invalid_ratio), args.batch, "ndjson")),
+        ]
+        for name, bodies in scenarios:
+            counter.accepted = 0
+            elapsed, latencies = asyncio.run(run_scenario(base_url, bodies, args.concurrency))
+            results.append(summarize(name, bodies, elapsed, latencies, counter.accepted))
+    finally:
+        server.should_exit = True
+        thread.join(10)
+
+    if args.json:
+        print(json.dumps({"concurrency": args.concurrency, "invalid_ratio": args.invalid_ratio,
+                          "results": results}, indent=2))
+        return
+
+    print(f"concurrency {args.concurrency}, {args.invalid_ratio:.0%} invalid")
+    print(f"{'scenario':<18} {'requests':>9} {'req/s':>8} {'events/s':>10} {'p50 ms':>8} {'p99 ms':>8} {'accepted':>9}")
+    for row in results:
+        print(f"{row['name']:<18} {row['requests']:>9} {row['requests_per_second']:>8} {row['events_per_second']:>10} "
+              f"{row['p50_ms']:>8} {row['p99_ms']:>8} {row['accepted']:>9}")
+
+
+if __name__ == "__main__":
+    main()
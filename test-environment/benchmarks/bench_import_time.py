@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Import-Time Audit
+
+Imports each Scribe entry point in a fresh interpreter with ``-X importtime``
+and reports, per entry point, the median cumulative import time and the
+modules with the highest cumulative and self cost. Each entry point is
+checked against import_budget.json:
+
+    - budget_ms: ceiling on the entry point's median cumulative import time
+    - deferred:  modules (or packages) the entry point must not import
+
+Exits non-zero when any budget is exceeded or a deferred module is loaded,
+so it can run as a CI gate.
+
+Usage:
+    python test-environment/benchmarks/bench_import_time.py [--runs 5] [--top 15] [--module tools.scribe.main] [--json]
+"""
+
+import argparse
+import json
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent.parent
+DEFAULT_BUDGET = Path(__file__).resolve().parent / "import_budget.json"
+
+# import time:     self [us] | cumulative | imported package
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def profile_import(module):
+    """One fresh interpreter: {module: (self_us, cumulative_us, depth)} in import order."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}" if module else "pass"],
+        cwd=project_root, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+    timings = {}
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            timings[name] = (int(self_us), int(cumulative_us), len(indent) // 2)
+    return timings
+
+
+def is_loaded(timings, package):
+    return any(name == package or name.startswith(package + ".") for name in timings)
+
+
+def audit(module, spec, runs, top, startup):
+    samples = [profile_import(module) for _ in range(runs)]
+
+    def median_us(name, field):
+        return statistics.median(s[name][field] for s in samples if name in s)
+
+    names = set().union(*samples)
+    # Modules below the entry point, excluding interpreter startup (site, encodings)
+    own = [n for n in names if n != module and n not in startup]
+    by_cumulative = sorted(own, key=lambda n: median_us(n, 1), reverse=True)[:top]
+    by_self = sorted(own, key=lambda n: median_us(n, 0), reverse=True)[:top]
+    total_ms = median_us(module, 1) / 1000 if module in names else 0.0
+
+    budget_ms = spec.get("budget_ms")
+    deferred_loaded = [p for p in spec.get("deferred", []) if any(is_loaded(s, p) for s in samples)]
+    return {
+        "module": module,
+        "total_ms": round(total_ms, 1),
+        "budget_ms": budget_ms,
+        "over_budget": budget_ms is not None and total_ms > budget_ms,
+        "deferred_loaded": deferred_loaded,
+        "modules_imported": statistics.median(len(s) for s in samples),
+        "top_cumulative": [{"module": n, "ms": round(median_us(n, 1) / 1000, 1)} for n in by_cumulative],
+        "top_self": [{"module": n, "ms": round(median_us(n, 0) / 1000, 1)} for n in by_self],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Audit Scribe import time against a budget.")
+    parser.add_argument("--budget", type=Path, default=DEFAULT_BUDGET, help="Budget JSON file.")
+    parser.add_argument("--module", action="append", help="Entry point to audit (default: all in the budget).")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per entry point.")
+    parser.add_argument("--top", type=int, default=15, help="Most expensive modules to list.")
+    parser.add_argument("--json", action="store_true", help="Emit JSON instead of a table.")
+    args = parser.parse_args()
+
+    budget = json.loads(args.budget.read_text(encoding="utf-8"))["modules"]
+    modules = args.module or list(budget)
+    startup = set(profile_import(None))
+    results = [audit(module, budget.get(module, {}), args.runs, args.top, startup) for module in modules]
+    failed = any(r["over_budget"] or r["deferred_loaded"] for r in results)
+
+    if args.json:
+        print(json.dumps({"runs": args.runs, "failed": failed, "results": results}, indent=2))
+    else:
+        for r in results:
+            status = "OVER BUDGET" if r["over_budget"] else "ok"
+            budget_text = f"{r['budget_ms']} ms" if r["budget_ms"] is not None else "none"
+            print(f"{r['module']}: {r['total_ms']} ms (budget {budget_text}, {status}), "
+                  f"{r['modules_imported']:.0f} modules")
+            if r["deferred_loaded"]:
+                print(f"  deferred modules imported: {', '.join(r['deferred_loaded'])}")
+            print(f"  {'cumulative ms':>13}  {'self ms':>8}")
+            for cumulative, own in zip(r["top_cumulative"], r["top_self"]):
+                print(f"  {cumulative['ms']:>13} {cumulative['module']:<48} {own['ms']:>8} {own['module']}")
+            print()
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+LLM Batch Generation Benchmark
+
+Measures frontmatter generation throughput through LLMClient against the
+deterministic StubLLMBackend with a simulated per-call latency:
+    - sequential: one document at a time through the synchronous client
+    - batch:      agenerate_batch with --concurrency calls in flight
+    - warm:       the same batch again, served from the response cache
+
+Each document gets a distinct prompt, so the cold runs make one backend call
+per document.
+
+Usage:
+    python test-environment/benchmarks/bench_llm_batch.py [--documents 64] [--latency 0.05] [--concurrency 8] [--json]
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from tools.scribe.integrations.llm_integration import LLMClient, StubLLMBackend, constraint_profile_hash
+
+PROFILE_HASH = constraint_profile_hash({"mandatory_fields": ["title", "info-type", "kb-id"]})
+
+
+def fixed_clock():
+    """Pinned date so backend output is identical across runs."""
+    return datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def make_prompts(count):
+    return [(f"Generate YAML frontmatter for a technical-report document.\nDocument {i} preview: ...", PROFILE_HASH)
+            for i in range(count)]
+
+
+def summarize(label, client, documents, elapsed):
+    stats = client.get_generation_stats()
+    return {
+        "name": label,
+        "seconds": round(elapsed, 4),
+        "docs_per_second": round(documents / elapsed, 1),
+        "backend_calls": stats["backend_calls"],
+        "cache_hit_rate": round(stats["cache"]["hit_rate"], 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batched LLM frontmatter generation.")
+    parser.add_argument("--documents", type=int, default=64, help="Documents per scenario.")
+    parser.add_argument("--latency", type=float, default=0.05, help="Simulated backend latency in seconds.")
+    parser.add_argument("--concurrency", type=int, default=8, help="In-flight calls for the batch scenarios.")
+    parser.add_argument("--json", action="store_true", help="Emit JSON instead of a table.")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    prompts = make_prompts(args.documents)
+
+    sequential = LLMClient(backend=StubLLMBackend(latency=args.latency, clock=fixed_clock))
+    start = time.perf_counter()
+    for prompt, profile_hash in prompts:
+        sequential.generate(prompt, profile_hash=profile_hash)
+    results = [summarize("sequential", sequential, args.documents, time.perf_counter() - start)]
+
+    batched = LLMClient(backend=StubLLMBackend(latency=args.latency, clock=fixed_clock), max_concurrency=args.concurrency)
+    start = time.perf_counter()
+    batched.generate_batch(prompts)
+    results.append(summarize(f"batch(x{args.concurrency})", batched, args.documents, time.perf_counter() - start))
+
+    start = time.perf_counter()
+    batched.generate_batch(prompts)
+    results.append(summarize("warm cache", batched, args.documents, time.perf_counter() - start))
+
+    if args.json:
+        print(json.dumps({"documents": args.documents, "latency": args.latency, "results": results}, indent=2))
+        return
+
+    print(f"{args.documents} documents, {args.latency * 1000:.0f} ms simulated latency")
+    print(f"{'scenario':<14} {'seconds':>9} {'docs/s':>9} {'backend calls':>14} {'hit rate':>9}")
+    for row in results:
+        print(f"{row['name']:<14} {row['seconds']:>9} {row['docs_per_second']:>9} "
+              f"{row['backend_calls']:>14} {row['cache_hit_rate']:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Structured Logging Overhead Benchmark
+
+Measures the per-call cost an INFO log line adds to the event path with the
+Scribe structlog configuration: synchronous JSON rendering, the asynchronous
+queue-backed writer, and the async writer with INFO sampling. Output goes to
+os.devnull so only the logging pipeline is measured. "caller" is the time
+spent in the logging call itself; "drain" is the extra time until the
+background writer has flushed everything.
+
+Usage:
+    python test-environment/benchmarks/bench_logging.py [--events 50000] [--sample-rate 0.1] [--json]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from tools.scribe.core.logging_config import (
+    configure_log_pipeline,
+    configure_structured_logging,
+    flush_logs,
+    get_logging_stats,
+    get_scribe_logger,
+    shutdown_logging,
+)
+
+
+def run_scenario(label, logger, events, devnull, **pipeline_kwargs):
+    configure_log_pipeline(stream=devnull, **pipeline_kwargs)
+    start = time.perf_counter()
+    for i in range(events):
+        logger.info("atomic_write_completed", target_file=f"standards/src/doc-{i}.md", bytes_written=512)
+    caller = time.perf_counter() - start
+    flush_logs(timeout=60.0)
+    total = time.perf_counter() - start
+    stats = get_logging_stats()
+    shutdown_logging()
+    return {
+        "name": label,
+        "caller_us_per_event": round(caller / events * 1e6, 2),
+        "drain_seconds": round(total - caller, 4),
+        "total_seconds": round(total, 4),
+        "dropped_sampled": stats["dropped_sampled"],
+        "written": stats["writer"]["written"] if stats["writer"] else events,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark structured logging modes.")
+    parser.add_argument("--events", type=int, default=50000, help="Log calls per scenario.")
+    parser.add_argument("--sample-rate", type=float, default=0.1, help="INFO keep-probability for the sampled scenario.")
+    parser.add_argument("--json", action="store_true", help="Emit JSON instead of a table.")
+    args = parser.parse_args()
+
+    devnull = open(os.devnull, "w", encoding="utf-8")
+    real_stdout = sys.stdout
+    # basicConfig binds the stdlib handler to the current sys.stdout
+    sys.stdout = devnull
+    try:
+        configure_structured_logging(log_level="INFO", include_stdlib_logs=True)
+        logger = get_scribe_logger("bench.logging")
+        queue_size = args.events + 1
+        results = [
+            run_scenario("sync", logger, args.events, devnull),
+            run_scenario("async", logger, args.events, devnull, async_enabled=True, max_queue_size=queue_size),
+            run_scenario(f"async+sample({args.sample_rate})", logger, args.events, devnull,
+                         async_enabled=True, max_queue_size=queue_size, sample_rates={"info": args.sample_rate}),
+        ]
+    finally:
+        sys.stdout = real_stdout
+        devnull.close()
+
+    if args.json:
+        print(json.dumps({"events": args.events, "results": results}, indent=2))
+        return
+
+    print(f"{args.events} INFO events per scenario")
+    print(f"{'scenario':<22} {'caller us/event':>16} {'drain s':>10} {'total s':>10} {'written':>9}")
+    for row in results:
+        print(f"{row['name']:<22} {row['caller_us_per_event']:>16} {row['drain_seconds']:>10} "
+              f"{row['total_seconds']:>10} {row['written']:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Plugin Loading Startup Benchmark
+
+Generates --plugins synthetic action plugins (each with an HMA v2.2 manifest
+and an import of --heavy-module) and measures, in a fresh interpreter per
+run, the time from startup to:
+    - plugins registered (PluginLoader.load_all_plugins returns)
+    - first processed event (one action class resolved, instantiated and run)
+
+Scenarios:
+    - eager:        every plugin module imported at load (lazy=False)
+    - lazy-cold:    manifest registration, empty scan cache
+    - lazy-warm:    manifest registration, scan cache from a previous run
+    - lazy-prewarm: lazy-warm plus the background pre-warm thread
+
+Usage:
+    python test-environment/benchmarks/bench_plugin_startup.py [--plugins 20] [--heavy-module pandas] [--runs 5] [--json]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent.parent
+
+# Lives outside the plugin directory so it is not discovered as a plugin.
+# Plugins reference it as a module attribute, so only their own class is
+# found when the loader scans module members.
+SUPPORT_MODULE = '''
+from tools.scribe.actions.base import BaseAction
+
+
+class SyntheticAction(BaseAction):
+    def __init__(self, action_type, params, plugin_context=None):
+        self.action_type = action_type
+        self.params = params
+
+    def execute(self, file_content, match, file_path, params):
+        return file_content.upper()
+'''
+
+PLUGIN_SOURCE = '''
+import {heavy_module}
+import bench_plugin_support as support
+
+
+class {class_name}(support.SyntheticAction):
+    pass
+'''
+
+MANIFEST = {
+    "manifest_version": "2.2",
+    "plugin_metadata": {"name": "", "version": "1.0.0", "description": "Synthetic benchmark plugin",
+                        "author": "benchmarks", "license": "MIT", "type": "L3-Capability", "product": "scribe"},
+    "hma_compliance": {
+        "hma_version": "2.2",
+        "tier_classification": {"mandatory": ["json_schema", "otel_boundary", "mtls"],
+                                "recommended": [], "alternative": []},
+        "boundary_interfaces": [{"port_type": "PluginExecutionPort", "direction": "inbound",
+                                 "validation": "json_schema", "telemetry": "otel_spans"}],
+    },
+    "runtime_requirements": {"python_version": ">=3.8", "dependencies": {"required": [], "optional": []},
+                             "platform_support": ["linux"],
+                             "resource_limits": {"max_memory_mb": 100, "max_cpu_percent": 10, "max_file_handles": 10}},
+    "interface_contracts": {"action_interface": {"entry_point": "", "configuration_schema": {"type": "object"}}},
+    "security": {"permissions": [], "sandbox_compatible": True, "mtls_required": True},
+}
+
+# Runs in a fresh interpreter; argv: plugin_dir support_dir cache_path lazy prewarm
+CHILD = '''
+import time
+start = time.perf_counter()
+import json, logging, sys
+import structlog
+logging.disable(logging.CRITICAL)
+structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.CRITICAL))
+sys.path.insert(0, sys.argv[2])
+from tools.scribe.core.plugin_loader import PluginLoader
+imported = time.perf_counter()
+loader = PluginLoader(plugin_directories=[sys.argv[1]], lazy=sys.argv[4] == "1", cache_path=sys.argv[3] or None)
+plugins = loader.load_all_plugins()
+registered = time.perf_counter()
+if sys.argv[5] == "1":
+    loader.prewarm()
+info = plugins["synthetic0"]
+action = info.action_class(action_type=info.action_type, params={})
+action.execute("first event", None, "doc.md", {})
+first_event = time.perf_counter()
+print(json.dumps({"plugins": len(plugins), "import_ms": (imported - start) * 1000,
+                  "registered_ms": (registered - start) * 1000, "first_event_ms": (first_event - start) * 1000}))
+'''
+
+
+def generate_plugins(root, count, heavy_module):
+    plugin_dir, support_dir = root / "plugins", root / "support"
+    plugin_dir.mkdir()
+    support_dir.mkdir()
+    (support_dir / "bench_plugin_support.py").write_text(SUPPORT_MODULE, encoding="utf-8")
+    for i in range(count):
+        stem, class_name = f"synthetic_{i}_action", f"Synthetic{i}Action"
+        (plugin_dir / f"{stem}.py").write_text(
+            PLUGIN_SOURCE.format(heavy_module=heavy_module, class_name=class_name),
+            encoding="utf-8")
+        manifest = json.loads(json.dumps(MANIFEST))
+        manifest["plugin_metadata"]["name"] = stem
+        manifest["interface_contracts"]["action_interface"]["entry_point"] = f"{stem}.{class_name}"
+        (plugin_dir / stem).mkdir()
+        (plugin_dir / stem / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+    return plugin_dir, support_dir
+
+
+def run_child(plugin_dir, support_dir, cache_path, lazy, prewarm):
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD, str(plugin_dir), str(support_dir), str(cache_path or ""),
+         "1" if lazy else "0", "1" if prewarm else "0"],
+        cwd=project_root, capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure plugin loading startup time.")
+    parser.add_argument("--plugins", type=int, default=20, help="Synthetic plugins to generate.")
+    parser.add_argument("--heavy-module", default="pandas", help="Module each plugin imports at module level.")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per scenario.")
+    parser.add_argument("--json", action="store_true", help="Emit JSON instead of a table.")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="scribe-plugin-bench-") as tmp:
+        root = Path(tmp)
+        plugin_dir, support_dir = generate_plugins(root, args.plugins, args.heavy_module)
+        warm_cache = root / "warm_cache.json"
+        run_child(plugin_dir, support_dir, warm_cache, lazy=True, prewarm=True)  # populate the cache
+
+        scenarios = [
+            ("eager", None, False, False),
+            ("lazy-cold", "cold", True, False),
+            ("lazy-warm", warm_cache, True, False),
+            ("lazy-prewarm", warm_cache, True, True),
+        ]
+        for name, cache, lazy, prewarm in scenarios:
+            samples = []
+            for run in range(args.runs):
+                cache_path = root / f"cold_{run}.json" if cache == "cold" else cache
+                samples.append(run_child(plugin_dir, support_dir, cache_path, lazy, prewarm))
+            results.append({
+                "name": name,
+                "plugins": samples[0]["plugins"],
+                **{key: round(statistics.median(s[key] for s in samples), 1)
+                   for key in ("import_ms", "registered_ms", "first_event_ms")},
+            })
+
+    if args.json:
+        print(json.dumps({"plugins": args.plugins, "heavy_module": args.heavy_module, "runs": args.runs,
+                          "results": results}, indent=2))
+        return
+
+    print(f"{args.plugins} plugins importing {args.heavy_module}, median of {args.runs} fresh interpreters")
+    print(f"{'scenario':<14} {'registered':>8} {'core import ms':>15} {'registered ms':>14} {'first event ms':>15}")
+    for row in results:
+        print(f"{row['name']:<14} {row['plugins']:>10} {row['import_ms']:>15} {row['registered_ms']:>14} "
+              f"{row['first_event_ms']:>15}")
+
+
+if __name__ == "__main__":
+    main()
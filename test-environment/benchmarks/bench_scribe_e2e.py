@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+End-to-end Scribe Benchmark
+
+Generates a synthetic knowledge base and replays file events through the
+Scribe pipeline: watcher event handler -> event bus -> RuleProcessor ->
+ActionDispatcher. Reports events/sec, per-stage latency percentiles
+(watcher, bus, read, rules, dispatch, end-to-end), CPU and peak RSS.
+
+Sources:
+    - synthetic: FileModifiedEvents fed straight into the watcher's handler
+    - watchdog:  a real Watcher observes the KB while files are modified
+Buses:
+    - inprocess:    queue hand-off to --consumers threads
+    - nats-standin: same, plus NATS JSON envelope encode/decode per event
+
+Results depend on the host; compare JSON reports from the same machine.
+
+Usage:
+    python test-environment/benchmarks/bench_scribe_e2e.py [--documents 1000] [--rounds 1]
+        [--source synthetic|watchdog] [--bus inprocess|nats-standin] [--consumers 1] [--json] [--output report.json]
+"""
+
+import argparse
+import json
+import logging
+import sys
+import tempfile
+from pathlib import Path
+
+import structlog
+
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from scribe_e2e.kb_generator import generate_kb
+from scribe_e2e.pipeline import EventReplayer, write_bench_config
+from scribe_e2e.reporter import ResourceMeter, build_report, format_report
+
+SCRIBE_ROOT = project_root / "tools" / "scribe"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Scribe pipeline end to end.")
+    parser.add_argument("--documents", type=int, default=1000, help="Documents in the synthetic KB.")
+    parser.add_argument("--rounds", type=int, default=1, help="Events replayed per document.")
+    parser.add_argument("--source", choices=["synthetic", "watchdog"], default="synthetic",
+                        help="How file events are produced.")
+    parser.add_argument("--bus", choices=["inprocess", "nats-standin"], default="inprocess",
+                        help="Event bus between the watcher and the consumers.")
+    parser.add_argument("--consumers", type=int, default=1, help="Consumer threads on the bus.")
+    parser.add_argument("--interval", type=float, default=0.001,
+                        help="Pause between file modifications with --source watchdog.")
+    parser.add_argument("--timeout", type=float, default=300.0, help="Seconds to wait for the pipeline to drain.")
+    parser.add_argument("--seed", type=int, default=42, help="KB generator seed.")
+    parser.add_argument("--json", action="store_true", help="Emit JSON instead of a table.")
+    parser.add_argument("--output", type=Path, help="Also write the JSON report to this file.")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.CRITICAL))
+
+    with tempfile.TemporaryDirectory(prefix="scribe-e2e-") as tmp:
+        tmp_path = Path(tmp)
+        kb_root = tmp_path / "kb"
+        paths = generate_kb(kb_root, args.documents, seed=args.seed)
+        config_path = write_bench_config(SCRIBE_ROOT / "config" / "config.json", tmp_path / "config.json")
+
+        replayer = EventReplayer(kb_root, config_path, SCRIBE_ROOT / "schemas" / "scribe_config.schema.json",
+                                 bus=args.bus, consumers=args.consumers)
+        replayer.set_known_ids(paths)
+        try:
+            with ResourceMeter() as meter:
+                if args.source == "watchdog":
+                    drained = replayer.replay_watchdog(paths, args.rounds, args.timeout, args.interval)
+                else:
+                    drained = replayer.replay_synthetic(paths, args.rounds, args.timeout)
+        finally:
+            replayer.close()
+
+    settings = {
+        "documents": args.documents,
+        "rounds": args.rounds,
+        "source": args.source,
+        "bus": args.bus,
+        "consumers": args.consumers,
+        "seed": args.seed,
+        "drained": drained,
+    }
+    report = build_report(settings, replayer.recorder, meter, project_root)
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(format_report(report))
+    if not drained:
+        print("warning: pipeline did not drain before --timeout", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
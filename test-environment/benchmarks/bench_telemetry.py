@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Boundary Tracing Overhead Benchmark
+
+Measures per-call overhead of TelemetryManager.trace_boundary_call around an
+empty body:
+    - disabled: no collector endpoint (mock tracer and meter)
+    - sampled:  OpenTelemetry SDK tracer and meter, --sample-rate of calls traced
+    - full:     OpenTelemetry SDK tracer and meter, every call traced
+
+SDK scenarios use in-process providers with no exporter, so only the
+instrumentation cost is measured. They are skipped when opentelemetry-sdk is
+not installed.
+
+Usage:
+    python test-environment/benchmarks/bench_telemetry.py [--calls 100000] [--sample-rate 0.01] [--json]
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+
+import structlog
+
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from tools.scribe.core.telemetry import TelemetryManager
+
+try:
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.trace import TracerProvider
+    SDK_AVAILABLE = True
+except ImportError:
+    SDK_AVAILABLE = False
+
+
+def make_manager(sampling_rate, use_sdk):
+    manager = TelemetryManager(service_name="bench", endpoint=None, sampling_rate=sampling_rate)
+    if use_sdk:
+        # Wire SDK providers directly instead of exporting to a collector
+        manager.tracer = TracerProvider().get_tracer("bench")
+        manager.meter = MeterProvider().get_meter("bench")
+        manager._create_standard_metrics()
+    return manager
+
+
+def measure(label, manager, calls):
+    trace_call = manager.trace_boundary_call
+    start = time.perf_counter()
+    for _ in range(calls):
+        with trace_call("inbound", "file_system", "file_watcher", "event_validation"):
+            pass
+    elapsed = time.perf_counter() - start
+    return {"name": label, "us_per_call": round(elapsed / calls * 1e6, 3), "seconds": round(elapsed, 4)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark boundary tracing overhead.")
+    parser.add_argument("--calls", type=int, default=100000, help="Traced calls per scenario.")
+    parser.add_argument("--sample-rate", type=float, default=0.01, help="Sampling rate for the sampled scenario.")
+    parser.add_argument("--json", action="store_true", help="Emit JSON instead of a table.")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.CRITICAL))
+
+    start = time.perf_counter()
+    for _ in range(args.calls):
+        pass
+    baseline = (time.perf_counter() - start) / args.calls * 1e6
+
+    results = [measure("disabled", make_manager(1.0, use_sdk=False), args.calls)]
+    if SDK_AVAILABLE:
+        results.append(measure(f"sampled({args.sample_rate})", make_manager(args.sample_rate, use_sdk=True), args.calls))
+        results.append(measure("full", make_manager(1.0, use_sdk=True), args.calls))
+
+    if args.json:
+        print(json.dumps({"calls": args.calls, "empty_loop_us": round(baseline, 3), "results": results}, indent=2))
+        return
+
+    print(f"{args.calls} calls per scenario (empty loop: {baseline:.3f} us/iteration)")
+    print(f"{'scenario':<16} {'us/call':>10} {'seconds':>10}")
+    for row in results:
+        print(f"{row['name']:<16} {row['us_per_call']:>10} {row['seconds']:>10}")
+    if not SDK_AVAILABLE:
+        print("opentelemetry-sdk not installed; sampled/full scenarios skipped")
+
+
+if __name__ == "__main__":
+    main()
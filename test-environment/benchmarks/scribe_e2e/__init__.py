@@ -0,0 +1,11 @@
+"""
+End-to-end Scribe benchmark harness.
+
+- kb_generator: synthetic knowledge base with realistic frontmatter and links
+- pipeline:     event replayer driving the watcher's event handler, an event
+                bus (in-process or a local NATS stand-in), RuleProcessor and
+                ActionDispatcher
+- reporter:     events/sec, per-stage latency percentiles, peak RSS and CPU
+
+Run through test-environment/benchmarks/bench_scribe_e2e.py.
+"""
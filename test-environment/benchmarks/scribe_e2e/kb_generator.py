@@ -0,0 +1,102 @@
+"""
+Synthetic knowledge base generator.
+
+Creates N Markdown documents shaped like standards/src: YAML frontmatter with
+the repository's standard fields, a few sections of prose, wiki links
+([[STANDARD-ID]]) to other generated documents, and relative Markdown links.
+Output is fully determined by the seed so runs are comparable across commits.
+"""
+
+import random
+from pathlib import Path
+from typing import List
+
+import yaml
+
+DOMAINS = ["AS", "CS", "GM", "MT", "OM", "QM", "SF", "UA"]
+SUB_DOMAINS = ["STRUCTURE", "SCHEMA", "NAMING", "POLICY", "LINKS", "TAGS", "METADATA", "PROCESS"]
+INFO_TYPES = ["standard-definition", "policy-document", "guide-document", "technical-report", "general-document"]
+CRITICALITIES = ["P0-Critical", "P1-Important", "P2-Recommended", "P3-Optional"]
+WORDS = (
+    "standard document knowledge base schema field value link section content policy structure "
+    "validation metadata index registry naming convention version lifecycle review change topic "
+    "frontmatter reference architecture process quality compliance requirement scope domain"
+).split()
+
+
+def standard_id(index: int) -> str:
+    domain = DOMAINS[index % len(DOMAINS)]
+    sub_domain = SUB_DOMAINS[(index // len(DOMAINS)) % len(SUB_DOMAINS)]
+    return f"{domain}-{sub_domain}-BENCH-{index:05d}"
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    text = " ".join(rng.choice(WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+
+def render_document(index: int, total: int, rng: random.Random, links_per_doc: int,
+                    paragraphs: int) -> str:
+    """Render one document; links point at other documents in the same KB."""
+    doc_id = standard_id(index)
+    domain, sub_domain = doc_id.split("-")[:2]
+    targets = [rng.randrange(total) for _ in range(links_per_doc)] if total > 1 else []
+    targets = [t for t in targets if t != index]
+
+    frontmatter = {
+        "title": f"{sub_domain.title()} Standard {index}",
+        "standard_id": doc_id,
+        "aliases": [f"Bench {index}"],
+        "tags": [
+            f"content-type/{INFO_TYPES[index % len(INFO_TYPES)]}",
+            f"criticality/{CRITICALITIES[index % len(CRITICALITIES)].lower()}",
+            "status/active",
+            f"topic/{sub_domain.lower()}",
+        ],
+        "kb-id": "standards",
+        "info-type": INFO_TYPES[index % len(INFO_TYPES)],
+        "primary-topic": _sentence(rng, 8),
+        "related-standards": [standard_id(t) for t in targets[:3]],
+        "version": f"1.{index % 10}.0",
+        "date-created": "2025-01-01T00:00:00Z",
+        "date-modified": "2025-06-01T00:00:00Z",
+        "primary_domain": domain,
+        "sub_domain": sub_domain,
+        "scope_application": _sentence(rng, 10),
+        "criticality": CRITICALITIES[index % len(CRITICALITIES)],
+        "lifecycle_gatekeeper": "Architect-Review",
+        "impact_areas": ["KB navigation", "Content discoverability"],
+    }
+
+    body = [f"# {frontmatter['title']} ({doc_id})", ""]
+    for section in range(paragraphs):
+        body.append(f"## Section {section + 1}")
+        body.append("")
+        sentences = [_sentence(rng, rng.randint(8, 20)) for _ in range(4)]
+        if targets:
+            target = targets[section % len(targets)]
+            sentences.append(f"See [[{standard_id(target)}]] for details.")
+            sentences.append(f"Also read [{standard_id(target)}]({standard_id(target)}.md).")
+        body.append(" ".join(sentences))
+        body.append("")
+
+    return "---\n" + yaml.safe_dump(frontmatter, sort_keys=False) + "---\n" + "\n".join(body)
+
+
+def generate_kb(root: Path, documents: int, seed: int = 42, links_per_doc: int = 4,
+                paragraphs: int = 4, docs_per_directory: int = 200) -> List[Path]:
+    """
+    Write ``documents`` Markdown files under ``root`` and return their paths.
+
+    Files are spread over subdirectories of at most ``docs_per_directory``.
+    """
+    rng = random.Random(seed)
+    root = Path(root)
+    paths = []
+    for index in range(documents):
+        directory = root / "standards" / f"batch-{index // docs_per_directory:03d}"
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"{standard_id(index)}.md"
+        path.write_text(render_document(index, documents, rng, links_per_doc, paragraphs), encoding="utf-8")
+        paths.append(path)
+    return paths
@@ -0,0 +1,329 @@
+"""
+Event replayer for the Scribe processing path.
+
+Events enter through the watcher's ScribeEventHandler (L1 boundary validation
+and publish), cross an EventBusPort, and are consumed by RuleProcessor and
+ActionDispatcher:
+
+- source "synthetic": FileModifiedEvents are fed straight into the handler
+- source "watchdog":  a real Watcher observes the KB while files are appended to
+
+Two buses are available. "inprocess" hands event dicts to consumer threads
+through a queue. "nats-standin" additionally encodes every event as the JSON
+envelope NatsEventBusAdapter sends on subject scribe.events.<type> and
+decodes and validates it on delivery, so serialization cost is included
+without needing a broker.
+"""
+
+import asyncio
+import json
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from watchdog.events import FileModifiedEvent
+
+from tools.scribe.actions.base import BaseAction
+from tools.scribe.core.action_dispatcher import ActionDispatcher
+from tools.scribe.core.config_manager import ConfigManager
+from tools.scribe.core.hma_ports import EventBusPort
+from tools.scribe.core.plugin_loader import PluginInfo
+from tools.scribe.core.rule_processor import RuleProcessor
+from tools.scribe.core.security_manager import SecurityManager
+from tools.scribe.watcher import ScribeEventHandler, Watcher
+
+from .reporter import StageRecorder
+
+_STOP = object()
+
+
+class InProcessEventBus(EventBusPort):
+    """Queue-backed EventBusPort delivering to subscribers on consumer threads."""
+
+    broker_type = "inprocess"
+
+    def __init__(self, recorder: StageRecorder, consumers: int = 1):
+        self.recorder = recorder
+        self.consumers = max(1, consumers)
+        self._queue: "queue.Queue" = queue.Queue()
+        self._subscribers: Dict[str, List[Dict[str, Any]]] = {}
+        self._threads: List[threading.Thread] = []
+        self.events_published = 0
+        self.events_delivered = 0
+
+    def start(self) -> None:
+        for index in range(self.consumers):
+            thread = threading.Thread(target=self._consume, name=f"bench-bus-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self) -> None:
+        for _ in self._threads:
+            self._queue.put(_STOP)
+        for thread in self._threads:
+            thread.join(timeout=10)
+        self._threads.clear()
+
+    def _encode(self, event_type: str, event: Dict[str, Any]) -> Any:
+        return event
+
+    def _decode(self, payload: Any) -> Optional[Dict[str, Any]]:
+        return payload
+
+    async def publish_event(self, event_type: str, event_data: Dict[str, Any],
+                            target: Optional[str] = None,
+                            correlation_id: Optional[str] = None) -> bool:
+        event_id = correlation_id or event_data.get("event_id")
+        self.recorder.published(event_id, event_data.get("file_path"))
+        event = {
+            "eventId": event_id,
+            "eventType": event_type,
+            "eventVersion": "2.2",
+            "source": "scribe-core",
+            "timestamp": time.time(),
+            "data": event_data,
+        }
+        self._queue.put((event_type, time.perf_counter(), self._encode(event_type, event)))
+        self.events_published += 1
+        return True
+
+    async def subscribe_to_events(self, event_types: List[str], callback: Callable,
+                                  subscriber_id: str) -> bool:
+        for event_type in event_types:
+            self._subscribers.setdefault(event_type, []).append(
+                {"callback": callback, "subscriber_id": subscriber_id}
+            )
+        return True
+
+    async def unsubscribe_from_events(self, event_types: List[str], subscriber_id: str) -> bool:
+        for event_type in event_types:
+            self._subscribers[event_type] = [
+                sub for sub in self._subscribers.get(event_type, []) if sub["subscriber_id"] != subscriber_id
+            ]
+        return True
+
+    def _consume(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            event_type, published_at, payload = item
+            event = self._decode(payload)
+            if event is None:
+                continue
+            self.recorder.record("bus", time.perf_counter() - published_at)
+            for subscriber in self._subscribers.get(event_type, []):
+                callback = subscriber["callback"]
+                if asyncio.iscoroutinefunction(callback):
+                    asyncio.run(callback(event))
+                else:
+                    callback(event)
+            self.events_delivered += 1
+
+    def get_event_statistics(self) -> Dict[str, Any]:
+        return {
+            "events_published": self.events_published,
+            "events_delivered": self.events_delivered,
+            "queue_size": self._queue.qsize(),
+            "broker_type": self.broker_type,
+        }
+
+
+class NatsStandInEventBus(InProcessEventBus):
+    """In-process bus that round-trips events through the NATS wire format."""
+
+    broker_type = "nats-standin"
+    REQUIRED_FIELDS = ("eventId", "eventType", "eventVersion", "source", "timestamp", "data")
+
+    def _encode(self, event_type: str, event: Dict[str, Any]) -> Any:
+        return f"scribe.events.{event_type}", json.dumps(event).encode("utf-8")
+
+    def _decode(self, payload: Any) -> Optional[Dict[str, Any]]:
+        _subject, data = payload
+        event = json.loads(data.decode("utf-8"))
+        if any(field not in event for field in self.REQUIRED_FIELDS):
+            return None
+        return event
+
+
+class LinkIndexAction(BaseAction):
+    """
+    Benchmark action: resolve a matched [[STANDARD-ID]] link against the KB.
+
+    Leaves content unchanged; cost is dominated by the dispatcher itself.
+    """
+
+    known_ids: frozenset = frozenset()
+
+    def __init__(self, action_type: str, params: Dict[str, Any], **dependencies):
+        # ActionDispatcher instantiates actions with config/security managers
+        # rather than a plugin context, so BaseAction.__init__ is not used
+        self.action_type = action_type
+        self.params = params
+        self.dependencies = dependencies
+
+    def execute(self, file_content, match, file_path, params):
+        target = match.group(1)
+        if target not in self.known_ids and params.get("strict"):
+            raise ValueError(f"Unresolved link {target}")
+        return file_content
+
+
+class TouchModifiedDateAction(LinkIndexAction):
+    """Benchmark action: rewrite the matched date-modified line in memory."""
+
+    def execute(self, file_content, match, file_path, params):
+        stamp = params.get("timestamp", "2025-06-01T00:00:00Z")
+        return f"{file_content[:match.start()]}date-modified: '{stamp}'{file_content[match.end():]}"
+
+
+BENCH_ACTIONS = {
+    "bench_link_index": LinkIndexAction,
+    "bench_touch_modified": TouchModifiedDateAction,
+}
+
+BENCH_RULES = [
+    {
+        "id": "BENCH-LINKS",
+        "name": "bench-link-index",
+        "enabled": True,
+        "file_glob": "*.md",
+        "patterns": ["*.md"],
+        "trigger_pattern": r"\[\[([A-Z]{2}-[A-Z0-9-]+)\]\]",
+        "actions": [{"type": "bench_link_index", "params": {"strict": False}}],
+    },
+    {
+        "id": "BENCH-DATE",
+        "name": "bench-touch-modified",
+        "enabled": True,
+        "file_glob": "*.md",
+        "patterns": ["*.md"],
+        "trigger_pattern": r"^date-modified: .*$",
+        "actions": [{"type": "bench_touch_modified", "params": {"timestamp": "2025-06-01T00:00:00Z"}}],
+    },
+]
+
+
+class BenchPluginRegistry:
+    """Minimal PluginLoader stand-in exposing only the benchmark actions."""
+
+    def __init__(self):
+        self._plugins = {
+            action_type: PluginInfo(action_class, __file__, action_type)
+            for action_type, action_class in BENCH_ACTIONS.items()
+        }
+
+    def get_plugin(self, action_type: str) -> Optional[PluginInfo]:
+        return self._plugins.get(action_type)
+
+
+def write_bench_config(base_config_path: Path, target: Path) -> Path:
+    """Write a config with the benchmark rules and the security settings they need."""
+    config = json.loads(Path(base_config_path).read_text(encoding="utf-8"))
+    config["rules"] = BENCH_RULES
+    config["security"]["allowed_commands"] = ["git"]
+    config["engine"]["enable_hot_reload"] = False
+    target.write_text(json.dumps(config), encoding="utf-8")
+    return target
+
+
+class PipelineConsumer:
+    """Event bus subscriber running RuleProcessor and ActionDispatcher for each event."""
+
+    def __init__(self, rule_processor: RuleProcessor, dispatcher: ActionDispatcher, recorder: StageRecorder):
+        self.rule_processor = rule_processor
+        self.dispatcher = dispatcher
+        self.recorder = recorder
+
+    def __call__(self, event: Dict[str, Any]) -> None:
+        data = event["data"]
+        event_id = event["eventId"]
+        failed = 0
+        matches = []
+        try:
+            start = time.perf_counter()
+            content = Path(data["file_path"]).read_text(encoding="utf-8")
+            read_done = time.perf_counter()
+            matches = self.rule_processor.process_file(data["file_path"], content, event_id)
+            rules_done = time.perf_counter()
+            if matches:
+                # In memory only: writing back would re-trigger the watcher
+                result = self.dispatcher.dispatch_file(matches, content, write=False)
+                failed += sum(1 for chain in result.dispatch_results if not chain.success)
+            dispatch_done = time.perf_counter()
+            self.recorder.record("read", read_done - start)
+            self.recorder.record("rules", rules_done - read_done)
+            self.recorder.record("dispatch", dispatch_done - rules_done)
+        except OSError:
+            failed += 1
+        finally:
+            self.recorder.completed(event_id, len(matches), failed)
+
+
+class EventReplayer:
+    """Builds the pipeline around a generated KB and replays file events through it."""
+
+    def __init__(self, kb_root: Path, config_path: Path, schema_path: Path,
+                 bus: str = "inprocess", consumers: int = 1):
+        self.kb_root = Path(kb_root)
+        self.recorder = StageRecorder()
+        bus_class = NatsStandInEventBus if bus == "nats-standin" else InProcessEventBus
+        self.event_bus = bus_class(self.recorder, consumers)
+
+        self.config_manager = ConfigManager(config_path=str(config_path), schema_path=str(schema_path),
+                                            auto_reload=False)
+        self.security_manager = SecurityManager(self.config_manager)
+        self.rule_processor = RuleProcessor(self.config_manager)
+        self.dispatcher = ActionDispatcher(BenchPluginRegistry(), self.config_manager, self.security_manager,
+                                           quarantine_path=str(self.kb_root / ".quarantine"))
+        self.handler = ScribeEventHandler(self.event_bus, file_patterns=["*.md"])
+
+        consumer = PipelineConsumer(self.rule_processor, self.dispatcher, self.recorder)
+        asyncio.run(self.event_bus.subscribe_to_events(["file_event"], consumer, "bench-pipeline"))
+
+    def set_known_ids(self, paths: List[Path]) -> None:
+        LinkIndexAction.known_ids = frozenset(path.stem for path in paths)
+
+    def replay_synthetic(self, paths: List[Path], rounds: int, timeout: float) -> bool:
+        """Feed FileModifiedEvents for every path straight into the watcher's handler."""
+        self.event_bus.start()
+        try:
+            # The handler publishes with run_until_complete on the thread's event loop
+            asyncio.set_event_loop(asyncio.new_event_loop())
+            for _ in range(rounds):
+                for path in paths:
+                    self.recorder.begin(str(path))
+                    self.handler.on_modified(FileModifiedEvent(str(path)))
+            return self.recorder.wait_for(self.recorder.events_started, timeout)
+        finally:
+            self.event_bus.stop()
+            asyncio.get_event_loop().close()
+
+    def replay_watchdog(self, paths: List[Path], rounds: int, timeout: float, interval: float) -> bool:
+        """Append to files in a watched KB and let a real Watcher emit the events."""
+        shutdown = threading.Event()
+        watcher = Watcher([str(self.kb_root)], file_patterns=["*.md"], event_bus_port=self.event_bus,
+                          shutdown_event=shutdown)
+        watcher.event_handler = self.handler
+        self.event_bus.start()
+        watcher.start()
+        try:
+            time.sleep(0.5)  # let the observer finish scheduling watches
+            for round_index in range(rounds):
+                for path in paths:
+                    self.recorder.begin(str(path))
+                    with open(path, "a", encoding="utf-8") as f:
+                        f.write(f"\n<!-- bench round {round_index} -->\n")
+                    if interval:
+                        time.sleep(interval)
+            return self.recorder.wait_for(self.recorder.events_started, timeout)
+        finally:
+            shutdown.set()
+            watcher.join(timeout=10)
+            time.sleep(0.2)  # drain duplicate notifications before stopping consumers
+            self.event_bus.stop()
+
+    def close(self) -> None:
+        self.config_manager.stop()
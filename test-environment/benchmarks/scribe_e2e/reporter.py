@@ -0,0 +1,210 @@
+"""
+Benchmark reporter: stage latency recording, resource usage and JSON output.
+"""
+
+import os
+import platform
+import subprocess
+import sys
+import threading
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+STAGES = ["watcher", "bus", "read", "rules", "dispatch", "end_to_end"]
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(pct / 100.0 * len(sorted_values))) - 1))
+    return sorted_values[rank]
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MiB, if the platform reports it."""
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is KiB on Linux and bytes on macOS
+        return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+    try:
+        import psutil
+        return round(psutil.Process().memory_info().peak_wset / (1024 * 1024), 1)
+    except Exception:
+        return None
+
+
+class StageRecorder:
+    """
+    Thread-safe per-event stage timings.
+
+    The replayer calls ``begin(path)`` just before it triggers an event for
+    a file; the bus claims that start time when the watcher publishes the
+    event. Events with no pending start (e.g. duplicate watchdog
+    notifications) are still timed downstream but excluded from watcher and
+    end-to-end latency.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._done = threading.Condition(self._lock)
+        self._pending_starts: Dict[str, deque] = defaultdict(deque)
+        self._event_starts: Dict[str, float] = {}
+        self._samples: Dict[str, List[float]] = defaultdict(list)
+        self.events_started = 0
+        self.events_published = 0
+        self.events_completed = 0
+        self.events_completed_with_start = 0
+        self.untracked_events = 0
+        self.rule_matches = 0
+        self.failed_dispatches = 0
+        self.first_start: Optional[float] = None
+        self.last_completion: Optional[float] = None
+
+    def begin(self, file_path: str) -> None:
+        now = time.perf_counter()
+        with self._lock:
+            self._pending_starts[str(file_path)].append(now)
+            self.events_started += 1
+            if self.first_start is None:
+                self.first_start = now
+
+    def published(self, event_id: str, file_path: str) -> None:
+        now = time.perf_counter()
+        with self._lock:
+            self.events_published += 1
+            starts = self._pending_starts.get(str(file_path))
+            if starts:
+                start = starts.popleft()
+                self._event_starts[event_id] = start
+                self._samples["watcher"].append(now - start)
+            else:
+                self.untracked_events += 1
+
+    def record(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            self._samples[stage].append(seconds)
+
+    def completed(self, event_id: str, matches: int, failed_dispatches: int) -> None:
+        now = time.perf_counter()
+        with self._done:
+            self.events_completed += 1
+            self.rule_matches += matches
+            self.failed_dispatches += failed_dispatches
+            self.last_completion = now
+            start = self._event_starts.pop(event_id, None)
+            if start is not None:
+                self.events_completed_with_start += 1
+                self._samples["end_to_end"].append(now - start)
+            self._done.notify_all()
+
+    def wait_for(self, tracked_events: int, timeout: float) -> bool:
+        """Wait until ``tracked_events`` started events have completed."""
+        with self._done:
+            return self._done.wait_for(lambda: self.events_completed_with_start >= tracked_events, timeout)
+
+    def stage_summary(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            samples = {stage: sorted(values) for stage, values in self._samples.items()}
+        summary = {}
+        for stage in STAGES:
+            values = samples.get(stage, [])
+            if not values:
+                continue
+            summary[stage] = {
+                "count": len(values),
+                "mean_ms": round(sum(values) / len(values) * 1000, 3),
+                "p50_ms": round(percentile(values, 50) * 1000, 3),
+                "p95_ms": round(percentile(values, 95) * 1000, 3),
+                "p99_ms": round(percentile(values, 99) * 1000, 3),
+                "max_ms": round(values[-1] * 1000, 3),
+            }
+        return summary
+
+
+class ResourceMeter:
+    """CPU time and wall time over a measured window."""
+
+    def __enter__(self):
+        self._times = os.times()
+        self._wall = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        end = os.times()
+        self.wall_seconds = time.perf_counter() - self._wall
+        self.cpu_user_seconds = end.user - self._times.user
+        self.cpu_system_seconds = end.system - self._times.system
+        return False
+
+    def as_dict(self) -> Dict[str, Any]:
+        cpu = self.cpu_user_seconds + self.cpu_system_seconds
+        return {
+            "wall_seconds": round(self.wall_seconds, 4),
+            "cpu_user_seconds": round(self.cpu_user_seconds, 4),
+            "cpu_system_seconds": round(self.cpu_system_seconds, 4),
+            "cpu_percent": round(cpu / self.wall_seconds * 100, 1) if self.wall_seconds else 0.0,
+            "peak_rss_mb": peak_rss_mb(),
+        }
+
+
+def git_revision(project_root: Path) -> Optional[str]:
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=project_root,
+                                capture_output=True, text=True, timeout=5)
+        return result.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def build_report(settings: Dict[str, Any], recorder: StageRecorder, meter: ResourceMeter,
+                 project_root: Path) -> Dict[str, Any]:
+    """Assemble the JSON report for one run."""
+    elapsed = None
+    if recorder.first_start is not None and recorder.last_completion is not None:
+        elapsed = recorder.last_completion - recorder.first_start
+    return {
+        "benchmark": "scribe_e2e",
+        "git_revision": git_revision(project_root),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "settings": settings,
+        "events": {
+            "started": recorder.events_started,
+            "published": recorder.events_published,
+            "completed": recorder.events_completed,
+            "untracked": recorder.untracked_events,
+            "rule_matches": recorder.rule_matches,
+            "failed_dispatches": recorder.failed_dispatches,
+        },
+        "events_per_second": round(recorder.events_completed / elapsed, 1) if elapsed else 0.0,
+        "stages": recorder.stage_summary(),
+        "resources": meter.as_dict(),
+    }
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Human-readable table for a report."""
+    settings = report["settings"]
+    lines = [
+        f"{settings['documents']} documents, {report['events']['completed']} events "
+        f"({settings['source']} source, {settings['bus']} bus, {settings['consumers']} consumer(s))",
+        f"throughput: {report['events_per_second']} events/s, "
+        f"rule matches: {report['events']['rule_matches']}, "
+        f"untracked events: {report['events']['untracked']}",
+        f"{'stage':<12} {'count':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}",
+    ]
+    for stage, row in report["stages"].items():
+        lines.append(f"{stage:<12} {row['count']:>7} {row['p50_ms']:>9} {row['p95_ms']:>9} "
+                     f"{row['p99_ms']:>9} {row['max_ms']:>9}")
+    resources = report["resources"]
+    lines.append(f"cpu: {resources['cpu_percent']}% of {resources['wall_seconds']} s wall, "
+                 f"peak RSS: {resources['peak_rss_mb']} MiB")
+    return "\n".join(lines)
@@ -16,7 +16,7 @@ from unittest.mock import Mock, patch, AsyncMock
 from pathlib import Path
 
 from tools.scribe.core.boundary_validator import create_boundary_validator
-from tools.scribe.core.dlq import write_dlq
+from tools.scribe.core.dlq import flush_dlq, write_dlq
 from tools.scribe.watcher import ScribeEventHandler
 from tools.scribe.adapters.nats_subscriber import run_nats
 from tools.scribe.adapters.http_validation import L1ValidationMiddleware
@@ -60,6 +60,7 @@ class TestFileWatcherL1Validation:
             handler._publish_event("invalid_type", "/test/file.md")
             
             # Verify DLQ file was created
+            assert flush_dlq()
             dlq_file = tmp_path / "dlq.jsonl"
             assert dlq_file.exists()
             
@@ -186,6 +187,7 @@ class TestL1BoundaryIntegration:
             mock_event_bus.publish_event.assert_not_called()
             
             # VERIFICATION: DLQ entry was created
+            assert flush_dlq()
             dlq_file = tmp_path / "dlq.jsonl"
             assert dlq_file.exists()
             
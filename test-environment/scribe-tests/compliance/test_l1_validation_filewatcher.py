@@ -111,4 +111,26 @@ class TestL1FileWatcherValidation:
             assert callable(self.event_handler._publish_event)
             
             # The method should handle validation internally
-            # We don't test the actual publishing here due to event loop complexity
\ No newline at end of file
+            # We don't test the actual publishing here due to event loop complexity
+        
+    def test_modified_and_moved_events_pass_l1_validation(self):
+        """Events without a source path must not carry old_path=None into validation"""
+        published = []
+
+        async def publish_event(event_type, event_data, correlation_id=None):
+            published.append(event_data)
+            return True
+
+        self.mock_event_bus.publish_event = publish_event
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            self.event_handler._publish_event('modified', '/test/file.md')
+            self.event_handler._publish_event('moved', '/test/new.md', '/test/old.md')
+        finally:
+            loop.close()
+            asyncio.set_event_loop(None)
+
+        assert [event['type'] for event in published] == ['modified', 'moved']
+        assert 'old_path' not in published[0]
+        assert published[1]['old_path'] == '/test/old.md'
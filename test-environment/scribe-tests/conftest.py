@@ -188,6 +188,19 @@ def mock_plugin_loader():
     return loader
 
 
+@pytest.fixture(scope="session", autouse=True)
+def scribe_state_dir(tmp_path_factory):
+    """Keep engine state files (plugin scan cache, snapshots) out of the source tree."""
+    state_dir = tmp_path_factory.mktemp("scribe-state")
+    previous = os.environ.get("SCRIBE_STATE_DIR")
+    os.environ["SCRIBE_STATE_DIR"] = str(state_dir)
+    yield state_dir
+    if previous is None:
+        os.environ.pop("SCRIBE_STATE_DIR", None)
+    else:
+        os.environ["SCRIBE_STATE_DIR"] = previous
+
+
 # Pytest configuration
 def pytest_configure(config):
     """Configure pytest with custom markers."""
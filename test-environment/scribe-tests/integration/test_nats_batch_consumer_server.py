@@ -0,0 +1,72 @@
+"""
+Integration test for the batch-consuming NATS subscriber against a local nats-server.
+
+Skipped unless a server is reachable at NATS_URL (default nats://localhost:4222).
+"""
+
+import asyncio
+import json
+import os
+import socket
+from pathlib import Path
+from urllib.parse import urlparse
+
+import pytest
+from nats.aio.client import Client as NATS
+
+from tools.scribe.adapters import nats_subscriber
+from tools.scribe.adapters.nats_subscriber import ConsumerConfig, run_nats
+
+NATS_URL = os.environ.get("NATS_URL", "nats://localhost:4222")
+NATS_SCHEMA = Path(__file__).resolve().parents[3] / "tools" / "scribe" / "schemas" / "l1" / "nats_message.schema.json"
+
+
+def _server_available():
+    parsed = urlparse(NATS_URL)
+    try:
+        with socket.create_connection((parsed.hostname or "localhost", parsed.port or 4222), timeout=1):
+            return True
+    except OSError:
+        return False
+
+
+@pytest.fixture
+def nats_server():
+    if not _server_available():
+        pytest.skip(f"nats-server not reachable at {NATS_URL}")
+
+
+def test_run_nats_consumes_and_drains(nats_server, tmp_path, monkeypatch):
+    monkeypatch.setenv("SCRIBE_REPORT_DIR", str(tmp_path))
+    nats_subscriber.boundary_validator.register_schema(
+        "l1_nats_input", json.loads(NATS_SCHEMA.read_text(encoding="utf-8")))
+    subject = f"scribe.test.{os.getpid()}"
+    seen = []
+
+    async def handler(payload, msg):
+        seen.append(payload["message_id"])
+
+    async def scenario():
+        stop = asyncio.Event()
+        consumer = asyncio.create_task(run_nats(NATS_URL, subject, handler=handler, stop_event=stop,
+                                                config=ConsumerConfig(batch_size=20, concurrency=4)))
+        await asyncio.sleep(0.2)
+        publisher = NATS()
+        await publisher.connect(NATS_URL)
+        for i in range(200):
+            message = {"message_id": f"m-{i}", "subject": subject, "payload": {}, "ts": "2025-01-01T00:00:00Z"}
+            await publisher.publish(subject, json.dumps(message).encode("utf-8"))
+        await publisher.flush()
+        await publisher.close()
+        while len(seen) < 200:
+            await asyncio.sleep(0.01)
+        stop.set()
+        return await asyncio.wait_for(consumer, 10)
+
+    try:
+        stats = asyncio.run(asyncio.wait_for(scenario(), 30))
+    finally:
+        nats_subscriber.boundary_validator.schemas.pop("l1_nats_input", None)
+
+    assert stats["processed"] == 200 and stats["invalid"] == 0
+    assert stats["batches"] < 200
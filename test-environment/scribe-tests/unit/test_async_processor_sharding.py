@@ -0,0 +1,179 @@
+"""
+Unit tests for key-ordered sharded execution in AsyncProcessor.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from tools.scribe.core.async_processor import (
+    AsyncProcessor,
+    AsyncTask,
+    ShardedTaskQueue,
+    TaskPriority,
+    TaskStatus,
+)
+
+
+def wait_until(predicate, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class ConcurrencyRecorder:
+    """Async handler that records execution order and concurrency per key."""
+
+    def __init__(self, delay=0.01):
+        self.delay = delay
+        self.order = {}
+        self.running = {}
+        self.max_per_key = 0
+        self.max_total = 0
+        self.lock = threading.Lock()
+
+    async def handle(self, task):
+        key = task.partition_key
+        with self.lock:
+            self.running[key] = self.running.get(key, 0) + 1
+            self.max_per_key = max(self.max_per_key, self.running[key])
+            self.max_total = max(self.max_total, sum(self.running.values()))
+        await asyncio.sleep(self.delay)
+        with self.lock:
+            self.running[key] -= 1
+            self.order.setdefault(key, []).append(task.payload["seq"])
+
+    def done(self):
+        with self.lock:
+            return sum(len(v) for v in self.order.values())
+
+
+@pytest.fixture
+def processor_factory():
+    processors = []
+
+    def make(**kwargs):
+        processor = AsyncProcessor(**kwargs)
+        processor.start()
+        assert wait_until(lambda: processor._loop is not None and processor._loop.is_running())
+        processors.append(processor)
+        return processor
+
+    yield make
+    for processor in processors:
+        processor.stop()
+
+
+def keys_in_shard(queue, shard, count):
+    keys, i = [], 0
+    while len(keys) < count:
+        key = f"/kb/doc-{i}.md"
+        if queue.shard_index(key) == shard:
+            keys.append(key)
+        i += 1
+    return keys
+
+
+class TestKeyOrderedExecution:
+    def test_same_key_runs_in_order_and_keys_run_in_parallel(self, processor_factory):
+        processor = processor_factory(max_workers=4)
+        recorder = ConcurrencyRecorder()
+        processor.register_handler("edit", recorder.handle)
+
+        keys = [f"/kb/doc-{k}.md" for k in range(4)]
+        for seq in range(10):
+            for key in keys:
+                priority = TaskPriority.HIGH if seq % 3 == 0 else TaskPriority.LOW
+                processor.submit_task("edit", {"file_path": key, "seq": seq}, priority=priority,
+                                      task_id=f"{key}-{seq}")
+
+        assert wait_until(lambda: recorder.done() == 40)
+        assert all(recorder.order[key] == list(range(10)) for key in keys)
+        assert recorder.max_per_key == 1
+        assert recorder.max_total > 1
+
+    def test_idle_workers_steal_from_busy_shard(self, processor_factory):
+        processor = processor_factory(max_workers=4)
+        recorder = ConcurrencyRecorder(delay=0.05)
+        processor.register_handler("edit", recorder.handle)
+
+        for seq, key in enumerate(keys_in_shard(processor._task_queue, 0, 8)):
+            processor.submit_task("edit", {"seq": seq}, partition_key=key)
+
+        assert wait_until(lambda: recorder.done() == 8)
+        assert recorder.max_total > 1
+        assert processor.get_stats()["work_steals"] > 0
+
+    def test_shard_depths_reported_in_stats(self, processor_factory):
+        processor = processor_factory(max_workers=2, num_shards=4)
+        release = threading.Event()
+
+        def blocking_handler(task):
+            release.wait(5)
+
+        processor.register_handler("edit", blocking_handler)
+        queue = processor._task_queue
+        key = "/kb/busy.md"
+        for seq in range(5):
+            processor.submit_task("edit", {"seq": seq}, partition_key=key)
+
+        try:
+            assert wait_until(lambda: processor.get_stats()["active_tasks"] == 1)
+            stats = processor.get_stats()
+            depths = stats["shard_queue_depths"]
+            assert len(depths) == 4
+            assert depths[queue.shard_index(key)] == 4 and sum(depths) == 4
+            assert stats["queue_size"] == 4
+        finally:
+            release.set()
+        assert wait_until(lambda: processor.get_stats()["tasks_processed"] == 5)
+        assert processor.get_stats()["shard_queue_depths"] == [0, 0, 0, 0]
+
+    def test_completed_history_is_bounded_fifo(self, processor_factory):
+        processor = processor_factory(max_workers=1, completed_history_size=3)
+        processor.register_handler("noop", lambda task: None)
+
+        for i in range(6):
+            processor.submit_task("noop", {}, task_id=f"t{i}", partition_key="same")
+
+        assert wait_until(lambda: processor.get_stats()["tasks_processed"] == 6)
+        assert list(processor._completed_tasks) == ["t3", "t4", "t5"]
+        assert processor.get_task_status("t5") == TaskStatus.COMPLETED
+        assert processor.get_task_status("t0") is None
+
+
+class TestShardedTaskQueue:
+    def test_priority_orders_keys_but_not_tasks_within_a_key(self):
+        async def scenario():
+            queue = ShardedTaskQueue(max_size=10, num_shards=1)
+            await queue.put(AsyncTask("a1", "t", TaskPriority.LOW, {}, partition_key="a"))
+            await queue.put(AsyncTask("a2", "t", TaskPriority.CRITICAL, {}, partition_key="a"))
+            await queue.put(AsyncTask("b1", "t", TaskPriority.HIGH, {}, partition_key="b"))
+
+            first = await queue.get()
+            second = await queue.get()
+            assert (first.task_id, second.task_id) == ("b1", "a1")
+            # a2 is blocked until a1 is released
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(queue.get(), timeout=0.05)
+            queue.task_done(second)
+            assert (await queue.get()).task_id == "a2"
+
+        asyncio.run(scenario())
+
+    def test_backpressure_and_unkeyed_tasks(self):
+        async def scenario():
+            queue = ShardedTaskQueue(max_size=2, num_shards=2)
+            assert await queue.put(AsyncTask("x", "t", TaskPriority.NORMAL, {}))
+            assert await queue.put(AsyncTask("y", "t", TaskPriority.NORMAL, {}))
+            assert not await queue.put(AsyncTask("z", "t", TaskPriority.NORMAL, {}))
+            # Unkeyed tasks are independent and can be taken together
+            assert {(await queue.get()).task_id, (await queue.get()).task_id} == {"x", "y"}
+            assert queue.empty()
+
+        asyncio.run(scenario())
@@ -0,0 +1,130 @@
+"""
+Unit tests for skip-unchanged and batch modes of the atomic write utility.
+"""
+
+import os
+import stat
+from unittest.mock import patch
+
+import pytest
+
+from tools.scribe.core import atomic_write as atomic_write_module
+from tools.scribe.core.atomic_write import AtomicBatchWriter, atomic_write, content_unchanged
+
+
+class TestAtomicWrite:
+    def test_skip_unchanged_leaves_file_untouched(self, tmp_path):
+        target = tmp_path / "doc.md"
+        assert atomic_write(target, "same content")
+        os.utime(target, ns=(1, 1))
+
+        assert atomic_write(target, "same content", skip_unchanged=True)
+        assert target.stat().st_mtime_ns == 1
+
+        assert atomic_write(target, "new content", skip_unchanged=True)
+        assert target.read_text(encoding="utf-8") == "new content"
+
+    def test_partial_os_write_is_completed(self, tmp_path):
+        real_write = os.write
+
+        def short_write(fd, data):
+            return real_write(fd, bytes(data[:3]))
+
+        target = tmp_path / "partial.txt"
+        with patch.object(atomic_write_module.os, "write", side_effect=short_write):
+            assert atomic_write(target, "0123456789")
+
+        assert target.read_text(encoding="utf-8") == "0123456789"
+
+    def test_content_unchanged_compares_size_then_hash(self, tmp_path):
+        target = tmp_path / "a.txt"
+        target.write_bytes(b"abc")
+
+        assert content_unchanged(target, b"abc")
+        assert not content_unchanged(target, b"abd")
+        assert not content_unchanged(target, b"abcd")
+        assert not content_unchanged(tmp_path / "missing.txt", b"abc")
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+    def test_rewrite_keeps_mode_and_new_files_follow_umask(self, tmp_path):
+        existing, new = tmp_path / "existing.md", tmp_path / "new.md"
+        existing.write_text("old", encoding="utf-8")
+        os.chmod(existing, 0o640)
+
+        assert atomic_write(existing, "new")
+        assert atomic_write(new, "new")
+
+        assert stat.S_IMODE(existing.stat().st_mode) == 0o640
+        assert stat.S_IMODE(new.stat().st_mode) == atomic_write_module._DEFAULT_FILE_MODE
+
+
+class TestAtomicBatchWriter:
+    def test_commit_writes_and_skips(self, tmp_path):
+        (tmp_path / "unchanged.md").write_text("keep", encoding="utf-8")
+
+        with AtomicBatchWriter() as batch:
+            batch.stage(tmp_path / "unchanged.md", "keep")
+            batch.stage(tmp_path / "new.md", "first")
+            batch.stage(tmp_path / "new.md", "second")
+            batch.stage(tmp_path / "nested" / "deep.md", b"bytes")
+
+        result = batch.result
+        assert result.success
+        assert result.skipped == [str(tmp_path / "unchanged.md")]
+        assert sorted(result.written) == sorted([str(tmp_path / "new.md"), str(tmp_path / "nested" / "deep.md")])
+        assert (tmp_path / "new.md").read_text(encoding="utf-8") == "second"
+        assert not [p for p in tmp_path.rglob("*") if ".tmp." in p.name or ".bak." in p.name]
+
+    def test_directory_fsynced_once_per_parent(self, tmp_path):
+        with patch.object(atomic_write_module, "_fsync_directory") as fsync_directory:
+            with AtomicBatchWriter() as batch:
+                for i in range(5):
+                    batch.stage(tmp_path / f"{i}.md", str(i))
+
+        fsync_directory.assert_called_once_with(tmp_path)
+
+    def test_all_or_nothing_rolls_back_on_rename_failure(self, tmp_path):
+        first, second = tmp_path / "a.md", tmp_path / "b.md"
+        first.write_text("original a", encoding="utf-8")
+        second.write_text("original b", encoding="utf-8")
+        real_replace = os.replace
+
+        def failing_replace(src, dst):
+            if str(dst) == str(second):
+                raise OSError("disk full")
+            return real_replace(src, dst)
+
+        batch = AtomicBatchWriter(all_or_nothing=True)
+        batch.stage(first, "new a")
+        batch.stage(second, "new b")
+        with patch.object(atomic_write_module.os, "replace", side_effect=failing_replace):
+            result = batch.commit()
+
+        assert result.rolled_back
+        assert not result.written
+        assert first.read_text(encoding="utf-8") == "original a"
+        assert second.read_text(encoding="utf-8") == "original b"
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["a.md", "b.md"]
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+    def test_commit_keeps_existing_modes(self, tmp_path):
+        shared, private = tmp_path / "shared.md", tmp_path / "private.md"
+        for path, mode in ((shared, 0o644), (private, 0o600)):
+            path.write_text("old", encoding="utf-8")
+            os.chmod(path, mode)
+
+        with AtomicBatchWriter() as batch:
+            batch.stage(shared, "new")
+            batch.stage(private, "new")
+            batch.stage(tmp_path / "created.md", "new")
+
+        assert stat.S_IMODE(shared.stat().st_mode) == 0o644
+        assert stat.S_IMODE(private.stat().st_mode) == 0o600
+        assert stat.S_IMODE((tmp_path / "created.md").stat().st_mode) == atomic_write_module._DEFAULT_FILE_MODE
+
+    def test_stage_after_commit_raises(self, tmp_path):
+        batch = AtomicBatchWriter()
+        batch.commit()
+
+        with pytest.raises(RuntimeError):
+            batch.stage(tmp_path / "late.md", "x")
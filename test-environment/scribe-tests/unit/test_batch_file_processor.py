@@ -0,0 +1,121 @@
+"""
+Unit tests for the event-driven BatchFileProcessor.
+"""
+
+import os
+import stat
+import time
+from unittest.mock import patch
+
+import pytest
+
+from tools.scribe.core.file_optimizer import BatchFileProcessor, FileOperation
+
+
+@pytest.fixture
+def processor():
+    processor = BatchFileProcessor(batch_size=100, batch_timeout=0.05)
+    yield processor
+    processor.shutdown()
+
+
+def submit(processor, operation_type, path, data=None):
+    return processor.submit_operation(FileOperation(operation_type=operation_type, file_path=path, data=data))
+
+
+class TestBatchFileProcessor:
+    def test_futures_resolve_with_results(self, processor, tmp_path):
+        target = tmp_path / "doc.md"
+        target.write_text("hello", encoding="utf-8")
+
+        read = submit(processor, "read", target)
+        missing = submit(processor, "read", tmp_path / "missing.md")
+        stat = submit(processor, "stat", target)
+
+        assert read.result(timeout=2) == "hello"
+        assert stat.result(timeout=2).st_size == 5
+        with pytest.raises(FileNotFoundError):
+            missing.result(timeout=2)
+
+    def test_duplicate_reads_and_stats_share_one_syscall(self, processor, tmp_path):
+        target = tmp_path / "doc.md"
+        target.write_text("shared", encoding="utf-8")
+
+        with patch("tools.scribe.core.file_optimizer.os.stat", wraps=os.stat) as stat_spy:
+            reads = [submit(processor, "read", target) for _ in range(5)]
+            stats = [submit(processor, "stat", target) for _ in range(5)]
+            assert processor.flush(timeout=2)
+
+        assert {f.result() for f in reads} == {"shared"}
+        assert len({id(f.result()) for f in stats}) == 1
+        assert stat_spy.call_count == 1
+        assert processor.get_stats()["operations_coalesced"] == 8
+
+    def test_writes_to_same_path_collapse_to_last(self, processor, tmp_path):
+        target = tmp_path / "out" / "doc.md"
+        writes = [submit(processor, "write", target, f"version {i}") for i in range(4)]
+
+        assert all(f.result(timeout=2) is True for f in writes)
+        assert target.read_text(encoding="utf-8") == "version 3"
+        assert processor.get_stats()["operations_coalesced"] == 3
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+    def test_writes_keep_file_mode(self, processor, tmp_path):
+        shared, private = tmp_path / "shared.md", tmp_path / "private.md"
+        for path, mode in ((shared, 0o644), (private, 0o600)):
+            path.write_text("old", encoding="utf-8")
+            os.chmod(path, mode)
+
+        writes = [submit(processor, "write", path, "new") for path in (shared, private)]
+
+        assert all(f.result(timeout=2) is True for f in writes)
+        assert stat.S_IMODE(shared.stat().st_mode) == 0o644
+        assert stat.S_IMODE(private.stat().st_mode) == 0o600
+
+    def test_legacy_callbacks_still_invoked(self, processor, tmp_path):
+        target = tmp_path / "doc.md"
+        target.write_text("x", encoding="utf-8")
+        received = []
+
+        processor.submit_operation(FileOperation(operation_type="delete", file_path=target,
+                                                 callback=lambda result, error: received.append((result, error))))
+        assert processor.flush(timeout=2)
+        assert received == [(True, None)]
+        assert not target.exists()
+
+    def test_latency_bounded_by_batch_timeout(self, tmp_path):
+        processor = BatchFileProcessor(batch_size=100, batch_timeout=0.1)
+        try:
+            start = time.monotonic()
+            submit(processor, "stat", tmp_path).result(timeout=2)
+            assert time.monotonic() - start < 0.5
+
+            # A full batch is dispatched without waiting for the timeout
+            slow = BatchFileProcessor(batch_size=3, batch_timeout=5.0)
+            try:
+                start = time.monotonic()
+                futures = [submit(slow, "stat", tmp_path) for _ in range(3)]
+                for future in futures:
+                    future.result(timeout=2)
+                assert time.monotonic() - start < 1.0
+            finally:
+                slow.shutdown()
+        finally:
+            processor.shutdown()
+
+    def test_rejects_when_full_or_shut_down(self, tmp_path):
+        processor = BatchFileProcessor(batch_size=1, batch_timeout=0.05)
+        processor.max_pending = 0
+        with pytest.raises(RuntimeError, match="queue full"):
+            submit(processor, "stat", tmp_path).result(timeout=1)
+
+        processor.shutdown()
+        with pytest.raises(RuntimeError, match="shut down"):
+            submit(processor, "stat", tmp_path).result(timeout=1)
+        assert processor.get_stats()["operations_rejected"] == 2
+
+    def test_shutdown_drains_queue(self, tmp_path):
+        processor = BatchFileProcessor(batch_size=100, batch_timeout=10.0)
+        future = submit(processor, "write", tmp_path / "late.md", "data")
+        processor.shutdown()
+        assert future.result(timeout=1) is True
@@ -0,0 +1,136 @@
+"""
+Unit tests for compiled boundary validators and the batch validation API.
+"""
+
+import json
+import uuid
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import jsonschema
+import pytest
+
+from tools.scribe.core.boundary_validator import (
+    BoundaryType,
+    compile_fast_check,
+    create_boundary_validator,
+)
+
+L1_SCHEMA_DIR = Path(__file__).resolve().parents[3] / "tools" / "scribe" / "schemas" / "l1"
+
+FILE_EVENTS = [
+    {"event_id": str(uuid.uuid4()), "type": "modified", "file_path": "/kb/a.md", "timestamp": 1.5},
+    {"event_id": str(uuid.uuid4()), "type": "moved", "file_path": "/kb/b.md", "old_path": "/kb/a.md", "timestamp": 2},
+    {"event_id": "x", "type": "renamed", "file_path": "/kb/a.md", "timestamp": 1.0},
+    {"event_id": "x", "type": "created", "file_path": "", "timestamp": 1.0},
+    {"event_id": "x", "type": "created", "file_path": "/kb/a.md", "timestamp": -1},
+    {"event_id": "x", "type": "created", "file_path": "/kb/a.md", "timestamp": True},
+    {"event_id": "x", "type": "created", "file_path": "/kb/a.md", "old_path": None, "timestamp": 1},
+    {"event_id": "x", "type": "created", "timestamp": 1},
+    {"test": "data"},
+    ["not", "an", "object"],
+]
+
+
+def jsonschema_outcome(data, schema):
+    try:
+        jsonschema.validate(data, schema)
+        return True, []
+    except jsonschema.ValidationError as e:
+        return False, [f"Validation failed: {e.message}"]
+
+
+class TestCompiledValidation:
+    def test_results_match_jsonschema_validate(self):
+        validator = create_boundary_validator()
+        schema = validator.schemas["l1_file_system_input"]
+        for event in FILE_EVENTS:
+            result = validator.validate_l1_input(event, "file_system")
+            assert (result.valid, result.errors) == jsonschema_outcome(event, schema), event
+
+    def test_fast_check_agrees_with_jsonschema_on_shipped_schemas(self):
+        samples = [None, True, 0, 1.5, "", "x", [], ["a"], {}, {"path": "a"}, {"event_id": "1", "path": "p",
+                   "operation": "modify", "ts": "2025-01-01T00:00:00Z"}, {"size": -1}, {"extra": 1}]
+        for schema_file in sorted(L1_SCHEMA_DIR.glob("*.json")):
+            schema = json.loads(schema_file.read_text(encoding="utf-8"))
+            check = compile_fast_check(schema)
+            if check is None:
+                continue
+            for sample in samples:
+                assert check(sample) == jsonschema_outcome(sample, schema)[0], (schema_file.name, sample)
+
+    def test_unsupported_keywords_fall_back(self):
+        assert compile_fast_check({"type": "string", "pattern": "^a"}) is None
+        assert compile_fast_check({"properties": {"a": {"$ref": "#/defs/x"}}}) is None
+        assert compile_fast_check({"enum": [1, True]}) is None
+
+    def test_schema_checked_and_compiled_once(self):
+        validator = create_boundary_validator()
+        with patch.object(jsonschema.Draft202012Validator, "check_schema",
+                          wraps=jsonschema.Draft202012Validator.check_schema) as check_schema:
+            for _ in range(50):
+                validator.validate_l1_input(FILE_EVENTS[0], "file_system")
+        assert check_schema.call_count == 1
+
+    def test_replaced_and_registered_schemas_are_recompiled(self):
+        validator = create_boundary_validator()
+        data = {"name": "x"}
+        validator.register_schema("custom", {"type": "object", "required": ["name"]})
+        assert validator.validate_custom_boundary(data, "custom", BoundaryType.L2_CORE, "c").valid
+
+        validator.schemas["custom"] = {"type": "object", "required": ["id"]}
+        assert not validator.validate_custom_boundary(data, "custom", BoundaryType.L2_CORE, "c").valid
+
+        validator.register_schema("custom", {"type": "object"})
+        assert validator.validate_custom_boundary(data, "custom", BoundaryType.L2_CORE, "c").valid
+
+    def test_invalid_schema_reports_schema_error(self):
+        validator = create_boundary_validator()
+        validator.register_schema("broken", {"type": "no-such-type"})
+        result = validator.validate_custom_boundary({}, "broken", BoundaryType.L2_CORE, "c")
+        assert not result.valid
+        assert result.errors[0].startswith("Schema error:")
+
+
+class TestValidateMany:
+    def test_per_item_results_and_aggregated_metrics(self):
+        observability = Mock()
+        validator = create_boundary_validator(observability_port=observability)
+        schema = validator.schemas["l1_file_system_input"]
+
+        results = validator.validate_l1_many(FILE_EVENTS, "file_system")
+
+        assert [(r.valid, r.errors) for r in results] == [jsonschema_outcome(e, schema) for e in FILE_EVENTS]
+        valid = sum(r.valid for r in results)
+        metrics = {call.args[0]: call.args[1] for call in observability.emit_metric.call_args_list}
+        assert observability.emit_metric.call_count == 2
+        assert metrics["hma_boundary_validations_total"] == valid
+        assert metrics["hma_boundary_validation_errors_total"] == len(FILE_EVENTS) - valid
+        observability.record_boundary_crossing.assert_called_once()
+
+    def test_missing_schema_and_empty_batch(self):
+        observability = Mock()
+        validator = create_boundary_validator(observability_port=observability)
+
+        assert validator.validate_l1_many([], "file_system") == []
+        results = validator.validate_l1_many([{}, {}], "unknown")
+        assert [r.valid for r in results] == [False, False]
+        assert "No schema found" in results[0].errors[0]
+        observability.emit_metric.assert_called_once_with(
+            "hma_boundary_validation_errors_total", 2.0,
+            {"boundary_type": "l1_interface", "error_type": "schema_missing"})
+
+
+@pytest.mark.parametrize("schema,value,expected", [
+    ({"type": "integer"}, 3.0, True),
+    ({"type": "integer"}, 3.5, False),
+    ({"type": "number"}, False, False),
+    ({"type": ["string", "null"]}, None, True),
+    ({"additionalProperties": False, "properties": {"a": {}}}, {"a": 1, "b": 2}, False),
+    ({"items": {"type": "string"}, "minItems": 1}, ["a", "b"], True),
+    ({"exclusiveMinimum": 0}, 0, False),
+    ({"minLength": 2}, 5, True),
+])
+def test_fast_check_keyword_semantics(schema, value, expected):
+    assert compile_fast_check(schema)(value) is expected
+    assert jsonschema_outcome(value, schema)[0] is expected
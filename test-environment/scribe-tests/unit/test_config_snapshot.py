@@ -0,0 +1,111 @@
+"""
+Unit tests for immutable configuration snapshots in ConfigManager.
+"""
+
+import copy
+import json
+import pickle
+from pathlib import Path
+
+import pytest
+
+from tools.scribe.core.config_manager import (
+    ConfigManager,
+    ConfigSnapshot,
+    thaw_config,
+)
+
+project_root = Path(__file__).parent.parent.parent.parent
+SCHEMA_PATH = project_root / "tools" / "scribe" / "schemas" / "scribe_config.schema.json"
+BASE_CONFIG_PATH = project_root / "tools" / "scribe" / "config" / "config.json"
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    config = json.loads(BASE_CONFIG_PATH.read_text(encoding="utf-8"))
+    config["security"]["allowed_commands"] = ["git"]
+    target = tmp_path / "config.json"
+    target.write_text(json.dumps(config), encoding="utf-8")
+    return target
+
+
+@pytest.fixture
+def manager(config_file):
+    cm = ConfigManager(config_path=str(config_file), schema_path=str(SCHEMA_PATH), auto_reload=False)
+    yield cm
+    cm.stop()
+
+
+class TestConfigSnapshot:
+    def test_snapshot_is_deeply_frozen(self, manager):
+        snapshot = manager.get_config()
+        assert isinstance(snapshot, ConfigSnapshot)
+        assert isinstance(snapshot, dict)
+
+        with pytest.raises(TypeError):
+            snapshot["config_version"] = "x"
+        with pytest.raises(TypeError):
+            snapshot["security"]["audit_enabled"] = False
+        with pytest.raises(TypeError):
+            snapshot["security"]["allowed_commands"].append("rm")
+
+    def test_reads_share_one_snapshot(self, manager):
+        assert manager.get_config() is manager.get_config()
+        assert manager.get_security_settings() is manager.get_config()["security"]
+
+    def test_dotted_lookup_is_cached_per_snapshot(self, manager):
+        assert manager.get("security.allowed_commands") == ["git"]
+        assert manager.get("security.missing", "fallback") == "fallback"
+        assert manager.get("security.missing") is None
+        assert "security.allowed_commands" in manager.snapshot._lookup_cache
+
+    def test_reload_publishes_new_generation(self, manager, config_file):
+        received = []
+        manager.add_change_callback(received.append)
+        first = manager.snapshot
+        assert manager.generation == first.generation == 1
+
+        config = thaw_config(first)
+        config["security"]["allowed_commands"] = ["git", "python"]
+        config_file.write_text(json.dumps(config), encoding="utf-8")
+        manager._load_and_validate_config()
+
+        assert manager.generation == 2
+        assert received and received[-1] is manager.snapshot
+        assert received[-1].generation == 2
+        assert manager.get("security.allowed_commands") == ["git", "python"]
+        # Readers still holding the old snapshot see a consistent old view
+        assert first.lookup("security.allowed_commands") == ["git"]
+
+    def test_failed_reload_keeps_snapshot(self, manager, config_file):
+        before = manager.snapshot
+        config_file.write_text("{not json", encoding="utf-8")
+        manager._load_and_validate_config()
+        assert manager.snapshot is before
+        assert manager.generation == 1
+
+    def test_snapshot_copy_serialise_and_thaw(self, manager):
+        snapshot = manager.snapshot
+        assert copy.deepcopy(snapshot) is snapshot
+        assert json.loads(json.dumps(snapshot)) == thaw_config(snapshot)
+
+        restored = pickle.loads(pickle.dumps(snapshot))
+        assert restored == snapshot
+        assert restored.generation == snapshot.generation
+
+        mutable = thaw_config(snapshot)
+        mutable["security"]["allowed_commands"].append("python")
+        assert snapshot["security"]["allowed_commands"] == ["git"]
+
+
+class TestRuntimeStatePaths:
+    def test_scan_cache_defaults_to_state_dir(self, manager, monkeypatch, tmp_path):
+        monkeypatch.setenv("SCRIBE_STATE_DIR", str(tmp_path / "state"))
+        assert manager.get_plugin_scan_cache_path() == str(tmp_path / "state" / "plugin_scan_cache.json")
+
+    def test_scan_cache_can_be_disabled(self, manager, config_file):
+        config = json.loads(config_file.read_text(encoding="utf-8"))
+        config["plugins"]["scan_cache_path"] = None
+        config_file.write_text(json.dumps(config), encoding="utf-8")
+        manager._load_and_validate_config()
+        assert manager.get_plugin_scan_cache_path() is None
@@ -0,0 +1,180 @@
+"""
+Unit tests for the stack sampler and the health server's /debug endpoints.
+"""
+
+import asyncio
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from tools.scribe.core.async_processor import AsyncProcessor
+from tools.scribe.core.health_monitor import (
+    HealthMonitor,
+    get_health_monitor,
+    initialize_health_monitor,
+    shutdown_health_monitor,
+)
+from tools.scribe.core.stack_sampler import StackSampler
+
+
+def busy_bench_loop(stop):
+    while not stop.is_set():
+        sum(range(1000))
+
+
+@pytest.fixture
+def busy_thread():
+    stop = threading.Event()
+    thread = threading.Thread(target=busy_bench_loop, args=(stop,), name="busy-worker", daemon=True)
+    thread.start()
+    yield thread
+    stop.set()
+    thread.join()
+
+
+def start_monitor(**kwargs):
+    monitor = HealthMonitor(port=0, **kwargs)
+    monitor.start()
+    base_url = f"http://127.0.0.1:{monitor._http_server.server_address[1]}"
+    return monitor, base_url
+
+
+def get(url):
+    try:
+        with urllib.request.urlopen(url, timeout=10) as response:
+            return response.status, dict(response.headers), response.read().decode("utf-8")
+    except urllib.error.HTTPError as e:
+        return e.code, dict(e.headers), e.read().decode("utf-8")
+
+
+class TestStackSampler:
+    def test_samples_busy_thread_and_reports_overhead(self, busy_thread):
+        result = StackSampler(interval=0.002).profile(0.3)
+
+        assert result.samples > 10
+        assert 0.25 < result.duration < 1.0
+        assert result.sampler_cpu_seconds >= 0
+        busy = [frames for (thread, frames), _ in result.stacks.items() if thread == "busy-worker"]
+        assert any(frames[-1][0] == "busy_bench_loop" for frames in busy)
+        assert all(thread != "ScribeStackSampler" for thread, _ in result.stacks)
+
+        collapsed = result.to_collapsed()
+        assert any(line.startswith("busy-worker;") and "busy_bench_loop" in line for line in collapsed.splitlines())
+
+    def test_speedscope_output_references_shared_frames(self, busy_thread):
+        document = StackSampler(interval=0.002).profile(0.1).to_speedscope()
+
+        frames = document["shared"]["frames"]
+        assert document["scribe_sampler"]["samples"] > 0
+        for profile in document["profiles"]:
+            assert profile["type"] == "sampled"
+            assert len(profile["samples"]) == len(profile["weights"])
+            assert all(0 <= index < len(frames) for sample in profile["samples"] for index in sample)
+
+    def test_rejects_concurrent_profiles(self):
+        sampler = StackSampler(interval=0.01)
+        worker = threading.Thread(target=sampler.profile, args=(0.3,))
+        worker.start()
+        time.sleep(0.05)
+        with pytest.raises(RuntimeError, match="already running"):
+            sampler.profile(0.1)
+        worker.join()
+
+
+class TestDebugEndpoints:
+    def test_disabled_by_default(self):
+        monitor, base_url = start_monitor()
+        try:
+            assert get(f"{base_url}/debug/profile?seconds=0.1")[0] == 404
+            assert get(f"{base_url}/debug/tasks")[0] == 404
+            assert get(f"{base_url}/health")[0] in (200, 503)
+        finally:
+            monitor.stop()
+
+    def test_profile_endpoint_formats_and_validation(self, busy_thread):
+        monitor, base_url = start_monitor(debug_endpoints=True, max_profile_seconds=1.0)
+        try:
+            status, headers, body = get(f"{base_url}/debug/profile?seconds=0.2")
+            assert status == 200
+            assert headers["Content-Type"].startswith("text/plain")
+            assert float(headers["X-Sampler-Overhead-Percent"]) >= 0
+            assert "busy_bench_loop" in body
+
+            status, _, body = get(f"{base_url}/debug/profile?seconds=0.1&format=speedscope")
+            assert status == 200
+            assert "sampler_overhead_percent" in json.loads(body)["scribe_sampler"]
+
+            assert get(f"{base_url}/debug/profile?seconds=5")[0] == 400
+            assert get(f"{base_url}/debug/profile?seconds=abc")[0] == 400
+            assert get(f"{base_url}/debug/profile?seconds=0.1&format=pprof")[0] == 400
+        finally:
+            monitor.stop()
+
+    def test_tasks_endpoint_dumps_threads_and_registered_loops(self, busy_thread):
+        monitor, base_url = start_monitor(debug_endpoints=True)
+        loop = asyncio.new_event_loop()
+        ready = threading.Event()
+
+        async def parked_coroutine():
+            await asyncio.sleep(30)
+
+        def run_loop():
+            asyncio.set_event_loop(loop)
+            loop.create_task(parked_coroutine(), name="parked")
+            loop.call_soon(ready.set)
+            loop.run_forever()
+
+        loop_thread = threading.Thread(target=run_loop, daemon=True)
+        loop_thread.start()
+        try:
+            ready.wait(2)
+            monitor.register_event_loop(loop)
+            status, _, body = get(f"{base_url}/debug/tasks")
+            dump = json.loads(body)
+
+            assert status == 200
+            busy = next(t for t in dump["threads"] if t["name"] == "busy-worker")
+            assert any("busy_bench_loop" in line for line in busy["stack"])
+            parked = next(t for t in dump["asyncio_tasks"] if t["name"] == "parked")
+            assert parked["coroutine"].endswith("parked_coroutine")
+            assert parked["done"] is False
+        finally:
+            for task in asyncio.all_tasks(loop):
+                loop.call_soon_threadsafe(task.cancel)
+            loop.call_soon_threadsafe(loop.stop)
+            loop_thread.join(2)
+            loop.close()
+            monitor.stop()
+
+
+class TestDebugConfigWiring:
+    def test_config_section_reaches_monitor(self):
+        initialize_health_monitor(port=0, debug_config={"enabled": True, "max_profile_seconds": 5, "sample_interval_ms": 2})
+        try:
+            monitor = get_health_monitor()
+            assert monitor.debug_endpoints is True
+            assert monitor.max_profile_seconds == 5
+            base_url = f"http://127.0.0.1:{monitor._http_server.server_address[1]}"
+            assert get(f"{base_url}/debug/tasks")[0] == 200
+        finally:
+            shutdown_health_monitor()
+        assert get_health_monitor() is None
+
+    def test_async_processor_registers_its_loop(self):
+        monitor = initialize_health_monitor(port=0, debug_config={"enabled": True})
+        processor = AsyncProcessor(max_workers=1)
+        try:
+            processor.start()
+            deadline = time.time() + 5
+            while processor._loop is None and time.time() < deadline:
+                time.sleep(0.01)
+            while processor._loop not in monitor._event_loops.loops() and time.time() < deadline:
+                time.sleep(0.01)
+            assert processor._loop in monitor._event_loops.loops()
+        finally:
+            processor.stop()
+            shutdown_health_monitor()
@@ -0,0 +1,154 @@
+"""
+Unit tests for the segmented dead-letter queue and its replayer.
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from tools.scribe.core.dlq import DLQConfig, DLQReplayer, DeadLetterQueue, INDEX_ENTRY, MANIFEST
+
+
+@pytest.fixture
+def make_dlq(tmp_path):
+    queues = []
+
+    def make(**config):
+        dlq = DeadLetterQueue(tmp_path, DLQConfig(**config))
+        queues.append(dlq)
+        return dlq
+
+    yield make
+    for dlq in queues:
+        dlq.close()
+
+
+def fill(dlq, count, surface="nats"):
+    for i in range(count):
+        dlq.write(surface, f"e-{i}", [f"error {i}"], {"n": i})
+    assert dlq.flush()
+
+
+class FakeEventBus:
+    def __init__(self, fail_at=None):
+        self.published = []
+        self.fail_at = fail_at
+
+    async def publish_event(self, event_type, event_data, target=None, correlation_id=None):
+        if self.fail_at is not None and len(self.published) == self.fail_at:
+            return False
+        self.published.append((event_type, event_data, correlation_id))
+        return True
+
+
+class TestDeadLetterQueue:
+    def test_query_by_surface_event_id_and_time(self, make_dlq):
+        dlq = make_dlq()
+        fill(dlq, 5, "nats")
+        midpoint = time.time()
+        time.sleep(0.01)
+        fill(dlq, 3, "file_system")
+
+        assert [e.event_id for e in dlq.query(surface="file_system")] == ["e-0", "e-1", "e-2"]
+        assert [e.surface for e in dlq.query(event_id="e-4")] == ["nats"]
+        assert [e.surface for e in dlq.query(since=midpoint)] == ["file_system"] * 3
+        assert len(list(dlq.query(until=midpoint))) == 5
+        assert len(list(dlq.query(limit=2))) == 2
+        assert dlq.stats()["written"] == 8
+
+    def test_rotation_retention_and_reopen(self, make_dlq, tmp_path):
+        dlq = make_dlq(max_segment_bytes=400, max_segments=3)
+        for _ in range(10):
+            fill(dlq, 5)
+        stats = dlq.stats()
+        dlq.close()
+
+        manifest = json.loads((tmp_path / MANIFEST).read_text())
+        assert stats["rotations"] == 10
+        assert len(manifest["segments"]) == 3
+        assert len(list(tmp_path.glob("dlq.0*.jsonl"))) == 3
+
+        reopened = make_dlq(max_segment_bytes=400, max_segments=3)
+        entries = list(reopened.query())
+        assert len(entries) == 15
+        assert [e.segment for e in entries] == sorted(e.segment for e in entries)
+        after = entries[6].position
+        assert [e.position for e in reopened.query(after=after)] == [e.position for e in entries[7:]]
+
+    def test_unindexed_and_torn_active_segment_is_recovered(self, make_dlq, tmp_path):
+        lines = [json.dumps({"ts": 1700000000 + i, "surface": "file_system", "event_id": f"old-{i}",
+                             "errors": ["x"], "payload": {}}) for i in range(3)]
+        (tmp_path / "dlq.jsonl").write_text("\n".join(lines) + "\n" + '{"ts": 17000', encoding="utf-8")
+
+        dlq = make_dlq()
+        assert [e.event_id for e in dlq.query()] == ["old-0", "old-1", "old-2"]
+        fill(dlq, 1)
+        assert [e.event_id for e in dlq.query()][-2:] == ["old-2", "e-0"]
+        assert [e.event_id for e in dlq.query(until=1700000001)] == ["old-0", "old-1"]
+
+    def test_full_queue_drops_instead_of_blocking(self, tmp_path):
+        dlq = DeadLetterQueue(tmp_path, DLQConfig(max_queue_size=2))
+        dlq._stop.set()
+        dlq._thread.join()
+        results = [dlq.write("nats", f"e-{i}", [], {}) for i in range(5)]
+        assert results == [True, True, False, False, False]
+        assert dlq.stats()["dropped_queue_full"] == 3
+
+    def test_read_only_queue_does_not_write(self, make_dlq, tmp_path):
+        fill(make_dlq(), 2)
+        reader = DeadLetterQueue(tmp_path, read_only=True)
+        assert [e.event_id for e in reader.query()] == ["e-0", "e-1"]
+        with pytest.raises(RuntimeError):
+            reader.write("nats", "e", [], {})
+        reader.close()
+
+    def test_two_writers_share_a_directory(self, make_dlq, tmp_path):
+        first, second = make_dlq(max_segment_bytes=1500), make_dlq(max_segment_bytes=1500)
+        for _ in range(4):
+            fill(first, 5, "nats")
+            fill(second, 5, "http")
+
+        for dlq in (first, second, DeadLetterQueue(tmp_path, read_only=True)):
+            entries = list(dlq.query())
+            assert len(entries) == 40
+            assert sum(e.surface == "http" for e in entries) == 20
+            assert len({e.position for e in entries}) == 40
+
+    def test_undecodable_index_entry_is_skipped(self, make_dlq, tmp_path):
+        dlq = make_dlq()
+        fill(dlq, 2)
+        index = tmp_path / "dlq.jsonl.idx"
+        entry = index.read_bytes()[:INDEX_ENTRY.size]
+        ts, offset, length, s_hash, e_hash = INDEX_ENTRY.unpack(entry)
+        index.write_bytes(index.read_bytes() + INDEX_ENTRY.pack(ts, offset + 3, length, s_hash, e_hash))
+
+        assert [e.event_id for e in dlq.query()] == ["e-0", "e-1"]
+
+
+class TestDLQReplayer:
+    def test_replay_is_rate_limited_and_resumes_from_checkpoint(self, make_dlq, tmp_path):
+        dlq = make_dlq()
+        fill(dlq, 6)
+        bus = FakeEventBus(fail_at=4)
+        replayer = DLQReplayer(dlq, bus, rate_per_second=100, checkpoint_every=2)
+
+        start = time.monotonic()
+        first = asyncio.run(replayer.replay(surface="nats"))
+        elapsed = time.monotonic() - start
+        assert first["stopped_on_failure"] and first["replayed"] == 4
+        assert elapsed >= 0.03
+        assert bus.published[0][0] == "dlq_replay"
+        assert bus.published[0][2] == "e-0"
+        assert bus.published[0][1]["payload"] == {"n": 0}
+
+        bus.fail_at = None
+        second = asyncio.run(replayer.replay(surface="nats"))
+        assert (second["replayed"], second["replayed_total"]) == (2, 6)
+        assert [c for _, _, c in bus.published] == [f"e-{i}" for i in range(6)]
+
+        # A different filter does not reuse the checkpoint
+        third = asyncio.run(replayer.replay(event_id="e-5"))
+        assert third["replayed"] == 1
+        assert json.loads((tmp_path / "dlq.replay-checkpoint.json").read_text())["filter"]["event_id"] == "e-5"
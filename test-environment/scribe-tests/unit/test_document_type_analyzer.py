@@ -0,0 +1,182 @@
+"""
+Unit tests for the document type analyzer's feature accumulator and its
+incremental --state-file mode.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from tools.analysis.document_type_analyzer import (
+    FeatureAccumulator,
+    UniversalDocumentTypeAnalyzer,
+    extract_file_features,
+)
+
+project_root = Path(__file__).parent.parent.parent.parent
+CLI_PATH = project_root / "tools" / "analysis" / "analyze_document_types.py"
+
+STANDARD_DOC = """---
+title: Naming Standard
+info_type: standard-definition
+criticality: P1
+standard_id: NAM-01
+date_created: 2025-06-17
+tags: [naming, core]
+---
+# Naming Standard
+
+## STANDARD DEFINITION
+
+Files use kebab-case.
+"""
+
+REPORT_DOC = """---
+title: Weekly Report
+info_type: technical-report
+tags: [report]
+---
+# Weekly Report
+
+## EXECUTIVE SUMMARY
+
+| metric | value |
+|--------|-------|
+"""
+
+
+def write_doc(directory: Path, name: str, content: str) -> Path:
+    path = directory / name
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+def counter_state(accumulator: FeatureAccumulator) -> dict:
+    return {
+        "field_usage_matrix": accumulator.field_usage_matrix(),
+        "aggregate_statistics": accumulator.aggregate_statistics(),
+    }
+
+
+def test_extract_file_features_keeps_per_file_frontmatter(tmp_path):
+    record = extract_file_features(write_doc(tmp_path, "naming.md", STANDARD_DOC))
+
+    metadata = record["metadata"]
+    assert metadata["field_count"] == 6
+    assert metadata["info_type"] == "standard-definition"
+    assert metadata["has_standard_id"] is True
+    # Dates are stringified so the record survives a JSON round trip
+    assert metadata["frontmatter_data"]["date_created"] == "2025-06-17"
+    assert metadata["field_values"]["tags"] == ["naming", "core"]
+    assert json.loads(json.dumps(record)) == record
+
+
+def test_split_records_expose_frontmatter_in_content_and_metadata_views(tmp_path):
+    accumulator = FeatureAccumulator()
+    accumulator.add(extract_file_features(write_doc(tmp_path, "naming.md", STANDARD_DOC)))
+
+    analyzer = UniversalDocumentTypeAnalyzer(str(tmp_path))
+    content, _, metadata, _ = analyzer._split_feature_records(accumulator)
+
+    file_key = str(tmp_path / "naming.md")
+    assert content[file_key]["current_frontmatter"]["title"] == "Naming Standard"
+    assert metadata[file_key]["frontmatter_data"] == content[file_key]["current_frontmatter"]
+    assert metadata[file_key]["field_count"] == 6
+
+
+def test_accumulator_add_and_remove_are_inverse(tmp_path):
+    standard = extract_file_features(write_doc(tmp_path, "naming.md", STANDARD_DOC))
+    report = extract_file_features(write_doc(tmp_path, "report.md", REPORT_DOC))
+
+    only_standard = FeatureAccumulator()
+    only_standard.add(standard)
+
+    accumulator = FeatureAccumulator()
+    accumulator.add(standard)
+    accumulator.add(report)
+    assert accumulator.field_usage["tags"] == 2
+    assert accumulator.field_values["info_type"]["technical-report"] == 1
+
+    accumulator.remove(report["path"])
+    assert counter_state(accumulator) == counter_state(only_standard)
+    assert "technical-report" not in accumulator.field_values["info_type"]
+
+    # Re-adding a path replaces its previous contribution instead of double counting
+    accumulator.add(standard)
+    assert accumulator.field_usage["title"] == 1
+
+
+def test_accumulator_merge_matches_sequential_add(tmp_path):
+    standard = extract_file_features(write_doc(tmp_path, "naming.md", STANDARD_DOC))
+    report = extract_file_features(write_doc(tmp_path, "report.md", REPORT_DOC))
+
+    sequential = FeatureAccumulator()
+    sequential.add(standard)
+    sequential.add(report)
+
+    left, right = FeatureAccumulator(), FeatureAccumulator()
+    left.add(standard)
+    right.add(report)
+    merged = left.merge(right)
+
+    assert set(merged.records) == set(sequential.records)
+    assert counter_state(merged) == counter_state(sequential)
+
+
+def test_accumulator_state_round_trip(tmp_path):
+    accumulator = FeatureAccumulator()
+    accumulator.add(extract_file_features(write_doc(tmp_path, "naming.md", STANDARD_DOC)))
+    accumulator.add(extract_file_features(write_doc(tmp_path, "report.md", REPORT_DOC)))
+
+    state_path = tmp_path / "state" / "analysis-state.json"
+    accumulator.save(state_path)
+    restored = FeatureAccumulator.load(state_path)
+
+    assert restored.records == accumulator.records
+    assert counter_state(restored) == counter_state(accumulator)
+
+
+def test_state_from_other_format_version_is_ignored(tmp_path):
+    state_path = tmp_path / "analysis-state.json"
+    state_path.write_text(json.dumps({"format_version": -1, "records": [{"path": "x"}]}), encoding="utf-8")
+
+    assert FeatureAccumulator.load(state_path).records == {}
+
+
+def run_cli(docs_dir: Path, state_path: Path, output_path: Path) -> subprocess.CompletedProcess:
+    result = subprocess.run(
+        [sys.executable, str(CLI_PATH), "--target-paths", str(docs_dir),
+         "--state-file", str(state_path), "--output", str(output_path)],
+        cwd=project_root, capture_output=True, text=True, timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+    return result
+
+
+def test_cli_state_file_round_trip_rescans_only_changed_files(tmp_path):
+    docs_dir = tmp_path / "docs"
+    docs_dir.mkdir()
+    write_doc(docs_dir, "naming.md", STANDARD_DOC)
+    report = write_doc(docs_dir, "report.md", REPORT_DOC)
+    state_path = tmp_path / "analysis-state.json"
+    output_path = tmp_path / "analysis.json"
+
+    first = run_cli(docs_dir, state_path, output_path)
+    assert "2 files found, 2 to scan, 0 reused" in first.stderr
+    first_results = json.loads(output_path.read_text(encoding="utf-8"))
+
+    second = run_cli(docs_dir, state_path, output_path)
+    assert "2 files found, 0 to scan, 2 reused" in second.stderr
+    second_results = json.loads(output_path.read_text(encoding="utf-8"))
+    assert second_results["field_usage_matrix"] == first_results["field_usage_matrix"]
+    assert second_results["aggregate_statistics"] == first_results["aggregate_statistics"]
+
+    report.write_text(REPORT_DOC.replace("tags: [report]", "tags: [report, weekly]"), encoding="utf-8")
+    stat = report.stat()
+    os.utime(report, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    third = run_cli(docs_dir, state_path, output_path)
+    assert "2 files found, 1 to scan, 1 reused" in third.stderr
+    third_results = json.loads(output_path.read_text(encoding="utf-8"))
+    assert "weekly" in third_results["field_usage_matrix"]["value_patterns"]["tags"]
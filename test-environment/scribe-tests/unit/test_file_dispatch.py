@@ -0,0 +1,183 @@
+"""
+Unit tests for the per-file transactional action pipeline (ActionDispatcher.dispatch_file).
+"""
+
+import os
+import re
+import stat
+from unittest.mock import Mock, patch
+
+import pytest
+
+from tools.scribe.actions.base import BaseAction
+from tools.scribe.core import action_dispatcher as dispatcher_module
+from tools.scribe.core.action_dispatcher import ActionDispatcher
+from tools.scribe.core.plugin_loader import PluginInfo
+from tools.scribe.core.rule_processor import CompiledRule, RuleMatch
+
+
+class KwargsAction(BaseAction):
+    """Accepts the keyword arguments ActionDispatcher instantiates actions with."""
+
+    def __init__(self, action_type, params, **dependencies):
+        self.action_type = action_type
+        self.params = params
+
+
+class ReplaceMatchAction(KwargsAction):
+    def execute(self, file_content, match, file_path, params):
+        return file_content[:match.start()] + params["replacement"] + file_content[match.end():]
+
+
+class PrependAction(KwargsAction):
+    def execute(self, file_content, match, file_path, params):
+        return params["text"] + file_content
+
+
+class ConcurrentEditAction(KwargsAction):
+    def execute(self, file_content, match, file_path, params):
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write("edited elsewhere, longer than before\n")
+        return file_content.replace("x", "y")
+
+
+ACTIONS = {"replace": ReplaceMatchAction, "prepend": PrependAction, "concurrent": ConcurrentEditAction}
+
+
+def make_rule(rule_id, pattern, action_type, **params):
+    return CompiledRule({
+        "id": rule_id, "name": rule_id, "enabled": True, "file_glob": "*.md",
+        "trigger_pattern": pattern, "actions": [{"type": action_type, "params": params}],
+    })
+
+
+def matches_for(rules, path, content):
+    return [RuleMatch(rule, m, str(path), content, "evt-1") for rule in rules for m in rule.find_matches(content)]
+
+
+@pytest.fixture
+def dispatcher(tmp_path):
+    loader = Mock()
+    loader.get_plugin.side_effect = lambda t: PluginInfo(ACTIONS[t], __file__, t) if t in ACTIONS else None
+    loader.get_all_plugins.return_value = {}
+    security = Mock()
+    security.validate_action_params.return_value = (True, None)
+    return ActionDispatcher(loader, Mock(), security, quarantine_path=str(tmp_path / "quarantine"))
+
+
+class TestDispatchFile:
+    def test_all_matches_applied_to_one_buffer_with_one_write(self, dispatcher, tmp_path):
+        path = tmp_path / "doc.md"
+        content = "status: TODO\nitems: TODO TODO\n"
+        path.write_text(content, encoding="utf-8")
+        rules = [
+            make_rule("R1", r"TODO", "replace", replacement="DONE-LONGER"),
+            make_rule("R2", r"^status: .*$", "prepend", text="# header\n"),
+        ]
+
+        with patch.object(dispatcher_module, "atomic_write", wraps=dispatcher_module.atomic_write) as writes:
+            result = dispatcher.dispatch_file(matches_for(rules, path, content))
+
+        expected = "# header\nstatus: DONE-LONGER\nitems: DONE-LONGER DONE-LONGER\n"
+        assert result.success and result.committed
+        assert result.final_content == expected
+        assert path.read_text(encoding="utf-8") == expected
+        assert [r.rule_id for r in result.dispatch_results] == ["R1", "R1", "R1", "R2"]
+        assert writes.call_count == 1
+
+    def test_offsets_recomputed_after_earlier_rule_shifts_content(self, dispatcher, tmp_path):
+        path = tmp_path / "doc.md"
+        content = "a [[X]] b [[Y]]\n"
+        path.write_text(content, encoding="utf-8")
+        rules = [
+            make_rule("R1", r"^a ", "prepend", text="intro line\n"),
+            make_rule("R2", r"\[\[\w\]\]", "replace", replacement="[[LINK]]"),
+        ]
+
+        result = dispatcher.dispatch_file(matches_for(rules, path, content))
+
+        assert result.final_content == "intro line\na [[LINK]] b [[LINK]]\n"
+
+    def test_in_memory_run_leaves_file_untouched(self, dispatcher, tmp_path):
+        path = tmp_path / "doc.md"
+        path.write_text("TODO\n", encoding="utf-8")
+        rule = make_rule("R1", r"TODO", "replace", replacement="DONE")
+
+        result = dispatcher.dispatch_file(matches_for([rule], path, "TODO\n"), write=False)
+
+        assert result.final_content == "DONE\n" and not result.committed
+        assert path.read_text(encoding="utf-8") == "TODO\n"
+
+    def test_concurrent_modification_is_not_overwritten(self, dispatcher, tmp_path):
+        path = tmp_path / "doc.md"
+        path.write_text("x\n", encoding="utf-8")
+        rule = make_rule("R1", r"x", "concurrent")
+
+        result = dispatcher.dispatch_file(matches_for([rule], path, "x\n"))
+
+        assert result.conflict and not result.committed and not result.success
+        assert path.read_text(encoding="utf-8") == "edited elsewhere, longer than before\n"
+        assert dispatcher.get_execution_stats()["write_conflicts"] == 1
+
+    def test_edit_after_rule_processor_read_is_not_overwritten(self, dispatcher, tmp_path):
+        path = tmp_path / "doc.md"
+        path.write_text("TODO\n", encoding="utf-8")
+        rule = make_rule("R1", r"TODO", "replace", replacement="DONE")
+        matches = matches_for([rule], path, "TODO\n")
+        path.write_text("TODO\nappended by the user\n", encoding="utf-8")
+
+        result = dispatcher.dispatch_file(matches)
+
+        assert result.conflict and not result.committed
+        assert path.read_text(encoding="utf-8") == "TODO\nappended by the user\n"
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+    def test_commit_keeps_file_mode(self, dispatcher, tmp_path):
+        path = tmp_path / "doc.md"
+        path.write_text("TODO\n", encoding="utf-8")
+        path.chmod(0o644)
+        rule = make_rule("R1", r"TODO", "replace", replacement="DONE")
+
+        assert dispatcher.dispatch_file(matches_for([rule], path, "TODO\n")).committed
+        assert stat.S_IMODE(path.stat().st_mode) == 0o644
+
+    def test_open_circuit_breaker_rolls_back_and_quarantines(self, dispatcher, tmp_path):
+        path = tmp_path / "doc.md"
+        content = "TODO\nstatus: draft\n"
+        path.write_text(content, encoding="utf-8")
+        rules = [
+            make_rule("R1", r"TODO", "replace", replacement="DONE"),
+            make_rule("R2", r"^status: .*$", "prepend", text="# header\n"),
+        ]
+        breaker = dispatcher.circuit_breaker_manager.get_breaker(rule_id="R2")
+        for _ in range(breaker.failure_threshold):
+            breaker.record_failure(RuntimeError("earlier failure"))
+
+        result = dispatcher.dispatch_file(matches_for(rules, path, content))
+
+        assert result.aborted and not result.committed
+        assert result.final_content == content
+        assert not path.exists()
+        entries = dispatcher.quarantine_store.entries(path=str(path))
+        assert [(e.rule_id, e.reason) for e in entries] == [("R2", "circuit_breaker_open")]
+        assert dispatcher.quarantine_store.blob_path(entries[0].hash).read_text(encoding="utf-8") == content
+        assert dispatcher.get_execution_stats()["circuit_breaker_blocks"] == 1
+
+    def test_requires_matches_for_one_file(self, dispatcher, tmp_path):
+        rule = make_rule("R1", r"x", "replace", replacement="y")
+        with pytest.raises(ValueError):
+            dispatcher.dispatch_file([])
+        mixed = matches_for([rule], tmp_path / "a.md", "x") + matches_for([rule], tmp_path / "b.md", "x")
+        with pytest.raises(ValueError):
+            dispatcher.dispatch_file(mixed)
+
+
+@pytest.mark.parametrize("old,new,span,expected", [
+    ("aa XX bb", "aa XX bb", (3, 5), 5),              # unchanged
+    ("aa XX bb", "aa XX bbcc", (3, 5), 5),            # edit after the match
+    ("aa XX bb", "zzaa XX bb", (3, 5), 7),            # edit before the match shifts it
+    ("aa XX bb", "aa LONGER bb", (3, 5), 9),          # match replaced: resume after the edit
+])
+def test_next_search_position(old, new, span, expected):
+    match = re.compile(re.escape(old[span[0]:span[1]])).search(old, span[0])
+    assert ActionDispatcher._next_search_position(old, new, match) == expected
@@ -0,0 +1,79 @@
+"""
+Unit tests for the shared frontmatter parsing library.
+"""
+
+import pytest
+import yaml
+
+from tools.scribe.utils.frontmatter_parser import (
+    clear_frontmatter_cache,
+    frontmatter_cache_info,
+    load_frontmatter_yaml,
+    parse_frontmatter,
+    remove_frontmatter,
+    split_frontmatter,
+)
+
+DOCUMENT = "---\ntitle: Example\n@id: kb:example\ntags: [a, b]\n---\n\n# Heading\nBody text\n"
+
+
+class TestSplitFrontmatter:
+    def test_offsets_and_lazy_body(self):
+        document = split_frontmatter(DOCUMENT)
+
+        assert document.has_frontmatter
+        assert document.frontmatter_text == "title: Example\n@id: kb:example\ntags: [a, b]\n"
+        assert document.body == "\n# Heading\nBody text\n"
+        assert document.start_line == 2
+        assert document.end_line == 5
+
+    def test_crlf_delimiters(self):
+        document = split_frontmatter("---\r\ntitle: X\r\n---\r\nbody")
+
+        assert document.parse() == {"title": "X"}
+        assert document.body == "body"
+
+    @pytest.mark.parametrize("content", [
+        "no frontmatter",
+        "--- START OF FILE notes.md ---\n# Title\n---\n",
+        "---\ntitle: unterminated\n",
+    ])
+    def test_no_frontmatter(self, content):
+        document = split_frontmatter(content)
+
+        assert not document.has_frontmatter
+        assert document.frontmatter_text is None
+        assert document.body == content
+
+
+class TestParseCache:
+    def setup_method(self):
+        clear_frontmatter_cache()
+
+    def test_repeated_parse_hits_cache(self):
+        load_frontmatter_yaml("title: A\n")
+        load_frontmatter_yaml("title: A\n")
+
+        info = frontmatter_cache_info()
+        assert info["misses"] == 1
+        assert info["hits"] == 1
+
+    def test_results_are_copied_by_default(self):
+        first = load_frontmatter_yaml("tags: [a]\n")
+        first["tags"].append("mutated")
+
+        assert load_frontmatter_yaml("tags: [a]\n") == {"tags": ["a"]}
+
+    def test_errors_are_raised_and_not_cached(self):
+        with pytest.raises(yaml.YAMLError):
+            load_frontmatter_yaml("key: [unclosed\n")
+
+        assert frontmatter_cache_info()["size"] == 0
+
+
+def test_parse_frontmatter_quotes_at_keys():
+    assert parse_frontmatter(DOCUMENT) == {"title": "Example", "@id": "kb:example", "tags": ["a", "b"]}
+
+
+def test_remove_frontmatter():
+    assert remove_frontmatter(DOCUMENT) == "# Heading\nBody text\n"
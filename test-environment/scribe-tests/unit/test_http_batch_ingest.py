@@ -0,0 +1,145 @@
+"""
+Unit tests for NDJSON / JSON-array batch ingest and the pure ASGI L1ValidationMiddleware.
+"""
+
+import json
+import uuid
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from tools.scribe.adapters.http_app import app as http_app
+from tools.scribe.adapters.http_validation import (
+    INGEST_ROUTE,
+    JSONArrayStreamParser,
+    L1ValidationMiddleware,
+    NDJSONStreamParser,
+    get_parsed_body,
+)
+from tools.scribe.core.boundary_validator import create_boundary_validator
+
+
+def event(path="/kb/a.md", **overrides):
+    data = {"event_id": str(uuid.uuid4()), "type": "modified", "file_path": path, "timestamp": 1.0}
+    data.update(overrides)
+    return data
+
+
+def feed_in_chunks(parser, data: bytes, size: int):
+    items = []
+    for offset in range(0, len(data), size):
+        items.extend(parser.feed(data[offset:offset + size], final=offset + size >= len(data)))
+    return items
+
+
+@pytest.fixture
+def ingest_client():
+    received = []
+    http_app.state.event_sink = received.extend
+    with TestClient(http_app) as client:
+        yield client, received
+    http_app.state.event_sink = None
+
+
+class TestBatchIngestRoute:
+    def test_ndjson_items_accepted_and_rejected_individually(self, ingest_client):
+        client, received = ingest_client
+        good = [event("/kb/a.md"), event("/kb/b.md")]
+        lines = [json.dumps(good[0]), '{"broken": ', json.dumps(event(type="touched")), json.dumps(good[1]), ""]
+
+        response = client.post(INGEST_ROUTE, content="\n".join(lines),
+                               headers={"content-type": "application/x-ndjson"})
+
+        body = response.json()
+        assert response.status_code == 200
+        assert (body["accepted"], body["rejected"]) == (2, 2)
+        assert [r["accepted"] for r in body["results"]] == [True, False, False, True]
+        assert [r["index"] for r in body["results"]] == [0, 1, 2, 3]
+        assert body["results"][1]["errors"][0].startswith("Invalid JSON")
+        assert body["results"][2]["errors"][0].startswith("Validation failed")
+        assert received == good
+
+    def test_json_array_body(self, ingest_client):
+        client, received = ingest_client
+        events = [event(f"/kb/{i}.md") for i in range(5)] + [{"type": "created"}]
+
+        body = client.post(INGEST_ROUTE, json=events).json()
+
+        assert (body["accepted"], body["rejected"]) == (5, 1)
+        assert received == events[:5]
+
+    def test_unsupported_content_type_and_oversized_batch(self):
+        app = FastAPI()
+        app.add_middleware(L1ValidationMiddleware, max_batch_items=3)
+
+        @app.post(INGEST_ROUTE)
+        async def ingest(request: Request):
+            return request.state.l1_batch.to_dict()
+
+        client = TestClient(app)
+        assert client.post(INGEST_ROUTE, content="x", headers={"content-type": "text/csv"}).status_code == 415
+        assert client.post(INGEST_ROUTE, json=[event() for _ in range(4)]).status_code == 413
+        assert client.post(INGEST_ROUTE, json=[event() for _ in range(3)]).json()["accepted"] == 3
+
+
+class TestSingleRequestValidation:
+    def test_middleware_is_pure_asgi(self):
+        assert not issubclass(L1ValidationMiddleware, BaseHTTPMiddleware)
+
+    def test_parsed_body_is_stashed_and_replayed(self):
+        validator = create_boundary_validator()
+        validator.register_schema("l1_http_input", {"type": "object", "required": ["body"]})
+        app = FastAPI()
+        app.add_middleware(L1ValidationMiddleware, validator=validator)
+
+        @app.post("/echo")
+        async def echo(request: Request):
+            return {"stashed": get_parsed_body(request), "replayed": await request.json()}
+
+        response = TestClient(app).post("/echo", json={"a": 1})
+        assert response.json() == {"stashed": {"a": 1}, "replayed": {"a": 1}}
+
+    def test_invalid_request_rejected_without_reaching_app(self):
+        validator = create_boundary_validator()
+        validator.register_schema("l1_http_input", {"type": "object",
+                                                    "properties": {"body": {"required": ["name"]}}})
+        app = FastAPI()
+        app.add_middleware(L1ValidationMiddleware, validator=validator)
+        calls = []
+
+        @app.post("/things")
+        async def things():
+            calls.append(1)
+            return {}
+
+        response = TestClient(app).post("/things", json={"other": 1})
+        assert response.status_code == 400 and response.json() == {"error": "invalid"}
+        assert calls == []
+
+
+class TestStreamParsers:
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 1000])
+    def test_json_array_matches_json_loads_at_any_chunking(self, chunk_size):
+        values = [{"a": [1, 2, {"b": "é,]"}]}, 12345, -1.5e3, "s", None, True, [], {}]
+        items = feed_in_chunks(JSONArrayStreamParser(), json.dumps(values).encode("utf-8"), chunk_size)
+        assert items == [(value, None) for value in values]
+
+    @pytest.mark.parametrize("body,expected_error", [
+        (b'{"a": 1}', "Expected a JSON array"),
+        (b'[1, 2', "Unexpected end of JSON array"),
+        (b'[1 2]', "Expected ',' or ']'"),
+        (b'[1, 2] 3', "Unexpected data after JSON array"),
+        (b'[1, }]', "Invalid JSON"),
+    ])
+    def test_json_array_errors_reported_once(self, body, expected_error):
+        items = feed_in_chunks(JSONArrayStreamParser(), body, 2)
+        errors = [error for _, error in items if error]
+        assert len(errors) == 1 and errors[0].startswith(expected_error)
+
+    def test_ndjson_lines_split_across_chunks(self):
+        data = b'{"a": 1}\r\n\n[2]\nnot json\n"last"'
+        items = feed_in_chunks(NDJSONStreamParser(), data, 4)
+        assert [value for value, _ in items] == [{"a": 1}, [2], None, "last"]
+        assert items[2][1].startswith("Invalid JSON")
@@ -0,0 +1,59 @@
+"""
+Unit tests for deferred heavy imports and the CLI paths that rely on them.
+
+Timing budgets are checked by benchmarks/bench_import_time.py; these tests
+only assert which modules each entry point imports, which is deterministic.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from tools.scribe.main import main
+
+BUDGET = Path(__file__).resolve().parents[2] / "benchmarks" / "import_budget.json"
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+CHECK_IMPORTS = '''
+import json, sys
+import {module}
+deferred = {deferred!r}
+print(json.dumps([p for p in deferred if any(m == p or m.startswith(p + ".") for m in sys.modules)]))
+'''
+
+
+def budget_entries():
+    return json.loads(BUDGET.read_text(encoding="utf-8"))["modules"].items()
+
+
+@pytest.mark.parametrize("module,spec", budget_entries(), ids=[m for m, _ in budget_entries()])
+def test_entry_point_does_not_import_deferred_modules(module, spec):
+    result = subprocess.run(
+        [sys.executable, "-c", CHECK_IMPORTS.format(module=module, deferred=spec["deferred"])],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, check=True)
+    assert json.loads(result.stdout.strip().splitlines()[-1]) == []
+
+
+def test_adapter_singletons_are_created_on_first_access():
+    import tools.scribe.adapters.nats_subscriber as nats_subscriber
+
+    validator = nats_subscriber.boundary_validator
+    assert validator is nats_subscriber._validator()
+    assert nats_subscriber.telemetry_manager is nats_subscriber._telemetry()
+
+
+class TestValidateConfig:
+    def test_valid_config(self):
+        result = CliRunner().invoke(main, ["--validate-config"])
+        assert result.exit_code == 0
+        assert "Configuration valid" in result.output
+
+    def test_invalid_config(self, tmp_path):
+        config = tmp_path / "config.json"
+        config.write_text(json.dumps({"config_version": "1.0"}), encoding="utf-8")
+        result = CliRunner().invoke(main, ["--validate-config", "-c", str(config)])
+        assert result.exit_code == 1
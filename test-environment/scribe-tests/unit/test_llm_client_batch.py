@@ -0,0 +1,218 @@
+"""
+Unit tests for the cached, rate-limited, concurrent LLM client.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+import yaml
+
+from tools.scribe.actions.enhanced_frontmatter_action import EnhancedFrontmatterAction
+from tools.scribe.integrations.llm_integration import (
+    LLMBackend,
+    LLMClient,
+    LLMResponseCache,
+    LLMSchemaIntegration,
+    StubLLMBackend,
+    TokenBucket,
+    constraint_profile_hash,
+)
+
+
+project_root = Path(__file__).parent.parent.parent.parent
+
+
+class ConcurrencyProbe(LLMBackend):
+    """Backend that records the peak number of concurrent calls."""
+
+    model_name = "probe"
+
+    def __init__(self, latency=0.02):
+        self.latency = latency
+        self.active = 0
+        self.peak = 0
+        self.calls = 0
+
+    def generate(self, prompt, max_tokens=500, temperature=0.1):
+        raise AssertionError("sync path not expected")
+
+    async def agenerate(self, prompt, max_tokens=500, temperature=0.1):
+        self.calls += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(self.latency)
+        self.active -= 1
+        return f"title: {prompt}\n"
+
+
+class FailingBackend(LLMBackend):
+    def generate(self, prompt, max_tokens=500, temperature=0.1):
+        raise RuntimeError("provider down")
+
+
+class TestStubBackend:
+    def test_dates_come_from_the_clock(self):
+        fixed = StubLLMBackend(clock=lambda: datetime(2025, 1, 1, tzinfo=timezone.utc))
+        assert yaml.safe_load(fixed.generate("prompt"))["date-created"] == "2025-01-01T00:00:00Z"
+
+        before = datetime.now(timezone.utc).strftime('%Y-%m-%d')
+        created = yaml.safe_load(StubLLMBackend().generate("prompt"))["date-created"]
+        assert created[:10] >= before
+
+    def test_backend_must_implement_generate(self):
+        with pytest.raises(TypeError):
+            LLMBackend()
+
+
+def test_profile_hash_does_not_modify_generator(tmp_path):
+    integration = LLMSchemaIntegration(str(tmp_path / "missing.ttl"), str(tmp_path / "missing.jsonld"),
+                                       llm_client=LLMClient())
+    generator = integration._get_default_profile_generator()
+    assert integration._profile_hash(generator) == constraint_profile_hash(generator["constraints"])
+    assert "profile_hash" not in generator
+    assert integration._get_default_profile_generator() is generator
+
+
+class TestResponseCache:
+    def test_key_ignores_whitespace_but_not_model_or_profile(self):
+        key = LLMResponseCache.make_key("m", "Generate  the\nfrontmatter", "p1")
+        assert key == LLMResponseCache.make_key("m", "Generate the frontmatter", "p1")
+        assert key != LLMResponseCache.make_key("other", "Generate the frontmatter", "p1")
+        assert key != LLMResponseCache.make_key("m", "Generate the frontmatter", "p2")
+
+    def test_profile_hash_is_stable_for_sets(self):
+        first = constraint_profile_hash({"required_fields": {"b", "a"}, "x": 1})
+        second = constraint_profile_hash({"x": 1, "required_fields": {"a", "b"}})
+        assert first == second
+
+    def test_repeat_generation_hits_cache_and_persists(self, tmp_path):
+        path = tmp_path / "llm-cache.json"
+        backend = StubLLMBackend()
+        client = LLMClient(backend=backend, cache=LLMResponseCache(path))
+
+        first = client.generate("info-type: technical-report", profile_hash="abc")
+        second = client.generate("info-type:   technical-report", profile_hash="abc")
+        assert first == second
+        assert backend.calls == 1
+        assert client.get_generation_stats()["cache"]["hit_rate"] == 0.5
+        assert client.cache.save()
+        assert not client.cache.save()
+
+        reloaded = LLMClient(backend=StubLLMBackend(), cache=LLMResponseCache(path))
+        assert reloaded.generate("info-type: technical-report", profile_hash="abc") == first
+        assert reloaded.backend.calls == 0
+
+    def test_failures_fall_back_and_are_not_cached(self):
+        client = LLMClient(backend=FailingBackend())
+        assert "Fallback Generated Title" in client.generate("prompt")
+        assert len(client.cache) == 0
+        assert client.get_generation_stats()["fallback_generations"] == 1
+
+
+class TestBatchGeneration:
+    def test_batch_is_bounded_ordered_and_coalesced(self):
+        backend = ConcurrencyProbe()
+        client = LLMClient(model_name="probe", backend=backend, max_concurrency=3)
+        prompts = [f"doc-{i % 8}" for i in range(16)]
+
+        responses = client.generate_batch(prompts)
+
+        assert responses == [f"title: {p}\n" for p in prompts]
+        assert backend.calls == 8
+        assert backend.peak == 3
+        stats = client.get_generation_stats()
+        assert stats["coalesced_requests"] == 8
+        assert stats["batches"] == 1 and stats["batch_items"] == 16
+        assert stats["batch_throughput_per_second"] > 0
+
+    def test_direct_agenerate_callers_share_the_client_limit(self):
+        backend = ConcurrencyProbe()
+        client = LLMClient(model_name="probe", backend=backend, max_concurrency=2)
+
+        async def run():
+            return await asyncio.gather(*[client.agenerate(f"doc-{i}") for i in range(6)])
+
+        assert len(asyncio.run(run())) == 6
+        assert backend.calls == 6
+        assert backend.peak == 2
+
+    def test_client_limit_works_across_event_loops(self):
+        backend = ConcurrencyProbe(latency=0.01)
+        client = LLMClient(model_name="probe", backend=backend, max_concurrency=2)
+
+        async def run(offset):
+            return await asyncio.gather(*[client.agenerate(f"doc-{offset}-{i}") for i in range(4)])
+
+        asyncio.run(run(0))
+        asyncio.run(run(1))
+        assert backend.calls == 8
+        assert backend.peak == 2
+
+    def test_batch_overlaps_backend_latency(self):
+        client = LLMClient(backend=StubLLMBackend(latency=0.05), max_concurrency=10)
+        start = time.perf_counter()
+        client.generate_batch([f"prompt {i}" for i in range(10)])
+        assert time.perf_counter() - start < 0.3
+
+    def test_token_bucket_limits_rate(self):
+        bucket = TokenBucket(rate=50, capacity=1)
+        start = time.perf_counter()
+        for _ in range(6):
+            bucket.acquire()
+        assert time.perf_counter() - start >= 0.09
+
+
+class TestEnhancedFrontmatterAction:
+    DOCUMENTS = {
+        "alpha.md": "# Alpha\n\nA general document.\n",
+        "beta.md": "# Beta\n\nAnother general document.\n",
+    }
+
+    @staticmethod
+    def make_action(cache_path):
+        config_values = {"llm_cache_path": str(cache_path)}
+        config_port = MagicMock()
+        config_port.get_config_value.side_effect = lambda key, plugin_id, default=None: config_values.get(key, default)
+        context = MagicMock()
+        context.get_plugin_id.return_value = "enhanced_frontmatter"
+        context.get_port.side_effect = lambda name: config_port if name == "configuration" else MagicMock()
+        return EnhancedFrontmatterAction("enhanced_frontmatter", {}, context)
+
+    def write_documents(self, directory):
+        for name, content in self.DOCUMENTS.items():
+            (directory / name).write_text(content, encoding="utf-8")
+        return [str(directory / name) for name in self.DOCUMENTS]
+
+    def test_rerun_over_unchanged_documents_makes_no_backend_calls(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(project_root)
+        cache_path = tmp_path / "llm-cache.json"
+        params = {"info_type": "general-document", "force_regenerate": True}
+
+        first = self.make_action(cache_path)
+        assert first.validator.llm_client is first.llm_integration.llm_client
+        file_paths = self.write_documents(tmp_path)
+        first_run = first.process_multiple_files(file_paths, params)
+        assert all(result["success"] for result in first_run["results"].values())
+        first_stats = first.llm_integration.llm_client.get_generation_stats()
+        assert first_stats["backend_calls"] >= len(file_paths)
+        assert first_stats["batches"] == 1
+        assert cache_path.exists()
+
+        # A new action (cold memory, warm on-disk cache) over the same documents
+        second = self.make_action(cache_path)
+        file_paths = self.write_documents(tmp_path)
+        second_run = second.process_multiple_files(file_paths, params)
+        assert all(result["success"] for result in second_run["results"].values())
+        second_stats = second.llm_integration.llm_client.get_generation_stats()
+        assert second_stats["backend_calls"] == 0
+        assert second_stats["cache"]["hits"] == first_stats["total_generations"]
+
+        # The single-file path reads from and persists the same cache
+        third = self.make_action(cache_path)
+        self.write_documents(tmp_path)
+        assert third.execute(None, None, file_paths[0], params)["success"]
+        assert third.llm_integration.llm_client.get_generation_stats()["backend_calls"] == 0
@@ -0,0 +1,123 @@
+"""
+Unit tests for the sampled, asynchronous structured logging pipeline.
+"""
+
+import io
+import json
+import logging
+import threading
+
+import pytest
+import structlog
+
+from tools.scribe.core.logging_config import AsyncLogWriter, LogPipeline, LogSampler
+
+
+def make_logger(name, sampler, pipeline):
+    stdlib_logger = logging.getLogger(name)
+    stdlib_logger.setLevel(logging.DEBUG)
+    stdlib_logger.propagate = False
+    return structlog.wrap_logger(
+        stdlib_logger,
+        processors=[
+            structlog.stdlib.filter_by_level,
+            structlog.stdlib.add_logger_name,
+            structlog.stdlib.add_log_level,
+            sampler,
+            pipeline,
+        ],
+        wrapper_class=structlog.stdlib.BoundLogger,
+    )
+
+
+@pytest.fixture
+def pipeline():
+    pipeline = LogPipeline()
+    yield pipeline
+    if pipeline.writer is not None:
+        pipeline.writer.close()
+
+
+class TestLogSampler:
+    def test_sampling_drops_info_but_never_warnings(self, pipeline):
+        sampler = LogSampler()
+        sampler.configure(sample_rates={"info": 0.0})
+        stream = io.StringIO()
+        pipeline.writer = AsyncLogWriter(pipeline.render_queued, stream=stream)
+        logger = make_logger("test.sampling", sampler, pipeline)
+
+        for _ in range(5):
+            logger.info("noisy")
+        logger.warning("important")
+        assert pipeline.writer.flush()
+
+        lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert [line["event"] for line in lines] == ["important"]
+        assert sampler.stats()["dropped_sampled"] == 5
+        assert sampler.stats()["dropped_by_logger"] == {"test.sampling": {"sampled": 5}}
+
+    def test_rate_limit_is_per_logger(self):
+        sampler = LogSampler()
+        sampler.configure(rate_limit_per_second=0.001, rate_limit_burst=3)
+
+        kept = {"a": 0, "b": 0}
+        for name in ("a", "b"):
+            for _ in range(10):
+                try:
+                    sampler(None, "info", {"level": "info", "logger": name, "event": "x"})
+                    kept[name] += 1
+                except structlog.DropEvent:
+                    pass
+
+        assert kept == {"a": 3, "b": 3}
+        assert sampler.stats()["dropped_rate_limited"] == 14
+
+
+class TestAsyncLogWriter:
+    def test_events_are_rendered_off_thread_as_json(self, pipeline):
+        stream = io.StringIO()
+        pipeline.writer = AsyncLogWriter(pipeline.render_queued, stream=stream, batch_size=4)
+        logger = make_logger("test.async", LogSampler(), pipeline)
+
+        for i in range(10):
+            logger.info("processed", index=i)
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("failed")
+        assert pipeline.writer.flush()
+
+        lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert [line.get("index") for line in lines[:10]] == list(range(10))
+        assert lines[0]["timestamp"].endswith("Z") and "T" in lines[0]["timestamp"]
+        assert "ValueError: boom" in lines[-1]["exception"]
+        assert pipeline.writer.stats()["written"] == 11
+
+    def test_full_queue_drops_instead_of_blocking(self):
+        release = threading.Event()
+
+        def slow_render(event_dict):
+            release.wait(5)
+            return json.dumps(event_dict)
+
+        writer = AsyncLogWriter(slow_render, stream=io.StringIO(), max_queue_size=1, batch_size=1)
+        try:
+            results = [writer.submit({"event": i}) for i in range(5)]
+            assert not all(results)
+            assert writer.stats()["dropped_queue_full"] == results.count(False)
+        finally:
+            release.set()
+            writer.close()
+
+    def test_output_file_rotates(self, tmp_path):
+        target = tmp_path / "logs" / "scribe.log"
+        writer = AsyncLogWriter(json.dumps, output_path=target, max_bytes=200, backup_count=2)
+        for i in range(40):
+            writer.submit({"event": "line", "index": i})
+            if i % 5 == 4:
+                writer.flush()
+        writer.close()
+
+        assert target.exists()
+        assert (tmp_path / "logs" / "scribe.log.1").exists()
+        assert not (tmp_path / "logs" / "scribe.log.3").exists()
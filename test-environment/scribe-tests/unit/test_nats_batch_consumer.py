@@ -0,0 +1,206 @@
+"""
+Unit tests for the batch-consuming NATS subscriber, run against an in-process fake client.
+"""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from tools.scribe.adapters.nats_subscriber import ConsumerConfig, NatsBatchConsumer
+from tools.scribe.core.boundary_validator import create_boundary_validator
+from tools.scribe.core.dlq import flush_dlq
+
+NATS_SCHEMA = Path(__file__).resolve().parents[3] / "tools" / "scribe" / "schemas" / "l1" / "nats_message.schema.json"
+
+
+class FakeMsg:
+    def __init__(self, subject, data):
+        self.subject = subject
+        self.data = data
+
+
+class FakeSubscription:
+    """Mirrors nats-py's iterator subscriptions: a pending queue with msg/byte limits."""
+
+    def __init__(self, pending_msgs_limit, pending_bytes_limit):
+        self.queue = asyncio.Queue()
+        self.pending_bytes = 0
+        self.pending_msgs_limit = pending_msgs_limit
+        self.pending_bytes_limit = pending_bytes_limit
+        self.dropped = 0
+        self.closed = False
+
+    @property
+    def pending_msgs(self):
+        return self.queue.qsize()
+
+    def deliver(self, msg):
+        if self.closed:
+            return
+        if self.pending_msgs >= self.pending_msgs_limit or self.pending_bytes + len(msg.data) > self.pending_bytes_limit:
+            self.dropped += 1  # nats-py reports a slow consumer here
+            return
+        self.pending_bytes += len(msg.data)
+        self.queue.put_nowait(msg)
+
+    async def next_msg(self, timeout=1.0):
+        msg = await asyncio.wait_for(self.queue.get(), timeout)
+        self.pending_bytes -= len(msg.data)
+        self.queue.task_done()
+        return msg
+
+    async def drain(self):
+        self.closed = True
+        await self.queue.join()
+
+
+class FakeNats:
+    def __init__(self):
+        self.subscriptions = {}
+
+    async def subscribe(self, subject, queue="", pending_msgs_limit=0, pending_bytes_limit=0):
+        sub = FakeSubscription(pending_msgs_limit, pending_bytes_limit)
+        self.subscriptions[subject] = sub
+        return sub
+
+    def publish(self, subject, payload):
+        data = payload if isinstance(payload, bytes) else json.dumps(payload).encode("utf-8")
+        self.subscriptions[subject].deliver(FakeMsg(subject, data))
+
+
+def message(i, subject="scribe.events"):
+    return {"message_id": f"m-{i}", "subject": subject, "payload": {"n": i}, "ts": "2025-01-01T00:00:00Z"}
+
+
+@pytest.fixture
+def validator():
+    validator = create_boundary_validator()
+    validator.register_schema("l1_nats_input", json.loads(NATS_SCHEMA.read_text(encoding="utf-8")))
+    return validator
+
+
+@pytest.fixture(autouse=True)
+def report_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("SCRIBE_REPORT_DIR", str(tmp_path))
+    return tmp_path
+
+
+def dlq_records(report_dir):
+    flush_dlq()
+    path = report_dir / "dlq.jsonl"
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()] if path.exists() else []
+
+
+class Recorder:
+    def __init__(self, delay=0.0):
+        self.seen = []
+        self.running = 0
+        self.max_running = 0
+        self.max_in_flight = 0
+        self.delay = delay
+        self.consumer = None
+
+    async def __call__(self, payload, msg):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        if self.consumer is not None:
+            self.max_in_flight = max(self.max_in_flight, self.consumer.get_stats()["in_flight"])
+        await asyncio.sleep(self.delay)
+        self.running -= 1
+        self.seen.append(payload["message_id"])
+
+
+async def wait_for(predicate, timeout=5.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condition not met")
+        await asyncio.sleep(0.005)
+
+
+class TestNatsBatchConsumer:
+    def test_batches_validate_and_dead_letter_invalid_messages(self, validator, report_dir):
+        async def scenario():
+            nc, recorder = FakeNats(), Recorder()
+            consumer = NatsBatchConsumer(nc, "scribe.events", handler=recorder, validator=validator,
+                                         config=ConsumerConfig(batch_size=10))
+            await consumer.start()
+            for i in range(40):
+                nc.publish("scribe.events", message(i))
+            nc.publish("scribe.events", b"not json")
+            nc.publish("scribe.events", {"message_id": "bad", "subject": "s", "payload": [], "ts": "x"})
+            await wait_for(lambda: consumer.get_stats()["received"] == 42)
+            await consumer.stop()
+            return consumer.get_stats(), recorder
+
+        stats, recorder = asyncio.run(scenario())
+        assert sorted(recorder.seen) == sorted(f"m-{i}" for i in range(40))
+        assert (stats["processed"], stats["invalid"], stats["in_flight"]) == (40, 2, 0)
+        assert stats["batches"] < 42
+        assert [r["event_id"] for r in dlq_records(report_dir)] == ["", "bad"]
+
+    def test_concurrency_and_in_flight_budget_are_bounded(self, validator):
+        async def scenario():
+            nc, recorder = FakeNats(), Recorder(delay=0.01)
+            consumer = NatsBatchConsumer(nc, "scribe.events", handler=recorder, validator=validator,
+                                         config=ConsumerConfig(batch_size=8, concurrency=3, max_in_flight=10))
+            recorder.consumer = consumer
+            await consumer.start()
+            for i in range(60):
+                nc.publish("scribe.events", message(i))
+            await wait_for(lambda: len(recorder.seen) == 60)
+            await consumer.stop()
+            return recorder
+
+        recorder = asyncio.run(scenario())
+        assert recorder.max_running == 3
+        assert recorder.max_in_flight <= 10
+
+    def test_backlog_reported_as_lag_and_bounded_by_pending_limits(self, validator):
+        async def scenario():
+            nc, release = FakeNats(), asyncio.Event()
+
+            async def blocked(payload, msg):
+                await release.wait()
+
+            consumer = NatsBatchConsumer(nc, "scribe.events", handler=blocked, validator=validator,
+                                         config=ConsumerConfig(max_in_flight=4, pending_msgs_limit=10))
+            await consumer.start()
+            for i in range(20):
+                nc.publish("scribe.events", message(i))
+            await wait_for(lambda: consumer.get_stats()["in_flight"] == 4)
+            await asyncio.sleep(0.05)
+            stats = consumer.get_stats()
+            dropped = nc.subscriptions["scribe.events"].dropped
+            release.set()
+            await consumer.stop()
+            return stats, dropped, consumer.get_stats()
+
+        stats, dropped, final = asyncio.run(scenario())
+        assert stats["in_flight"] == 4 and stats["lag_msgs"] == 6
+        assert dropped == 10
+        assert final["processed"] == 10 and final["lag_msgs"] == 0
+
+    def test_stop_drains_delivered_messages_and_counts_handler_failures(self, validator, report_dir):
+        async def scenario():
+            nc = FakeNats()
+
+            async def flaky(payload, msg):
+                await asyncio.sleep(0.001)
+                if payload["payload"]["n"] % 10 == 0:
+                    raise RuntimeError("boom")
+
+            consumer = NatsBatchConsumer(nc, "scribe.events", handler=flaky, validator=validator,
+                                         config=ConsumerConfig(batch_size=16, max_in_flight=32))
+            await consumer.start()
+            for i in range(100):
+                nc.publish("scribe.events", message(i))
+            await consumer.stop()
+            return consumer.get_stats()
+
+        stats = asyncio.run(scenario())
+        assert (stats["received"], stats["processed"], stats["failed"]) == (100, 90, 10)
+        assert stats["throughput_per_second"] > 0
+        assert all(r["errors"][0].startswith("Handler failed") for r in dlq_records(report_dir))
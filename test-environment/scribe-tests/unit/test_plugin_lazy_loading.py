@@ -0,0 +1,136 @@
+"""
+Unit tests for manifest-driven lazy plugin loading and the plugin scan cache.
+"""
+
+import json
+import uuid
+
+import pytest
+
+from tools.scribe.core.plugin_loader import PluginLoader
+
+# No method bodies: the loader's substring security scan rejects any source
+# containing "exec", which includes BaseAction.execute overrides
+PLUGIN_SOURCE = '''
+from tools.scribe.actions.base import BaseAction
+
+
+class {class_name}(BaseAction):
+    ACTION_TYPE = "{action_type}"
+'''
+
+
+def manifest(entry_point):
+    return {
+        "manifest_version": "2.2",
+        "plugin_metadata": {"name": "sample", "version": "1.0.0", "description": "Sample lazy plugin",
+                            "author": "tests", "license": "MIT", "type": "L3-Capability", "product": "scribe"},
+        "hma_compliance": {
+            "hma_version": "2.2",
+            "tier_classification": {"mandatory": ["json_schema", "otel_boundary", "mtls"],
+                                    "recommended": [], "alternative": []},
+            "boundary_interfaces": [{"port_type": "PluginExecutionPort", "direction": "inbound",
+                                     "validation": "json_schema", "telemetry": "otel_spans"}],
+        },
+        "runtime_requirements": {"python_version": ">=3.8", "dependencies": {"required": [], "optional": []},
+                                 "platform_support": ["linux"],
+                                 "resource_limits": {"max_memory_mb": 100, "max_cpu_percent": 10, "max_file_handles": 10}},
+        "interface_contracts": {"action_interface": {"entry_point": entry_point, "configuration_schema": {"type": "object"}}},
+        "security": {"permissions": [], "sandbox_compatible": True, "mtls_required": True},
+    }
+
+
+def write_plugin(directory, action_type="shout", with_manifest=True, extra_source=""):
+    stem = f"sample_{uuid.uuid4().hex[:8]}_action"
+    class_name = "SampleShoutAction"
+    (directory / f"{stem}.py").write_text(
+        PLUGIN_SOURCE.format(class_name=class_name, action_type=action_type) + extra_source, encoding="utf-8")
+    if with_manifest:
+        (directory / stem).mkdir()
+        (directory / stem / "manifest.json").write_text(json.dumps(manifest(f"{stem}.{class_name}")))
+    return stem
+
+
+@pytest.fixture
+def plugin_dir(tmp_path):
+    directory = tmp_path / "plugins"
+    directory.mkdir()
+    return directory
+
+
+class TestLazyPluginLoading:
+    def test_manifest_plugins_register_without_import(self, plugin_dir):
+        write_plugin(plugin_dir)
+        loader = PluginLoader(plugin_directories=[str(plugin_dir)])
+        plugins = loader.load_all_plugins()
+
+        # Without a cached scan the action type is read from the class body
+        info = plugins["shout"]
+        assert not info.is_loaded and info.class_name == "SampleShoutAction"
+        assert loader.get_plugin_stats()["loaded_modules"] == 0
+
+        action_class = info.action_class
+        assert info.is_loaded and action_class.ACTION_TYPE == "shout"
+        assert loader.get_plugin_stats()["loaded_modules"] == 1
+
+    def test_scan_cache_persists_security_verdict_and_action_types(self, plugin_dir, tmp_path):
+        write_plugin(plugin_dir)
+        cache_path = tmp_path / "cache" / "plugin_scan_cache.json"
+        first = PluginLoader(plugin_directories=[str(plugin_dir)], cache_path=str(cache_path))
+        first.load_all_plugins()["shout"].action_class
+
+        entries = json.loads(cache_path.read_text())["entries"]
+        (record,) = entries.values()
+        assert record["security"] is None
+        assert record["classes"] == [["SampleShoutAction", "shout"]]
+
+        second = PluginLoader(plugin_directories=[str(plugin_dir)], cache_path=str(cache_path))
+        second._scan_source = None  # a cache hit must not rescan
+        plugins = second.load_all_plugins()
+        assert list(plugins) == ["shout"] and not plugins["shout"].is_loaded
+
+    def test_changed_content_is_rescanned(self, plugin_dir, tmp_path):
+        stem = write_plugin(plugin_dir)
+        cache_path = tmp_path / "plugin_scan_cache.json"
+        PluginLoader(plugin_directories=[str(plugin_dir)], cache_path=str(cache_path)).load_all_plugins()
+
+        source = plugin_dir / f"{stem}.py"
+        source.write_text(source.read_text() + "\nimport subprocess\n", encoding="utf-8")
+        loader = PluginLoader(plugin_directories=[str(plugin_dir)], cache_path=str(cache_path))
+        assert loader.load_all_plugins() == {}
+        assert len(json.loads(cache_path.read_text())["entries"]) == 2
+
+    def test_plugins_without_manifest_load_eagerly(self, plugin_dir):
+        write_plugin(plugin_dir, action_type="legacy", with_manifest=False)
+        loader = PluginLoader(plugin_directories=[str(plugin_dir)])
+        plugins = loader.load_all_plugins()
+        assert plugins["legacy"].is_loaded
+
+    def test_prewarm_imports_deferred_plugins(self, plugin_dir):
+        write_plugin(plugin_dir)
+        loader = PluginLoader(plugin_directories=[str(plugin_dir)])
+        loader.load_all_plugins()
+        thread = loader.prewarm()
+        thread.join(10)
+        assert loader.get_plugin_stats()["deferred_plugins"] == 0
+        assert loader.prewarm() is None
+
+    def test_eager_mode_imports_at_load(self, plugin_dir):
+        write_plugin(plugin_dir)
+        loader = PluginLoader(plugin_directories=[str(plugin_dir)], lazy=False)
+        assert loader.load_all_plugins()["shout"].is_loaded
+
+    def test_cold_warm_and_eager_loads_agree_on_action_types(self, plugin_dir, tmp_path):
+        # A second action class is only discoverable by importing the module
+        write_plugin(plugin_dir, extra_source="\n\nclass WhisperAction(BaseAction):\n    pass\n")
+        cache_path = tmp_path / "plugin_scan_cache.json"
+
+        cold = PluginLoader(plugin_directories=[str(plugin_dir)], cache_path=str(cache_path))
+        assert list(cold.load_all_plugins()) == ["shout"]
+        cold.get_plugin("shout").action_class
+        assert sorted(cold.get_all_plugins()) == ["shout", "whisper"]
+        assert cold.get_plugin("whisper").action_class.__name__ == "WhisperAction"
+
+        warm = PluginLoader(plugin_directories=[str(plugin_dir)], cache_path=str(cache_path))
+        eager = PluginLoader(plugin_directories=[str(plugin_dir)], lazy=False)
+        assert sorted(warm.load_all_plugins()) == sorted(eager.load_all_plugins()) == ["shout", "whisper"]
@@ -0,0 +1,93 @@
+"""
+Unit tests for the content-addressed quarantine store.
+"""
+
+import json
+import time
+from pathlib import Path
+
+from tools.scribe.core.engine_factory import create_engine_components
+from tools.scribe.core.quarantine_store import QuarantineConfig, QuarantineStore
+
+
+def write(path, content):
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+class TestQuarantineStore:
+    def test_repeated_content_is_stored_once(self, tmp_path):
+        store = QuarantineStore(tmp_path / "q")
+        source = tmp_path / "doc.md"
+
+        results = []
+        for _ in range(5):
+            write(source, "same content\n")
+            results.append(store.quarantine(source, "R1", "circuit_breaker_open"))
+
+        digests = {entry.hash for entry, _ in results}
+        assert [dedup for _, dedup in results] == [False, True, True, True, True]
+        assert len(digests) == 1
+        assert len(list((tmp_path / "q" / "blobs").rglob("*"))) == 2  # fan-out dir + blob
+        assert len(store.entries(path=str(source))) == 5
+        assert store.contains(digests.pop()) and store.contains_file(source)
+        stats = store.get_stats()
+        assert (stats["blobs_written"], stats["deduplicated"], stats["bytes_saved"]) == (1, 4, 4 * 13)
+
+    def test_index_is_reloaded_and_torn_lines_skipped(self, tmp_path):
+        store = QuarantineStore(tmp_path / "q")
+        entry, _ = store.quarantine(write(tmp_path / "a.md", "alpha\n"), "R1", "reason")
+        store.quarantine(write(tmp_path / "b.md", "beta\n"), "R2", "reason")
+        with open(store.index_path, "a", encoding="utf-8") as f:
+            f.write('{"hash": "abc", "si')
+
+        reloaded = QuarantineStore(tmp_path / "q")
+        assert reloaded.get_stats()["entries"] == 2
+        assert reloaded.contains(entry.hash)
+        restored = reloaded.restore(entry.hash, tmp_path / "restored.md")
+        assert restored.read_text(encoding="utf-8") == "alpha\n"
+
+    def test_size_quota_evicts_least_recently_quarantined(self, tmp_path):
+        store = QuarantineStore(tmp_path / "q", QuarantineConfig(max_bytes=250, enforce_every=1))
+        first, _ = store.quarantine(write(tmp_path / "a.md", "a" * 100), "R", "x")
+        second, _ = store.quarantine(write(tmp_path / "b.md", "b" * 100), "R", "x")
+        # Touch the first blob again so the second is the least recent
+        store.quarantine(write(tmp_path / "a.md", "a" * 100), "R", "x")
+        third, _ = store.quarantine(write(tmp_path / "c.md", "c" * 100), "R", "x")
+
+        assert store.contains(first.hash) and store.contains(third.hash)
+        assert not store.contains(second.hash)
+        assert not store.blob_path(second.hash).exists()
+        assert store.get_stats()["total_bytes"] == 200
+        hashes = {json.loads(line)["hash"] for line in store.index_path.read_text().splitlines()}
+        assert hashes == {first.hash, third.hash}
+
+    def test_retention_drops_old_entries_and_blobs(self, tmp_path):
+        store = QuarantineStore(tmp_path / "q", QuarantineConfig(retention_seconds=60, enforce_every=0))
+        old, _ = store.quarantine(write(tmp_path / "old.md", "old\n"), "R", "x")
+        kept, _ = store.quarantine(write(tmp_path / "kept.md", "kept\n"), "R", "x")
+
+        later = time.time() + 120
+        store._blobs[kept.hash].last_seen = later
+        store.quarantine(write(tmp_path / "kept.md", "kept\n"), "R", "x")
+        store._entries[-1].ts = later
+
+        assert store.enforce_retention(now=later) == 1
+        assert not store.contains(old.hash) and store.contains(kept.hash)
+        assert len(store.entries(digest=kept.hash)) == 1
+
+
+def test_factory_applies_quarantine_config(tmp_path, monkeypatch):
+    project_root = Path(__file__).parent.parent.parent.parent
+    config = json.loads((project_root / "tools" / "scribe" / "config" / "config.json").read_text(encoding="utf-8"))
+    config["quarantine"] = {"path": str(tmp_path / "q"), "max_bytes": 4096, "retention_seconds": 60, "enforce_every": 0}
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps(config), encoding="utf-8")
+    monkeypatch.chdir(project_root)  # the default schema path is repo-relative
+
+    components = create_engine_components(config_path=str(config_path))
+    components.config_manager.stop()
+
+    store = components.action_dispatcher.quarantine_store
+    assert store.root == tmp_path / "q"
+    assert store.config == QuarantineConfig(max_bytes=4096, retention_seconds=60, enforce_every=0)
@@ -0,0 +1,254 @@
+"""
+Unit tests for the engine state snapshot and the file stat manifest.
+"""
+
+import json
+import os
+import time
+import uuid
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from tools.scribe.core.circuit_breaker import CircuitBreakerManager, CircuitState
+from tools.scribe.core.engine_factory import create_engine_components
+from tools.scribe.core.plugin_loader import PluginLoader
+from tools.scribe.core.state_snapshot import EngineStateSnapshot, FileStatManifest, source_unchanged, fingerprint
+
+project_root = Path(__file__).parent.parent.parent.parent
+BASE_CONFIG_PATH = project_root / "tools" / "scribe" / "config" / "config.json"
+
+# No method bodies: the loader's security scan rejects sources containing "exec"
+PLUGIN_SOURCE = '''
+from tools.scribe.actions.base import BaseAction
+
+
+class SampleAction(BaseAction):
+    ACTION_TYPE = "{action_type}"
+'''
+
+
+def write_plugin(directory, action_type="shout"):
+    stem = f"sample_{uuid.uuid4().hex[:8]}_action"
+    (directory / f"{stem}.py").write_text(PLUGIN_SOURCE.format(action_type=action_type), encoding="utf-8")
+    return stem
+
+
+@pytest.fixture
+def plugin_dir(tmp_path):
+    directory = tmp_path / "plugins"
+    directory.mkdir()
+    return directory
+
+
+def saved_snapshot(path, participant):
+    snapshot = EngineStateSnapshot(path)
+    snapshot.register("plugins", participant)
+    assert snapshot.save()
+    return snapshot
+
+
+def restore_into(path, participant, name="plugins", **kwargs):
+    snapshot = EngineStateSnapshot(path, **kwargs)
+    snapshot.register(name, participant)
+    return snapshot.restore()[name]
+
+
+class TestPluginRegistrySnapshot:
+    def test_registry_restores_without_scanning(self, plugin_dir, tmp_path):
+        write_plugin(plugin_dir)
+        path = tmp_path / "engine_state.json"
+        first = PluginLoader(plugin_directories=[str(plugin_dir)])
+        first.load_all_plugins()
+        saved_snapshot(path, first)
+
+        second = PluginLoader(plugin_directories=[str(plugin_dir)])
+        assert restore_into(path, second) == "restored"
+        second.discover_plugins = None  # a restored registry must not rediscover
+        plugins = second.load_all_plugins()
+        assert list(plugins) == ["shout"] and not plugins["shout"].is_loaded
+        assert plugins["shout"].action_class.ACTION_TYPE == "shout"
+
+    def test_edited_plugin_makes_section_stale(self, plugin_dir, tmp_path):
+        stem = write_plugin(plugin_dir)
+        path = tmp_path / "engine_state.json"
+        loader = PluginLoader(plugin_directories=[str(plugin_dir)])
+        loader.load_all_plugins()
+        saved_snapshot(path, loader)
+
+        source = plugin_dir / f"{stem}.py"
+        source.write_text(source.read_text() + "\n# edited\n", encoding="utf-8")
+        assert restore_into(path, PluginLoader(plugin_directories=[str(plugin_dir)])) == "stale"
+
+    def test_added_plugin_makes_section_stale(self, plugin_dir, tmp_path):
+        write_plugin(plugin_dir)
+        path = tmp_path / "engine_state.json"
+        loader = PluginLoader(plugin_directories=[str(plugin_dir)])
+        loader.load_all_plugins()
+        saved_snapshot(path, loader)
+
+        write_plugin(plugin_dir, action_type="whisper")
+        assert restore_into(path, PluginLoader(plugin_directories=[str(plugin_dir)])) == "stale"
+
+    def test_eager_loader_declines_restore(self, plugin_dir, tmp_path):
+        write_plugin(plugin_dir)
+        path = tmp_path / "engine_state.json"
+        loader = PluginLoader(plugin_directories=[str(plugin_dir)])
+        loader.load_all_plugins()
+        saved_snapshot(path, loader)
+        assert restore_into(path, PluginLoader(plugin_directories=[str(plugin_dir)], lazy=False)) == "failed"
+
+    def test_factory_restores_before_loading(self, plugin_dir, tmp_path, monkeypatch):
+        write_plugin(plugin_dir)
+        config = json.loads(BASE_CONFIG_PATH.read_text(encoding="utf-8"))
+        config["plugins"]["directories"] = [str(plugin_dir)]
+        config["engine"]["state_snapshot"] = {"enabled": True, "path": str(tmp_path / "engine_state.json")}
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps(config), encoding="utf-8")
+        monkeypatch.chdir(project_root)  # the default schema path is repo-relative
+
+        cold = create_engine_components(config_path=str(config_path))
+        cold.config_manager.stop()
+        assert cold.state_snapshot.save()
+
+        with patch.object(PluginLoader, "resolve_plugin_load_order", side_effect=AssertionError("rediscovered")):
+            warm = create_engine_components(config_path=str(config_path))
+        warm.config_manager.stop()
+        assert list(warm.plugin_loader.get_all_plugins()) == ["shout"]
+        assert warm.state_snapshot.get_stats()["restored_sections"] == 1
+
+
+class TestSnapshotFile:
+    def test_missing_snapshot(self, tmp_path):
+        assert restore_into(tmp_path / "absent.json", CircuitBreakerManager(), "breakers") == "missing"
+
+    def test_version_mismatch_is_ignored(self, tmp_path):
+        path = tmp_path / "engine_state.json"
+        saved_snapshot(path, CircuitBreakerManager())
+        data = json.loads(path.read_text())
+        data["version"] = 0
+        path.write_text(json.dumps(data))
+        assert restore_into(path, CircuitBreakerManager()) == "missing"
+
+    def test_old_snapshot_is_ignored(self, tmp_path):
+        path = tmp_path / "engine_state.json"
+        saved_snapshot(path, CircuitBreakerManager())
+        data = json.loads(path.read_text())
+        data["created_at"] = time.time() - 3600
+        path.write_text(json.dumps(data))
+        assert restore_into(path, CircuitBreakerManager(), max_age_seconds=60) == "missing"
+        assert restore_into(path, CircuitBreakerManager(), max_age_seconds=7200) == "restored"
+
+    def test_corrupt_snapshot_is_ignored(self, tmp_path):
+        path = tmp_path / "engine_state.json"
+        path.write_text("{not json")
+        assert restore_into(path, CircuitBreakerManager()) == "missing"
+
+    def test_touched_source_with_same_content_is_unchanged(self, tmp_path):
+        source = tmp_path / "rules.json"
+        source.write_text("{}")
+        recorded = fingerprint(source)
+        os.utime(source, ns=(recorded["mtime_ns"] + 10**9, recorded["mtime_ns"] + 10**9))
+        assert source_unchanged(source, recorded)
+        source.write_text("[]")
+        assert not source_unchanged(source, recorded)
+
+
+def test_restore_offers_each_section_once(tmp_path):
+    path = tmp_path / "engine_state.json"
+    saved = EngineStateSnapshot(path)
+    saved.register("plugins", CircuitBreakerManager())
+    saved.register("breakers", CircuitBreakerManager())
+    assert saved.save()
+
+    snapshot = EngineStateSnapshot(path)
+    early = CircuitBreakerManager()
+    snapshot.register("plugins", early)
+    assert snapshot.restore() == {"plugins": "restored"}
+
+    snapshot.register("breakers", CircuitBreakerManager())
+    with patch.object(early, "restore_state", side_effect=AssertionError("restored twice")):
+        assert snapshot.restore() == {"breakers": "restored"}
+
+
+def test_open_circuit_breaker_survives_restart(tmp_path):
+    path = tmp_path / "engine_state.json"
+    manager = CircuitBreakerManager()
+    breaker = manager.get_breaker("rule-1", failure_threshold=2, recovery_timeout_seconds=600)
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    saved_snapshot(path, manager)
+
+    restarted = CircuitBreakerManager()
+    assert restore_into(path, restarted) == "restored"
+    restored = restarted.get_breaker("rule-1")
+    assert restored.state == CircuitState.OPEN
+    assert restored.failure_threshold == 2 and not restored.can_execute()
+
+
+def test_periodic_save(tmp_path):
+    snapshot = EngineStateSnapshot(tmp_path / "engine_state.json")
+    snapshot.register("breakers", CircuitBreakerManager())
+    snapshot.start_periodic(0.05)
+    try:
+        deadline = time.time() + 5
+        while snapshot.get_stats()["saves"] == 0 and time.time() < deadline:
+            time.sleep(0.01)
+    finally:
+        snapshot.stop_periodic()
+    assert snapshot.get_stats()["saves"] >= 1
+
+
+def backdate(path, seconds=60):
+    """Move mtime out of FileStatManifest's safety window."""
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+class TestFileStatManifest:
+    def test_unchanged_files_hit(self, tmp_path):
+        doc = tmp_path / "doc.md"
+        doc.write_text("# Title")
+        backdate(doc)
+        manifest_path = tmp_path / "manifest.json"
+
+        first = FileStatManifest(manifest_path)
+        assert first.lookup("doc.md", doc.stat()) is None
+        first.record("doc.md", doc.stat(), "abc")
+        assert first.save()
+
+        second = FileStatManifest(manifest_path)
+        assert second.lookup("doc.md", doc.stat()) == "abc"
+        assert (second.hits, second.misses) == (1, 0)
+
+        doc.write_text("# Longer title")
+        assert FileStatManifest(manifest_path).lookup("doc.md", doc.stat()) is None
+
+    def test_recently_modified_file_is_not_recorded(self, tmp_path):
+        doc = tmp_path / "doc.md"
+        doc.write_text("# Title")
+        manifest_path = tmp_path / "manifest.json"
+
+        manifest = FileStatManifest(manifest_path)
+        manifest.record("doc.md", doc.stat(), "abc")
+        assert manifest.save()
+
+        # A same-size rewrite in the same mtime tick must not be served from the manifest
+        assert FileStatManifest(manifest_path).lookup("doc.md", doc.stat()) is None
+
+    def test_entries_not_seen_are_dropped(self, tmp_path):
+        doc = tmp_path / "doc.md"
+        doc.write_text("# Title")
+        backdate(doc)
+        manifest_path = tmp_path / "manifest.json"
+        first = FileStatManifest(manifest_path)
+        first.record("doc.md", doc.stat(), "abc")
+        first.record("gone.md", doc.stat(), "def")
+        first.save()
+
+        second = FileStatManifest(manifest_path)
+        second.lookup("doc.md", doc.stat())
+        second.save()
+        assert list(json.loads(manifest_path.read_text())["files"]) == ["doc.md"]
@@ -0,0 +1,98 @@
+"""
+Unit tests for sampled boundary tracing in TelemetryManager.
+"""
+
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from tools.scribe.core.telemetry import TelemetryManager, _NOOP_SPAN
+
+
+def make_manager(sampling_rate):
+    manager = TelemetryManager(service_name="test", endpoint=None, sampling_rate=sampling_rate)
+    manager.tracer = MagicMock()
+    manager.boundary_calls_counter = Mock()
+    manager.boundary_call_errors_counter = Mock()
+    manager.boundary_call_duration_histogram = Mock()
+    return manager
+
+
+class TestBoundarySampling:
+    def test_unsampled_call_reuses_noop_span_and_counts(self):
+        manager = make_manager(0.0)
+
+        first = manager.trace_boundary_call("inbound", "file_system", "watcher", "event_validation")
+        second = manager.trace_boundary_call("inbound", "file_system", "other", "event_validation")
+        assert first is second
+        with first as span:
+            assert span is _NOOP_SPAN
+            span.set_attribute("valid", True)
+
+        manager.tracer.start_as_current_span.assert_not_called()
+        manager.boundary_call_duration_histogram.record.assert_not_called()
+        assert manager.boundary_calls_counter.add.call_count == 2
+        labels = [c.args[1] for c in manager.boundary_calls_counter.add.call_args_list]
+        assert labels[0] is labels[1]
+        assert labels[0] == {"interface_type": "inbound", "protocol": "file_system",
+                             "operation": "event_validation"}
+
+    def test_unsampled_errors_are_counted_and_propagate(self):
+        manager = make_manager(0.0)
+
+        with pytest.raises(ValueError):
+            with manager.trace_boundary_call("outbound", "file_system", "/tmp/x", "read"):
+                raise ValueError("boom")
+
+        manager.boundary_call_errors_counter.add.assert_called_once()
+        assert manager.boundary_call_errors_counter.add.call_args.args[1]["status"] == "error"
+
+    def test_sampled_call_creates_span_and_records_duration(self):
+        manager = make_manager(1.0)
+
+        with manager.trace_boundary_call("inbound", "http", "/validate", "request_received",
+                                         attributes={"extra": 1}):
+            pass
+
+        name = manager.tracer.start_as_current_span.call_args.args[0]
+        attributes = manager.tracer.start_as_current_span.call_args.kwargs["attributes"]
+        assert name == "inbound_http_request_received"
+        assert attributes["scribe.boundary.endpoint"] == "/validate"
+        assert attributes["extra"] == 1
+        duration, labels = manager.boundary_call_duration_histogram.record.call_args.args
+        assert duration >= 0
+        assert labels["status"] == "success"
+
+    def test_sampling_rate_is_honoured(self):
+        manager = make_manager(0.25)
+        manager._random.seed(1234)
+
+        for _ in range(4000):
+            with manager.trace_boundary_call("inbound", "nats", "subject", "message_received"):
+                pass
+
+        sampled = manager.tracer.start_as_current_span.call_count
+        assert 800 < sampled < 1200
+        assert manager.boundary_calls_counter.add.call_count == 4000
+
+    def test_exported_fraction_matches_sampling_rate(self):
+        # Real SDK provider: the sampling decision must be made once, not
+        # again by the SDK sampler
+        pytest.importorskip("opentelemetry.sdk")
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+        manager = make_manager(0.5)
+        exporter = InMemorySpanExporter()
+        provider = manager._create_tracer_provider(Resource.create({}), SimpleSpanProcessor(exporter))
+        manager.tracer = provider.get_tracer("test")
+        manager._random.seed(1234)
+
+        for _ in range(4000):
+            with manager.trace_boundary_call("inbound", "nats", "subject", "message_received"):
+                pass
+
+        exported = len(exporter.get_finished_spans())
+        assert 1800 < exported < 2200
+        assert manager.boundary_call_duration_histogram.record.call_count == exported
@@ -37,6 +37,9 @@ Examples:
   # Analyze KB import
   python tools/analysis/analyze_document_types.py --kb-import-mode --source-path /path/to/new/kb --output tools/reports/kb-analysis-$(date +%%Y%%m%%d-%%H%%M).json
 
+  # Re-analyze a large KB import incrementally, reusing features from the previous run
+  python tools/analysis/analyze_document_types.py --kb-import-mode --source-path /path/to/new/kb --state-file tools/reports/kb-analysis-state.json --output tools/reports/kb-analysis.json
+
   # Analyze specific directories
   python tools/analysis/analyze_document_types.py --target-paths standards/ tools/ --output tools/reports/targeted-analysis-$(date +%%Y%%m%%d-%%H%%M).json
         """,
@@ -71,6 +74,12 @@ Examples:
     parser.add_argument('--include-recommendations', action='store_true', default=True,
                        help='Include actionable recommendations in output')
     
+    parser.add_argument('--state-file', type=str,
+                       help='Persist per-file features here and re-scan only changed files on later runs')
+    
+    parser.add_argument('--workers', type=int, default=None,
+                       help='Number of worker processes for feature extraction (default: CPU count)')
+    
     parser.add_argument('--verbose', '-v', action='store_true',
                        help='Enable verbose logging')
     
@@ -136,7 +145,9 @@ def run_analysis(args):
         
         results = analyzer.analyze_on_demand(
             target_paths=target_paths,
-            kb_import_mode=args.kb_import_mode
+            kb_import_mode=args.kb_import_mode,
+            state_path=Path(args.state_file) if args.state_file else None,
+            max_workers=args.workers
         )
         
         # Add metadata about this analysis run
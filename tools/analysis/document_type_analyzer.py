@@ -9,18 +9,326 @@ This module provides scalable, on-demand methodology for current repository
 and future KB imports with comprehensive document type analysis.
 """
 
+import os
 import re
+import sys
 import json
 import yaml
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
-from collections import defaultdict
+from typing import Dict, List, Any, Optional, Tuple, Iterable
+from collections import defaultdict, Counter
+from concurrent.futures import ProcessPoolExecutor
 import logging
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from tools.scribe.utils.frontmatter_parser import split_frontmatter
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+CONTENT_PATTERNS = {
+    'standard-definition': [
+        r'## STANDARD DEFINITION',
+        r'standard_id:',
+        r'## COMPLIANCE REQUIREMENTS',
+        r'## STANDARD SCOPE',
+        r'## VALIDATION CRITERIA'
+    ],
+    'technical-report': [
+        r'## EXECUTIVE SUMMARY',
+        r'## ANALYSIS',
+        r'Report Date:',
+        r'## FINDINGS',
+        r'## RECOMMENDATIONS'
+    ],
+    'policy-document': [
+        r'## POLICY STATEMENT',
+        r'## MANDATORY REQUIREMENTS',
+        r'lifecycle_gatekeeper:',
+        r'## ENFORCEMENT',
+        r'## COMPLIANCE'
+    ],
+    'meeting-notes': [
+        r'## ATTENDEES',
+        r'## ACTION ITEMS',
+        r'Meeting Date:',
+        r'## DECISIONS',
+        r'## NEXT STEPS'
+    ],
+    'process-document': [
+        r'## PROCESS OVERVIEW',
+        r'## STEPS',
+        r'## WORKFLOW',
+        r'## METHODOLOGY'
+    ],
+    'guide-document': [
+        r'## INTRODUCTION',
+        r'## GETTING STARTED',
+        r'## TUTORIAL',
+        r'## EXAMPLES'
+    ],
+    'general-document': [
+        # Fallback patterns
+        r'# .+',  # Any heading
+        r'## .+'  # Any sub-heading
+    ]
+}
+
+PATH_PATTERNS = {
+    'standard-definition': [r'standards/src/', r'/standards/', r'.*-STANDARD.*', r'.*POLICY.*'],
+    'technical-report': [r'tools/reports/', r'/reports/', r'.*-report.*', r'.*-analysis.*'],
+    'policy-document': [r'standards/src/.*POLICY.*', r'/policies/', r'.*-policy.*'],
+    'meeting-notes': [r'meetings/', r'/notes/', r'.*-notes.*', r'.*-meeting.*'],
+    'guide-document': [r'guides/', r'/guide/', r'.*-guide.*', r'.*tutorial.*'],
+    'general-document': []  # Fallback
+}
+
+_COMPILED_CONTENT_PATTERNS = {
+    doc_type: [re.compile(pattern, re.IGNORECASE) for pattern in pattern_list]
+    for doc_type, pattern_list in CONTENT_PATTERNS.items()
+}
+_COMPILED_PATH_PATTERNS = {
+    doc_type: [re.compile(pattern, re.IGNORECASE) for pattern in pattern_list]
+    for doc_type, pattern_list in PATH_PATTERNS.items()
+}
+_STRUCTURE_PATTERNS = {
+    'has_code_blocks': re.compile(r'```'),
+    'has_tables': re.compile(r'\|.*\|'),
+    'has_lists': re.compile(r'^\s*[-\*\+]\s', re.MULTILINE),
+    'has_numbered_lists': re.compile(r'^\s*\d+\.\s', re.MULTILINE),
+    'has_links': re.compile(r'\[.*\]\(.*\)'),
+}
+_HEADING_PATTERN = re.compile(r'^(#+)\s', re.MULTILINE)
+_PARAGRAPH_BREAK_PATTERN = re.compile(r'\n\s*\n')
+
+STATE_FORMAT_VERSION = 2
+
+
+def _best_type(scores: Dict[str, int]) -> str:
+    return max(scores, key=scores.get) if scores and max(scores.values()) > 0 else 'general-document'
+
+
+def _extract_frontmatter(content: str) -> Dict[str, Any]:
+    """Extract and parse YAML frontmatter from document content."""
+    try:
+        frontmatter = split_frontmatter(content).parse(copy_result=False)
+    except yaml.YAMLError:
+        return {}
+    return frontmatter if isinstance(frontmatter, dict) else {}
+
+
+def extract_file_features(md_file: Path) -> Optional[Dict[str, Any]]:
+    """
+    Read a Markdown file once and compute every per-file feature used by the
+    analysis phases (content, structure, metadata and path). Returns a
+    JSON-serializable record, or None if the file cannot be read.
+    """
+    try:
+        stat = md_file.stat()
+        content = md_file.read_text(encoding='utf-8', errors='ignore')
+    except OSError as e:
+        logger.warning(f"Error analyzing {md_file}: {e}")
+        return None
+
+    file_path_str = str(md_file)
+    content_scores = {
+        doc_type: sum(1 for pattern in pattern_list if pattern.search(content))
+        for doc_type, pattern_list in _COMPILED_CONTENT_PATTERNS.items()
+    }
+    path_scores = {
+        doc_type: sum(1 for pattern in pattern_list if pattern.search(file_path_str))
+        for doc_type, pattern_list in _COMPILED_PATH_PATTERNS.items()
+    }
+    heading_levels = [len(heading) for heading in _HEADING_PATTERN.findall(content)]
+    # Records are persisted as JSON, so YAML dates and similar become strings
+    frontmatter = json.loads(json.dumps(_extract_frontmatter(content), default=str))
+
+    # Only string values are aggregated, so only those are kept in the record
+    field_values = {}
+    for field, value in frontmatter.items():
+        if isinstance(value, str):
+            field_values[str(field)] = [value]
+        elif isinstance(value, list):
+            field_values[str(field)] = [item for item in value if isinstance(item, str)]
+        else:
+            field_values[str(field)] = []
+
+    return {
+        'path': file_path_str,
+        'signature': [stat.st_mtime_ns, stat.st_size],
+        'content': {
+            'inferred_type': _best_type(content_scores),
+            'confidence_scores': content_scores,
+            'content_length': len(content),
+            'heading_count': len(heading_levels),
+        },
+        'structure': {
+            'has_frontmatter': content.startswith('---'),
+            'heading_levels': heading_levels,
+            **{name: bool(pattern.search(content)) for name, pattern in _STRUCTURE_PATTERNS.items()},
+            'paragraph_count': len(_PARAGRAPH_BREAK_PATTERN.findall(content)),
+        },
+        'metadata': {
+            'fields_present': list(field_values.keys()),
+            'field_count': len(frontmatter),
+            'field_values': field_values,
+            'info_type': frontmatter.get('info_type'),
+            'has_standard_id': 'standard_id' in frontmatter,
+            'has_kb_id': 'kb_id' in frontmatter,
+            'criticality': frontmatter.get('criticality'),
+            'frontmatter_data': frontmatter,
+        },
+        'path_features': {
+            'inferred_type': _best_type(path_scores),
+            'path_scores': path_scores,
+            'file_name': md_file.name,
+            'directory': str(md_file.parent),
+            'depth': len(md_file.parts),
+        },
+    }
+
+
+class FeatureAccumulator:
+    """
+    Mergeable aggregate of per-file feature records.
+
+    Every statistic is a counter, so records can be added, removed (when a
+    file changes or disappears) and whole accumulators merged after being
+    built independently in worker processes. The state round-trips through
+    JSON for incremental re-analysis.
+    """
+
+    def __init__(self):
+        self.records: Dict[str, Dict[str, Any]] = {}
+        self.field_usage = Counter()
+        self.field_values: Dict[str, Counter] = defaultdict(Counter)
+        self.field_cooccurrence = Counter()
+        self.content_type_counts = Counter()
+        self.path_type_counts = Counter()
+        self.structure_feature_counts = Counter()
+        self.heading_level_histogram = Counter()
+
+    def _apply(self, record: Dict[str, Any], sign: int) -> None:
+        metadata = record['metadata']
+        fields = sorted(metadata['fields_present'])
+        for field in fields:
+            self.field_usage[field] += sign
+            for value in metadata['field_values'].get(field, []):
+                self.field_values[field][value] += sign
+        for i, first in enumerate(fields):
+            for second in fields[i + 1:]:
+                self.field_cooccurrence[(first, second)] += sign
+        self.content_type_counts[record['content']['inferred_type']] += sign
+        self.path_type_counts[record['path_features']['inferred_type']] += sign
+        for name, present in record['structure'].items():
+            if present is True:
+                self.structure_feature_counts[name] += sign
+        for level in record['structure']['heading_levels']:
+            self.heading_level_histogram[level] += sign
+
+    def add(self, record: Dict[str, Any]) -> None:
+        if record['path'] in self.records:
+            self.remove(record['path'])
+        self.records[record['path']] = record
+        self._apply(record, 1)
+
+    def remove(self, path: str) -> None:
+        record = self.records.pop(path, None)
+        if record is None:
+            return
+        self._apply(record, -1)
+        # Drop zeroed entries so merged/persisted state stays compact
+        for counter in (self.field_usage, self.field_cooccurrence, self.content_type_counts,
+                        self.path_type_counts, self.structure_feature_counts, self.heading_level_histogram):
+            for key in [key for key, count in counter.items() if count <= 0]:
+                del counter[key]
+        for field in list(self.field_values):
+            values = self.field_values[field]
+            for key in [key for key, count in values.items() if count <= 0]:
+                del values[key]
+            if not values:
+                del self.field_values[field]
+
+    def merge(self, other: "FeatureAccumulator") -> "FeatureAccumulator":
+        """Fold another accumulator into this one (files must be disjoint)."""
+        overlap = self.records.keys() & other.records.keys()
+        for path in overlap:
+            self.remove(path)
+        self.records.update(other.records)
+        self.field_usage.update(other.field_usage)
+        for field, values in other.field_values.items():
+            self.field_values[field].update(values)
+        self.field_cooccurrence.update(other.field_cooccurrence)
+        self.content_type_counts.update(other.content_type_counts)
+        self.path_type_counts.update(other.path_type_counts)
+        self.structure_feature_counts.update(other.structure_feature_counts)
+        self.heading_level_histogram.update(other.heading_level_histogram)
+        return self
+
+    def field_usage_matrix(self) -> Dict[str, Any]:
+        return {
+            'usage_counts': dict(self.field_usage),
+            'value_patterns': {field: list(values) for field, values in self.field_values.items()}
+        }
+
+    def aggregate_statistics(self) -> Dict[str, Any]:
+        cooccurrence = defaultdict(dict)
+        for (first, second), count in self.field_cooccurrence.items():
+            cooccurrence[first][second] = count
+            cooccurrence[second][first] = count
+        return {
+            'documents': len(self.records),
+            'content_type_counts': dict(self.content_type_counts),
+            'path_type_counts': dict(self.path_type_counts),
+            'structure_feature_counts': dict(self.structure_feature_counts),
+            'heading_level_histogram': {str(level): count for level, count in sorted(self.heading_level_histogram.items())},
+            'field_cooccurrence': dict(cooccurrence),
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        # Aggregates are derived from the records, so only the records are persisted
+        return {'format_version': STATE_FORMAT_VERSION, 'records': list(self.records.values())}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FeatureAccumulator":
+        accumulator = cls()
+        if data.get('format_version') != STATE_FORMAT_VERSION:
+            return accumulator
+        for record in data.get('records', []):
+            accumulator.add(record)
+        return accumulator
+
+    def save(self, state_path: Path) -> None:
+        state_path = Path(state_path)
+        state_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = state_path.with_name(state_path.name + '.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+        os.replace(temp_path, state_path)
+
+    @classmethod
+    def load(cls, state_path: Path) -> "FeatureAccumulator":
+        try:
+            with open(state_path, 'r', encoding='utf-8') as f:
+                return cls.from_dict(json.load(f))
+        except FileNotFoundError:
+            return cls()
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable analysis state {state_path}: {e}")
+            return cls()
+
+
+def _scan_partition(file_paths: List[str]) -> FeatureAccumulator:
+    """Worker entry point: build an accumulator for one partition of files."""
+    accumulator = FeatureAccumulator()
+    for file_path in file_paths:
+        record = extract_file_features(Path(file_path))
+        if record is not None:
+            accumulator.add(record)
+    return accumulator
+
+
 class UniversalDocumentTypeAnalyzer:
     """
     Universal Document Type Analyzer for scalable document classification.
@@ -39,8 +347,13 @@ class UniversalDocumentTypeAnalyzer:
         # Initialize logger for this analyzer instance
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
     
+    # Below this many files a process pool costs more than it saves
+    PARALLEL_THRESHOLD = 200
+
     def analyze_on_demand(self, target_paths: Optional[List[Path]] = None, 
-                         kb_import_mode: bool = False) -> Dict[str, Any]:
+                         kb_import_mode: bool = False,
+                         state_path: Optional[Path] = None,
+                         max_workers: Optional[int] = None) -> Dict[str, Any]:
         """
         Robust methodology for analyzing document types.
         Works with current limited documents AND future KB imports.
@@ -48,6 +361,9 @@ class UniversalDocumentTypeAnalyzer:
         Args:
             target_paths: List of paths to analyze. If None, analyzes entire repository.
             kb_import_mode: Whether this is analyzing an imported KB (changes behavior)
+            state_path: Optional JSON file holding per-file features from a previous run.
+                Only new or modified files are re-read; the state is updated afterwards.
+            max_workers: Process pool size for feature extraction (defaults to CPU count).
             
         Returns:
             Comprehensive analysis results with actionable recommendations
@@ -58,21 +374,11 @@ class UniversalDocumentTypeAnalyzer:
         self.logger.info(f"Starting document type analysis for {len(target_paths)} target paths")
         self.logger.info(f"KB import mode: {kb_import_mode}")
         
-        # Phase 1: Content-based classification
-        self.logger.info("Phase 1: Analyzing content patterns...")
-        content_analysis = self._analyze_content_patterns(target_paths)
-        
-        # Phase 2: Structural pattern recognition
-        self.logger.info("Phase 2: Analyzing structural patterns...")
-        structural_analysis = self._analyze_structural_patterns(target_paths)
-        
-        # Phase 3: Metadata pattern extraction
-        self.logger.info("Phase 3: Analyzing metadata patterns...")
-        metadata_analysis = self._analyze_metadata_patterns(target_paths)
-        
-        # Phase 4: Path-based classification
-        self.logger.info("Phase 4: Analyzing path patterns...")
-        path_analysis = self._analyze_path_patterns(target_paths)
+        # Phases 1-4: single streaming pass producing one feature record per file
+        self.logger.info("Phases 1-4: Extracting content, structural, metadata and path features...")
+        accumulator = self.collect_features(target_paths, state_path=state_path, max_workers=max_workers)
+        content_analysis, structural_analysis, metadata_analysis, path_analysis = self._split_feature_records(accumulator)
+        self.field_usage_matrix = accumulator.field_usage_matrix()
         
         # Phase 5: Composite classification
         self.logger.info("Phase 5: Generating composite profiles...")
@@ -89,6 +395,7 @@ class UniversalDocumentTypeAnalyzer:
             'document_types_identified': composite_profiles,
             'shacl_profile_suggestions': shacl_profiles,
             'field_usage_matrix': self.field_usage_matrix,
+            'aggregate_statistics': accumulator.aggregate_statistics(),
             'recommended_actions': self._generate_action_recommendations(),
             'analysis_metadata': {
                 'target_paths': [str(p) for p in target_paths],
@@ -101,201 +408,60 @@ class UniversalDocumentTypeAnalyzer:
         self.logger.info(f"Analysis complete. Found {len(composite_profiles)} document types.")
         return results
     
-    def _analyze_content_patterns(self, target_paths: List[Path]) -> Dict[str, Any]:
-        """Analyze document content to infer types based on content patterns."""
-        patterns = {
-            'standard-definition': [
-                r'## STANDARD DEFINITION',
-                r'standard_id:',
-                r'## COMPLIANCE REQUIREMENTS',
-                r'## STANDARD SCOPE',
-                r'## VALIDATION CRITERIA'
-            ],
-            'technical-report': [
-                r'## EXECUTIVE SUMMARY',
-                r'## ANALYSIS',
-                r'Report Date:',
-                r'## FINDINGS',
-                r'## RECOMMENDATIONS'
-            ],
-            'policy-document': [
-                r'## POLICY STATEMENT',
-                r'## MANDATORY REQUIREMENTS',
-                r'lifecycle_gatekeeper:',
-                r'## ENFORCEMENT',
-                r'## COMPLIANCE'
-            ],
-            'meeting-notes': [
-                r'## ATTENDEES',
-                r'## ACTION ITEMS',
-                r'Meeting Date:',
-                r'## DECISIONS',
-                r'## NEXT STEPS'
-            ],
-            'process-document': [
-                r'## PROCESS OVERVIEW',
-                r'## STEPS',
-                r'## WORKFLOW',
-                r'## METHODOLOGY'
-            ],
-            'guide-document': [
-                r'## INTRODUCTION',
-                r'## GETTING STARTED',
-                r'## TUTORIAL',
-                r'## EXAMPLES'
-            ],
-            'general-document': [
-                # Fallback patterns
-                r'# .+',  # Any heading
-                r'## .+'  # Any sub-heading
-            ]
-        }
-        
-        classification_results = {}
-        
-        for path in target_paths:
-            for md_file in path.rglob("*.md"):
-                try:
-                    content = md_file.read_text(encoding='utf-8', errors='ignore')
-                    scores = {}
-                    
-                    for doc_type, pattern_list in patterns.items():
-                        score = sum(1 for pattern in pattern_list 
-                                  if re.search(pattern, content, re.IGNORECASE))
-                        scores[doc_type] = score
-                    
-                    # Assign type based on highest score
-                    best_type = max(scores, key=scores.get) if scores and max(scores.values()) > 0 else 'general-document'
-                    classification_results[str(md_file)] = {
-                        'inferred_type': best_type,
-                        'confidence_scores': scores,
-                        'current_frontmatter': self._extract_frontmatter(content),
-                        'content_length': len(content),
-                        'heading_count': len(re.findall(r'^#+\s', content, re.MULTILINE))
-                    }
-                    
-                except Exception as e:
-                    self.logger.warning(f"Error analyzing {md_file}: {e}")
-        
-        return classification_results
-    
-    def _analyze_structural_patterns(self, target_paths: List[Path]) -> Dict[str, Any]:
-        """Analyze document structure patterns."""
-        structural_analysis = {}
-        
-        for path in target_paths:
-            for md_file in path.rglob("*.md"):
-                try:
-                    content = md_file.read_text(encoding='utf-8', errors='ignore')
-                    
-                    # Analyze document structure
-                    structure = {
-                        'has_frontmatter': content.startswith('---'),
-                        'heading_levels': self._extract_heading_levels(content),
-                        'has_code_blocks': bool(re.search(r'```', content)),
-                        'has_tables': bool(re.search(r'\|.*\|', content)),
-                        'has_lists': bool(re.search(r'^\s*[-\*\+]\s', content, re.MULTILINE)),
-                        'has_numbered_lists': bool(re.search(r'^\s*\d+\.\s', content, re.MULTILINE)),
-                        'has_links': bool(re.search(r'\[.*\]\(.*\)', content)),
-                        'paragraph_count': len(re.findall(r'\n\s*\n', content))
-                    }
-                    
-                    structural_analysis[str(md_file)] = structure
-                    
-                except Exception as e:
-                    self.logger.warning(f"Error analyzing structure of {md_file}: {e}")
+    def collect_features(self, target_paths: Iterable[Path], state_path: Optional[Path] = None,
+                         max_workers: Optional[int] = None) -> FeatureAccumulator:
+        """
+        Build the feature accumulator for all Markdown files under target_paths.
         
-        return structural_analysis
-    
-    def _analyze_metadata_patterns(self, target_paths: List[Path]) -> Dict[str, Any]:
-        """Analyze existing metadata patterns in frontmatter."""
-        metadata_analysis = {}
-        field_usage = defaultdict(int)
-        field_patterns = defaultdict(set)
+        Files whose (mtime_ns, size) match the persisted state are reused, files
+        that no longer exist are dropped, and the rest are scanned, partitioned
+        across a process pool when there are enough of them.
+        """
+        accumulator = FeatureAccumulator.load(state_path) if state_path else FeatureAccumulator()
         
+        current_files = {}
         for path in target_paths:
             for md_file in path.rglob("*.md"):
                 try:
-                    content = md_file.read_text(encoding='utf-8', errors='ignore')
-                    frontmatter = self._extract_frontmatter(content)
-                    
-                    if frontmatter:
-                        # Track field usage
-                        for field, value in frontmatter.items():
-                            field_usage[field] += 1
-                            if isinstance(value, str):
-                                field_patterns[field].add(value)
-                            elif isinstance(value, list):
-                                for item in value:
-                                    if isinstance(item, str):
-                                        field_patterns[field].add(item)
-                        
-                        metadata_analysis[str(md_file)] = {
-                            'fields_present': list(frontmatter.keys()),
-                            'field_count': len(frontmatter),
-                            'info_type': frontmatter.get('info_type'),
-                            'has_standard_id': 'standard_id' in frontmatter,
-                            'has_kb_id': 'kb_id' in frontmatter,
-                            'criticality': frontmatter.get('criticality'),
-                            'frontmatter_data': frontmatter
-                        }
-                    else:
-                        metadata_analysis[str(md_file)] = {
-                            'fields_present': [],
-                            'field_count': 0,
-                            'info_type': None,
-                            'has_standard_id': False,
-                            'has_kb_id': False,
-                            'criticality': None,
-                            'frontmatter_data': {}
-                        }
-                        
-                except Exception as e:
-                    self.logger.warning(f"Error analyzing metadata of {md_file}: {e}")
-        
-        # Store field usage matrix for later use
-        self.field_usage_matrix = {
-            'usage_counts': dict(field_usage),
-            'value_patterns': {k: list(v) for k, v in field_patterns.items()}
-        }
+                    stat = md_file.stat()
+                except OSError:
+                    continue
+                current_files[str(md_file)] = [stat.st_mtime_ns, stat.st_size]
+        
+        for stale_path in [p for p in accumulator.records if p not in current_files]:
+            accumulator.remove(stale_path)
+        to_scan = sorted(
+            file_path for file_path, signature in current_files.items()
+            if accumulator.records.get(file_path, {}).get('signature') != signature
+        )
+        self.logger.info(f"{len(current_files)} files found, {len(to_scan)} to scan, "
+                         f"{len(current_files) - len(to_scan)} reused from previous state")
+        
+        workers = max_workers or os.cpu_count() or 1
+        if workers > 1 and len(to_scan) >= self.PARALLEL_THRESHOLD:
+            partitions = [to_scan[i::workers] for i in range(workers)]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for partial in executor.map(_scan_partition, partitions):
+                    accumulator.merge(partial)
+        else:
+            accumulator.merge(_scan_partition(to_scan))
         
-        return metadata_analysis
+        if state_path:
+            accumulator.save(state_path)
+        return accumulator
     
-    def _analyze_path_patterns(self, target_paths: List[Path]) -> Dict[str, Any]:
-        """Analyze file path patterns for type inference."""
-        path_patterns = {
-            'standard-definition': [r'standards/src/', r'/standards/', r'.*-STANDARD.*', r'.*POLICY.*'],
-            'technical-report': [r'tools/reports/', r'/reports/', r'.*-report.*', r'.*-analysis.*'],
-            'policy-document': [r'standards/src/.*POLICY.*', r'/policies/', r'.*-policy.*'],
-            'meeting-notes': [r'meetings/', r'/notes/', r'.*-notes.*', r'.*-meeting.*'],
-            'guide-document': [r'guides/', r'/guide/', r'.*-guide.*', r'.*tutorial.*'],
-            'general-document': []  # Fallback
-        }
-        
-        path_analysis = {}
-        
-        for path in target_paths:
-            for md_file in path.rglob("*.md"):
-                file_path_str = str(md_file)
-                scores = {}
-                
-                for doc_type, pattern_list in path_patterns.items():
-                    score = sum(1 for pattern in pattern_list 
-                              if re.search(pattern, file_path_str, re.IGNORECASE))
-                    scores[doc_type] = score
-                
-                # Determine best match
-                best_type = max(scores, key=scores.get) if scores and max(scores.values()) > 0 else 'general-document'
-                
-                path_analysis[file_path_str] = {
-                    'inferred_type': best_type,
-                    'path_scores': scores,
-                    'file_name': md_file.name,
-                    'directory': str(md_file.parent),
-                    'depth': len(md_file.parts)
-                }
-        
-        return path_analysis
+    def _split_feature_records(self, accumulator: FeatureAccumulator) -> Tuple[Dict, Dict, Dict, Dict]:
+        """Project per-file records onto the content/structural/metadata/path views."""
+        content_analysis, structural_analysis, metadata_analysis, path_analysis = {}, {}, {}, {}
+        for file_path in sorted(accumulator.records):
+            record = accumulator.records[file_path]
+            # The frontmatter is stored once per record but reported in both views
+            content_analysis[file_path] = {**record['content'],
+                                           'current_frontmatter': record['metadata']['frontmatter_data']}
+            structural_analysis[file_path] = record['structure']
+            metadata_analysis[file_path] = record['metadata']
+            path_analysis[file_path] = record['path_features']
+        return content_analysis, structural_analysis, metadata_analysis, path_analysis
     
     def _generate_composite_profiles(self, content_analysis: Dict, structural_analysis: Dict,
                                    metadata_analysis: Dict, path_analysis: Dict) -> Dict[str, Any]:
@@ -317,7 +483,7 @@ class UniversalDocumentTypeAnalyzer:
         })
         
         # Get all files that were analyzed
-        all_files = set(content_analysis.keys()) | set(structural_analysis.keys()) | set(metadata_analysis.keys()) | set(path_analysis.keys())
+        all_files = sorted(set(content_analysis.keys()) | set(structural_analysis.keys()) | set(metadata_analysis.keys()) | set(path_analysis.keys()))
         
         for file_path in all_files:
             # Collect analysis results for this file
@@ -466,12 +632,16 @@ kb:{clean_type}Profile a sh:NodeShape ;
         
         return recommendations
     
-    def generate_kb_import_profile(self, kb_source_path: str) -> Dict[str, Any]:
+    def generate_kb_import_profile(self, kb_source_path: str, state_path: Optional[str] = None,
+                                   max_workers: Optional[int] = None) -> Dict[str, Any]:
         """
         Special methodology for analyzing imported KBs.
         Generates import-specific profiles and mapping recommendations.
+        Pass state_path to resume from, and update, a previous run over the same KB.
         """
-        import_analysis = self.analyze_on_demand([Path(kb_source_path)], kb_import_mode=True)
+        import_analysis = self.analyze_on_demand([Path(kb_source_path)], kb_import_mode=True,
+                                                 state_path=Path(state_path) if state_path else None,
+                                                 max_workers=max_workers)
         
         mapping_recommendations = {
             'field_mappings': self._suggest_field_mappings(import_analysis),
@@ -509,24 +679,11 @@ kb:{clean_type}Profile a sh:NodeShape ;
     
     def _extract_frontmatter(self, content: str) -> Dict[str, Any]:
         """Extract and parse YAML frontmatter from document content."""
-        if not content.startswith('---'):
-            return {}
-        
-        try:
-            # Find the end of frontmatter
-            end_match = re.search(r'\n---\s*\n', content)
-            if not end_match:
-                return {}
-            
-            frontmatter_text = content[3:end_match.start()]
-            return yaml.safe_load(frontmatter_text) or {}
-        except yaml.YAMLError:
-            return {}
+        return _extract_frontmatter(content)
     
     def _extract_heading_levels(self, content: str) -> List[int]:
         """Extract heading levels from document content."""
-        headings = re.findall(r'^(#+)\s', content, re.MULTILINE)
-        return [len(heading) for heading in headings]
+        return [len(heading) for heading in _HEADING_PATTERN.findall(content)]
 
 
 if __name__ == "__main__":
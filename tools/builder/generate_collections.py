@@ -4,9 +4,14 @@
 import json
 import os
 import datetime
+import hashlib
+import shutil
+import tempfile
+import threading
 import yaml # Using PyYAML
 import re
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import argparse
 import logging
 
@@ -117,10 +122,26 @@ def filter_standards(all_standards_map, criteria_list):
             filtered_list.append(standard_meta)
     return filtered_list
 
+# Regex to find [[STANDARD_ID(#target-sub-anchor)?(|alias)?]]
+LINK_PATTERN = re.compile(r"\[\[([A-Z]{2}-[A-Z]{2,6}-[A-Z0-9\-]+)((?:#[A-Za-z0-9\-]+)*)(?:\|([^\]]+))?\]\]")
+
+# Bump when the rendered output format changes so existing build manifests are invalidated.
+BUILD_FORMAT_VERSION = 1
+# Kept outside the published output directory (relative to --repo-base)
+DEFAULT_BUILD_MANIFEST = os.path.join(".build-cache", "collections-build-manifest.json")
+
+def _default_file_mode():
+    """Mode open(path, 'w') gives a new file: 0666 less the process umask."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+# Computed once at import; os.umask is process-wide and not safe to toggle from worker threads
+DEFAULT_FILE_MODE = _default_file_mode()
+
 def resolve_internal_links(body_content, current_collection_standard_ids_map, all_standards_map, used_anchors_in_collection):
     """Resolves [[STANDARD_ID]] and [[STANDARD_ID#anchor]] links within the body content."""
-    # Regex to find [[STANDARD_ID(#target-sub-anchor)?(|alias)?]]
-    link_pattern = r"\[\[([A-Z]{2}-[A-Z]{2,6}-[A-Z0-9\-]+)((?:#[A-Za-z0-9\-]+)*)(?:\|([^\]]+))?\]\]"
+    link_pattern = LINK_PATTERN
     # Group 1: STANDARD_ID
     # Group 2: #target-sub-anchor (optional, can be multiple like #anchor1#anchor2 - though unusual)
     # Group 3: |alias (optional, only last part)
@@ -168,7 +189,127 @@ def resolve_internal_links(body_content, current_collection_standard_ids_map, al
     return re.sub(link_pattern, replace_link, body_content)
 
 
-def generate_single_collection(collection_def, all_standards_map, output_dir, repo_base_dir):
+class StandardBodyCache:
+    """
+    Per-run cache of standard files shared by all collections.
+    Each file is read, hashed and stripped of frontmatter once; link-resolved bodies
+    are memoized by the subset of their link targets that belong to the collection,
+    since that is the only collection-specific input to resolve_internal_links.
+    """
+
+    def __init__(self, repo_base_dir):
+        self.repo_base_dir = repo_base_dir
+        self._entries = {}
+        self._resolved = {}
+        self._lock = threading.Lock()
+
+    def get(self, relative_path):
+        """Returns a dict with 'hash', 'body' and 'link_targets', or 'error' if unreadable."""
+        with self._lock:
+            entry = self._entries.get(relative_path)
+        if entry is not None:
+            return entry
+
+        filepath_abs = os.path.join(self.repo_base_dir, relative_path)
+        try:
+            with open(filepath_abs, 'rb') as f_std:
+                raw = f_std.read()
+            body = get_body_content_from_markdown(raw.decode('utf-8'))
+            entry = {
+                "hash": hashlib.sha256(raw).hexdigest(),
+                "body": body,
+                "link_targets": frozenset(m.group(1) for m in LINK_PATTERN.finditer(body)),
+            }
+        except Exception as e:
+            entry = {"hash": None, "error": e}
+
+        with self._lock:
+            return self._entries.setdefault(relative_path, entry)
+
+    def get_resolved_body(self, relative_path, current_collection_standard_ids_map, all_standards_map, used_anchors_in_collection):
+        entry = self.get(relative_path)
+        if "error" in entry:
+            raise entry["error"]
+        in_collection_targets = entry["link_targets"].intersection(current_collection_standard_ids_map)
+        cache_key = (relative_path, in_collection_targets)
+        with self._lock:
+            resolved = self._resolved.get(cache_key)
+        if resolved is None:
+            resolved = resolve_internal_links(entry["body"], current_collection_standard_ids_map, all_standards_map, used_anchors_in_collection)
+            with self._lock:
+                self._resolved[cache_key] = resolved
+        return resolved
+
+def select_collection_members(collection_def, all_standards_map):
+    """Returns the sorted list of standard metadata entries matching a collection definition."""
+    included_standards_metadata_list = filter_standards(all_standards_map, collection_def.get("criteria", []))
+    # Sort standards by standard_id for consistent ToC and content order
+    included_standards_metadata_list.sort(key=lambda x: x.get('standard_id', ''))
+    return included_standards_metadata_list
+
+def compute_collection_fingerprint(collection_def, members, all_standards_map, body_cache):
+    """
+    Hashes every input that affects a collection's rendered output: its definition,
+    the content and titles of its member standards, and the titles of any standards
+    their bodies link to (used as link display text).
+    """
+    member_inputs = []
+    linked_titles = {}
+    for standard_meta in members:
+        entry = body_cache.get(standard_meta.get('filepath'))
+        member_inputs.append([standard_meta.get('standard_id'), standard_meta.get('title'), standard_meta.get('filepath'), entry["hash"]])
+        for target_id in entry.get("link_targets", ()):
+            linked_titles[target_id] = (all_standards_map.get(target_id) or {}).get("title")
+
+    payload = json.dumps({
+        "format_version": BUILD_FORMAT_VERSION,
+        "definition": collection_def,
+        "members": member_inputs,
+        "linked_titles": linked_titles,
+    }, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def load_build_manifest(manifest_path):
+    """Loads the per-collection fingerprints recorded by the previous build."""
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get("format_version") != BUILD_FORMAT_VERSION:
+            return {}
+        return data.get("collections", {})
+    except FileNotFoundError:
+        return {}
+    except (json.JSONDecodeError, AttributeError) as e:
+        logging.warning(f"Ignoring unreadable build manifest {manifest_path}: {e}")
+        return {}
+
+def write_file_atomically(output_filepath, content):
+    """
+    Writes content to a temporary file in the target directory, then renames it into place.
+    The result keeps the existing file's mode, or gets the umask default for a new file
+    (mkstemp creates temp files as 0600).
+    """
+    output_dir = os.path.dirname(output_filepath) or "."
+    fd, temp_path = tempfile.mkstemp(dir=output_dir, prefix=".tmp-", suffix=".md")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f_tmp:
+            f_tmp.write(content)
+            f_tmp.flush()
+            os.fsync(f_tmp.fileno())
+        if os.path.exists(output_filepath):
+            shutil.copymode(output_filepath, temp_path)
+        else:
+            os.chmod(temp_path, DEFAULT_FILE_MODE)
+        os.replace(temp_path, output_filepath)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def generate_single_collection(collection_def, all_standards_map, output_dir, repo_base_dir, body_cache=None, members=None):
     collection_id = collection_def.get('id', 'unknown-collection')
     collection_title = collection_def.get('title', 'Untitled Collection')
     collection_filename = collection_def.get('output_filename', f"{collection_id}.md")
@@ -176,19 +317,17 @@ def generate_single_collection(collection_def, all_standards_map, output_dir, re
     
     logging.info(f"Processing collection: {collection_title} (ID: {collection_id})")
 
-    criteria = collection_def.get("criteria", [])
-    included_standards_metadata_list = filter_standards(all_standards_map, criteria)
+    if body_cache is None:
+        body_cache = StandardBodyCache(repo_base_dir)
+    included_standards_metadata_list = members if members is not None else select_collection_members(collection_def, all_standards_map)
 
     if not included_standards_metadata_list:
         logging.info(f"  No standards matched criteria for: {collection_title}")
-        return
+        return None
 
     logging.info(f"  Found {len(included_standards_metadata_list)} standards for collection '{collection_title}'.")
     
     current_collection_standard_ids_map = {std_meta['standard_id']: std_meta for std_meta in included_standards_metadata_list}
-    
-    # Sort standards by standard_id for consistent ToC and content order
-    included_standards_metadata_list.sort(key=lambda x: x.get('standard_id', ''))
 
     collection_frontmatter_str = f"""---
 title: "{collection_title}"
@@ -224,11 +363,8 @@ info-type: "collection-document"
         
         try:
             logging.debug(f"    Aggregating: {standard_id} - {standard_title}")
-            with open(standard_filepath_abs, 'r', encoding='utf-8') as f_std:
-                file_content = f_std.read()
-                body_content = get_body_content_from_markdown(file_content)
-                resolved_body_content = resolve_internal_links(body_content, current_collection_standard_ids_map, all_standards_map, used_anchors_this_collection)
-                aggregated_content_parts.append(resolved_body_content.strip() + "\n\n---\n")
+            resolved_body_content = body_cache.get_resolved_body(standard_meta.get('filepath'), current_collection_standard_ids_map, all_standards_map, used_anchors_this_collection)
+            aggregated_content_parts.append(resolved_body_content.strip() + "\n\n---\n")
         except FileNotFoundError:
             logging.error(f"  File not found for '{standard_title}' at {standard_filepath_abs}. Content will be missing.")
             aggregated_content_parts.append(f"*Error: Content for '{standard_title}' (`{standard_id}`) could not be loaded. File not found.* \n\n---\n")
@@ -242,11 +378,73 @@ info-type: "collection-document"
 
     output_filepath = os.path.join(output_dir, collection_filename)
     try:
-        with open(output_filepath, 'w', encoding='utf-8') as f_coll:
-            f_coll.write(final_markdown)
+        write_file_atomically(output_filepath, final_markdown)
         logging.info(f"  Successfully wrote collection: {output_filepath}")
+        return True
     except IOError as e:
         logging.error(f"  Error writing collection file {output_filepath}: {e}")
+        return False
+
+def build_collections(collection_defs, all_standards_map, output_dir, repo_base_dir, force=False, max_workers=None, manifest_path=None):
+    """
+    Incrementally builds collections. A collection is rebuilt only when its fingerprint
+    differs from the one recorded in the build manifest or its output file is missing.
+    Stale collections are generated in parallel and share one StandardBodyCache.
+    The manifest defaults to DEFAULT_BUILD_MANIFEST under repo_base_dir, so it is never
+    part of the published output. Returns a (rebuilt, skipped) tuple of collection IDs.
+    """
+    manifest_path = manifest_path or os.path.join(repo_base_dir, DEFAULT_BUILD_MANIFEST)
+    previous = {} if force else load_build_manifest(manifest_path)
+    body_cache = StandardBodyCache(repo_base_dir)
+
+    current = {}
+    stale = []
+    skipped = []
+    for collection_def in collection_defs:
+        collection_id = collection_def.get('id', 'unknown-collection')
+        collection_filename = collection_def.get('output_filename', f"{collection_id}.md")
+        members = select_collection_members(collection_def, all_standards_map)
+        fingerprint = compute_collection_fingerprint(collection_def, members, all_standards_map, body_cache)
+        current[collection_id] = {"fingerprint": fingerprint, "output_filename": collection_filename}
+
+        recorded = previous.get(collection_id, {})
+        if (recorded.get("fingerprint") == fingerprint
+                and (not members or os.path.exists(os.path.join(output_dir, collection_filename)))):
+            logging.info(f"Skipping unchanged collection: {collection_def.get('title', collection_id)} (ID: {collection_id})")
+            skipped.append(collection_id)
+        else:
+            stale.append((collection_def, members))
+
+    rebuilt = []
+    failed = set()
+    if stale:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(generate_single_collection, collection_def, all_standards_map, output_dir, repo_base_dir, body_cache, members): collection_def.get('id', 'unknown-collection')
+                for collection_def, members in stale
+            }
+            for future in as_completed(futures):
+                collection_id = futures[future]
+                try:
+                    result = future.result()
+                    if result:
+                        rebuilt.append(collection_id)
+                    elif result is False:
+                        failed.add(collection_id)
+                except Exception as e:
+                    logging.error(f"  Failed to build collection {collection_id}: {e}")
+                    failed.add(collection_id)
+
+    # Failed collections keep no fingerprint so they are retried on the next run
+    for collection_id in failed:
+        current.pop(collection_id, None)
+    try:
+        os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+        write_file_atomically(manifest_path, json.dumps({"format_version": BUILD_FORMAT_VERSION, "collections": current}, indent=2, sort_keys=True))
+    except IOError as e:
+        logging.error(f"Error writing build manifest {manifest_path}: {e}")
+
+    return sorted(rebuilt), skipped
 
 def main():
     parser = argparse.ArgumentParser(description="Generate derived collection views from a standards index.")
@@ -254,6 +452,9 @@ def main():
     parser.add_argument("--index-file", default="dist/standards_index.json", help="Path to the standards index JSON file, relative to repo-base.")
     parser.add_argument("--definitions-file", default="tools/builder/collection_definitions.yaml", help="Path to the collection definitions YAML file, relative to repo-base.")
     parser.add_argument("--output-dir", default="dist/collections", help="Directory to save generated collection files, relative to repo-base.")
+    parser.add_argument("--manifest-file", default=DEFAULT_BUILD_MANIFEST, help="Path to the incremental build manifest, relative to repo-base.")
+    parser.add_argument("--force", action="store_true", help="Rebuild every collection, ignoring the build manifest.")
+    parser.add_argument("--jobs", type=int, default=None, help="Maximum number of collections to build in parallel.")
     parser.add_argument("--log-level", default="INFO", choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"], help="Set the logging level.")
     
     args = parser.parse_args()
@@ -265,6 +466,7 @@ def main():
     index_file_abs = os.path.abspath(os.path.join(repo_base_abs, args.index_file))
     collection_config_abs = os.path.abspath(os.path.join(repo_base_abs, args.definitions_file))
     output_dir_abs = os.path.abspath(os.path.join(repo_base_abs, args.output_dir))
+    manifest_file_abs = os.path.abspath(os.path.join(repo_base_abs, args.manifest_file))
 
     if not os.path.exists(output_dir_abs):
         os.makedirs(output_dir_abs)
@@ -283,10 +485,9 @@ def main():
     logging.info(f"Loaded {len(all_standards_map)} standards from index.")
     logging.info(f"Loaded {len(collection_defs)} collection definitions.")
 
-    for collection_def in collection_defs:
-        generate_single_collection(collection_def, all_standards_map, output_dir_abs, repo_base_abs)
+    rebuilt, skipped = build_collections(collection_defs, all_standards_map, output_dir_abs, repo_base_abs, force=args.force, max_workers=args.jobs, manifest_path=manifest_file_abs)
     
-    logging.info("Collection generation process completed.")
+    logging.info(f"Collection generation process completed: {len(rebuilt)} rebuilt, {len(skipped)} unchanged.")
 
 if __name__ == "__main__":
     main()
@@ -7,6 +7,11 @@ Manages date-created and date-modified fields in frontmatter using:
 - Manual updates with YYYY-MM-DD or YYYY-MM-DD-HH-MM format
 - Git commit integration with automatic timestamp updates
 - Date locking mechanism to prevent automatic updates
+
+Change detection for a batch of files is a single
+``git diff --numstat -z --ignore-all-space`` call, and updates run on a
+bounded worker pool. Each file is validated in memory and written
+atomically (temp file + rename), so no backup copy or re-read is needed.
 """
 
 import os
@@ -14,12 +19,17 @@ import sys
 import json
 import argparse
 import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 import re
 import subprocess
 import yaml
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from tools.scribe.utils.frontmatter_parser import split_frontmatter
+
 # Canonical key order from linter (kb_linter.py)
 CANONICAL_KEY_ORDER = [
     "title", "standard_id", "aliases", "tags", "kb-id", "info-type",
@@ -28,8 +38,30 @@ CANONICAL_KEY_ORDER = [
     "criticality", "lifecycle_gatekeeper", "impact_areas"
 ]
 
+# Default upper bound on concurrent file updates
+DEFAULT_MAX_WORKERS = min(8, (os.cpu_count() or 1) + 4)
+
+
+def write_file_atomically(file_path, content):
+    """Write content via a temp file in the same directory, then rename over the target."""
+    file_path = Path(file_path)
+    fd, tmp_path = tempfile.mkstemp(dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        if file_path.exists():
+            shutil.copymode(file_path, tmp_path)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
 class DateTimeManager:
-    def init(self, root_dir="."):
+    def __init__(self, root_dir="."):
         self.root_dir = Path(root_dir)
         self.lock_marker = "# date-locked"
         
@@ -46,19 +78,13 @@ class DateTimeManager:
     
     def parse_frontmatter(self, content):
         """Parse YAML frontmatter from markdown content"""
-        if not content.startswith('---\n'):
+        document = split_frontmatter(content)
+        if not document.has_frontmatter:
             return None, content
         
         try:
-            # Find end of frontmatter
-            end_marker = content.find('\n---\n', 4)
-            if end_marker == -1:
-                return None, content
-            
-            frontmatter_yaml = content[4:end_marker]
-            body = content[end_marker + 5:]
-            frontmatter = yaml.safe_load(frontmatter_yaml)
-            return frontmatter, body
+            frontmatter = document.parse()
+            return frontmatter, document.body
             
         except yaml.YAMLError:
             return None, content
@@ -103,13 +129,21 @@ class DateTimeManager:
         if backup_path.exists():
             backup_path.unlink()
     
-    def validate_yaml_integrity(self, content):
-        """Validate YAML frontmatter integrity"""
+    def validate_yaml_integrity(self, content, expected_frontmatter=None):
+        """Validate YAML frontmatter integrity, optionally against the intended fields"""
         try:
             frontmatter, body = self.parse_frontmatter(content)
             if frontmatter is None:
                 return False, "No valid frontmatter found"
             
+            if expected_frontmatter is not None:
+                # The serialized text must round-trip to the same set of fields
+                if set(frontmatter) != set(expected_frontmatter):
+                    return False, "Serialized frontmatter does not round-trip to the same fields"
+                for key in ('date-created', 'date-modified'):
+                    if key in expected_frontmatter and str(frontmatter.get(key)) != str(expected_frontmatter[key]):
+                        return False, f"Serialized {key} does not round-trip"
+            
             # Re-serialize to check if it's valid
             yaml.dump(frontmatter, default_flow_style=False)
             return True, "Valid"
@@ -149,8 +183,6 @@ class DateTimeManager:
 
     def update_frontmatter_dates(self, file_path, manual_date=None, include_time=False, force=False, dry_run=False):
         """Update date fields in frontmatter with safety measures"""
-        backup_path = None
-        
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
@@ -165,10 +197,6 @@ class DateTimeManager:
                 print(f"No frontmatter found in {file_path}")
                 return False
             
-            # Create backup before any changes
-            if not dry_run:
-                backup_path = self.create_backup(file_path)
-            
             # Get timestamps
             created, modified = self.get_file_timestamps(file_path)
             
@@ -191,12 +219,10 @@ class DateTimeManager:
             frontmatter_yaml = self.serialize_frontmatter_with_order(frontmatter)
             new_content = f"---\n{frontmatter_yaml}---\n{body}"
             
-            # Validate new content before writing
-            is_valid, validation_msg = self.validate_yaml_integrity(new_content)
+            # Validate new content in memory before writing
+            is_valid, validation_msg = self.validate_yaml_integrity(new_content, frontmatter)
             if not is_valid:
                 print(f"Validation failed for {file_path}: {validation_msg}")
-                if backup_path:
-                    backup_path.unlink()  # Remove backup since we didn't modify
                 return False
             
             if dry_run:
@@ -205,60 +231,68 @@ class DateTimeManager:
                 print(f"  New date-modified: {frontmatter.get('date-modified', 'None')}")
                 return True
             
-            # Write to file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
-            
-            # Verify the file was written correctly
-            with open(file_path, 'r', encoding='utf-8') as f:
-                verify_content = f.read()
-            
-            is_valid, validation_msg = self.validate_yaml_integrity(verify_content)
-            if not is_valid:
-                print(f"File corruption detected after write: {validation_msg}")
-                print(f"Restoring backup for {file_path}")
-                self.restore_backup(file_path)
-                return False
-            
-            # Success - cleanup backup
-            self.cleanup_backup(file_path)
+            # Atomic replace: the file is either fully old or fully new
+            write_file_atomically(file_path, new_content)
             return True
             
         except Exception as e:
             print(f"Error processing {file_path}: {e}")
-            # Restore backup if something went wrong
-            if backup_path and backup_path.exists():
-                print(f"Restoring backup for {file_path}")
-                self.restore_backup(file_path)
             return False
     
-    def is_real_change(self, file_path):
-        """Check if file has real content changes (not just line endings/formatting)"""
+    def _resolve_path(self, file_path):
+        """Resolve a path the way git does when run from root_dir"""
+        path = Path(file_path)
+        if not path.is_absolute():
+            path = self.root_dir / path
+        return path.resolve()
+    
+    def get_real_changes(self, file_paths):
+        """
+        Return the subset of file_paths with real content changes against HEAD.
+        
+        Runs one ``git diff --numstat -z --ignore-all-space`` for the whole
+        set: whitespace/line-ending-only edits drop out of the output, and
+        any listed file has real changes. Files git does not report (clean
+        or untracked) are not real changes. If git fails, every file is
+        assumed to have changed.
+        """
+        file_paths = list(file_paths)
+        if not file_paths:
+            return set()
+        
+        resolved = {self._resolve_path(p): p for p in file_paths}
         try:
             result = subprocess.run(
-                ['git', 'diff', '--word-diff=porcelain', 'HEAD', str(file_path)],
-                capture_output=True, text=True, cwd=self.root_dir
+                ['git', 'diff', '--numstat', '-z', '--ignore-all-space', '--no-renames',
+                 '--relative', 'HEAD', '--'] + [str(p) for p in resolved],
+                capture_output=True, cwd=self.root_dir
             )
-            
-            if result.returncode != 0:
-                # File not in git or other error, assume real change
-                return True
-            
-            diff_output = result.stdout
-            
-            # Check for real changes (not just whitespace/line endings)
-            for line in diff_output.split('\n'):
-                if line.startswith('+') or line.startswith('-'):
-                    # Skip pure whitespace changes
-                    content = line[1:].strip()
-                    if content and not content.isspace():
-                        return True
-            
-            return False
-            
         except Exception:
-            # If git check fails, assume real change
-            return True
+            return set(file_paths)
+        
+        if result.returncode != 0:
+            # Not a git repository or other error, assume real changes
+            return set(file_paths)
+        
+        changed = set()
+        for record in result.stdout.decode('utf-8', errors='surrogateescape').split('\0'):
+            if not record:
+                continue
+            parts = record.split('\t', 2)
+            if len(parts) != 3:
+                continue
+            added, deleted, rel_path = parts
+            # Binary files report "-" for both counts
+            if added == '0' and deleted == '0':
+                continue
+            original = resolved.get(self._resolve_path(rel_path))
+            if original is not None:
+                changed.add(original)
+        return changed
+    
+    def is_real_change(self, file_path):
+        """Check if file has real content changes (not just line endings/formatting)"""
+        return file_path in self.get_real_changes([file_path])
     
     def lock_dates(self, file_path):
         """Add date-locked marker to prevent automatic updates"""
@@ -312,10 +346,9 @@ class DateTimeManager:
             print(f"Error unlocking {file_path}: {e}")
             return False
     
-    def update_multiple_files(self, file_paths, manual_date=None, include_time=False, check_changes=False, dry_run=False, force=False):
+    def update_multiple_files(self, file_paths, manual_date=None, include_time=False, check_changes=False, dry_run=False, force=False, max_workers=None):
         """Update multiple files with date/time"""
-        updated_count = 0
-        
+        candidates = []
         for file_path in file_paths:
             if not file_path.exists():
                 print(f"File not found: {file_path}")
@@ -325,19 +358,34 @@ class DateTimeManager:
                 print(f"Skipping non-markdown file: {file_path}")
                 continue
             
-            # Check for real changes if requested
-            if check_changes and not self.is_real_change(file_path):
-                print(f"Skipping {file_path}: no real content changes")
-                continue
-            
-            if self.update_frontmatter_dates(file_path, manual_date, include_time, force, dry_run):
-                updated_count += 1
+            candidates.append(file_path)
+        
+        # Check for real changes if requested (one git call for the batch)
+        if check_changes and candidates:
+            real_changes = self.get_real_changes(candidates)
+            for file_path in candidates:
+                if file_path not in real_changes:
+                    print(f"Skipping {file_path}: no real content changes")
+            candidates = [p for p in candidates if p in real_changes]
+        
+        if not candidates:
+            return 0
+        
+        def update(file_path):
+            return self.update_frontmatter_dates(file_path, manual_date, include_time, force, dry_run)
+        
+        workers = max(1, min(max_workers or DEFAULT_MAX_WORKERS, len(candidates)))
+        if workers == 1:
+            return sum(1 for file_path in candidates if update(file_path))
         
-        return updated_count
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return sum(1 for updated in executor.map(update, candidates) if updated)
 
 def main():
     parser = argparse.ArgumentParser(description="Manage date/time fields in frontmatter")
     parser.add_argument("--root", "-r", default=".", help="Root directory to scan")
+    parser.add_argument("--workers", type=int, default=None,
+                        help=f"Maximum concurrent file updates (default: {DEFAULT_MAX_WORKERS})")
     
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
     
@@ -388,7 +436,8 @@ def main():
         file_paths = [Path(f) for f in args.files]
         dry_run = getattr(args, 'dry_run', False)
         count = manager.update_multiple_files(file_paths, manual_date, args.time, 
-                                            check_changes=False, dry_run=dry_run, force=args.force)
+                                            check_changes=False, dry_run=dry_run, force=args.force,
+                                            max_workers=args.workers)
         if dry_run:
             print(f"DRY RUN: Would update {count} files")
         else:
@@ -401,7 +450,8 @@ def main():
         
         file_paths = [Path(f) for f in args.files]
         count = manager.update_multiple_files(file_paths, manual_date, args.time, 
-                                            check_changes=False, dry_run=True, force=False)
+                                            check_changes=False, dry_run=True, force=False,
+                                            max_workers=args.workers)
         print(f"DRY RUN: Would update {count} files")
     
     elif args.command == "commit-update":
@@ -419,7 +469,8 @@ def main():
                 print("Could not get changed files from git")
                 return
         
-        count = manager.update_multiple_files(file_paths, None, args.time, check_changes=True, dry_run=False, force=False)
+        count = manager.update_multiple_files(file_paths, None, args.time, check_changes=True, dry_run=False, force=False,
+                                             max_workers=args.workers)
         print(f"Updated {count} files with real changes")
     
     elif args.command == "lock":
@@ -433,7 +484,8 @@ def main():
     elif args.command == "scan":
         directory = Path(args.directory)
         md_files = list(directory.rglob("*.md"))
-        count = manager.update_multiple_files(md_files, None, args.time, check_changes=False, dry_run=False, force=False)
+        count = manager.update_multiple_files(md_files, None, args.time, check_changes=False, dry_run=False, force=False,
+                                             max_workers=args.workers)
         print(f"Scanned {len(md_files)} files, updated {count}")
 
 if __name__ == "__main__":
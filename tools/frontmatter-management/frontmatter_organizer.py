@@ -12,6 +12,9 @@ import argparse
 import yaml
 from pathlib import Path
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from tools.scribe.utils.frontmatter_parser import split_frontmatter
+
 class FrontmatterOrganizer:
     def __init__(self, repo_base_path="."):
         """Initialize with repository base path to locate schema file"""
@@ -73,19 +76,13 @@ class FrontmatterOrganizer:
     
     def parse_frontmatter(self, content):
         """Parse YAML frontmatter from markdown content"""
-        if not content.startswith('---\n'):
+        document = split_frontmatter(content)
+        if not document.has_frontmatter:
             return None, content
         
         try:
-            # Find end of frontmatter
-            end_marker = content.find('\n---\n', 4)
-            if end_marker == -1:
-                return None, content
-            
-            frontmatter_yaml = content[4:end_marker]
-            body = content[end_marker + 5:]
-            frontmatter = yaml.safe_load(frontmatter_yaml)
-            return frontmatter, body
+            frontmatter = document.parse()
+            return frontmatter, document.body
             
         except yaml.YAMLError:
             return None, content
@@ -18,21 +18,15 @@ import argparse
 import logging
 import hashlib
 import re # Added re
+import sys
 from pathlib import Path
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from tools.scribe.utils.frontmatter_parser import split_frontmatter, load_frontmatter_yaml, quote_at_key_lines
+
 def get_frontmatter_from_content(file_content):
     """Extracts YAML frontmatter string from file content."""
-    lines = file_content.splitlines(True)
-    if not lines or not lines[0].startswith("---"):
-        return None
-    fm_end_index = -1
-    for i, line in enumerate(lines[1:], start=1):
-        if line.startswith("---"):
-            fm_end_index = i
-            break
-    if fm_end_index == -1: 
-        return None
-    return "".join(lines[1:fm_end_index])
+    return split_frontmatter(file_content).frontmatter_text
 
 def calculate_content_hash(file_content):
     """Calculate SHA-256 hash of file content for change detection."""
@@ -48,26 +42,14 @@ def extract_frontmatter_metadata(filepath_rel_to_repo, file_content):
         logging.debug(f"No frontmatter string extracted by get_frontmatter_from_content for {filepath_rel_to_repo}")
         return None
 
-    # Pre-process frontmatter_str to quote keys starting with @
-    def quote_at_keys(line):
-        # This regex finds lines starting with optional spaces, then @, then word characters (key), then a colon.
-        # It captures the indentation (group 1), the @key (group 2), and the rest of the line after the colon (group 3).
-        match = re.match(r'^(\s*)(@\w+):\s*(.*)$', line)
-        if match:
-            indent, key, value = match.groups()
-            # Reconstruct the line with the @key quoted.
-            return f'{indent}"{key}": {value}'
-        return line
-
-    processed_frontmatter_str = "\n".join([quote_at_keys(line) for line in frontmatter_str.splitlines()])
-
     try:
-        frontmatter_data = yaml.safe_load(processed_frontmatter_str)
+        # Keys starting with @ are quoted before parsing
+        frontmatter_data = load_frontmatter_yaml(frontmatter_str, quote_at_keys=True)
         if not isinstance(frontmatter_data, dict):
             logging.debug(f"Frontmatter data is not a dict for {filepath_rel_to_repo}: {type(frontmatter_data)}. Data: {frontmatter_data}")
             return None
     except yaml.YAMLError as e:
-        logging.debug(f"YAML parsing error for {filepath_rel_to_repo}: {e}\nProcessed frontmatter string was:\n{processed_frontmatter_str}")
+        logging.debug(f"YAML parsing error for {filepath_rel_to_repo}: {e}\nProcessed frontmatter string was:\n{quote_at_key_lines(frontmatter_str)}")
         return None
 
     return frontmatter_data
@@ -12,6 +12,9 @@ from pathlib import Path # Added for robust path handling
 import sys # For CI-friendliness
 import time # For adding a small delay
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from tools.scribe.utils.frontmatter_parser import split_frontmatter, load_frontmatter_yaml
+
 # --- Configuration (Constants) ---
 STANDARD_ID_REGEX = r"^[A-Z]{2}-[A-Z0-9]+(?:-[A-Z0-9]+)*$" # Agreed: All UPPERCASE, Domain-RestOfID structure
 ISO_DATE_REGEX = r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$"
@@ -176,20 +179,10 @@ def is_placeholder_value(value_str):
     return False
 
 def get_frontmatter_and_content(file_content):
-    lines = file_content.splitlines(True) 
-    if not lines or not lines[0].startswith("---"):
-        return None, file_content, 0, 0 
-    fm_end_index = -1
-    fm_start_line_num = 1 
-    for i, line in enumerate(lines[1:], start=1): 
-        if line.startswith("---"):
-            fm_end_index = i
-            break
-    if fm_end_index == -1: return None, file_content, 0, 0
-    
-    frontmatter_str = "".join(lines[1:fm_end_index])
-    content_str = "".join(lines[fm_end_index+1:])
-    return frontmatter_str, content_str, fm_start_line_num + 1, fm_start_line_num + fm_end_index
+    document = split_frontmatter(file_content)
+    if not document.has_frontmatter:
+        return None, file_content, 0, 0
+    return document.frontmatter_text, document.body, document.start_line, document.end_line
 
 def get_line_number_of_key(frontmatter_str, key, fm_content_start_line):
     """Approximates line number of a key in the original document."""
@@ -255,7 +248,7 @@ def lint_file(filepath_abs, config: LinterConfig, file_content_raw=None):
 
     frontmatter_data = None
     try:
-        frontmatter_data = yaml.safe_load(frontmatter_str)
+        frontmatter_data = load_frontmatter_yaml(frontmatter_str)
         if not isinstance(frontmatter_data, dict):
              errors.append({"message": "Frontmatter is not a valid YAML mapping.", "line": fm_content_start_line}); frontmatter_data = {}
     except yaml.YAMLError as e:
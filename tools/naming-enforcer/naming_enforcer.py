@@ -20,6 +20,9 @@ import yaml
 from uuid import uuid4
 import fnmatch
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from tools.scribe.utils.frontmatter_parser import split_frontmatter
+
 # Note: NamingRule dataclass might be deprecated or simplified if rules are directly consumed.
 # For now, it's kept if the structure of storing patterns relies on it.
 @dataclass
@@ -1068,19 +1071,11 @@ class NamingEnforcerV2:
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
             
-            if not content.startswith('---'):
+            document = split_frontmatter(content)
+            if not document.has_frontmatter:
                 return violations
             
-            first_line_end = content.find('\n')
-            if first_line_end == -1: return violations
-            
-            frontmatter_start = first_line_end + 1
-            fm_end_match = re.search(r'^---\s*$', content[frontmatter_start:], re.MULTILINE)
-            if not fm_end_match: return violations
-            
-            frontmatter_content = content[frontmatter_start:frontmatter_start + fm_end_match.start()]
-            
-            fm_data = yaml.safe_load(frontmatter_content)
+            fm_data = document.parse(copy_result=False)
             if not isinstance(fm_data, dict):
                 return violations
                 
@@ -6,15 +6,36 @@ This package contains all action plugins for the Scribe automation engine.
 Action plugins implement the L3 Capability Plugin layer in the HMA architecture.
 """
 
+import importlib
+
 from .base import BaseAction, ActionExecutionError, ValidationError
 from .base import get_match_context, validate_required_params, apply_default_params
-from .run_command_action import RunCommandAction
-from .enhanced_frontmatter_action import EnhancedFrontmatterAction
-from .graph_validation_action import GraphValidationAction
-from .naming_enforcement_action import NamingEnforcementAction
-from .reconciliation_action import ReconciliationAction
-from .roadmap_populator_action import RoadmapPopulatorAction
-from .view_generation_action import ViewGenerationAction
+
+# Action classes are imported on first access: importing any submodule
+# (including .base) runs this file, and graph validation alone pulls in
+# rdflib and pyshacl.
+_LAZY_ACTIONS = {
+    'RunCommandAction': '.run_command_action',
+    'EnhancedFrontmatterAction': '.enhanced_frontmatter_action',
+    'GraphValidationAction': '.graph_validation_action',
+    'NamingEnforcementAction': '.naming_enforcement_action',
+    'ReconciliationAction': '.reconciliation_action',
+    'RoadmapPopulatorAction': '.roadmap_populator_action',
+    'ViewGenerationAction': '.view_generation_action',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ACTIONS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ACTIONS))
 
 
 __all__ = [
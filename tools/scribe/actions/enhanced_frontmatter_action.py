@@ -12,7 +12,10 @@ LLM-based generation with SHACL validation and existing Scribe workflow.
 import os
 import sys
 import yaml
+import asyncio
 import logging
+import threading
+import time
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Union
 from datetime import datetime
@@ -28,10 +31,10 @@ from tools.scribe.utils.frontmatter_parser import parse_frontmatter, apply_front
 
 # Import Phase 3 components
 try:
-    from integrations.llm_integration import LLMSchemaIntegration
-    from validation.llm_shacl_validator import LLMSHACLValidator
-    from prompts.schema_constraint_prompts import SchemaConstraintPromptEngine
-    from error_handling.llm_error_handler import LLMErrorHandler
+    from tools.scribe.integrations.llm_integration import LLMSchemaIntegration
+    from tools.scribe.validation.llm_shacl_validator import LLMSHACLValidator
+    from tools.scribe.prompts.schema_constraint_prompts import SchemaConstraintPromptEngine
+    from tools.scribe.error_handling.llm_error_handler import LLMErrorHandler
 except ImportError as e:
     logging.warning(f"Could not import Phase 3 components: {e}")
     # Create mock classes for fallback
@@ -46,6 +49,8 @@ except ImportError as e:
             pass
         def validate_with_retry_loop(self, *args, **kwargs):
             return {'success': True, 'frontmatter': {}, 'fallback_used': True}
+        async def avalidate_with_retry_loop(self, *args, **kwargs):
+            return {'success': True, 'frontmatter': {}, 'fallback_used': True}
     
     class SchemaConstraintPromptEngine:
         def __init__(self, *args, **kwargs):
@@ -59,7 +64,7 @@ except ImportError as e:
 
 # Import analysis components from Phase 1
 try:
-    from analysis.document_type_analyzer import UniversalDocumentTypeAnalyzer
+    from tools.analysis.document_type_analyzer import UniversalDocumentTypeAnalyzer
 except ImportError:
     class UniversalDocumentTypeAnalyzer:
         def __init__(self, *args, **kwargs):
@@ -84,6 +89,7 @@ class EnhancedFrontmatterAction(BaseAction):
     
     def __init__(self, action_type: str, params: Dict[str, Any], plugin_context: 'PluginContextPort'):
         super().__init__(action_type, params, plugin_context)
+        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         
         # HMA v2.2 compliant logging through port
         self.log_port = self.context.get_port("logging")
@@ -93,16 +99,19 @@ class EnhancedFrontmatterAction(BaseAction):
         config_port = self.context.get_port("configuration")
         shacl_shapes_path = config_port.get_config_value("shacl_shapes_path", self.context.get_plugin_id(), 'standards/registry/shacl-shapes.ttl')
         jsonld_context_path = config_port.get_config_value("jsonld_context_path", self.context.get_plugin_id(), 'standards/registry/contexts/fields.jsonld')
+        llm_cache_path = config_port.get_config_value("llm_cache_path", self.context.get_plugin_id(), None)
         
-        self.llm_integration = LLMSchemaIntegration(shacl_shapes_path, jsonld_context_path)
-        self.validator = LLMSHACLValidator()
+        self.llm_integration = LLMSchemaIntegration(shacl_shapes_path, jsonld_context_path, cache_path=llm_cache_path)
+        # Generation goes through the integration's cached, rate-limited client
+        self.validator = LLMSHACLValidator(llm_client=getattr(self.llm_integration, 'llm_client', None))
         self.prompt_engine = SchemaConstraintPromptEngine()
         self.error_handler = LLMErrorHandler()
         
         # Initialize Phase 1 components
         self.document_analyzer = UniversalDocumentTypeAnalyzer()
         
-        # Generation statistics
+        # Generation statistics (execute may be called from engine worker threads)
+        self._stats_lock = threading.Lock()
         self.generation_stats = {
             'total_processed': 0,
             'successful_generations': 0,
@@ -136,71 +145,111 @@ class EnhancedFrontmatterAction(BaseAction):
         start_time = datetime.now()
         
         try:
-            # Sub-step 5.1: Read document content
-            content = self._read_file_content(file_path)
-            
-            # Sub-step 5.2: Detect or specify info-type
-            info_type = params.get('info_type') or self._detect_info_type(content, file_path)
-            
-            # Sub-step 5.3: Check if regeneration is needed
-            if not params.get('force_regenerate', False):
-                existing_frontmatter = parse_frontmatter(content)
-                if existing_frontmatter and self._is_frontmatter_valid(existing_frontmatter, info_type):
-                    self.logger.info(f"Valid frontmatter exists, skipping generation for {file_path}")
-                    return self._create_success_result(file_path, existing_frontmatter, 'skipped_valid')
+            # Sub-steps 5.1-5.3: Read document, detect info-type, keep valid frontmatter
+            content, info_type, skipped_result = self._prepare_document(file_path, params)
+            if skipped_result is not None:
+                return skipped_result
             
             # Sub-step 5.4: Build schema-constrained prompt
             prompt = self._build_comprehensive_prompt(content, info_type, file_path)
             
             # Sub-step 5.5: Generate with validation loop (100% success)
             generation_result = self.validator.validate_with_retry_loop(prompt, info_type)
+            self._save_llm_cache()
             
-            # Sub-step 5.6: Apply frontmatter to document
-            updated_content = apply_frontmatter(content, generation_result['frontmatter'])
-            
-            # Sub-step 5.7: Write updated content back to file
-            self._write_file_content(file_path, updated_content)
+            # Sub-steps 5.6-5.8: Apply, write back and log metrics
+            return self._apply_generation_result(file_path, content, generation_result, start_time)
             
-            # Sub-step 5.8: Log success metrics
-            processing_time = (datetime.now() - start_time).total_seconds()
-            result = self._log_generation_metrics(file_path, generation_result, processing_time)
+        except Exception as e:
+            return self._recover_from_error(file_path, params, e, start_time)
+    
+    async def _aexecute(self, file_path: str, params: Dict[str, Any],
+                        semaphore: Optional[asyncio.Semaphore] = None) -> Dict[str, Any]:
+        """Async form of ``execute`` used by ``process_multiple_files``; ``semaphore`` bounds LLM calls."""
+        self.logger.info(f"Processing file: {file_path}")
+        start_time = datetime.now()
+        
+        try:
+            content, info_type, skipped_result = self._prepare_document(file_path, params)
+            if skipped_result is not None:
+                return skipped_result
             
-            return result
+            prompt = self._build_comprehensive_prompt(content, info_type, file_path)
+            generation_result = await self.validator.avalidate_with_retry_loop(
+                prompt, info_type, semaphore=semaphore
+            )
+            return self._apply_generation_result(file_path, content, generation_result, start_time)
             
         except Exception as e:
-            self.logger.error(f"Error processing {file_path}: {e}")
-            
-            # Use error handler for recovery
-            error_type = self.error_handler.classify_error(str(e))
-            recovery_result = self.error_handler.handle_generation_errors(
-                error_type, {'error_message': str(e), 'file_path': file_path}
+            return self._recover_from_error(file_path, params, e, start_time)
+    
+    def _prepare_document(self, file_path: str, params: Dict[str, Any]):
+        """
+        Sub-steps 5.1-5.3: read the document and resolve its info-type.
+        
+        Returns ``(content, info_type, skipped_result)``; ``skipped_result`` is
+        set when the existing frontmatter is valid and generation is not needed.
+        """
+        # Sub-step 5.1: Read document content
+        content = self._read_file_content(file_path)
+        
+        # Sub-step 5.2: Detect or specify info-type
+        info_type = params.get('info_type') or self._detect_info_type(content, file_path)
+        
+        # Sub-step 5.3: Check if regeneration is needed
+        if not params.get('force_regenerate', False):
+            existing_frontmatter = parse_frontmatter(content)
+            if existing_frontmatter and self._is_frontmatter_valid(existing_frontmatter, info_type):
+                self.logger.info(f"Valid frontmatter exists, skipping generation for {file_path}")
+                return content, info_type, self._create_success_result(file_path, existing_frontmatter, 'skipped_valid')
+        
+        return content, info_type, None
+    
+    def _apply_generation_result(self, file_path: str, content: str, generation_result: Dict[str, Any],
+                                 start_time: datetime) -> Dict[str, Any]:
+        """Sub-steps 5.6-5.8: apply the generated frontmatter, write the file and log metrics."""
+        # Sub-step 5.6: Apply frontmatter to document
+        updated_content = apply_frontmatter(content, generation_result['frontmatter'])
+        
+        # Sub-step 5.7: Write updated content back to file
+        self._write_file_content(file_path, updated_content)
+        
+        # Sub-step 5.8: Log success metrics
+        processing_time = (datetime.now() - start_time).total_seconds()
+        return self._log_generation_metrics(file_path, generation_result, processing_time)
+    
+    def _recover_from_error(self, file_path: str, params: Dict[str, Any], error: Exception,
+                            start_time: datetime) -> Dict[str, Any]:
+        """Recover from a processing error with the deterministic fallback when possible."""
+        self.logger.error(f"Error processing {file_path}: {error}")
+        
+        # Use error handler for recovery
+        error_type = self.error_handler.classify_error(str(error))
+        recovery_result = self.error_handler.handle_generation_errors(
+            error_type, {'error_message': str(error), 'file_path': file_path}
+        )
+        
+        # If recovery suggests deterministic fallback, use it
+        if recovery_result.get('recovery_strategy') == 'deterministic_fallback':
+            fallback_result = self.validator._generate_deterministic_fallback(
+                params.get('info_type', 'general-document')
             )
             
-            # If recovery suggests deterministic fallback, use it
-            if recovery_result.get('recovery_strategy') == 'deterministic_fallback':
-                fallback_result = self.validator._generate_deterministic_fallback(
-                    params.get('info_type', 'general-document')
-                )
+            try:
+                content = self._read_file_content(file_path)
+                return self._apply_generation_result(file_path, content, fallback_result, start_time)
                 
-                try:
-                    content = self._read_file_content(file_path)
-                    updated_content = apply_frontmatter(content, fallback_result['frontmatter'])
-                    self._write_file_content(file_path, updated_content)
-                    
-                    processing_time = (datetime.now() - start_time).total_seconds()
-                    return self._log_generation_metrics(file_path, fallback_result, processing_time)
-                    
-                except Exception as fallback_error:
-                    self.logger.error(f"Fallback generation failed for {file_path}: {fallback_error}")
-            
-            # Return error result if all recovery attempts fail
-            return {
-                'success': False,
-                'file_processed': file_path,
-                'error': str(e),
-                'recovery_attempted': True,
-                'recovery_result': recovery_result
-            }
+            except Exception as fallback_error:
+                self.logger.error(f"Fallback generation failed for {file_path}: {fallback_error}")
+        
+        # Return error result if all recovery attempts fail
+        return {
+            'success': False,
+            'file_processed': file_path,
+            'error': str(error),
+            'recovery_attempted': True,
+            'recovery_result': recovery_result
+        }
     
     def _read_file_content(self, file_path: str) -> str:
         """Sub-step 5.1: Read document content safely."""
@@ -272,12 +321,11 @@ class EnhancedFrontmatterAction(BaseAction):
                 content, info_type, constraints
             )
             
-            # Add file-specific context
+            # Add file-specific context (no timestamp: the prompt is the LLM cache key)
             file_context = f"""
 FILE CONTEXT:
 - File path: {file_path}
 - File name: {Path(file_path).name}
-- Processing timestamp: {datetime.now().strftime('%Y-%m-%dT%H:%M:%SZ')}
 
 """
             
@@ -363,18 +411,6 @@ Generate ONLY the YAML frontmatter block:
         fallback_used = generation_result.get('fallback_used', False)
         validation_method = generation_result.get('validation_method', 'unknown')
         
-        # Update statistics
-        self.generation_stats['total_processed'] += 1
-        if success:
-            self.generation_stats['successful_generations'] += 1
-        if fallback_used:
-            self.generation_stats['fallback_generations'] += 1
-        
-        # Update average attempts
-        total_attempts = (self.generation_stats['average_attempts'] * 
-                         (self.generation_stats['total_processed'] - 1) + attempts_used)
-        self.generation_stats['average_attempts'] = total_attempts / self.generation_stats['total_processed']
-        
         # Record processing history
         history_entry = {
             'file_path': file_path,
@@ -385,7 +421,21 @@ Generate ONLY the YAML frontmatter block:
             'validation_method': validation_method,
             'processing_time_seconds': processing_time
         }
-        self.generation_stats['processing_history'].append(history_entry)
+        
+        # Update statistics
+        with self._stats_lock:
+            self.generation_stats['total_processed'] += 1
+            if success:
+                self.generation_stats['successful_generations'] += 1
+            if fallback_used:
+                self.generation_stats['fallback_generations'] += 1
+            
+            # Update average attempts
+            total_attempts = (self.generation_stats['average_attempts'] * 
+                             (self.generation_stats['total_processed'] - 1) + attempts_used)
+            self.generation_stats['average_attempts'] = total_attempts / self.generation_stats['total_processed']
+            
+            self.generation_stats['processing_history'].append(history_entry)
         
         # Log metrics
         self.logger.info(f"Generation metrics for {file_path}:")
@@ -411,7 +461,9 @@ Generate ONLY the YAML frontmatter block:
     
     def get_processing_statistics(self) -> Dict[str, Any]:
         """Get comprehensive processing statistics."""
-        stats = self.generation_stats.copy()
+        with self._stats_lock:
+            stats = self.generation_stats.copy()
+            stats['processing_history'] = list(stats['processing_history'])
         
         if stats['total_processed'] > 0:
             stats['success_rate'] = (stats['successful_generations'] / 
@@ -424,21 +476,50 @@ Generate ONLY the YAML frontmatter block:
         
         return stats
     
+    def _save_llm_cache(self) -> None:
+        """Persist LLM responses so unchanged documents hit the cache next run (no-op when unchanged)."""
+        llm_client = getattr(self.llm_integration, 'llm_client', None)
+        if llm_client is None:
+            return
+        try:
+            llm_client.cache.save()
+        except Exception as e:
+            self.logger.warning(f"Could not persist LLM response cache: {e}")
+    
     def process_multiple_files(self, file_paths: List[str], params: Dict[str, Any]) -> Dict[str, Any]:
-        """Process multiple files with enhanced frontmatter generation."""
-        results = {}
+        """
+        Process multiple files with enhanced frontmatter generation.
+        
+        Files are processed as one async batch through the cached LLM client,
+        with at most ``params['max_concurrency']`` (default 4) LLM calls in
+        flight, so round-trips for different files overlap and unchanged
+        documents are answered from the response cache. Results are keyed by
+        file path in input order. Not for use inside a running event loop.
+        """
         total_start_time = datetime.now()
+        max_concurrency = max(1, int(params.get('max_concurrency', 4)))
         
-        for file_path in file_paths:
+        async def process(file_path: str, semaphore: asyncio.Semaphore) -> Dict[str, Any]:
             try:
-                result = self.execute(file_path, **params)
-                results[file_path] = result
+                return await self._aexecute(file_path, params, semaphore)
             except Exception as e:
-                results[file_path] = {
+                return {
                     'success': False,
                     'error': str(e)
                 }
         
+        async def process_batch() -> List[Dict[str, Any]]:
+            semaphore = asyncio.Semaphore(max_concurrency)
+            return await asyncio.gather(*[process(file_path, semaphore) for file_path in file_paths])
+        
+        batch_start = time.perf_counter()
+        results = dict(zip(file_paths, asyncio.run(process_batch())))
+        
+        llm_client = getattr(self.llm_integration, 'llm_client', None)
+        if llm_client is not None:
+            llm_client.record_batch(len(file_paths), time.perf_counter() - batch_start)
+        self._save_llm_cache()
+        
         total_time = (datetime.now() - total_start_time).total_seconds()
         
         return {
@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional, Set, Tuple
 
 from .base import BaseAction, ActionExecutionError
+from tools.scribe.core.state_snapshot import FileStatManifest, state_dir
 from tools.scribe.utils.frontmatter_parser import parse_frontmatter
 
 # Helper functions (adapted from tools/indexer/generate_index.py)
@@ -66,6 +67,9 @@ class ReconciliationAction(BaseAction):
         self.kb_root_dirs_str = self.params.get("kb_root_dirs", ["."]) # Scan whole repo by default relative to repo_root
         self.exclude_dirs_set = set(self.params.get("exclude_dirs",
             ['.git', 'node_modules', '__pycache__', '.vscode', 'archive', 'tools', 'temp-naming-enforcer-test']))
+        # Stat manifest from the previous run: unchanged files are not re-read
+        default_manifest = state_dir() / "reconciliation_stat_manifest.json"
+        self.stat_manifest_path_str = self.params.get("stat_manifest_path", str(default_manifest))
         
         # Get repo root through configuration port
         try:
@@ -79,6 +83,7 @@ class ReconciliationAction(BaseAction):
 
         self.master_index_file = self.repo_root / self.master_index_path_str
         self.kb_root_paths = [self.repo_root / Path(p) for p in self.kb_root_dirs_str]
+        self.stat_manifest_file = self.repo_root / self.stat_manifest_path_str
 
         for p_path in self.kb_root_paths:
              if not p_path.exists() or not p_path.is_dir():
@@ -105,7 +110,12 @@ class ReconciliationAction(BaseAction):
         }
 
     def _scan_knowledge_base(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Find all .md files. Files whose size and mtime match the stat
+        manifest are not read: they carry only their recorded content hash.
+        """
         found_files = {}
+        self.stat_manifest = FileStatManifest(self.stat_manifest_file)
         for root_dir_path in self.kb_root_paths:
             self.logger.info(f"Scanning for .md files in: {root_dir_path}")
             for md_file in root_dir_path.rglob('*.md'):
@@ -115,32 +125,45 @@ class ReconciliationAction(BaseAction):
 
                 rel_path_posix = md_file.relative_to(self.repo_root).as_posix()
                 try:
+                    stats = md_file.stat()
+                    content_hash = self.stat_manifest.lookup(rel_path_posix, stats)
+                    if content_hash is not None:
+                        found_files[rel_path_posix] = {'content': None, 'hash': content_hash, 'stats': stats}
+                        continue
                     with open(md_file, 'r', encoding='utf-8') as f:
                         content = f.read()
-                    found_files[rel_path_posix] = {'content': content, 'stats': md_file.stat()}
+                    content_hash = _calculate_content_hash(content)
+                    self.stat_manifest.record(rel_path_posix, stats, content_hash)
+                    found_files[rel_path_posix] = {'content': content, 'hash': content_hash, 'stats': stats}
                 except (IOError, UnicodeDecodeError) as e:
                     self.logger.warning(f"Could not read file {rel_path_posix}: {e}")
-        self.logger.info(f"Scan found {len(found_files)} markdown files.")
+        self.logger.info(f"Scan found {len(found_files)} markdown files "
+                         f"({self.stat_manifest.hits} unchanged by stat, not read).")
         return found_files
 
+    def _read_file(self, filepath: str) -> Tuple[str, os.stat_result]:
+        md_file = self.repo_root / filepath
+        with open(md_file, 'r', encoding='utf-8') as f:
+            return f.read(), md_file.stat()
+
     def _reconcile_index_logic(self, existing_index: Dict[str, Any], current_files: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, int]]:
         stats = {'added': 0, 'updated': 0, 'removed': 0, 'unchanged': 0}
         existing_docs_map = {doc['kb:filepath']: doc for doc in existing_index.get('kb:documents', [])}
         new_documents_list = []
 
         for filepath, file_info in current_files.items():
-            content_hash = _calculate_content_hash(file_info['content'])
-            if filepath in existing_docs_map:
-                existing_doc = existing_docs_map[filepath]
-                if existing_doc.get('kb:contentHash') != content_hash:
-                    new_documents_list.append(_create_node_from_file(filepath, file_info['content'], file_info['stats']))
-                    stats['updated'] += 1
-                else:
-                    new_documents_list.append(existing_doc)
-                    stats['unchanged'] += 1
-            else:
-                new_documents_list.append(_create_node_from_file(filepath, file_info['content'], file_info['stats']))
-                stats['added'] += 1
+            content_hash = file_info['hash']
+            if filepath in existing_docs_map and existing_docs_map[filepath].get('kb:contentHash') == content_hash:
+                new_documents_list.append(existing_docs_map[filepath])
+                stats['unchanged'] += 1
+                continue
+
+            content, file_stats = file_info['content'], file_info['stats']
+            if content is None:
+                # Unchanged on disk but missing from (or different in) the index
+                content, file_stats = self._read_file(filepath)
+            new_documents_list.append(_create_node_from_file(filepath, content, file_stats))
+            stats['updated' if filepath in existing_docs_map else 'added'] += 1
 
         current_filepaths_set = set(current_files.keys())
         for filepath in existing_docs_map.keys():
@@ -173,6 +196,8 @@ class ReconciliationAction(BaseAction):
         updated_index, stats = self._reconcile_index_logic(existing_index, current_files)
 
         if self._save_index(updated_index):
+            if not self.stat_manifest.save():
+                self.logger.warning(f"Could not save stat manifest {self.stat_manifest.path}")
             msg = f"Reconciliation complete. Stats: Added {stats['added']}, Updated {stats['updated']}, Removed {stats['removed']}, Unchanged {stats['unchanged']}."
             self.logger.info(msg)
             return file_content
@@ -1,7 +1,21 @@
-from fastapi import FastAPI
-from tools.scribe.adapters.http_validation import L1ValidationMiddleware
+from fastapi import FastAPI, Request
+from tools.scribe.adapters.http_validation import INGEST_ROUTE, L1ValidationMiddleware
 
 app = FastAPI()
 app.add_middleware(L1ValidationMiddleware)
 
-# Add routes below using FastAPI routers as needed (kept minimal here per boundary focus)
\ No newline at end of file
+# Accepted ingest events are handed to app.state.event_sink (a callable taking a
+# list of events) when one is configured.
+app.state.event_sink = None
+
+
+@app.post(INGEST_ROUTE)
+async def ingest_events(request: Request):
+    """Batch ingest of NDJSON or JSON-array events, already validated by the middleware."""
+    batch = request.state.l1_batch
+    sink = request.app.state.event_sink
+    if sink is not None and batch.accepted:
+        sink(batch.accepted)
+    return batch.to_dict()
+
+# Add routes below using FastAPI routers as needed (kept minimal here per boundary focus)
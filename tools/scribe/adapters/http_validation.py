@@ -1,41 +1,373 @@
+"""
+L1 HTTP boundary validation for the Scribe HTTP adapter.
+
+``L1ValidationMiddleware`` is a pure ASGI middleware. Request bodies are read
+and parsed exactly once: single requests have their JSON body stashed on
+``request.state.l1_body`` and replayed to the application, and batch ingest
+routes stream NDJSON or JSON-array bodies item by item through the boundary
+validator, leaving a ``BatchIngestResult`` on ``request.state.l1_batch``.
+"""
+
+import codecs
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
 from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
 from tools.scribe.core.boundary_validator import BoundaryValidator, create_boundary_validator, BoundaryType
 from tools.scribe.core.logging_config import get_scribe_logger
 from tools.scribe.core.telemetry import initialize_telemetry, get_telemetry_manager
 
 logger = get_scribe_logger(__name__)
 
-# Initialize sophisticated telemetry system
-telemetry_manager = initialize_telemetry("scribe-http-adapter")
-boundary_validator = create_boundary_validator()
+# Telemetry and the boundary validator are created on first use rather than
+# at import, so importing this module has no side effects.
+_telemetry_manager = None
+_boundary_validator: Optional[BoundaryValidator] = None
+
+
+def _telemetry():
+    global _telemetry_manager
+    if _telemetry_manager is None:
+        _telemetry_manager = initialize_telemetry("scribe-http-adapter")
+    return _telemetry_manager
+
+
+def _validator() -> BoundaryValidator:
+    global _boundary_validator
+    if _boundary_validator is None:
+        _boundary_validator = create_boundary_validator()
+    return _boundary_validator
+
+
+def __getattr__(name):
+    # ``telemetry_manager`` and ``boundary_validator`` remain readable as
+    # module attributes
+    if name == "telemetry_manager":
+        return _telemetry()
+    if name == "boundary_validator":
+        return _validator()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+INGEST_ROUTE = "/ingest/events"
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl", "application/x-jsonlines")
+
+_INVALID_RESPONSE = b'{"error":"invalid"}'
+
+# A parsed stream item: (value, parse_error)
+ParsedItem = Tuple[Any, Optional[str]]
+
+
+class NDJSONStreamParser:
+    """Incremental parser for newline-delimited JSON; a bad line only rejects itself."""
+
+    def __init__(self):
+        self._buffer = b""
+
+    def feed(self, chunk: bytes, final: bool = False) -> List[ParsedItem]:
+        """Parse every complete line in ``chunk`` (and the remainder when ``final``)."""
+        self._buffer += chunk
+        *lines, self._buffer = self._buffer.split(b"\n")
+        if final:
+            lines.append(self._buffer)
+            self._buffer = b""
+        return [self._parse_line(line) for line in lines if line.strip()]
+
+    @staticmethod
+    def _parse_line(line: bytes) -> ParsedItem:
+        try:
+            return json.loads(line), None
+        except ValueError as e:
+            return None, f"Invalid JSON: {e}"
+
+
+class JSONArrayStreamParser:
+    """
+    Incremental parser yielding the elements of a top-level JSON array.
+
+    Elements are decoded as soon as they are complete. A syntax error cannot be
+    resynchronised, so it is reported once and the rest of the body is ignored.
+    """
+
+    _WHITESPACE = " \t\n\r"
+
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._text = ""
+        self._state = "start"
+
+    def feed(self, chunk: bytes, final: bool = False) -> List[ParsedItem]:
+        """Parse every complete element in ``chunk``; ``final`` marks the end of the body."""
+        if self._state == "failed":
+            return []
+        try:
+            self._text += self._decoder.decode(chunk, final)
+        except UnicodeDecodeError as e:
+            return self._fail(f"Invalid UTF-8: {e}")
+
+        items: List[ParsedItem] = []
+        text, pos = self._text, 0
+        while self._state not in ("done", "failed"):
+            while pos < len(text) and text[pos] in self._WHITESPACE:
+                pos += 1
+            if pos == len(text):
+                break
+            char = text[pos]
+
+            if self._state == "start":
+                if char != "[":
+                    items.extend(self._fail("Expected a JSON array"))
+                    break
+                self._state = "item_or_end"
+                pos += 1
+            elif self._state == "separator":
+                if char not in ",]":
+                    items.extend(self._fail(f"Expected ',' or ']' at offset {pos}"))
+                    break
+                self._state = "item" if char == "," else "done"
+                pos += 1
+            elif char == "]" and self._state == "item_or_end":
+                self._state = "done"
+                pos += 1
+            else:
+                try:
+                    value, end = self._json.raw_decode(text, pos)
+                except ValueError as e:
+                    if not final:
+                        break  # element incomplete, wait for more data
+                    items.extend(self._fail(f"Invalid JSON: {e}"))
+                    break
+                if not final and not self._is_complete(value, text, end):
+                    break  # a number may continue in the next chunk
+                items.append((value, None))
+                self._state = "separator"
+                pos = end
+
+        self._text = text[pos:]
+        if final and self._state not in ("done", "failed"):
+            items.extend(self._fail("Unexpected end of JSON array"))
+        elif self._state == "done" and self._text.strip(self._WHITESPACE):
+            items.extend(self._fail("Unexpected data after JSON array"))
+        return items
+
+    def _is_complete(self, value: Any, text: str, end: int) -> bool:
+        """Whether a decoded element cannot be extended by data not yet received."""
+        if end == len(text):
+            return False
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return True
+        # "1.5e" decodes as 1.5; only a following delimiter proves the number ended
+        rest = text[end:].lstrip(self._WHITESPACE)
+        return bool(rest) and rest[0] in ",]"
+
+    def _fail(self, error: str) -> List[ParsedItem]:
+        self._state = "failed"
+        self._text = ""
+        return [(None, error)]
+
+
+@dataclass
+class BatchIngestResult:
+    """Per-item outcome of a validated batch ingest request."""
+    accepted: List[Dict[str, Any]] = field(default_factory=list)
+    results: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def rejected_count(self) -> int:
+        return len(self.results) - len(self.accepted)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "accepted": len(self.accepted),
+            "rejected": self.rejected_count,
+            "results": self.results,
+        }
+
+
+def get_parsed_body(request: Request) -> Any:
+    """Return the body L1ValidationMiddleware already parsed, without re-reading it."""
+    return getattr(request.state, "l1_body", None)
+
+
+class L1ValidationMiddleware:
+    """
+    Pure ASGI middleware validating inbound HTTP requests at the L1 boundary.
+
+    Requests to ``batch_routes`` are streamed and every event is validated
+    against the ``l1_<item_interface>_input`` schema; other requests are
+    validated as a single ``l1_http_input`` envelope.
+    """
+
+    def __init__(self, app,
+                 validator: Optional[BoundaryValidator] = None,
+                 batch_routes: Iterable[str] = (INGEST_ROUTE,),
+                 item_interface: str = "file_system",
+                 validation_chunk_size: int = 256,
+                 max_batch_items: int = 10000):
+        self.app = app
+        self.validator = validator or _validator()
+        self.batch_routes = frozenset(batch_routes)
+        self.item_interface = item_interface
+        self.validation_chunk_size = validation_chunk_size
+        self.max_batch_items = max_batch_items
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "POST" and scope["path"] in self.batch_routes:
+            await self._handle_batch(scope, receive, send)
+            return
+
+        body_bytes = await self._read_body(receive)
+        if body_bytes is None:
+            return
+        try:
+            body = json.loads(body_bytes) if body_bytes else {}
+        except ValueError:
+            body = {}
+        scope.setdefault("state", {})["l1_body"] = body
+
+        headers = _headers(scope)
+        if not self._validate_envelope(scope["path"], headers, body):
+            await _send_json(send, 400, _INVALID_RESPONSE)
+            return
+        await self.app(scope, _replay_receive(body_bytes, receive), send)
 
-class L1ValidationMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next):
+        """Validate a Starlette request and forward it to ``call_next``."""
         try:
             body = await request.json()
         except Exception:
             body = {}
+        if not self._validate_envelope(request.url.path, request.headers, body):
+            return Response(status_code=400, content=_INVALID_RESPONSE, media_type="application/json")
+        return await call_next(request)
+
+    def _validate_envelope(self, route: str, headers, body: Any) -> bool:
         # Use sophisticated boundary validation system
-        with telemetry_manager.trace_boundary_call("inbound", "http", request.url.path, "request_received") as span:
+        with _telemetry().trace_boundary_call("inbound", "http", route, "request_received") as span:
             payload = {
-                "request_id": request.headers.get("x-request-id", ""),
-                "route": request.url.path,
+                "request_id": headers.get("x-request-id", ""),
+                "route": route,
                 "body": body,
-                "ts": request.headers.get("x-request-ts", "")
+                "ts": headers.get("x-request-ts", "")
             }
-            
-            result = boundary_validator.validate_l1_input(payload, "http")
+
+            result = self.validator.validate_l1_input(payload, "http")
             span.set_attribute("surface", "http")
-            span.set_attribute("route", request.url.path)
+            span.set_attribute("route", route)
             span.set_attribute("valid", result.valid)
             span.set_attribute("error_count", len(result.errors))
-            
+
             if not result.valid:
-                telemetry_manager.action_failures_counter.add(1, {"surface": "http", "reason": "validation"})
-                logger.error("L1 validation failed; request rejected", 
-                           route=request.url.path, errors=result.errors, component_id=result.component_id)
-                return Response(status_code=400, content=b'{"error":"invalid"}', media_type="application/json")
-            
-            telemetry_manager.file_events_counter.add(1, {"surface": "http"})
-        return await call_next(request)
\ No newline at end of file
+                _telemetry().action_failures_counter.add(1, {"surface": "http", "reason": "validation"})
+                logger.error("L1 validation failed; request rejected",
+                           route=route, errors=result.errors, component_id=result.component_id)
+                return False
+
+            _telemetry().file_events_counter.add(1, {"surface": "http"})
+        return True
+
+    async def _handle_batch(self, scope, receive, send):
+        content_type = _headers(scope).get("content-type", "").split(";")[0].strip().lower()
+        if content_type in NDJSON_CONTENT_TYPES:
+            parser = NDJSONStreamParser()
+        elif content_type in ("application/json", ""):
+            parser = JSONArrayStreamParser()
+        else:
+            await _send_json(send, 415, b'{"error":"unsupported content type"}')
+            return
+
+        batch = BatchIngestResult()
+        route = scope["path"]
+        with _telemetry().trace_boundary_call("inbound", "http", route, "batch_received") as span:
+            pending: List[ParsedItem] = []
+            more_body = True
+            while more_body:
+                message = await receive()
+                if message["type"] == "http.disconnect":
+                    return
+                more_body = message.get("more_body", False)
+                pending.extend(parser.feed(message.get("body", b""), final=not more_body))
+
+                if len(batch.results) + len(pending) > self.max_batch_items:
+                    logger.warning("Batch ingest rejected; too many items",
+                                 route=route, max_batch_items=self.max_batch_items)
+                    await _send_json(send, 413, b'{"error":"too many items"}')
+                    return
+                if len(pending) >= self.validation_chunk_size or not more_body:
+                    self._validate_items(pending, batch)
+                    pending = []
+
+            span.set_attribute("surface", "http")
+            span.set_attribute("route", route)
+            span.set_attribute("items", len(batch.results))
+            span.set_attribute("rejected", batch.rejected_count)
+
+        if batch.accepted:
+            _telemetry().file_events_counter.add(len(batch.accepted), {"surface": "http"})
+        if batch.rejected_count:
+            _telemetry().action_failures_counter.add(batch.rejected_count, {"surface": "http", "reason": "validation"})
+            logger.warning("Batch ingest items rejected",
+                         route=route, items=len(batch.results), rejected=batch.rejected_count)
+
+        scope.setdefault("state", {})["l1_batch"] = batch
+        await self.app(scope, _replay_receive(b"", receive), send)
+
+    def _validate_items(self, parsed: List[ParsedItem], batch: BatchIngestResult):
+        if not parsed:
+            return
+        candidates = [value for value, error in parsed if error is None]
+        validations = iter(self.validator.validate_l1_many(candidates, self.item_interface))
+
+        for value, parse_error in parsed:
+            index = len(batch.results)
+            if parse_error is not None:
+                batch.results.append({"index": index, "accepted": False, "errors": [parse_error]})
+                continue
+            result = next(validations)
+            batch.results.append({"index": index, "accepted": result.valid, "errors": result.errors})
+            if result.valid:
+                batch.accepted.append(value)
+
+    @staticmethod
+    async def _read_body(receive) -> Optional[bytes]:
+        chunks = []
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return None
+            chunks.append(message.get("body", b""))
+            more_body = message.get("more_body", False)
+        return b"".join(chunks)
+
+
+def _headers(scope) -> Dict[str, str]:
+    return {name.decode("latin-1"): value.decode("latin-1") for name, value in scope.get("headers", [])}
+
+
+def _replay_receive(body: bytes, receive):
+    """Receive callable that hands the already-read body to the application once."""
+    replayed = False
+
+    async def replay():
+        nonlocal replayed
+        if not replayed:
+            replayed = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        return await receive()
+
+    return replay
+
+
+async def _send_json(send, status: int, body: bytes):
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+    })
+    await send({"type": "http.response.body", "body": body})
@@ -1,5 +1,22 @@
+"""
+L1 NATS subscriber for the Scribe engine.
+
+``NatsBatchConsumer`` pulls messages from a core NATS subscription in batches,
+validates each batch through the boundary validator in one call, and runs the
+message handler with bounded concurrency. An in-flight budget caps how many
+messages are held at once; beyond it, messages wait in the subscription's
+pending buffer, which is bounded by ``pending_msgs_limit`` and
+``pending_bytes_limit`` (the client reports a slow consumer past those).
+"""
+
 import asyncio
 import json
+import signal
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
 from nats.aio.client import Client as NATS
 from tools.scribe.core.logging_config import get_scribe_logger
 from tools.scribe.core.boundary_validator import BoundaryValidator, create_boundary_validator, BoundaryType
@@ -8,38 +25,309 @@ from tools.scribe.core.dlq import write_dlq
 
 logger = get_scribe_logger(__name__)
 
-# Initialize sophisticated telemetry system
-telemetry_manager = initialize_telemetry("scribe-nats-adapter")
-boundary_validator = create_boundary_validator()
+# Telemetry and the boundary validator are created on first use rather than
+# at import, so importing this module has no side effects.
+_telemetry_manager = None
+_boundary_validator: Optional[BoundaryValidator] = None
+
+
+def _telemetry():
+    global _telemetry_manager
+    if _telemetry_manager is None:
+        _telemetry_manager = initialize_telemetry("scribe-nats-adapter")
+    return _telemetry_manager
+
+
+def _validator() -> BoundaryValidator:
+    global _boundary_validator
+    if _boundary_validator is None:
+        _boundary_validator = create_boundary_validator()
+    return _boundary_validator
+
+
+def __getattr__(name):
+    # ``telemetry_manager`` and ``boundary_validator`` remain readable as
+    # module attributes
+    if name == "telemetry_manager":
+        return _telemetry()
+    if name == "boundary_validator":
+        return _validator()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Called with the validated payload and the raw message
+MessageHandler = Callable[[Dict[str, Any], Any], Awaitable[None]]
 
-async def run_nats(url: str, subject: str):
-    nc = NATS()
-    await nc.connect(url)
 
-    async def handler(msg):
+@dataclass
+class ConsumerConfig:
+    """Batching, concurrency and flow-control settings for NatsBatchConsumer."""
+    batch_size: int = 64
+    batch_timeout: float = 0.05
+    concurrency: int = 8
+    max_in_flight: int = 512
+    pending_msgs_limit: int = 65536
+    pending_bytes_limit: int = 64 * 1024 * 1024
+    queue_group: str = ""
+    poll_interval: float = 0.5
+    metrics_interval: float = 10.0
+    drain_timeout: float = 30.0
+
+
+class NatsBatchConsumer:
+    """
+    Batch-consuming NATS subscriber with bounded in-flight work.
+
+    Works with any client exposing nats-py's ``subscribe()`` and a
+    subscription with ``next_msg()``, ``drain()``, ``pending_msgs`` and
+    ``pending_bytes``.
+    """
+
+    def __init__(self, nc, subject: str,
+                 handler: Optional[MessageHandler] = None,
+                 config: Optional[ConsumerConfig] = None,
+                 validator: Optional[BoundaryValidator] = None):
+        self.nc = nc
+        self.subject = subject
+        self.handler = handler
+        self.config = config or ConsumerConfig()
+        self.validator = validator or _validator()
+
+        self._sub = None
+        self._pull_task: Optional[asyncio.Task] = None
+        self._metrics_task: Optional[asyncio.Task] = None
+        self._batch_tasks: Set[asyncio.Task] = set()
+        self._budget: Optional[asyncio.Semaphore] = None
+        self._workers: Optional[asyncio.Semaphore] = None
+        self._stopping = False
+
+        self._stats = {
+            "received": 0,
+            "processed": 0,
+            "failed": 0,
+            "invalid": 0,
+            "batches": 0,
+            "in_flight": 0,
+        }
+        self._started_at: Optional[float] = None
+        self._last_sample = (0.0, 0)
+        self._throughput = 0.0
+
+    async def start(self):
+        """Subscribe and begin pulling messages."""
+        if self._pull_task is not None:
+            return
+        self._budget = asyncio.Semaphore(self.config.max_in_flight)
+        self._workers = asyncio.Semaphore(self.config.concurrency)
+        self._sub = await self.nc.subscribe(
+            self.subject,
+            queue=self.config.queue_group,
+            pending_msgs_limit=self.config.pending_msgs_limit,
+            pending_bytes_limit=self.config.pending_bytes_limit,
+        )
+        self._started_at = time.time()
+        self._last_sample = (self._started_at, 0)
+        self._pull_task = asyncio.create_task(self._pull_loop(), name=f"nats-pull:{self.subject}")
+        self._metrics_task = asyncio.create_task(self._metrics_loop(), name=f"nats-metrics:{self.subject}")
+        logger.info("NATS batch consumer started",
+                   subject=self.subject,
+                   batch_size=self.config.batch_size,
+                   concurrency=self.config.concurrency,
+                   max_in_flight=self.config.max_in_flight)
+
+    async def stop(self):
+        """
+        Drain and shut down: stop interest in the subject, process every
+        message already delivered, then wait for in-flight work.
+        """
+        if self._pull_task is None or self._stopping:
+            return
+        self._stopping = True
         try:
-            payload = json.loads(msg.data.decode("utf-8"))
-        except Exception:
-            payload = {"message_id": "", "subject": subject, "payload": {}, "ts": ""}
+            # The pull loop keeps consuming until the subscription's pending
+            # buffer is empty, which is what drain() waits for
+            await asyncio.wait_for(self._sub.drain(), self.config.drain_timeout)
+        except Exception as e:
+            logger.warning("NATS subscription drain incomplete", subject=self.subject, error=str(e))
+
+        self._pull_task.cancel()
+        self._metrics_task.cancel()
+        await asyncio.gather(self._pull_task, self._metrics_task, return_exceptions=True)
+        if self._batch_tasks:
+            done, pending = await asyncio.wait(set(self._batch_tasks), timeout=self.config.drain_timeout)
+            for task in pending:
+                task.cancel()
+        self._publish_metrics()
+        logger.info("NATS batch consumer stopped", subject=self.subject, **self.get_stats())
+
+    async def _pull_loop(self):
+        while True:
+            batch = await self._next_batch()
+            if batch:
+                self._dispatch_batch(batch)
+
+    async def _next_batch(self) -> List[Any]:
+        """Pull up to batch_size messages, waiting at most batch_timeout after the first."""
+        loop = asyncio.get_running_loop()
+        batch: List[Any] = []
+        deadline = 0.0
+        try:
+            while len(batch) < self.config.batch_size:
+                # Every held message owns one unit of the in-flight budget;
+                # dispatch a partial batch rather than hold it while waiting
+                if batch and self._budget.locked():
+                    break
+                await self._budget.acquire()
+                if batch:
+                    timeout = max(deadline - loop.time(), 0.001)
+                else:
+                    timeout = self.config.poll_interval
+                try:
+                    msg = await self._sub.next_msg(timeout=timeout)
+                except asyncio.TimeoutError:
+                    self._budget.release()
+                    break
+                except BaseException:
+                    self._budget.release()
+                    raise
+                batch.append(msg)
+                if len(batch) == 1:
+                    deadline = loop.time() + self.config.batch_timeout
+        except asyncio.CancelledError:
+            # Never drop messages already taken from the subscription
+            if batch:
+                self._dispatch_batch(batch)
+            raise
+        return batch
+
+    def _dispatch_batch(self, batch: List[Any]):
+        self._stats["received"] += len(batch)
+        self._stats["in_flight"] += len(batch)
+        self._stats["batches"] += 1
+        task = asyncio.create_task(self._process_batch(batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _process_batch(self, batch: List[Any]):
+        payloads = [self._decode(msg) for msg in batch]
         # Use sophisticated boundary validation system
-        with telemetry_manager.trace_boundary_call("inbound", "nats", subject, "message_received") as span:
-            result = boundary_validator.validate_l1_input(payload, "nats")
+        with _telemetry().trace_boundary_call("inbound", "nats", self.subject, "batch_received") as span:
+            results = self.validator.validate_l1_many(payloads, "nats")
+            invalid = sum(not result.valid for result in results)
             span.set_attribute("surface", "nats")
-            span.set_attribute("subject", subject)
-            span.set_attribute("valid", result.valid)
-            span.set_attribute("error_count", len(result.errors))
-            
-            if not result.valid:
-                telemetry_manager.action_failures_counter.add(1, {"surface": "nats", "reason": "validation"})
-                write_dlq("nats", payload.get("message_id", ""), result.errors, {"subject": subject})
-                logger.error("L1 validation failed; message dropped", 
-                           subject=subject, errors=result.errors, component_id=result.component_id)
-                return
-            
-            telemetry_manager.file_events_counter.add(1, {"surface": "nats"})
-        # Proceed with normal processing via ports/adapters
-
-    await nc.subscribe(subject, cb=handler)
-    logger.info("NATS subscriber started", subject=subject)
-    while True:
-        await asyncio.sleep(3600)
\ No newline at end of file
+            span.set_attribute("subject", self.subject)
+            span.set_attribute("batch_size", len(batch))
+            span.set_attribute("invalid_count", invalid)
+
+        handled = []
+        for msg, payload, result in zip(batch, payloads, results):
+            if result.valid:
+                handled.append(self._handle(msg, payload))
+                continue
+            write_dlq("nats", payload.get("message_id", ""), result.errors, {"subject": self.subject})
+            logger.error("L1 validation failed; message dropped",
+                       subject=self.subject, errors=result.errors, component_id=result.component_id)
+            self._release(1)
+
+        if invalid:
+            self._stats["invalid"] += invalid
+            _telemetry().action_failures_counter.add(invalid, {"surface": "nats", "reason": "validation"})
+        if handled:
+            _telemetry().file_events_counter.add(len(handled), {"surface": "nats"})
+            await asyncio.gather(*handled)
+
+    async def _handle(self, msg, payload: Dict[str, Any]):
+        try:
+            async with self._workers:
+                # Proceed with normal processing via ports/adapters
+                if self.handler is not None:
+                    await self.handler(payload, msg)
+            self._stats["processed"] += 1
+        except Exception as e:
+            self._stats["failed"] += 1
+            write_dlq("nats", payload.get("message_id", ""), [f"Handler failed: {e}"], {"subject": self.subject})
+            logger.error("NATS message handler failed",
+                       subject=self.subject, message_id=payload.get("message_id", ""), error=str(e))
+        finally:
+            self._release(1)
+
+    def _release(self, count: int):
+        self._stats["in_flight"] -= count
+        for _ in range(count):
+            self._budget.release()
+
+    def _decode(self, msg) -> Dict[str, Any]:
+        try:
+            payload = json.loads(msg.data.decode("utf-8"))
+            if isinstance(payload, dict):
+                return payload
+        except Exception:
+            pass
+        return {"message_id": "", "subject": self.subject, "payload": {}, "ts": ""}
+
+    async def _metrics_loop(self):
+        try:
+            while True:
+                await asyncio.sleep(self.config.metrics_interval)
+                self._publish_metrics()
+        except asyncio.CancelledError:
+            pass
+
+    def _publish_metrics(self):
+        now = time.time()
+        last_time, last_processed = self._last_sample
+        if now > last_time:
+            self._throughput = (self._stats["processed"] - last_processed) / (now - last_time)
+        self._last_sample = (now, self._stats["processed"])
+
+        stats = self.get_stats()
+        attributes = {"surface": "nats", "subject": self.subject}
+        _telemetry().queue_size_gauge.set(stats["lag_msgs"], attributes)
+        _telemetry().active_workers_gauge.set(stats["in_flight"], attributes)
+        logger.info("NATS consumer metrics", subject=self.subject, **stats)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Consumer counters, lag (messages delivered but not yet pulled) and throughput."""
+        sub = self._sub
+        return {
+            **self._stats,
+            "lag_msgs": sub.pending_msgs if sub is not None else 0,
+            "lag_bytes": sub.pending_bytes if sub is not None else 0,
+            "throughput_per_second": round(self._throughput, 2),
+            "uptime_seconds": round(time.time() - self._started_at, 3) if self._started_at else 0.0,
+        }
+
+
+async def run_nats(url: str, subject: str,
+                   handler: Optional[MessageHandler] = None,
+                   config: Optional[ConsumerConfig] = None,
+                   stop_event: Optional[asyncio.Event] = None) -> Dict[str, Any]:
+    """
+    Consume ``subject`` until ``stop_event`` is set (or SIGINT/SIGTERM when run
+    from the main thread), then drain the consumer and the connection.
+
+    Returns the consumer's final stats.
+    """
+    stop_event = stop_event or asyncio.Event()
+    loop = asyncio.get_running_loop()
+    signals = []
+    if threading.current_thread() is threading.main_thread():
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop_event.set)
+                signals.append(sig)
+            except (NotImplementedError, RuntimeError):
+                pass
+
+    nc = NATS()
+    await nc.connect(url)
+    consumer = NatsBatchConsumer(nc, subject, handler=handler, config=config)
+    try:
+        await consumer.start()
+        logger.info("NATS subscriber started", subject=subject)
+        await stop_event.wait()
+        await consumer.stop()
+        return consumer.get_stats()
+    finally:
+        for sig in signals:
+            loop.remove_signal_handler(sig)
+        await nc.drain()
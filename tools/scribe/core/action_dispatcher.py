@@ -8,17 +8,18 @@ Handles action loading, parameter validation, execution, and error recovery.
 
 import re
 import time
-import shutil
 import os
-from datetime import datetime
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 import structlog
 
+from .atomic_write import atomic_write
 from .logging_config import get_scribe_logger
 from .plugin_loader import PluginLoader, PluginInfo
 from .rule_processor import RuleMatch
 from .circuit_breaker import CircuitBreakerManager, CircuitBreakerError
+from .quarantine_store import QuarantineStore, QuarantineConfig
 from tools.scribe.actions.base import BaseAction, ActionExecutionError, ValidationError
 from .config_manager import ConfigManager
 from .security_manager import SecurityManager, SecurityViolation
@@ -149,6 +150,83 @@ class DispatchResult:
         return f"DispatchResult(rule_id='{self.rule_id}', success={self.success}, actions={self.successful_actions}/{self.total_actions})"
 
 
+def _common_prefix_length(a: str, b: str) -> int:
+    """Length of the common prefix, by binary search over slice comparisons."""
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[:mid] == b[:mid]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+def _common_suffix_length(a: str, b: str, limit: int) -> int:
+    """Length of the common suffix, at most ``limit``."""
+    low, high = 0, max(0, limit)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[len(a) - mid:] == b[len(b) - mid:]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+class FileDispatchResult:
+    """Result of running all rule matches for one file as a single transaction."""
+    
+    def __init__(self,
+                 file_path: str,
+                 original_content: str,
+                 final_content: str,
+                 dispatch_results: List[DispatchResult],
+                 committed: bool = False,
+                 aborted: bool = False,
+                 conflict: bool = False,
+                 error: Optional[Exception] = None,
+                 event_id: Optional[str] = None):
+        """
+        Initialize file dispatch result.
+        
+        Args:
+            file_path: Path to the file that was processed
+            original_content: Content the pipeline started from
+            final_content: Content after all action chains (original if aborted)
+            dispatch_results: One DispatchResult per executed action chain
+            committed: Whether final_content was written to disk
+            aborted: Whether a chain failure rolled the transaction back
+            conflict: Whether the file changed on disk before the commit
+            error: Write or abort error, if any
+            event_id: Event that triggered the dispatch
+        """
+        self.file_path = file_path
+        self.original_content = original_content
+        self.final_content = final_content
+        self.dispatch_results = dispatch_results
+        self.committed = committed
+        self.aborted = aborted
+        self.conflict = conflict
+        self.error = error
+        self.event_id = event_id
+        self.timestamp = time.time()
+        
+        self.content_changed = final_content != original_content
+        self.total_actions = sum(r.total_actions for r in dispatch_results)
+        self.failed_actions = sum(r.failed_actions for r in dispatch_results)
+        self.success = (not aborted and not conflict and error is None
+                        and all(r.success for r in dispatch_results))
+    
+    def __str__(self) -> str:
+        status = "SUCCESS" if self.success else "ABORTED" if self.aborted else "CONFLICT" if self.conflict else "PARTIAL/FAILED"
+        return f"FileDispatchResult({self.file_path}: {status}, {len(self.dispatch_results)} chains, committed={self.committed})"
+    
+    def __repr__(self) -> str:
+        return (f"FileDispatchResult(file_path='{self.file_path}', success={self.success}, "
+                f"chains={len(self.dispatch_results)}, committed={self.committed})")
+
+
 class ActionDispatcher:
     """
     Dispatches and executes actions for rule matches.
@@ -161,7 +239,8 @@ class ActionDispatcher:
                  plugin_loader: PluginLoader,
                  config_manager: ConfigManager,
                  security_manager: SecurityManager,
-                 quarantine_path: Optional[str] = None):
+                 quarantine_path: Optional[str] = None,
+                 quarantine_config: Optional[QuarantineConfig] = None):
         """
         Initialize the action dispatcher.
         
@@ -170,11 +249,13 @@ class ActionDispatcher:
             config_manager: ConfigManager instance.
             security_manager: SecurityManager instance.
             quarantine_path: Path to quarantine directory for failed files.
+            quarantine_config: Retention and size quota for the quarantine store.
         """
         self.plugin_loader = plugin_loader
         self.config_manager = config_manager
         self.security_manager = security_manager
         self.quarantine_path = quarantine_path or "archive/scribe/quarantine/"
+        self.quarantine_store = QuarantineStore(self.quarantine_path, quarantine_config)
         
         # Circuit breaker manager for rule failure isolation
         self.circuit_breaker_manager = CircuitBreakerManager()
@@ -189,7 +270,10 @@ class ActionDispatcher:
             'total_actions_executed': 0,
             'total_execution_time': 0.0,
             'circuit_breaker_blocks': 0,
-            'files_quarantined': 0
+            'files_quarantined': 0,
+            'files_dispatched': 0,
+            'file_writes': 0,
+            'write_conflicts': 0
         }
         
         logger.info("ActionDispatcher initialized",
@@ -328,8 +412,8 @@ class ActionDispatcher:
                 )
                 
                 return DispatchResult(
-                    success=False,
                     rule_id=rule_id,
+                    file_path=file_path,
                     final_content=current_content,
                     action_results=[circuit_breaker_error]
                 )
@@ -408,7 +492,8 @@ class ActionDispatcher:
         
         return default_config
     
-    def _execute_actions_internal(self, rule_match: RuleMatch, current_content: str) -> DispatchResult:
+    def _execute_actions_internal(self, rule_match: RuleMatch, current_content: str,
+                                  match: Optional[re.Match] = None) -> DispatchResult:
         """
         Internal method to execute actions for a rule match.
         
@@ -418,6 +503,7 @@ class ActionDispatcher:
         Args:
             rule_match: The rule match to process
             current_content: Current file content
+            match: Match against current_content (defaults to rule_match.match)
             
         Returns:
             DispatchResult with execution details
@@ -428,6 +514,7 @@ class ActionDispatcher:
         rule_id = rule_match.rule.id
         file_path = rule_match.file_path
         event_id = rule_match.event_id
+        match = match or rule_match.match
         action_results = []
         
         # Process each action in sequence
@@ -509,7 +596,7 @@ class ActionDispatcher:
             # based on a configuration setting (e.g., from self.config_manager).
 
             # Execute the action
-            result = self.execute_action(action, current_content, rule_match.match, file_path, params, event_id)
+            result = self.execute_action(action, current_content, match, file_path, params, event_id)
             action_results.append(result)
             
             # Update statistics
@@ -578,9 +665,219 @@ class ActionDispatcher:
         
         return dispatch_result
     
+    def dispatch_file(self, rule_matches: List[RuleMatch], file_content: Optional[str] = None,
+                      write: bool = True) -> FileDispatchResult:
+        """
+        Run all rule matches for one file against a single buffer and commit once.
+        
+        Rules run in the order their matches were produced (config order from
+        RuleProcessor.process_file). Each rule's pattern is searched again in
+        the current buffer before every chain, so offsets stay correct after
+        earlier edits; a rule runs at most as many chains as it had matches.
+        The file is written with one atomic write at the end, unless it changed
+        on disk since its content was read (conflict). A chain that fails or
+        hits an open circuit breaker rolls the whole transaction back and
+        quarantines the file, as dispatch_actions() does.
+        
+        Args:
+            rule_matches: All matches for one file, as returned by process_file()
+            file_content: Content to start from (defaults to the matches' content,
+                read from disk if neither is available)
+            write: Commit the result to disk; False runs the pipeline in memory only
+            
+        Returns:
+            FileDispatchResult with one DispatchResult per executed chain
+            
+        Raises:
+            ValueError: If no matches are given or they refer to different files
+        """
+        if not rule_matches:
+            raise ValueError("dispatch_file requires at least one rule match")
+        file_path = rule_matches[0].file_path
+        if any(rule_match.file_path != file_path for rule_match in rule_matches):
+            raise ValueError("dispatch_file requires matches for a single file")
+        event_id = rule_matches[0].event_id
+        start_time = time.time()
+        self._execution_stats['files_dispatched'] += 1
+        
+        # Snapshot before reading so a concurrent edit is detected at commit time.
+        # Content handed in was read earlier (by RuleProcessor or the caller), so
+        # an edit made before this stat is only caught by comparing the content.
+        base_stat = self._file_stat(file_path)
+        if file_content is None:
+            file_content = rule_matches[0].file_content
+        verify_content = file_content is not None
+        if file_content is None:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                file_content = f.read()
+        
+        matches_by_rule: "OrderedDict[str, List[RuleMatch]]" = OrderedDict()
+        for rule_match in rule_matches:
+            matches_by_rule.setdefault(rule_match.rule.id, []).append(rule_match)
+        
+        buffer = file_content
+        dispatch_results: List[DispatchResult] = []
+        abort_error: Optional[Exception] = None
+        
+        for rule_id, rule_group in matches_by_rule.items():
+            rule = rule_group[0].rule
+            pattern = getattr(rule, 'compiled_pattern', None) or re.compile(rule.trigger_pattern, re.MULTILINE)
+            circuit_breaker = self.circuit_breaker_manager.get_breaker(
+                rule_id=rule_id,
+                **self._get_circuit_breaker_config(rule)
+            )
+            cursor = 0
+            for rule_match in rule_group:
+                match = pattern.search(buffer, cursor)
+                if match is None:
+                    break
+                
+                self._execution_stats['total_dispatches'] += 1
+                failures: List[Exception] = []
+                chain_result = circuit_breaker.execute(
+                    lambda: self._execute_actions_internal(rule_match, buffer, match),
+                    failures.append
+                )
+                if failures:
+                    abort_error = failures[0]
+                    self._execution_stats['failed_dispatches'] += 1
+                    if isinstance(abort_error, CircuitBreakerError):
+                        self._execution_stats['circuit_breaker_blocks'] += 1
+                    dispatch_results.append(DispatchResult(
+                        rule_id=rule_id,
+                        file_path=file_path,
+                        final_content=buffer,
+                        action_results=[ActionResult(
+                            action_type="circuit_breaker",
+                            success=False,
+                            error=abort_error,
+                            metadata={
+                                "blocked_by_circuit_breaker": isinstance(abort_error, CircuitBreakerError),
+                                "transaction_aborted": True
+                            }
+                        )]
+                    ))
+                    break
+                
+                self._execution_stats['successful_dispatches'] += 1
+                dispatch_results.append(chain_result)
+                cursor = self._next_search_position(buffer, chain_result.final_content, match)
+                buffer = chain_result.final_content
+            
+            if abort_error is not None:
+                break
+        
+        committed = False
+        conflict = False
+        write_error: Optional[Exception] = abort_error
+        if abort_error is not None:
+            buffer = file_content
+            logger.warning("File dispatch aborted; no changes written",
+                          event_id=event_id,
+                          file_path=file_path,
+                          error=str(abort_error))
+            if write:
+                reason = "circuit_breaker_open" if isinstance(abort_error, CircuitBreakerError) else "action_chain_failed"
+                self.quarantine_file(file_path, dispatch_results[-1].rule_id, reason)
+        elif write and buffer != file_content:
+            if self._changed_on_disk(file_path, base_stat, file_content if verify_content else None):
+                conflict = True
+                self._execution_stats['write_conflicts'] += 1
+                logger.warning("File changed on disk during dispatch; not writing",
+                              event_id=event_id,
+                              file_path=file_path)
+            else:
+                try:
+                    committed = atomic_write(file_path, buffer)
+                    self._execution_stats['file_writes'] += 1
+                except OSError as e:
+                    write_error = e
+                    logger.error("Failed to commit file dispatch",
+                                event_id=event_id,
+                                file_path=file_path,
+                                error=str(e))
+        
+        result = FileDispatchResult(
+            file_path=file_path,
+            original_content=file_content,
+            final_content=buffer,
+            dispatch_results=dispatch_results,
+            committed=committed,
+            aborted=abort_error is not None,
+            conflict=conflict,
+            error=write_error,
+            event_id=event_id
+        )
+        total_time = time.time() - start_time
+        self._execution_stats['total_execution_time'] += total_time
+        
+        logger.info("File dispatch complete",
+                   event_id=event_id,
+                   file_path=file_path,
+                   rules=len(matches_by_rule),
+                   chains=len(dispatch_results),
+                   content_changed=result.content_changed,
+                   committed=committed,
+                   total_time=total_time)
+        
+        return result
+    
+    @staticmethod
+    def _file_stat(file_path: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    @classmethod
+    def _changed_on_disk(cls, file_path: str, base_stat: Optional[Tuple[int, int]],
+                         expected_content: Optional[str]) -> bool:
+        """
+        Whether the file differs from what the dispatch started from.
+        
+        Args:
+            file_path: File about to be committed
+            base_stat: Stat taken when the dispatch started
+            expected_content: Content the dispatch started from, compared with the
+                file on disk when it was read before base_stat was taken
+        """
+        if base_stat is None or cls._file_stat(file_path) != base_stat:
+            return True
+        if expected_content is None:
+            return False
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                return f.read() != expected_content
+        except (OSError, UnicodeDecodeError):
+            return True
+    
+    @staticmethod
+    def _next_search_position(old: str, new: str, match: re.Match) -> int:
+        """
+        Where to resume searching in ``new`` after a chain ran on ``match``.
+        
+        The edit is located by the common prefix/suffix of old and new: a
+        match before the edit keeps its offset, one after it shifts by the
+        length delta, and one overlapping it resumes after the edited region.
+        """
+        step = match.end() if match.end() > match.start() else match.end() + 1
+        if new == old:
+            return step
+        prefix = _common_prefix_length(old, new)
+        if step <= prefix:
+            return step
+        suffix = _common_suffix_length(old, new, min(len(old), len(new)) - prefix)
+        if match.start() >= len(old) - suffix:
+            return step + len(new) - len(old)
+        return len(new) - suffix
+    
     def quarantine_file(self, file_path: str, rule_id: str, reason: str) -> Dict[str, Any]:
         """
-        Quarantine a problematic file by moving it to the quarantine directory.
+        Quarantine a problematic file by moving it into the quarantine store.
+        
+        Content already in the store is not copied again; the quarantine is
+        recorded as an index entry against the existing blob.
         
         Args:
             file_path: Path to the file to quarantine
@@ -591,7 +888,6 @@ class ActionDispatcher:
             Dictionary with quarantine operation result
         """
         try:
-            # Convert to Path objects for easier manipulation
             source_path = Path(file_path)
             
             # Check if source file exists
@@ -606,60 +902,8 @@ class ActionDispatcher:
                     "file_path": file_path
                 }
             
-            # Create quarantine directory structure
-            quarantine_base = Path(self.quarantine_path)
-            
-            # Preserve relative path structure in quarantine
-            if source_path.is_absolute():
-                # For absolute paths, use relative path from current working directory
-                try:
-                    relative_path = source_path.relative_to(Path.cwd())
-                except ValueError:
-                    # If can't make relative, preserve the full path structure
-                    # Handle Windows drive letters for cross-platform compatibility
-                    path_parts = source_path.parts
-                    if len(path_parts) > 1 and ':' in path_parts[0]:
-                        # Windows path with drive letter
-                        relative_path = Path(*path_parts[1:])
-                    else:
-                        # Unix-style absolute path
-                        relative_path = Path(*path_parts[1:]) if path_parts[0] == '/' else source_path
-            else:
-                relative_path = source_path
-            
-            # Ensure relative_path is a Path object
-            if isinstance(relative_path, str):
-                relative_path = Path(relative_path)
-            
-            # Create timestamped filename to avoid conflicts
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            stem = relative_path.stem
-            suffix = relative_path.suffix
-            quarantine_filename = f"{stem}_{timestamp}{suffix}"
-            
-            # Build full quarantine path
-            quarantine_dir = quarantine_base / relative_path.parent
-            quarantine_path = quarantine_dir / quarantine_filename
-            
-            # Create quarantine directory if it doesn't exist
-            quarantine_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Copy file to quarantine (preserving original)
-            shutil.copy2(source_path, quarantine_path)
-            
-            # Create metadata file alongside quarantined file
-            metadata_path = quarantine_path.with_suffix(quarantine_path.suffix + ".quarantine_info")
-            metadata = {
-                "original_path": str(source_path),
-                "quarantine_time": datetime.now().isoformat(),
-                "rule_id": rule_id,
-                "reason": reason,
-                "quarantine_path": str(quarantine_path)
-            }
-            
-            with open(metadata_path, 'w') as f:
-                import json
-                json.dump(metadata, f, indent=2)
+            entry, deduplicated = self.quarantine_store.quarantine(source_path, rule_id, reason)
+            quarantine_path = self.quarantine_store.blob_path(entry.hash)
             
             # Clean up original file after successful quarantine
             source_path.unlink()
@@ -670,6 +914,8 @@ class ActionDispatcher:
             logger.info("File quarantined successfully",
                        original_path=str(source_path),
                        quarantine_path=str(quarantine_path),
+                       content_hash=entry.hash,
+                       deduplicated=deduplicated,
                        rule_id=rule_id,
                        reason=reason)
             
@@ -677,7 +923,9 @@ class ActionDispatcher:
                 "success": True,
                 "original_path": str(source_path),
                 "quarantine_path": str(quarantine_path),
-                "metadata_path": str(metadata_path),
+                "metadata_path": str(self.quarantine_store.index_path),
+                "content_hash": entry.hash,
+                "deduplicated": deduplicated,
                 "rule_id": rule_id,
                 "reason": reason
             }
@@ -727,7 +975,8 @@ class ActionDispatcher:
         # Add quarantine statistics
         stats['quarantine_stats'] = {
             'files_quarantined': stats['files_quarantined'],
-            'quarantine_path': self.quarantine_path
+            'quarantine_path': self.quarantine_path,
+            **self.quarantine_store.get_stats()
         }
         
         return stats
@@ -750,6 +999,9 @@ class ActionDispatcher:
             'total_actions_executed': 0,
             'total_execution_time': 0.0,
             'circuit_breaker_blocks': 0,
-            'files_quarantined': 0
+            'files_quarantined': 0,
+            'files_dispatched': 0,
+            'file_writes': 0,
+            'write_conflicts': 0
         }
         logger.debug("Execution statistics reset") 
\ No newline at end of file
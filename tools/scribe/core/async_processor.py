@@ -4,11 +4,16 @@ Scribe Engine Async Processing Pipeline
 
 Implements high-performance asynchronous processing for file events and actions
 with concurrent execution, backpressure handling, and resource management.
+Tasks are partitioned by key (typically the file path): each key is processed
+strictly in order while different keys run in parallel across workers.
 """
 
 import asyncio
+import heapq
 import threading
 import time
+import zlib
+from collections import OrderedDict, deque
 from typing import Dict, Any, Optional, List, Callable, Union, Awaitable
 from dataclasses import dataclass
 from enum import Enum
@@ -54,10 +59,15 @@ class AsyncTask:
     retry_count: int = 0
     max_retries: int = 3
     error: Optional[Exception] = None
+    partition_key: Optional[str] = None
+    sequence: int = 0
     
     def __post_init__(self):
         if self.created_at is None:
             self.created_at = time.time()
+        if self.partition_key is None:
+            # Unkeyed tasks are independent of each other
+            self.partition_key = self.task_id
     
     @property
     def duration(self) -> Optional[float]:
@@ -74,86 +84,173 @@ class AsyncTask:
         return None
 
 
-class AsyncTaskQueue:
-    """Priority queue for async tasks with backpressure handling."""
-    
-    def __init__(self, max_size: int = 1000):
+class _Shard:
+    """Pending tasks for the partition keys hashed to one shard."""
+
+    __slots__ = ("keys", "ready", "depth")
+
+    def __init__(self):
+        # Per-key FIFO of pending tasks; a key is present while it has pending
+        # tasks or one of its tasks is running.
+        self.keys: Dict[str, deque] = {}
+        # Heap of (-priority, sequence, key) for keys whose next task may start
+        self.ready: List[tuple] = []
+        self.depth = 0
+
+
+class ShardedTaskQueue:
+    """
+    Key-ordered task queue sharded by partition key, with backpressure handling.
+
+    Tasks with the same partition key are handed out strictly in submission
+    order and never run concurrently; tasks for different keys run in
+    parallel. Among runnable keys, the head task with the highest priority is
+    taken first. Each worker prefers its home shard and steals runnable keys
+    from the deepest other shard when its own has none.
+
+    Only used from the processor's event loop thread.
+    """
+
+    def __init__(self, max_size: int = 1000, num_shards: int = 8):
         """
-        Initialize async task queue.
-        
+        Initialize sharded task queue.
+
         Args:
-            max_size: Maximum queue size for backpressure
+            max_size: Maximum number of pending tasks for backpressure
+            num_shards: Number of shards partition keys are hashed over
         """
+        if num_shards < 1:
+            raise ValueError("num_shards must be at least 1")
+
         self.max_size = max_size
-        self._queue = asyncio.PriorityQueue(maxsize=max_size)
-        self._lock = asyncio.Lock()
-        self._task_counter = 0
-        
-        logger.debug("AsyncTaskQueue initialized", max_size=max_size)
-    
+        self.num_shards = num_shards
+        self._shards = [_Shard() for _ in range(num_shards)]
+        self._running_keys: set = set()
+        self._size = 0
+        self._sequence = 0
+        self._steals = 0
+        self._available = asyncio.Event()
+
+        logger.debug("ShardedTaskQueue initialized", max_size=max_size, num_shards=num_shards)
+
+    def shard_index(self, key: str) -> int:
+        """Get the shard a partition key is assigned to (stable across processes)."""
+        return zlib.crc32(key.encode("utf-8")) % self.num_shards
+
+    def _push_ready(self, shard: _Shard, key: str):
+        head = shard.keys[key][0]
+        heapq.heappush(shard.ready, (-head.priority.value, head.sequence, key))
+
     async def put(self, task: AsyncTask) -> bool:
         """
-        Add task to queue with backpressure handling.
-        
+        Add task to the shard for its partition key.
+
         Args:
             task: Task to add
-            
+
         Returns:
             True if task was added, False if queue is full
         """
-        try:
-            # Check queue size for backpressure
-            if self._queue.qsize() >= self.max_size:
-                logger.warning("Task queue full, dropping task",
-                             task_id=task.task_id,
-                             queue_size=self._queue.qsize())
-                return False
-            
-            # Priority queue item: (priority, insertion_order, task)
-            priority_value = -task.priority.value  # Negative for descending order
-            async with self._lock:
-                self._task_counter += 1
-                await self._queue.put((priority_value, self._task_counter, task))
-            
-            logger.debug("Task queued",
-                        task_id=task.task_id,
-                        priority=task.priority.value,
-                        queue_size=self._queue.qsize())
-            return True
-            
-        except Exception as e:
-            logger.error("Error queuing task",
-                        task_id=task.task_id,
-                        error=str(e))
+        if self._size >= self.max_size:
+            logger.warning("Task queue full, dropping task",
+                         task_id=task.task_id,
+                         queue_size=self._size)
             return False
-    
-    async def get(self) -> Optional[AsyncTask]:
-        """Get next task from queue."""
-        try:
-            priority, order, task = await self._queue.get()
-            
-            logger.debug("Task dequeued",
-                        task_id=task.task_id,
-                        priority=task.priority.value,
-                        queue_size=self._queue.qsize())
-            
-            return task
-            
-        except Exception as e:
-            logger.error("Error dequeuing task", error=str(e))
-            return None
-    
+
+        key = task.partition_key
+        self._sequence += 1
+        task.sequence = self._sequence
+        shard = self._shards[self.shard_index(key)]
+
+        pending = shard.keys.get(key)
+        if pending is None:
+            pending = shard.keys[key] = deque()
+        pending.append(task)
+        # A key becomes runnable when it gets its first task and nothing for it
+        # is running; otherwise task_done() re-arms it
+        if len(pending) == 1 and key not in self._running_keys:
+            self._push_ready(shard, key)
+
+        shard.depth += 1
+        self._size += 1
+        self._available.set()
+
+        logger.debug("Task queued",
+                    task_id=task.task_id,
+                    partition_key=key,
+                    priority=task.priority.value,
+                    queue_size=self._size)
+        return True
+
+    def _take(self, home: int) -> Optional[AsyncTask]:
+        shard = self._shards[home]
+        if not shard.ready:
+            # Steal from the deepest shard that has a runnable key
+            victims = [s for s in self._shards if s.ready]
+            if not victims:
+                return None
+            shard = max(victims, key=lambda s: s.depth)
+            self._steals += 1
+
+        _, _, key = heapq.heappop(shard.ready)
+        task = shard.keys[key].popleft()
+        shard.depth -= 1
+        self._size -= 1
+        self._running_keys.add(key)
+        return task
+
+    async def get(self, home_shard: int = 0) -> AsyncTask:
+        """
+        Get the next runnable task, waiting until one is available.
+
+        Args:
+            home_shard: Shard the calling worker drains first
+        """
+        home = home_shard % self.num_shards
+        while True:
+            task = self._take(home)
+            if task is not None:
+                logger.debug("Task dequeued",
+                            task_id=task.task_id,
+                            partition_key=task.partition_key,
+                            priority=task.priority.value,
+                            queue_size=self._size)
+                return task
+            self._available.clear()
+            await self._available.wait()
+
+    def task_done(self, task: AsyncTask):
+        """Release the task's partition key so its next task can run."""
+        key = task.partition_key
+        self._running_keys.discard(key)
+        shard = self._shards[self.shard_index(key)]
+        pending = shard.keys.get(key)
+        if pending:
+            self._push_ready(shard, key)
+            self._available.set()
+        elif pending is not None:
+            del shard.keys[key]
+
+    def shard_depths(self) -> List[int]:
+        """Get the number of pending tasks in each shard."""
+        return [shard.depth for shard in self._shards]
+
+    @property
+    def steals(self) -> int:
+        """Number of tasks taken by a worker from a shard other than its own."""
+        return self._steals
+
     def qsize(self) -> int:
-        """Get current queue size."""
-        return self._queue.qsize()
-    
+        """Get current number of pending tasks."""
+        return self._size
+
     def empty(self) -> bool:
         """Check if queue is empty."""
-        return self._queue.empty()
-    
+        return self._size == 0
+
     def full(self) -> bool:
         """Check if queue is full."""
-        return self._queue.qsize() >= self.max_size
+        return self._size >= self.max_size
 
 
 class AsyncProcessor:
@@ -161,13 +258,16 @@ class AsyncProcessor:
     High-performance async processor for Scribe Engine.
     
     Implements concurrent processing with configurable worker pools,
-    priority queues, backpressure handling, and resource management.
+    key-ordered sharded queues, work stealing, backpressure handling, and
+    resource management.
     """
     
     def __init__(self,
                  max_workers: int = 10,
                  max_queue_size: int = 1000,
-                 worker_timeout: float = 300.0):
+                 worker_timeout: float = 300.0,
+                 num_shards: Optional[int] = None,
+                 completed_history_size: int = 1000):
         """
         Initialize async processor.
         
@@ -175,13 +275,17 @@ class AsyncProcessor:
             max_workers: Maximum number of async workers
             max_queue_size: Maximum task queue size
             worker_timeout: Timeout for worker tasks
+            num_shards: Number of queue shards (defaults to max_workers)
+            completed_history_size: Number of finished tasks kept for status lookups
         """
         self.max_workers = max_workers
         self.max_queue_size = max_queue_size
         self.worker_timeout = worker_timeout
+        self.num_shards = num_shards or max_workers
+        self.completed_history_size = completed_history_size
         
         # Async components
-        self._task_queue = AsyncTaskQueue(max_queue_size)
+        self._task_queue = ShardedTaskQueue(max_queue_size, self.num_shards)
         self._workers: List[asyncio.Task] = []
         self._running = False
         self._loop: Optional[asyncio.AbstractEventLoop] = None
@@ -192,7 +296,7 @@ class AsyncProcessor:
         
         # Task registry and stats
         self._active_tasks: Dict[str, AsyncTask] = {}
-        self._completed_tasks: Dict[str, AsyncTask] = {}
+        self._completed_tasks: "OrderedDict[str, AsyncTask]" = OrderedDict()
         self._task_handlers: Dict[str, Callable] = {}
         
         # Metrics
@@ -211,7 +315,8 @@ class AsyncProcessor:
         logger.info("AsyncProcessor initialized",
                    max_workers=max_workers,
                    max_queue_size=max_queue_size,
-                   worker_timeout=worker_timeout)
+                   worker_timeout=worker_timeout,
+                   num_shards=self.num_shards)
     
     def register_handler(self, task_type: str, handler: Callable):
         """
@@ -271,9 +376,15 @@ class AsyncProcessor:
             self._loop = asyncio.new_event_loop()
             asyncio.set_event_loop(self._loop)
             
+            # List this loop's tasks on /debug/tasks when the health monitor is running
+            from .health_monitor import get_health_monitor
+            health_monitor = get_health_monitor()
+            if health_monitor is not None:
+                health_monitor.register_event_loop(self._loop)
+            
             # Start worker tasks
             for i in range(self.max_workers):
-                worker = self._loop.create_task(self._worker(f"worker-{i}"))
+                worker = self._loop.create_task(self._worker(f"worker-{i}", i))
                 self._workers.append(worker)
             
             # Start stats collector
@@ -301,24 +412,24 @@ class AsyncProcessor:
             if self._loop and not self._loop.is_closed():
                 self._loop.close()
     
-    async def _worker(self, worker_name: str):
-        """Async worker that processes tasks from the queue."""
-        logger.debug("Async worker started", worker_name=worker_name)
+    async def _worker(self, worker_name: str, home_shard: int = 0):
+        """Async worker that processes tasks from its home shard, stealing when idle."""
+        logger.debug("Async worker started", worker_name=worker_name, home_shard=home_shard)
         
         try:
             while self._running:
                 try:
                     # Get next task from queue
                     task = await asyncio.wait_for(
-                        self._task_queue.get(),
+                        self._task_queue.get(home_shard),
                         timeout=1.0
                     )
                     
-                    if task is None:
-                        continue
-                    
-                    # Process the task
-                    await self._process_task(task, worker_name)
+                    # Process the task, then release its partition key
+                    try:
+                        await self._process_task(task, worker_name)
+                    finally:
+                        self._task_queue.task_done(task)
                     
                 except asyncio.TimeoutError:
                     # No task available, continue
@@ -489,12 +600,11 @@ class AsyncProcessor:
                 if task.task_id in self._active_tasks:
                     del self._active_tasks[task.task_id]
                 self._completed_tasks[task.task_id] = task
+                self._completed_tasks.move_to_end(task.task_id)
                 
-                # Limit completed tasks history
-                if len(self._completed_tasks) > 1000:
-                    oldest_task_id = min(self._completed_tasks.keys(), 
-                                       key=lambda k: self._completed_tasks[k].created_at)
-                    del self._completed_tasks[oldest_task_id]
+                # Limit completed tasks history, evicting the oldest completion
+                while len(self._completed_tasks) > self.completed_history_size:
+                    self._completed_tasks.popitem(last=False)
     
     async def _stats_collector(self):
         """Collect and update processor statistics."""
@@ -529,16 +639,21 @@ class AsyncProcessor:
                    payload: Dict[str, Any],
                    priority: TaskPriority = TaskPriority.NORMAL,
                    callback: Optional[Callable] = None,
-                   task_id: Optional[str] = None) -> str:
+                   task_id: Optional[str] = None,
+                   partition_key: Optional[str] = None) -> str:
         """
         Submit a task for async processing.
         
+        Tasks sharing a partition key run one at a time in submission order.
+        
         Args:
             task_type: Type of task
             payload: Task payload data
             priority: Task priority
             callback: Optional callback function
             task_id: Optional custom task ID
+            partition_key: Ordering key; defaults to the payload's ``file_path``,
+                and unkeyed tasks are unordered
             
         Returns:
             Task ID for tracking
@@ -546,12 +661,16 @@ class AsyncProcessor:
         if task_id is None:
             task_id = f"{task_type}_{int(time.time() * 1000000)}"
         
+        if partition_key is None:
+            partition_key = payload.get("file_path")
+        
         task = AsyncTask(
             task_id=task_id,
             task_type=task_type,
             priority=priority,
             payload=payload,
-            callback=callback
+            callback=callback,
+            partition_key=partition_key
         )
         
         # Submit to event loop
@@ -567,6 +686,7 @@ class AsyncProcessor:
                     logger.debug("Task submitted",
                                task_id=task_id,
                                task_type=task_type,
+                               partition_key=task.partition_key,
                                priority=priority.value)
                     return task_id
                 else:
@@ -596,6 +716,8 @@ class AsyncProcessor:
                 "active_tasks": len(self._active_tasks),
                 "completed_tasks": len(self._completed_tasks),
                 "queue_size": self._task_queue.qsize(),
+                "shard_queue_depths": self._task_queue.shard_depths(),
+                "work_steals": self._task_queue.steals,
                 "workers_count": len(self._workers),
                 "running": self._running
             }
@@ -613,7 +735,8 @@ def get_async_processor() -> Optional[AsyncProcessor]:
 
 def initialize_async_processor(max_workers: int = 10,
                              max_queue_size: int = 1000,
-                             worker_timeout: float = 300.0) -> AsyncProcessor:
+                             worker_timeout: float = 300.0,
+                             num_shards: Optional[int] = None) -> AsyncProcessor:
     """
     Initialize global async processor.
     
@@ -621,6 +744,7 @@ def initialize_async_processor(max_workers: int = 10,
         max_workers: Maximum number of async workers
         max_queue_size: Maximum task queue size
         worker_timeout: Timeout for worker tasks
+        num_shards: Number of queue shards (defaults to max_workers)
         
     Returns:
         AsyncProcessor instance
@@ -632,7 +756,8 @@ def initialize_async_processor(max_workers: int = 10,
             _async_processor = AsyncProcessor(
                 max_workers=max_workers,
                 max_queue_size=max_queue_size,
-                worker_timeout=worker_timeout
+                worker_timeout=worker_timeout,
+                num_shards=num_shards
             )
             _async_processor.start()
         
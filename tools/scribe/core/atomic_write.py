@@ -4,12 +4,21 @@ Atomic file write utility for crash-safe file operations.
 This module implements the write-temp -> fsync -> rename pattern to ensure
 that file writes are atomic and crash-safe. If the process is interrupted
 during a write operation, the original file remains unchanged.
+
+For bulk operations, AtomicBatchWriter stages many files, fsyncs them as a
+group, renames them into place, and fsyncs each parent directory once, with
+optional all-or-nothing rollback. Both paths can skip targets whose current
+content is already identical.
 """
 
 import os
+import hashlib
+import shutil
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Union, BinaryIO, TextIO
+from typing import Union, BinaryIO, TextIO, Dict, List, Optional, Tuple
 import structlog
 from .logging_config import get_scribe_logger
 import time
@@ -17,9 +26,78 @@ import portalocker
 
 logger = get_scribe_logger(__name__)
 
+_COMPARE_CHUNK_SIZE = 1024 * 1024
+
+
+def _default_file_mode() -> int:
+    """Mode open(path, 'w') gives a new file: 0666 less the process umask."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+# Read once at import: os.umask can only be read by setting it, which is process-wide
+_DEFAULT_FILE_MODE = _default_file_mode()
+
+
+def _to_bytes(data: Union[str, bytes], encoding: str) -> bytes:
+    return data.encode(encoding) if isinstance(data, str) else data
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write the whole buffer, retrying on partial os.write returns."""
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        if written <= 0:
+            raise OSError(f"os.write wrote {written} bytes")
+        view = view[written:]
+
+
+def _match_target_mode(temp_path: Path, filepath: Path) -> None:
+    """
+    Give a mkstemp file (always 0600) the mode of the file it will replace,
+    or the umask default when the target does not exist yet.
+    """
+    try:
+        shutil.copymode(filepath, temp_path)
+    except FileNotFoundError:
+        os.chmod(temp_path, _DEFAULT_FILE_MODE)
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Persist directory entries (renames) on POSIX; a no-op where unsupported."""
+    if os.name == 'nt':
+        return
+    dir_fd = os.open(str(directory), os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+def content_unchanged(filepath: Union[str, Path], data: bytes) -> bool:
+    """
+    True if filepath already holds exactly data.
+
+    Compares sizes first (one stat) and only hashes the existing file when
+    the sizes match.
+    """
+    try:
+        if os.stat(filepath).st_size != len(data):
+            return False
+        existing = hashlib.blake2b()
+        with open(filepath, 'rb') as f:
+            for chunk in iter(lambda: f.read(_COMPARE_CHUNK_SIZE), b''):
+                existing.update(chunk)
+    except OSError:
+        return False
+    return existing.digest() == hashlib.blake2b(data).digest()
+
 
 def atomic_write(filepath: Union[str, Path], data: Union[str, bytes], 
-                 encoding: str = 'utf-8', mode: str = 'w') -> bool:
+                 encoding: str = 'utf-8', mode: str = 'w',
+                 skip_unchanged: bool = False, fsync_directory: bool = True) -> bool:
     """
     Write data to a file atomically using the write-temp -> fsync -> rename pattern.
     
@@ -32,9 +110,11 @@ def atomic_write(filepath: Union[str, Path], data: Union[str, bytes],
         data: Data to write (string or bytes)
         encoding: Text encoding to use (ignored for binary mode)
         mode: Write mode ('w' for text, 'wb' for binary)
+        skip_unchanged: Leave the target untouched if it already holds identical bytes
+        fsync_directory: Fsync the parent directory after the rename so it survives a crash
         
     Returns:
-        bool: True if write succeeded, False otherwise
+        bool: True if write succeeded (or was skipped as unchanged), False otherwise
         
     Raises:
         ValueError: If mode is not supported
@@ -49,6 +129,14 @@ def atomic_write(filepath: Union[str, Path], data: Union[str, bytes],
     # Determine if we're writing text or binary
     is_binary = mode == 'wb'
     
+    if skip_unchanged:
+        payload = _to_bytes(data, encoding)
+        if content_unchanged(filepath, payload):
+            logger.debug("atomic_write_skipped_unchanged",
+                        target_file=str(filepath),
+                        data_size=len(payload))
+            return True
+    
     # Create temporary file in the same directory as target
     # This ensures the rename operation is atomic on POSIX systems
     temp_dir = filepath.parent
@@ -78,12 +166,12 @@ def atomic_write(filepath: Union[str, Path], data: Union[str, bytes],
                 if isinstance(data, str):
                     data = data.encode(encoding)
                 # Use low-level file operations for binary mode
-                os.write(temp_fd, data)
+                _write_all(temp_fd, data)
             else:
                 if isinstance(data, bytes):
                     data = data.decode(encoding)
                 # Use low-level file operations for text mode
-                os.write(temp_fd, data.encode(encoding))
+                _write_all(temp_fd, data.encode(encoding))
             
             # Force write to disk
             os.fsync(temp_fd)
@@ -97,6 +185,7 @@ def atomic_write(filepath: Union[str, Path], data: Union[str, bytes],
         # Close the file descriptor before rename (Windows requirement)
         os.close(temp_fd)
         temp_fd = None
+        _match_target_mode(temp_path, filepath)
         
         # Atomic rename with simple retry logic for Windows
         max_retries = 5
@@ -122,6 +211,14 @@ def atomic_write(filepath: Union[str, Path], data: Union[str, bytes],
                             error=str(e))
                 time.sleep(min(1, 0.1 * (2 ** retry)))  # Exponential backoff
 
+        if fsync_directory:
+            try:
+                _fsync_directory(temp_dir)
+            except OSError as e:
+                logger.warning("directory_fsync_failed",
+                               directory=str(temp_dir),
+                               error=str(e))
+
         logger.info("atomic_write_completed",
                    target_file=str(filepath),
                    data_size=len(data),
@@ -157,6 +254,209 @@ def atomic_write(filepath: Union[str, Path], data: Union[str, bytes],
                 pass  # Already closed or invalid
 
 
+@dataclass
+class BatchWriteResult:
+    """Outcome of an AtomicBatchWriter commit."""
+    written: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+    rolled_back: bool = False
+    duration_seconds: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        return not self.failed
+
+
+class AtomicBatchWriter:
+    """
+    Transactional writer for many files.
+
+    Staged files are written to temporary files next to their targets, all
+    temporaries are fsynced together, renamed into place, and every distinct
+    parent directory is fsynced once. With all_or_nothing=True, a failure
+    while preparing leaves every target untouched, and a failure while
+    renaming restores the targets that were already replaced.
+
+    Usage:
+        with AtomicBatchWriter(skip_unchanged=True) as batch:
+            batch.stage(path_a, text_a)
+            batch.stage(path_b, text_b)
+        result = batch.result
+    """
+
+    def __init__(self, encoding: str = 'utf-8', skip_unchanged: bool = True,
+                 all_or_nothing: bool = False, fsync_workers: int = 8):
+        self.encoding = encoding
+        self.skip_unchanged = skip_unchanged
+        self.all_or_nothing = all_or_nothing
+        self.fsync_workers = max(1, fsync_workers)
+        self._staged: Dict[Path, bytes] = {}
+        self.result: Optional[BatchWriteResult] = None
+
+    def stage(self, filepath: Union[str, Path], data: Union[str, bytes]) -> None:
+        """Queue a write; a later stage() of the same path replaces the earlier one."""
+        if self.result is not None:
+            raise RuntimeError("AtomicBatchWriter has already been committed")
+        self._staged[Path(filepath)] = _to_bytes(data, self.encoding)
+
+    def __len__(self) -> int:
+        return len(self._staged)
+
+    def __enter__(self) -> "AtomicBatchWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if exc_type is None:
+            self.commit()
+        else:
+            self._staged.clear()
+        return False
+
+    def commit(self) -> BatchWriteResult:
+        start_time = time.perf_counter()
+        result = BatchWriteResult()
+        self.result = result
+
+        pending: List[Tuple[Path, bytes]] = []
+        for filepath, payload in self._staged.items():
+            if self.skip_unchanged and content_unchanged(filepath, payload):
+                result.skipped.append(str(filepath))
+            else:
+                pending.append((filepath, payload))
+        self._staged.clear()
+
+        temps: List[Tuple[Path, Path, int]] = []  # (target, temp path, open fd)
+        try:
+            # Phase 1: write every temporary file without syncing
+            for filepath, payload in pending:
+                try:
+                    filepath.parent.mkdir(parents=True, exist_ok=True)
+                    temp_fd, temp_path = tempfile.mkstemp(
+                        dir=filepath.parent,
+                        prefix=f".{filepath.name}.tmp.",
+                        suffix=".atomic"
+                    )
+                    temps.append((filepath, Path(temp_path), temp_fd))
+                    _match_target_mode(Path(temp_path), filepath)
+                    _write_all(temp_fd, payload)
+                except OSError as e:
+                    result.failed[str(filepath)] = str(e)
+
+            # Phase 2: group fsync, overlapping the syncs on a small thread pool
+            def sync_one(entry: Tuple[Path, Path, int]) -> Optional[str]:
+                try:
+                    os.fsync(entry[2])
+                    return None
+                except OSError as e:
+                    return str(e)
+
+            if temps:
+                workers = min(self.fsync_workers, len(temps))
+                if workers > 1:
+                    with ThreadPoolExecutor(max_workers=workers) as executor:
+                        sync_errors = list(executor.map(sync_one, temps))
+                else:
+                    sync_errors = [sync_one(entry) for entry in temps]
+                for (filepath, _, _), error in zip(temps, sync_errors):
+                    if error:
+                        result.failed[str(filepath)] = error
+        finally:
+            for _, _, temp_fd in temps:
+                try:
+                    os.close(temp_fd)
+                except OSError:
+                    pass
+
+        if result.failed and self.all_or_nothing:
+            for _, temp_path, _ in temps:
+                temp_path.unlink(missing_ok=True)
+            result.rolled_back = True
+            result.duration_seconds = time.perf_counter() - start_time
+            logger.error("atomic_batch_aborted", failed=len(result.failed), staged=len(pending))
+            return result
+
+        # Phase 3: rename into place, keeping hard-link backups when rollback is requested
+        to_rename = []
+        for filepath, temp_path, _ in temps:
+            if str(filepath) in result.failed:
+                temp_path.unlink(missing_ok=True)
+            else:
+                to_rename.append((filepath, temp_path))
+
+        renamed: List[Tuple[Path, Optional[Path]]] = []
+        directories = set()
+        for index, (filepath, temp_path) in enumerate(to_rename):
+            backup_path = None
+            try:
+                if self.all_or_nothing and filepath.exists():
+                    backup_path = self._backup(filepath)
+                os.replace(str(temp_path), str(filepath))
+            except OSError as e:
+                result.failed[str(filepath)] = str(e)
+                temp_path.unlink(missing_ok=True)
+                if backup_path is not None:
+                    backup_path.unlink(missing_ok=True)
+                if self.all_or_nothing:
+                    for _, remaining_temp in to_rename[index + 1:]:
+                        remaining_temp.unlink(missing_ok=True)
+                    self._rollback(renamed)
+                    result.written.clear()
+                    result.rolled_back = True
+                    break
+                continue
+            renamed.append((filepath, backup_path))
+            directories.add(filepath.parent)
+            result.written.append(str(filepath))
+
+        if not result.rolled_back:
+            for _, backup_path in renamed:
+                if backup_path is not None:
+                    backup_path.unlink(missing_ok=True)
+
+        # Phase 4: one fsync per parent directory
+        for directory in directories:
+            try:
+                _fsync_directory(directory)
+            except OSError as e:
+                logger.warning("directory_fsync_failed", directory=str(directory), error=str(e))
+
+        result.duration_seconds = time.perf_counter() - start_time
+        logger.info("atomic_batch_completed",
+                    written=len(result.written),
+                    skipped=len(result.skipped),
+                    failed=len(result.failed),
+                    rolled_back=result.rolled_back,
+                    directories_synced=len(directories),
+                    duration_ms=round(result.duration_seconds * 1000, 2))
+        return result
+
+    @staticmethod
+    def _backup(filepath: Path) -> Path:
+        backup_path = filepath.with_name(f".{filepath.name}.bak.{os.getpid()}.{time.time_ns()}")
+        try:
+            os.link(filepath, backup_path)  # cheap: no data copy
+        except OSError:
+            shutil.copy2(filepath, backup_path)
+        return backup_path
+
+    @staticmethod
+    def _rollback(renamed: List[Tuple[Path, Optional[Path]]]) -> None:
+        for filepath, backup_path in reversed(renamed):
+            try:
+                if backup_path is not None:
+                    os.replace(str(backup_path), str(filepath))
+                else:
+                    filepath.unlink(missing_ok=True)
+            except OSError as e:
+                logger.error("atomic_batch_rollback_failed", target_file=str(filepath), error=str(e))
+        for directory in {filepath.parent for filepath, _ in renamed}:
+            try:
+                _fsync_directory(directory)
+            except OSError:
+                pass
+
+
 def atomic_write_json(filepath: Union[str, Path], data: dict, 
                       indent: int = 2, ensure_ascii: bool = False) -> bool:
     """
@@ -7,10 +7,13 @@ with JSON Schema requirements and event schema validation.
 """
 
 import jsonschema
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 import json
+import threading
 import time
 import uuid
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable, Iterable
 from pathlib import Path
 from dataclasses import dataclass
 from enum import Enum
@@ -36,12 +39,176 @@ class ValidationResult:
     component_id: str
     timestamp: float
 
+# Keywords that only annotate; jsonschema.validate() without a format
+# checker does not assert "format" either
+_ANNOTATION_KEYWORDS = frozenset({
+    "$schema", "$id", "$comment", "title", "description", "default", "examples", "format",
+    "readOnly", "writeOnly", "deprecated",
+})
+
+_TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    "string": lambda value: isinstance(value, str),
+    "object": lambda value: isinstance(value, dict),
+    "array": lambda value: isinstance(value, list),
+    "boolean": lambda value: isinstance(value, bool),
+    "null": lambda value: value is None,
+    "number": lambda value: isinstance(value, (int, float)) and not isinstance(value, bool),
+    "integer": lambda value: (isinstance(value, int) and not isinstance(value, bool))
+                             or (isinstance(value, float) and value.is_integer()),
+}
+
+
+# Drafts where "integer" excludes 1.0 and exclusiveMinimum is a boolean
+_LEGACY_DRAFTS = (jsonschema.Draft3Validator, jsonschema.Draft4Validator)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def compile_fast_check(schema: Any) -> Optional[Callable[[Any], bool]]:
+    """
+    Build a specialised ``data -> bool`` predicate for a schema.
+
+    Covers the keywords boundary schemas use (type, required, properties,
+    additionalProperties, enum of strings, string length, numeric bounds,
+    items/minItems/maxItems). Returns None when the schema uses anything
+    else, so callers fall back to the full jsonschema validator. A True
+    result is authoritative; on False the jsonschema validator is asked for
+    the error.
+    """
+    if schema is True or schema == {}:
+        return lambda value: True
+    if schema is False:
+        return lambda value: False
+    if not isinstance(schema, dict):
+        return None
+
+    checks: List[Callable[[Any], bool]] = []
+    for keyword, argument in schema.items():
+        if keyword in _ANNOTATION_KEYWORDS:
+            continue
+        if keyword == "type":
+            type_names = [argument] if isinstance(argument, str) else argument
+            if not isinstance(type_names, list) or any(name not in _TYPE_CHECKS for name in type_names):
+                return None
+            if len(type_names) == 1:
+                checks.append(_TYPE_CHECKS[type_names[0]])
+            else:
+                type_checks = [_TYPE_CHECKS[name] for name in type_names]
+                checks.append(lambda value, type_checks=type_checks: any(check(value) for check in type_checks))
+        elif keyword == "required":
+            required = list(argument)
+            checks.append(lambda value, required=required:
+                          not isinstance(value, dict) or all(key in value for key in required))
+        elif keyword == "properties":
+            property_checks = {}
+            for name, subschema in argument.items():
+                check = compile_fast_check(subschema)
+                if check is None:
+                    return None
+                property_checks[name] = check
+            def check_properties(value, property_checks=property_checks):
+                if not isinstance(value, dict):
+                    return True
+                for name, check in property_checks.items():
+                    if name in value and not check(value[name]):
+                        return False
+                return True
+            checks.append(check_properties)
+        elif keyword == "additionalProperties":
+            if "patternProperties" in schema:
+                return None
+            known = frozenset(schema.get("properties", {}))
+            extra_check = compile_fast_check(argument)
+            if extra_check is None:
+                return None
+            checks.append(lambda value, known=known, extra_check=extra_check:
+                          not isinstance(value, dict)
+                          or all(extra_check(item) for key, item in value.items() if key not in known))
+        elif keyword == "enum":
+            if not all(isinstance(option, str) for option in argument):
+                return None
+            options = frozenset(argument)
+            checks.append(lambda value, options=options: isinstance(value, str) and value in options)
+        elif keyword in ("minLength", "maxLength"):
+            bound = argument
+            if keyword == "minLength":
+                checks.append(lambda value, bound=bound: not isinstance(value, str) or len(value) >= bound)
+            else:
+                checks.append(lambda value, bound=bound: not isinstance(value, str) or len(value) <= bound)
+        elif keyword in ("minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum"):
+            if not _is_number(argument):
+                return None
+            bound = argument
+            compare = {
+                "minimum": lambda value, bound=bound: value >= bound,
+                "maximum": lambda value, bound=bound: value <= bound,
+                "exclusiveMinimum": lambda value, bound=bound: value > bound,
+                "exclusiveMaximum": lambda value, bound=bound: value < bound,
+            }[keyword]
+            checks.append(lambda value, compare=compare: not _is_number(value) or compare(value))
+        elif keyword in ("minItems", "maxItems"):
+            bound = argument
+            if keyword == "minItems":
+                checks.append(lambda value, bound=bound: not isinstance(value, list) or len(value) >= bound)
+            else:
+                checks.append(lambda value, bound=bound: not isinstance(value, list) or len(value) <= bound)
+        elif keyword == "items":
+            item_check = compile_fast_check(argument)
+            if item_check is None:
+                return None
+            checks.append(lambda value, item_check=item_check:
+                          not isinstance(value, list) or all(item_check(item) for item in value))
+        else:
+            return None
+
+    if len(checks) == 1:
+        return checks[0]
+
+    def check_all(value, checks=tuple(checks)):
+        for check in checks:
+            if not check(value):
+                return False
+        return True
+    return check_all
+
+
+class CompiledSchema:
+    """A schema checked against its metaschema once, with a cached validator."""
+    
+    __slots__ = ("schema", "validator", "fast_check", "schema_error")
+    
+    def __init__(self, schema: Dict[str, Any]):
+        self.schema = schema
+        self.validator = None
+        self.fast_check = None
+        self.schema_error: Optional[str] = None
+        validator_class = validator_for(schema)
+        try:
+            validator_class.check_schema(schema)
+        except jsonschema.SchemaError as e:
+            self.schema_error = f"Schema error: {e.message}"
+            return
+        self.validator = validator_class(schema)
+        if validator_class not in _LEGACY_DRAFTS:
+            self.fast_check = compile_fast_check(schema)
+    
+    def first_error(self, data: Any) -> Optional[jsonschema.ValidationError]:
+        """Return the error jsonschema.validate() would raise, or None."""
+        if self.fast_check is not None and self.fast_check(data):
+            return None
+        return best_match(self.validator.iter_errors(data))
+
+
 class BoundaryValidator:
     """Validates data at HMA boundary interfaces"""
     
     def __init__(self, schema_registry: Dict[str, Dict], observability_port: Optional[ObservabilityPort] = None):
         self.schemas = schema_registry
         self.observability = observability_port
+        self._compiled: Dict[str, CompiledSchema] = {}
+        self._compile_lock = threading.Lock()
         self._load_schemas()
     
     def _load_schemas(self) -> None:
@@ -86,6 +253,38 @@ class BoundaryValidator:
         
         # Merge with provided schemas
         self.schemas.update(self.default_schemas)
+        self.invalidate_compiled()
+    
+    def register_schema(self, schema_key: str, schema: Dict[str, Any]) -> None:
+        """Add or replace a schema; its compiled validator is rebuilt on next use."""
+        self.schemas[schema_key] = schema
+        self.invalidate_compiled(schema_key)
+    
+    def invalidate_compiled(self, schema_key: Optional[str] = None) -> None:
+        """
+        Drop compiled validators (all, or one key).
+        
+        Replacing an entry in ``schemas`` is detected automatically; call this
+        after mutating a schema dict in place.
+        """
+        with self._compile_lock:
+            if schema_key is None:
+                self._compiled.clear()
+            else:
+                self._compiled.pop(schema_key, None)
+    
+    def _get_compiled(self, schema_key: str) -> Optional[CompiledSchema]:
+        """Compiled validator for ``schema_key``, compiling on first use."""
+        schema = self.schemas.get(schema_key)
+        if not schema:
+            return None
+        compiled = self._compiled.get(schema_key)
+        if compiled is not None and compiled.schema is schema:
+            return compiled
+        compiled = CompiledSchema(schema)
+        with self._compile_lock:
+            self._compiled[schema_key] = compiled
+        return compiled
     
     def validate_l1_input(self, data: Dict[str, Any], interface: str) -> ValidationResult:
         """Validate L1 adapter input against schema"""
@@ -107,58 +306,116 @@ class BoundaryValidator:
         """Validate against custom boundary schema"""
         return self._validate_data(data, schema_key, boundary_type, component_id)
     
-    def _validate_data(self, data: Dict[str, Any], 
-                      schema_key: str, 
+    def validate_l1_many(self, items: Iterable[Dict[str, Any]], interface: str) -> List[ValidationResult]:
+        """Validate a batch of L1 adapter inputs against one schema"""
+        return self.validate_many(items, f"l1_{interface}_input", BoundaryType.L1_INTERFACE, interface)
+    
+    def validate_many(self, items: Iterable[Dict[str, Any]],
+                      schema_key: str,
                       boundary_type: BoundaryType,
-                      component_id: str) -> ValidationResult:
-        """Internal validation logic"""
+                      component_id: str) -> List[ValidationResult]:
+        """
+        Validate a batch against one schema, returning one result per item.
+        
+        Metrics and the boundary crossing are emitted once per batch with
+        aggregated counts instead of once per item.
+        """
+        items = list(items)
         timestamp = time.time()
+        if not items:
+            return []
         
-        # Get schema
-        schema = self.schemas.get(schema_key)
-        if not schema:
-            error_msg = f"No schema found for {schema_key}"
-            logger.error("Schema not found", schema_key=schema_key, component=component_id)
-            
-            if self.observability:
-                self.observability.emit_metric(
-                    "hma_boundary_validation_errors_total", 
-                    1.0,
-                    {"boundary_type": boundary_type.value, "error_type": "schema_missing"}
-                )
-            
-            return ValidationResult(False, [error_msg], boundary_type, component_id, timestamp)
+        compiled = self._get_compiled(schema_key)
+        if compiled is None or compiled.schema_error:
+            error_msg = compiled.schema_error if compiled else f"No schema found for {schema_key}"
+            self._log_schema_problem(compiled, schema_key, boundary_type, component_id, len(items))
+            return [ValidationResult(False, [error_msg], boundary_type, component_id, timestamp)
+                    for _ in items]
         
-        # Perform validation
-        try:
-            jsonschema.validate(data, schema)
-            
-            logger.debug("Boundary validation passed", 
-                        boundary_type=boundary_type.value,
-                        component=component_id,
-                        schema_key=schema_key)
-            
-            if self.observability:
+        results = []
+        failures = 0
+        for data in items:
+            error = compiled.first_error(data)
+            if error is None:
+                results.append(ValidationResult(True, [], boundary_type, component_id, timestamp))
+                continue
+            failures += 1
+            results.append(ValidationResult(False, [self._log_violation(error, boundary_type, component_id)],
+                                            boundary_type, component_id, timestamp))
+        
+        successes = len(items) - failures
+        logger.debug("Boundary batch validated",
+                    boundary_type=boundary_type.value,
+                    component=component_id,
+                    schema_key=schema_key,
+                    items=len(items),
+                    failures=failures)
+        
+        if self.observability:
+            if successes:
                 self.observability.emit_metric(
                     "hma_boundary_validations_total",
-                    1.0, 
+                    float(successes),
                     {"boundary_type": boundary_type.value, "status": "success"}
                 )
-                
                 self.observability.record_boundary_crossing(
-                    "validator", component_id, "validate", 
+                    "validator", component_id, "validate_many",
                     (time.time() - timestamp) * 1000
                 )
-            
-            return ValidationResult(True, [], boundary_type, component_id, timestamp)
-            
-        except jsonschema.ValidationError as e:
-            error_msg = f"Validation failed: {e.message}"
-            logger.error("Boundary validation failed",
+            if failures:
+                self.observability.emit_metric(
+                    "hma_boundary_validation_errors_total",
+                    float(failures),
+                    {"boundary_type": boundary_type.value, "error_type": "schema_violation"}
+                )
+        
+        return results
+    
+    def _log_violation(self, error: jsonschema.ValidationError, boundary_type: BoundaryType,
+                       component_id: str) -> str:
+        error_msg = f"Validation failed: {error.message}"
+        logger.error("Boundary validation failed",
+                    boundary_type=boundary_type.value,
+                    component=component_id,
+                    error=error_msg,
+                    error_path=list(error.absolute_path) if error.absolute_path else None)
+        return error_msg
+    
+    def _log_schema_problem(self, compiled: Optional[CompiledSchema], schema_key: str,
+                            boundary_type: BoundaryType, component_id: str, count: int = 1) -> None:
+        if compiled is not None:
+            logger.error("Schema validation error",
                         boundary_type=boundary_type.value,
                         component=component_id,
-                        error=error_msg,
-                        error_path=list(e.absolute_path) if e.absolute_path else None)
+                        schema_error=compiled.schema_error)
+            return
+        
+        logger.error("Schema not found", schema_key=schema_key, component=component_id)
+        if self.observability:
+            self.observability.emit_metric(
+                "hma_boundary_validation_errors_total", 
+                float(count),
+                {"boundary_type": boundary_type.value, "error_type": "schema_missing"}
+            )
+    
+    def _validate_data(self, data: Dict[str, Any], 
+                      schema_key: str, 
+                      boundary_type: BoundaryType,
+                      component_id: str) -> ValidationResult:
+        """Internal validation logic"""
+        timestamp = time.time()
+        
+        # Get compiled schema (checked against the metaschema once per schema)
+        compiled = self._get_compiled(schema_key)
+        if compiled is None or compiled.schema_error:
+            self._log_schema_problem(compiled, schema_key, boundary_type, component_id)
+            error_msg = compiled.schema_error if compiled else f"No schema found for {schema_key}"
+            return ValidationResult(False, [error_msg], boundary_type, component_id, timestamp)
+        
+        # Perform validation
+        error = compiled.first_error(data)
+        if error is not None:
+            error_msg = self._log_violation(error, boundary_type, component_id)
             
             if self.observability:
                 self.observability.emit_metric(
@@ -168,15 +425,25 @@ class BoundaryValidator:
                 )
             
             return ValidationResult(False, [error_msg], boundary_type, component_id, timestamp)
+        
+        logger.debug("Boundary validation passed", 
+                    boundary_type=boundary_type.value,
+                    component=component_id,
+                    schema_key=schema_key)
+        
+        if self.observability:
+            self.observability.emit_metric(
+                "hma_boundary_validations_total",
+                1.0, 
+                {"boundary_type": boundary_type.value, "status": "success"}
+            )
             
-        except jsonschema.SchemaError as e:
-            error_msg = f"Schema error: {e.message}"
-            logger.error("Schema validation error",
-                        boundary_type=boundary_type.value,
-                        component=component_id,
-                        schema_error=error_msg)
-            
-            return ValidationResult(False, [error_msg], boundary_type, component_id, timestamp)
+            self.observability.record_boundary_crossing(
+                "validator", component_id, "validate", 
+                (time.time() - timestamp) * 1000
+            )
+        
+        return ValidationResult(True, [], boundary_type, component_id, timestamp)
 
 class EventValidator:
     """Specialized validator for HMA events"""
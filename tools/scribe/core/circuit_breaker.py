@@ -9,7 +9,7 @@ Tracks failures, manages state transitions, and provides recovery mechanisms.
 import time
 import threading
 from enum import Enum
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, Tuple
 import structlog
 
 from .logging_config import get_scribe_logger
@@ -332,6 +332,34 @@ class CircuitBreaker:
                 'can_execute': self.can_execute()
             }
     
+    def snapshot_state(self) -> Dict[str, Any]:
+        """Settings and state needed to recreate this breaker after a restart."""
+        with self._lock:
+            return {
+                'failure_threshold': self.failure_threshold,
+                'recovery_timeout_seconds': self.recovery_timeout_seconds,
+                'success_threshold': self.success_threshold,
+                'state': self._state.value,
+                'failure_count': self._failure_count,
+                'success_count': self._success_count,
+                'last_failure_time': self._last_failure_time,
+                'last_success_time': self._last_success_time,
+                'state_change_time': self._state_change_time,
+            }
+    
+    def restore_state(self, data: Dict[str, Any]) -> None:
+        """
+        Adopt state saved by ``snapshot_state()``. Timestamps are wall-clock,
+        so an open breaker still waits out the rest of its recovery timeout.
+        """
+        with self._lock:
+            self._state = CircuitState(data['state'])
+            self._failure_count = data['failure_count']
+            self._success_count = data['success_count']
+            self._last_failure_time = data['last_failure_time']
+            self._last_success_time = data['last_success_time']
+            self._state_change_time = data['state_change_time']
+    
     def __str__(self) -> str:
         """String representation of circuit breaker."""
         return f"CircuitBreaker(rule_id='{self.rule_id}', state={self._state.value}, failures={self._failure_count})"
@@ -433,6 +461,27 @@ class CircuitBreakerManager:
                 breaker.reset()
             logger.info("All circuit breakers reset")
     
+    def snapshot_state(self) -> Tuple[Dict[str, Any], List[str]]:
+        """Breaker states for the engine state snapshot (no source files)."""
+        with self._lock:
+            breakers = {rule_id: breaker.snapshot_state() for rule_id, breaker in self._breakers.items()}
+        return {'breakers': breakers}, []
+    
+    def restore_state(self, data: Dict[str, Any]) -> bool:
+        """Recreate breakers saved by ``snapshot_state()``."""
+        with self._lock:
+            for rule_id, state in data['breakers'].items():
+                breaker = self.get_breaker(
+                    rule_id,
+                    failure_threshold=state['failure_threshold'],
+                    recovery_timeout_seconds=state['recovery_timeout_seconds'],
+                    success_threshold=state['success_threshold']
+                )
+                breaker.restore_state(state)
+        logger.info("Circuit breakers restored", breakers=len(data['breakers']),
+                    open_breakers=sum(s['state'] == CircuitState.OPEN.value for s in data['breakers'].values()))
+        return True
+    
     def get_manager_stats(self) -> Dict[str, Any]:
         """
         Get manager statistics.
@@ -4,6 +4,11 @@ Scribe Config Manager
 
 Handles loading, validation, and hot-reloading of configuration files.
 Implements atomic configuration swapping with JSON Schema validation.
+
+Configuration is published as an immutable ``ConfigSnapshot``: a deeply
+frozen mapping that is replaced wholesale on every successful (re)load.
+Readers never lock or copy; they load the current snapshot reference and
+resolve dotted keys through a per-snapshot accessor cache.
 """
 
 import json
@@ -12,17 +17,133 @@ import time
 import yaml
 import os
 from pathlib import Path
-from typing import Dict, Any, Optional, Callable, List
+from typing import Dict, Any, Optional, Callable, List, Tuple
 import structlog
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 import jsonschema
 
 from .logging_config import get_scribe_logger
-from .vault_secret_provider import get_vault_provider, configure_vault_from_environment, initialize_vault_provider
+from .state_snapshot import state_dir
 
 logger = get_scribe_logger(__name__)
 
+_MISSING = object()
+
+# Upper bound on distinct dotted keys memoised per snapshot; lookups beyond
+# this are still answered, just not cached.
+MAX_CACHED_KEYS = 1024
+
+
+def _immutable(self, *args, **kwargs):
+    raise TypeError(f"{type(self).__name__} is immutable; use thaw_config() for a mutable copy")
+
+
+class FrozenDict(dict):
+    """
+    Read-only dict used for published configuration.
+
+    Subclasses ``dict`` so existing ``isinstance`` checks, ``json.dumps`` and
+    JSON Schema validation keep working; every mutating method raises
+    ``TypeError``. ``copy()`` still returns a plain (shallow) dict.
+    """
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+    __ior__ = _immutable
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+
+class FrozenList(list):
+    """Read-only list counterpart of ``FrozenDict``."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = _immutable
+    append = extend = insert = pop = remove = clear = sort = reverse = _immutable
+    __iadd__ = __imul__ = _immutable
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (FrozenList, (list(self),))
+
+
+def freeze_config(value: Any) -> Any:
+    """Return a deeply frozen copy of a JSON/YAML-shaped value."""
+    if isinstance(value, FrozenDict) or isinstance(value, FrozenList):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict((k, freeze_config(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return FrozenList(freeze_config(v) for v in value)
+    return value
+
+
+def thaw_config(value: Any) -> Any:
+    """Return a plain, mutable deep copy of a (possibly frozen) value."""
+    if isinstance(value, dict):
+        return {k: thaw_config(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [thaw_config(v) for v in value]
+    return value
+
+
+class ConfigSnapshot(FrozenDict):
+    """
+    One published generation of the configuration.
+
+    ``generation`` increases by one on every successful load, so subscribers
+    and callers can tell whether anything they derived is stale. Dotted-key
+    lookups are resolved once and memoised on the snapshot itself; because the
+    snapshot never changes the cache never needs invalidating, and a reload
+    simply starts over with a fresh snapshot.
+    """
+
+    __slots__ = ("generation", "loaded_at", "_lookup_cache")
+
+    def __init__(self, config: Dict[str, Any], generation: int, loaded_at: Optional[float] = None):
+        dict.__init__(self, ((k, freeze_config(v)) for k, v in config.items()))
+        self.generation = generation
+        self.loaded_at = time.time() if loaded_at is None else loaded_at
+        self._lookup_cache: Dict[str, Any] = {}
+
+    def lookup(self, key: str, default: Any = None) -> Any:
+        """Resolve a dotted key (e.g. ``"engine_settings.max_workers"``)."""
+        cache = self._lookup_cache
+        value = cache.get(key, _MISSING)
+        if value is _MISSING:
+            value = self._resolve(key)
+            if len(cache) < MAX_CACHED_KEYS:
+                cache[key] = value
+        return default if value is _MISSING else value
+
+    def _resolve(self, key: str) -> Any:
+        value: Any = self
+        for part in key.split('.'):
+            if isinstance(value, dict) and part in value:
+                value = value[part]
+            else:
+                return _MISSING
+        return value
+
+    def __reduce__(self):
+        return (ConfigSnapshot, (dict(self), self.generation, self.loaded_at))
+
 
 class ConfigChangeHandler(FileSystemEventHandler):
     """File system event handler for configuration file changes."""
@@ -48,7 +169,9 @@ class ConfigManager:
     Configuration manager with hot-reloading and validation.
     
     Provides thread-safe access to configuration with automatic reloading
-    when the configuration file changes.
+    when the configuration file changes. Reads go through the current
+    ``ConfigSnapshot`` without locking; ``_config_lock`` only serialises
+    writers publishing a new snapshot.
     """
     
     DEFAULT_CONFIG_PATH = "scribe-config.json"
@@ -73,15 +196,16 @@ class ConfigManager:
 
         # Thread safety
         self._config_lock = threading.RLock()
-        self._config: Optional[Dict[str, Any]] = None
+        self._snapshot: Optional[ConfigSnapshot] = None
+        self._generation = 0
         self._schema: Optional[Dict[str, Any]] = None
         
         # Hot-reloading components
         self._observer: Optional[Observer] = None
         self._change_handler: Optional[ConfigChangeHandler] = None
         
-        # Change callbacks
-        self._change_callbacks: list[Callable[[Dict[str, Any]], None]] = []
+        # Change callbacks (invoked with the new ConfigSnapshot)
+        self._change_callbacks: Tuple[Callable[[Dict[str, Any]], None], ...] = ()
         
         # Vault integration
         self._vault_enabled = os.getenv('SCRIBE_VAULT_ENABLED', 'false').lower() == 'true'
@@ -166,17 +290,20 @@ class ConfigManager:
                                 schema_error=str(e))
                     raise
             
-            # Atomic swap of configuration
+            # Atomic swap of configuration: build the frozen snapshot first,
+            # then publish it with a single reference assignment
             with self._config_lock:
-                old_config = self._config
-                self._config = temp_config
+                snapshot = ConfigSnapshot(temp_config, self._generation + 1)
+                self._generation = snapshot.generation
+                self._snapshot = snapshot
             
             logger.info("Configuration loaded and validated successfully",
                        config_version=temp_config.get('config_version', 'unknown'),
-                       rules_count=len(temp_config.get('rules', [])))
+                       rules_count=len(temp_config.get('rules', [])),
+                       generation=snapshot.generation)
             
             # Notify change callbacks
-            self._notify_change_callbacks(temp_config)
+            self._notify_change_callbacks(snapshot)
             
         except Exception as e:
             logger.error("Failed to load configuration",
@@ -185,7 +312,7 @@ class ConfigManager:
                         exc_info=True)
             
             # If this is initial load, re-raise the exception
-            if self._config is None:
+            if self._snapshot is None:
                 raise
             
             # If this is a reload, keep the old configuration
@@ -236,17 +363,29 @@ class ConfigManager:
         
         logger.info("ConfigManager stopped")
     
+    @property
+    def snapshot(self) -> ConfigSnapshot:
+        """The current immutable configuration snapshot."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            raise RuntimeError("Configuration not loaded")
+        return snapshot
+    
+    @property
+    def generation(self) -> int:
+        """Generation number of the current snapshot (0 before first load)."""
+        return self._generation
+    
     def get_config(self) -> Dict[str, Any]:
         """
         Get the current configuration.
         
         Returns:
-            A copy of the current configuration dictionary
+            The current ``ConfigSnapshot``. It is immutable and shared, so it
+            is returned without copying; use ``thaw_config()`` if a mutable
+            copy is needed.
         """
-        with self._config_lock:
-            if self._config is None:
-                raise RuntimeError("Configuration not loaded")
-            return self._config.copy()
+        return self.snapshot
     
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -259,34 +398,52 @@ class ConfigManager:
         Returns:
             Configuration value or default
         """
-        config = self.get_config()
-        
-        # Support dot notation for nested keys
-        keys = key.split('.')
-        value = config
-        
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-                
-        return value
+        return self.snapshot.lookup(key, default)
     
     def get_engine_settings(self) -> Dict[str, Any]:
         """Get engine settings from configuration."""
-        config = self.get_config()
-        return config.get('engine_settings', {})
+        return self.snapshot.get('engine_settings', {})
+    
+    def get_health_check_port(self) -> int:
+        """Get the health monitor HTTP port."""
+        return self.snapshot.get('engine', {}).get('health_check_port', 9469)
+    
+    def get_debug_endpoint_settings(self) -> Dict[str, Any]:
+        """Get /debug/profile and /debug/tasks settings with defaults applied."""
+        settings = self.snapshot.get('engine', {}).get('debug_endpoints', {})
+        return {
+            'enabled': settings.get('enabled', False),
+            'max_profile_seconds': settings.get('max_profile_seconds', 30.0),
+            'sample_interval_ms': settings.get('sample_interval_ms', 5),
+        }
+    
+    def get_state_snapshot_settings(self) -> Dict[str, Any]:
+        """Get engine state snapshot settings with defaults applied."""
+        settings = self.snapshot.get('engine', {}).get('state_snapshot', {})
+        return {
+            'enabled': settings.get('enabled', False),
+            'path': settings.get('path', str(state_dir() / 'engine_state.json')),
+            'interval_seconds': settings.get('interval_seconds', 300),
+            'max_age_seconds': settings.get('max_age_seconds', 86400),
+        }
+    
+    def get_quarantine_settings(self) -> Dict[str, Any]:
+        """Get quarantine store path, retention and quota with defaults applied."""
+        settings = self.snapshot.get('quarantine', {})
+        return {
+            'path': settings.get('path', 'archive/scribe/quarantine/'),
+            'max_bytes': settings.get('max_bytes', 1024 * 1024 * 1024),
+            'retention_seconds': settings.get('retention_seconds', 30 * 24 * 3600),
+            'enforce_every': settings.get('enforce_every', 100),
+        }
     
     def get_security_settings(self) -> Dict[str, Any]:
         """Get security settings from configuration."""
-        config = self.get_config()
-        return config.get('security', {})
+        return self.snapshot.get('security', {})
     
     def get_rules(self) -> list[Dict[str, Any]]:
         """Get list of rules from configuration."""
-        config = self.get_config()
-        return config.get('rules', [])
+        return self.snapshot.get('rules', [])
     
     def get_enabled_rules(self) -> list[Dict[str, Any]]:
         """Get list of enabled rules from configuration."""
@@ -294,8 +451,7 @@ class ConfigManager:
     
     def get_plugin_settings(self) -> Dict[str, Any]:
         """Get plugin settings from configuration."""
-        config = self.get_config()
-        return config.get('plugins', {
+        return self.snapshot.get('plugins', {
             'directories': ['actions'],
             'auto_reload': False,
             'load_order': ['actions']
@@ -316,6 +472,23 @@ class ConfigManager:
         plugin_settings = self.get_plugin_settings()
         return plugin_settings.get('load_order', [])
     
+    def get_plugin_lazy_loading(self) -> bool:
+        """Get whether plugins with manifests are imported on first use."""
+        plugin_settings = self.get_plugin_settings()
+        return plugin_settings.get('lazy_loading', True)
+    
+    def get_plugin_prewarm(self) -> bool:
+        """Get whether lazily registered plugins are imported in the background after startup."""
+        plugin_settings = self.get_plugin_settings()
+        return plugin_settings.get('prewarm', False)
+    
+    def get_plugin_scan_cache_path(self) -> Optional[str]:
+        """Get the path of the persistent plugin scan cache (None disables it)."""
+        plugin_settings = self.get_plugin_settings()
+        if 'scan_cache_path' not in plugin_settings:
+            return str(state_dir() / 'plugin_scan_cache.json')
+        return plugin_settings['scan_cache_path']
+    
     def get_rule_by_id(self, rule_id: str) -> Optional[Dict[str, Any]]:
         """
         Get a specific rule by its ID.
@@ -336,9 +509,11 @@ class ConfigManager:
         Add a callback to be called when configuration changes.
         
         Args:
-            callback: Function to call with the new configuration
+            callback: Function to call with the new ``ConfigSnapshot``; its
+                ``generation`` attribute identifies the published version
         """
-        self._change_callbacks.append(callback)
+        with self._config_lock:
+            self._change_callbacks = self._change_callbacks + (callback,)
         logger.debug("Configuration change callback added")
     
     def remove_change_callback(self, callback: Callable[[Dict[str, Any]], None]) -> None:
@@ -348,11 +523,15 @@ class ConfigManager:
         Args:
             callback: The callback function to remove
         """
-        if callback in self._change_callbacks:
-            self._change_callbacks.remove(callback)
-            logger.debug("Configuration change callback removed")
+        with self._config_lock:
+            if callback not in self._change_callbacks:
+                return
+            callbacks = list(self._change_callbacks)
+            callbacks.remove(callback)
+            self._change_callbacks = tuple(callbacks)
+        logger.debug("Configuration change callback removed")
     
-    def _notify_change_callbacks(self, new_config: Dict[str, Any]) -> None:
+    def _notify_change_callbacks(self, new_config: ConfigSnapshot) -> None:
         """Notify all registered callbacks of configuration changes."""
         for callback in self._change_callbacks:
             try:
@@ -360,6 +539,7 @@ class ConfigManager:
             except Exception as e:
                 logger.error("Error in configuration change callback",
                            callback=str(callback),
+                           generation=new_config.generation,
                            error=str(e),
                            exc_info=True)
     
@@ -387,6 +567,9 @@ class ConfigManager:
     
     def _initialize_vault(self) -> None:
         """Initialize Vault connection and authentication."""
+        # hvac and the Vault OTLP exporters are only imported when Vault is enabled
+        from .vault_secret_provider import configure_vault_from_environment, initialize_vault_provider
+        
         try:
             # Configure Vault from environment variables
             vault_config = configure_vault_from_environment()
@@ -1,19 +1,670 @@
+"""
+Scribe Dead-Letter Queue
+
+Records rejected events in size/age-rotated JSONL segments under the report
+directory (``SCRIBE_REPORT_DIR``, default ``tools/reports``):
+
+    dlq.jsonl            active segment (same record format as always)
+    dlq.jsonl.idx        offset index for the active segment
+    dlq.000001.jsonl     rotated segments, oldest first, with ``.idx`` files
+    dlq.manifest.json    segment sequence numbers and time ranges
+    dlq.lock             serialises writers sharing the directory
+
+Writes are buffered and appended by a background thread, so ``write_dlq``
+never opens a file on the event path. Several processes (engine, HTTP
+adapter, NATS subscriber) may write to the same directory: each batch and
+rotation runs under an exclusive lock on ``dlq.lock``, and index offsets are
+taken from the segment's size under that lock. The lock is advisory and
+POSIX-only; elsewhere a directory must have a single writer. Each index entry is a fixed-size
+struct (timestamp, offset, length, surface hash, event_id hash), which lets
+queries by surface, event_id or time range read only the matching lines.
+``DLQReplayer`` re-publishes entries through an ``EventBusPort`` at a fixed
+rate, checkpointing its position so an interrupted replay can resume.
+"""
+
+import asyncio
+import atexit
 import json
 import os
-import pathlib
+import queue
+import struct
+import threading
 import time
-from typing import List, Dict, Any
+import zlib
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .atomic_write import atomic_write_json
+from .logging_config import get_scribe_logger
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = get_scribe_logger(__name__)
+
+ACTIVE_SEGMENT = "dlq.jsonl"
+MANIFEST = "dlq.manifest.json"
+LOCK_FILE = "dlq.lock"
+
+# ts (float64), offset (uint64), length (uint32), crc32(surface), crc32(event_id)
+INDEX_ENTRY = struct.Struct("<dQIII")
+
+# (segment sequence number, byte offset) of an entry
+Position = Tuple[int, int]
+
+
+def _hash(value: str) -> int:
+    return zlib.crc32(value.encode("utf-8"))
+
+
+@dataclass
+class DLQConfig:
+    """Segment rotation, retention and writer settings."""
+    max_segment_bytes: int = 16 * 1024 * 1024
+    max_segment_age: float = 3600.0
+    max_segments: int = 64
+    batch_size: int = 512
+    flush_interval: float = 0.2
+    max_queue_size: int = 10000
+    fsync: bool = False
+
+
+@dataclass
+class DLQEntry:
+    """A dead-lettered record and where it is stored."""
+    segment: int
+    offset: int
+    timestamp: float
+    record: Dict[str, Any]
+
+    @property
+    def position(self) -> Position:
+        return (self.segment, self.offset)
+
+    @property
+    def surface(self) -> str:
+        return self.record.get("surface", "")
+
+    @property
+    def event_id(self) -> str:
+        return self.record.get("event_id", "")
+
+
+@dataclass
+class _Segment:
+    seq: int
+    data_path: Path
+    index_path: Path
+    first_ts: Optional[float] = None
+    last_ts: Optional[float] = None
+    records: int = 0
+    size: int = 0
+
+    def overlaps(self, since: Optional[float], until: Optional[float]) -> bool:
+        if self.first_ts is None:
+            return True
+        if since is not None and self.last_ts is not None and self.last_ts < since:
+            return False
+        if until is not None and self.first_ts > until:
+            return False
+        return True
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"segment": self.seq, "first_ts": self.first_ts, "last_ts": self.last_ts,
+                "records": self.records, "bytes": self.size}
+
+
+class DeadLetterQueue:
+    """
+    Segmented, indexed dead-letter queue for one report directory.
+
+    ``write`` never blocks: records are queued for the writer thread, and when
+    the queue is full the record is dropped and counted. A ``read_only`` queue
+    starts no writer and never modifies segments, so it is safe to open while
+    the engine is writing to the same directory.
+    """
+
+    def __init__(self, root: os.PathLike, config: Optional[DLQConfig] = None, read_only: bool = False):
+        self.root = Path(root)
+        self.config = config or DLQConfig()
+        self.read_only = read_only
+        if not read_only:
+            self.root.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=self.config.max_queue_size)
+        self._stop = threading.Event()
+        self._segments: List[_Segment] = []
+        self._active: Optional[_Segment] = None
+        self._data_file = None
+        self._index_file = None
+        self._lock_file = None
+
+        self.enqueued = 0
+        self.written = 0
+        self.batches = 0
+        self.rotations = 0
+        self.dropped_queue_full = 0
+        self.write_errors = 0
+
+        if not read_only:
+            self._lock_file = open(self.root / LOCK_FILE, "ab")
+        with self._writers_lock():
+            self._open()
+        self._thread = threading.Thread(target=self._run, name="scribe-dlq-writer", daemon=True)
+        if not read_only:
+            self._thread.start()
+
+    # -- write path -------------------------------------------------------
+
+    def write(self, surface: str, event_id: str, errors: List[str], truncated_payload: Dict[str, Any]) -> bool:
+        """Queue a record for the writer thread; returns False if it was dropped."""
+        if self.read_only:
+            raise RuntimeError("DLQ opened read-only")
+        now = time.time()
+        record = {
+            "ts": int(now),
+            "surface": surface,
+            "event_id": event_id,
+            "errors": errors,
+            "payload": truncated_payload
+        }
+        try:
+            self._queue.put_nowait((now, record))
+        except queue.Full:
+            self.dropped_queue_full += 1
+            logger.warning("DLQ queue full; record dropped", surface=surface, event_id=event_id)
+            return False
+        self.enqueued += 1
+        return True
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Block until everything queued before this call is on disk."""
+        if not self._thread.is_alive():
+            return self._queue.empty()
+        marker = threading.Event()
+        try:
+            self._queue.put(marker, timeout=timeout)
+        except queue.Full:
+            return False
+        return marker.wait(timeout)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Flush, stop the writer thread and close the active segment."""
+        if self._thread.is_alive():
+            self.flush(timeout)
+            self._stop.set()
+            self._thread.join(timeout)
+        with self._lock:
+            self._close_files()
+            if self._lock_file is not None:
+                self._lock_file.close()
+                self._lock_file = None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            segments = [s.to_dict() for s in self._segments + [self._active]]
+        return {
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "batches": self.batches,
+            "queued": self._queue.qsize(),
+            "rotations": self.rotations,
+            "dropped_queue_full": self.dropped_queue_full,
+            "write_errors": self.write_errors,
+            "segments": segments,
+        }
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                first = self._queue.get(timeout=self.config.flush_interval)
+            except queue.Empty:
+                with self._lock, self._writers_lock():
+                    self._reload_if_rotated()
+                    self._maybe_rotate()
+                continue
+            batch = [first]
+            while len(batch) < self.config.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._write_batch(batch)
+
+    def _write_batch(self, batch: List[Any]) -> None:
+        records = [item for item in batch if not isinstance(item, threading.Event)]
+        try:
+            if records:
+                with self._lock, self._writers_lock():
+                    self._reload_if_rotated()
+                    self._append(records)
+                    self._maybe_rotate()
+        except Exception as e:
+            # Never let the writer thread die; the batch is lost
+            self.write_errors += len(records)
+            logger.error("DLQ write failed", records=len(records), error=str(e))
+        finally:
+            for item in batch:
+                if isinstance(item, threading.Event):
+                    item.set()
+
+    @contextmanager
+    def _writers_lock(self) -> Iterator[None]:
+        """Exclude other processes writing to this directory (no-op read-only or without fcntl)."""
+        if self._lock_file is None or fcntl is None:
+            yield
+            return
+        fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _append(self, records: List[Tuple[float, Dict[str, Any]]]) -> None:
+        """Append a batch to the active segment; the caller holds the writers lock."""
+        segment = self._active
+        lines = []
+        entries = []
+        # Other writers may have appended since our last batch
+        offset = os.fstat(self._data_file.fileno()).st_size
+        for ts, record in records:
+            line = (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+            lines.append(line)
+            entries.append(INDEX_ENTRY.pack(ts, offset, len(line),
+                                            _hash(record["surface"]), _hash(record["event_id"] or "")))
+            offset += len(line)
+
+        # Data before index: every index entry points at a complete line
+        self._data_file.write(b"".join(lines))
+        self._data_file.flush()
+        self._index_file.write(b"".join(entries))
+        self._index_file.flush()
+        if self.config.fsync:
+            os.fsync(self._data_file.fileno())
+            os.fsync(self._index_file.fileno())
+
+        if segment.first_ts is None:
+            segment.first_ts = records[0][0]
+        segment.last_ts = records[-1][0]
+        segment.records += len(records)
+        segment.size = offset
+        self.written += len(records)
+        self.batches += 1
+
+    def _maybe_rotate(self) -> None:
+        """Rotate the active segment when due; the caller holds the writers lock."""
+        segment = self._active
+        if segment is None or not segment.records:
+            return
+        segment.size = os.fstat(self._data_file.fileno()).st_size
+        too_big = segment.size >= self.config.max_segment_bytes
+        too_old = time.time() - segment.first_ts >= self.config.max_segment_age
+        if too_big or too_old:
+            self._rotate()
+
+    def _rotate(self) -> None:
+        segment = self._active
+        self._close_files()
+        # Count records other writers appended to this segment too
+        self._load_index_stats(segment)
+        rotated = _Segment(segment.seq, self._segment_path(segment.seq, ".jsonl"),
+                           self._segment_path(segment.seq, ".jsonl.idx"),
+                           segment.first_ts, segment.last_ts, segment.records, segment.size)
+        os.replace(segment.data_path, rotated.data_path)
+        os.replace(segment.index_path, rotated.index_path)
+        self._segments.append(rotated)
+        self.rotations += 1
+
+        while len(self._segments) > self.config.max_segments:
+            expired = self._segments.pop(0)
+            for path in (expired.data_path, expired.index_path):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+            logger.info("DLQ segment expired", segment=expired.seq, records=expired.records)
+
+        self._active = _Segment(segment.seq + 1, self.root / ACTIVE_SEGMENT, self.root / f"{ACTIVE_SEGMENT}.idx")
+        self._open_files()
+        self._write_manifest()
+        logger.info("DLQ segment rotated", segment=rotated.seq, records=rotated.records, bytes=rotated.size)
+
+    # -- segment bookkeeping ----------------------------------------------
+
+    def _segment_path(self, seq: int, suffix: str) -> Path:
+        return self.root / f"dlq.{seq:06d}{suffix}"
+
+    def _open(self) -> None:
+        manifest_path = self.root / MANIFEST
+        active_seq = 1
+        if manifest_path.exists():
+            try:
+                manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+                active_seq = int(manifest.get("active_segment", 1))
+                for item in manifest.get("segments", []):
+                    seq = int(item["segment"])
+                    segment = _Segment(seq, self._segment_path(seq, ".jsonl"), self._segment_path(seq, ".jsonl.idx"),
+                                       item.get("first_ts"), item.get("last_ts"),
+                                       item.get("records", 0), item.get("bytes", 0))
+                    if segment.data_path.exists():
+                        self._segments.append(segment)
+            except (ValueError, KeyError, TypeError) as e:
+                logger.warning("DLQ manifest unreadable; rebuilding from segments", error=str(e))
+                self._segments = []
+        if not self._segments:
+            # No (usable) manifest: discover rotated segments on disk
+            for path in sorted(self.root.glob("dlq.[0-9]*.jsonl")):
+                seq = int(path.name.split(".")[1])
+                segment = _Segment(seq, path, path.with_name(path.name + ".idx"))
+                self._load_index_stats(segment)
+                self._segments.append(segment)
+            if self._segments:
+                active_seq = max(active_seq, self._segments[-1].seq + 1)
+
+        self._active = _Segment(active_seq, self.root / ACTIVE_SEGMENT, self.root / f"{ACTIVE_SEGMENT}.idx")
+        if not self.read_only:
+            self._reindex(self._active)
+        self._load_index_stats(self._active)
+        if not self.read_only:
+            self._open_files()
+
+    def _reload_if_rotated(self) -> None:
+        """Pick up segments rotated by another queue writing to this directory."""
+        try:
+            manifest = json.loads((self.root / MANIFEST).read_text(encoding="utf-8"))
+            active_seq = int(manifest.get("active_segment", 1))
+        except (FileNotFoundError, ValueError, TypeError, AttributeError):
+            return
+        if active_seq == self._active.seq:
+            return
+        self._close_files()
+        self._segments = []
+        self._open()
+
+    def _open_files(self) -> None:
+        self._data_file = open(self._active.data_path, "ab")
+        self._index_file = open(self._active.index_path, "ab")
+
+    def _close_files(self) -> None:
+        for handle in (self._data_file, self._index_file):
+            if handle is not None:
+                handle.close()
+        self._data_file = None
+        self._index_file = None
+
+    def _write_manifest(self) -> None:
+        atomic_write_json(self.root / MANIFEST, {
+            "active_segment": self._active.seq,
+            "segments": [segment.to_dict() for segment in self._segments],
+        })
+
+    def _load_index_stats(self, segment: _Segment) -> None:
+        entries = self._read_index(segment)
+        segment.records = len(entries)
+        segment.size = segment.data_path.stat().st_size if segment.data_path.exists() else 0
+        if entries:
+            segment.first_ts = entries[0][0]
+            segment.last_ts = entries[-1][0]
+
+    def _reindex(self, segment: _Segment) -> None:
+        """Index lines the index does not cover (a crash, or a pre-index dlq.jsonl)."""
+        if not segment.data_path.exists():
+            return
+        data_size = segment.data_path.stat().st_size
+        entries = self._read_index(segment)
+        indexed_end = entries[-1][1] + entries[-1][2] if entries else 0
+        if indexed_end > data_size:
+            entries, indexed_end = [], 0
+        if indexed_end == data_size and segment.index_path.exists() \
+                and segment.index_path.stat().st_size == len(entries) * INDEX_ENTRY.size:
+            return
+
+        packed = [INDEX_ENTRY.pack(*entry) for entry in entries]
+        with open(segment.data_path, "rb") as f:
+            f.seek(indexed_end)
+            offset = indexed_end
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # torn final write; overwritten by the next append
+                try:
+                    record = json.loads(line)
+                    packed.append(INDEX_ENTRY.pack(float(record.get("ts", 0)), offset, len(line),
+                                                   _hash(record.get("surface", "")),
+                                                   _hash(record.get("event_id") or "")))
+                except (ValueError, AttributeError):
+                    pass
+                offset += len(line)
+        if offset < data_size:
+            with open(segment.data_path, "r+b") as f:
+                f.truncate(offset)
+        with open(segment.index_path, "wb") as f:
+            f.write(b"".join(packed))
+        logger.info("DLQ segment reindexed", segment=segment.seq, records=len(packed))
+
+    @staticmethod
+    def _read_index(segment: _Segment) -> List[Tuple[float, int, int, int, int]]:
+        try:
+            data = segment.index_path.read_bytes()
+        except FileNotFoundError:
+            return []
+        usable = len(data) - len(data) % INDEX_ENTRY.size
+        return list(INDEX_ENTRY.iter_unpack(data[:usable]))
+
+    # -- queries ----------------------------------------------------------
+
+    def query(self,
+              surface: Optional[str] = None,
+              event_id: Optional[str] = None,
+              since: Optional[float] = None,
+              until: Optional[float] = None,
+              after: Optional[Position] = None,
+              limit: Optional[int] = None) -> Iterator[DLQEntry]:
+        """
+        Yield entries in write order, optionally filtered by surface, event_id,
+        time range (epoch seconds, inclusive) and position.
+
+        Only records already on disk are visible; call ``flush()`` first to
+        include queued ones.
+        """
+        surface_hash = _hash(surface) if surface is not None else None
+        event_hash = _hash(event_id) if event_id is not None else None
+        with self._lock, self._writers_lock():
+            self._reload_if_rotated()
+            segments = list(self._segments) + [self._active]
+
+        returned = 0
+        for segment in segments:
+            if after is not None and segment.seq < after[0]:
+                continue
+            if not segment.overlaps(since, until):
+                continue
+            matches = []
+            for ts, offset, length, s_hash, e_hash in self._read_index(segment):
+                if after is not None and (segment.seq, offset) <= after:
+                    continue
+                if since is not None and ts < since or until is not None and ts > until:
+                    continue
+                if surface_hash is not None and s_hash != surface_hash:
+                    continue
+                if event_hash is not None and e_hash != event_hash:
+                    continue
+                matches.append((ts, offset, length))
+            if not matches:
+                continue
+
+            try:
+                with open(segment.data_path, "rb") as f:
+                    for ts, offset, length in matches:
+                        f.seek(offset)
+                        try:
+                            record = json.loads(f.read(length))
+                        except ValueError:
+                            # Stale or corrupt index entry; skip it rather than fail the query
+                            logger.debug("DLQ index entry does not decode", segment=segment.seq, offset=offset)
+                            continue
+                        if not isinstance(record, dict):
+                            continue
+                        # Hashes can collide; confirm the exact values
+                        if surface is not None and record.get("surface") != surface:
+                            continue
+                        if event_id is not None and record.get("event_id") != event_id:
+                            continue
+                        yield DLQEntry(segment.seq, offset, ts, record)
+                        returned += 1
+                        if limit is not None and returned >= limit:
+                            return
+            except FileNotFoundError:
+                # Rotated or expired while we were reading
+                logger.debug("DLQ segment vanished during query", segment=segment.seq)
+
+
+class DLQReplayer:
+    """
+    Rate-limited replay of DLQ entries through an ``EventBusPort``.
+
+    Progress is checkpointed to ``checkpoint_path`` every ``checkpoint_every``
+    entries. A replay with the same filter resumes after the last checkpointed
+    entry; a failed publish stops the replay so that it is retried on resume.
+    """
+
+    def __init__(self,
+                 dlq: DeadLetterQueue,
+                 event_bus,
+                 rate_per_second: float = 50.0,
+                 checkpoint_path: Optional[os.PathLike] = None,
+                 checkpoint_every: int = 100,
+                 build_event: Optional[Callable[[DLQEntry], Tuple[str, Dict[str, Any]]]] = None):
+        if rate_per_second <= 0:
+            raise ValueError("rate_per_second must be positive")
+        self.dlq = dlq
+        self.event_bus = event_bus
+        self.rate_per_second = rate_per_second
+        self.checkpoint_path = Path(checkpoint_path) if checkpoint_path else dlq.root / "dlq.replay-checkpoint.json"
+        self.checkpoint_every = max(1, checkpoint_every)
+        self.build_event = build_event or self.default_event
+
+    @staticmethod
+    def default_event(entry: DLQEntry) -> Tuple[str, Dict[str, Any]]:
+        """Publish as a ``dlq_replay`` event carrying the original record."""
+        return "dlq_replay", {
+            "surface": entry.surface,
+            "original_event_id": entry.event_id,
+            "errors": entry.record.get("errors", []),
+            "payload": entry.record.get("payload", {}),
+            "dead_lettered_at": entry.timestamp,
+        }
+
+    def load_checkpoint(self) -> Optional[Dict[str, Any]]:
+        try:
+            return json.loads(self.checkpoint_path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return None
+
+    async def replay(self,
+                     surface: Optional[str] = None,
+                     event_id: Optional[str] = None,
+                     since: Optional[float] = None,
+                     until: Optional[float] = None,
+                     limit: Optional[int] = None,
+                     resume: bool = True) -> Dict[str, Any]:
+        """Replay matching entries; returns counts and the final position."""
+        selection = {"surface": surface, "event_id": event_id, "since": since, "until": until}
+        checkpoint = self.load_checkpoint() if resume else None
+        after = None
+        replayed = 0
+        if checkpoint and checkpoint.get("filter") == selection and checkpoint.get("position"):
+            after = tuple(checkpoint["position"])
+            replayed = checkpoint.get("replayed", 0)
+            logger.info("Resuming DLQ replay", position=after, replayed=replayed)
+
+        interval = 1.0 / self.rate_per_second
+        next_send = time.monotonic()
+        position = after
+        session = 0
+        stopped_on_failure = False
+
+        for entry in self.dlq.query(surface=surface, event_id=event_id, since=since, until=until,
+                                    after=after, limit=limit):
+            delay = next_send - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            next_send = max(next_send + interval, time.monotonic())
+
+            event_type, event_data = self.build_event(entry)
+            try:
+                published = await self.event_bus.publish_event(event_type, event_data,
+                                                               correlation_id=entry.event_id or None)
+            except Exception as e:
+                logger.error("DLQ replay publish raised", position=entry.position, error=str(e))
+                published = False
+            if not published:
+                stopped_on_failure = True
+                logger.warning("DLQ replay stopped on publish failure", position=entry.position)
+                break
+
+            position = entry.position
+            replayed += 1
+            session += 1
+            if session % self.checkpoint_every == 0:
+                self._save_checkpoint(selection, position, replayed)
+
+        self._save_checkpoint(selection, position, replayed)
+        result = {
+            "replayed": session,
+            "replayed_total": replayed,
+            "position": list(position) if position else None,
+            "stopped_on_failure": stopped_on_failure,
+        }
+        logger.info("DLQ replay finished", **result)
+        return result
+
+    def _save_checkpoint(self, selection: Dict[str, Any], position: Optional[Position], replayed: int) -> None:
+        atomic_write_json(self.checkpoint_path, {
+            "filter": selection,
+            "position": list(position) if position else None,
+            "replayed": replayed,
+            "updated_at": time.time(),
+        })
+
+
+_queues: Dict[str, DeadLetterQueue] = {}
+_queues_lock = threading.Lock()
+
+
+def get_dlq(root: Optional[os.PathLike] = None, config: Optional[DLQConfig] = None) -> DeadLetterQueue:
+    """Get the DLQ for ``root`` (default: ``SCRIBE_REPORT_DIR`` or tools/reports)."""
+    root = root or os.environ.get("SCRIBE_REPORT_DIR", "tools/reports")
+    key = os.path.abspath(root)
+    with _queues_lock:
+        dlq = _queues.get(key)
+        if dlq is None:
+            dlq = _queues[key] = DeadLetterQueue(key, config)
+        return dlq
+
 
 def write_dlq(surface: str, event_id: str, errors: List[str], truncated_payload: Dict[str, Any]) -> None:
-    root = os.environ.get("SCRIBE_REPORT_DIR", "tools/reports")
-    pathlib.Path(root).mkdir(parents=True, exist_ok=True)
-    path = pathlib.Path(root) / "dlq.jsonl"
-    rec = {
-        "ts": int(time.time()),
-        "surface": surface,
-        "event_id": event_id,
-        "errors": errors,
-        "payload": truncated_payload
-    }
-    with open(path, "a", encoding="utf-8") as f:
-        f.write(json.dumps(rec, separators=(",", ":")) + "\n")
\ No newline at end of file
+    get_dlq().write(surface, event_id, errors, truncated_payload)
+
+
+def flush_dlq(timeout: float = 5.0) -> bool:
+    """Block until every queued DLQ record is on disk."""
+    with _queues_lock:
+        queues = list(_queues.values())
+    return all(dlq.flush(timeout) for dlq in queues)
+
+
+def shutdown_dlq(timeout: float = 5.0) -> None:
+    """Flush and close every DLQ writer."""
+    with _queues_lock:
+        queues = list(_queues.values())
+        _queues.clear()
+    for dlq in queues:
+        dlq.close(timeout)
+
+
+atexit.register(shutdown_dlq)
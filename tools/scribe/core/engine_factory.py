@@ -14,15 +14,18 @@ from pathlib import Path
 from .config_manager import ConfigManager
 from .security_manager import SecurityManager
 from .plugin_loader import PluginLoader
+from .action_dispatcher import ActionDispatcher
+from .quarantine_store import QuarantineConfig
 from .async_processor import AsyncProcessor
 from .telemetry import initialize_telemetry
+from .state_snapshot import EngineStateSnapshot
 from .port_adapters import (
     ScribePluginExecutionAdapter, ScribeConfigurationAdapter, ScribeHealthCheckAdapter,
     ScribeCommandExecutionAdapter, ScribeFileSystemAdapter, ScribeLoggingAdapter
 )
 from .adapters.nats_adapter import NatsEventBusAdapter
 from .hma_ports import PortRegistry
-from .logging_config import get_scribe_logger
+from .logging_config import get_scribe_logger, configure_logging_from_config
 
 logger = get_scribe_logger(__name__)
 
@@ -34,9 +37,11 @@ class EngineComponents:
         self.config_manager: Optional[ConfigManager] = None
         self.security_manager: Optional[SecurityManager] = None
         self.plugin_loader: Optional[PluginLoader] = None
+        self.action_dispatcher: Optional[ActionDispatcher] = None
         self.async_processor: Optional[AsyncProcessor] = None
         self.telemetry = None
         self.port_registry: Optional[PortRegistry] = None
+        self.state_snapshot: Optional[EngineStateSnapshot] = None
         
         # Port adapters
         self.plugin_execution_adapter = None
@@ -76,9 +81,21 @@ def create_engine_components(
         components.config_manager = ConfigManager(config_path=config_path)
         logger.debug("ConfigManager created")
         
+        # Apply async logging / sampling settings and follow hot reloads
+        configure_logging_from_config(components.config_manager.get('logging', {}))
+        components.config_manager.add_change_callback(
+            lambda config: configure_logging_from_config(config.get('logging', {}))
+        )
+        
         # Initialize sophisticated TelemetryManager with OTLP endpoint from environment
         otlp_endpoint = os.getenv('OTEL_EXPORTER_OTLP_ENDPOINT')
-        sampling_rate = float(os.getenv('OTEL_TRACE_SAMPLING_RATE', '1.0'))
+        telemetry_settings = components.config_manager.get('telemetry', {})
+        if not isinstance(telemetry_settings, dict):
+            telemetry_settings = {}
+        default_sampling_rate = telemetry_settings.get(
+            'sample_rate', telemetry_settings.get('sampling_rate', 1.0)
+        )
+        sampling_rate = float(os.getenv('OTEL_TRACE_SAMPLING_RATE', default_sampling_rate))
         
         components.telemetry = initialize_telemetry(
             service_name="scribe-engine",
@@ -96,10 +113,28 @@ def create_engine_components(
         # Initialize plugin loader
         plugin_directories = components.config_manager.get_plugin_directories()
         components.plugin_loader = PluginLoader(
-            plugin_directories=plugin_directories
+            plugin_directories=plugin_directories,
+            lazy=components.config_manager.get_plugin_lazy_loading(),
+            cache_path=components.config_manager.get_plugin_scan_cache_path()
         )
         logger.debug("PluginLoader created")
         
+        # Initialize action dispatcher with the configured quarantine store
+        quarantine_settings = components.config_manager.get_quarantine_settings()
+        if isinstance(quarantine_settings, dict):
+            components.action_dispatcher = ActionDispatcher(
+                components.plugin_loader,
+                components.config_manager,
+                components.security_manager,
+                quarantine_path=quarantine_settings['path'],
+                quarantine_config=QuarantineConfig(
+                    max_bytes=quarantine_settings['max_bytes'],
+                    retention_seconds=quarantine_settings['retention_seconds'],
+                    enforce_every=quarantine_settings['enforce_every']
+                )
+            )
+            logger.debug("ActionDispatcher created", quarantine_path=quarantine_settings['path'])
+        
         # Initialize async processor
         components.async_processor = AsyncProcessor()
         logger.debug("AsyncProcessor created")
@@ -111,6 +146,17 @@ def create_engine_components(
         # Create and register port adapters
         _create_port_adapters(components)
         
+        # Restore warm state before plugins are loaded, so a restored
+        # registry replaces discovery instead of following it
+        snapshot_settings = components.config_manager.get_state_snapshot_settings()
+        if isinstance(snapshot_settings, dict) and snapshot_settings['enabled']:
+            components.state_snapshot = EngineStateSnapshot(
+                snapshot_settings['path'],
+                max_age_seconds=snapshot_settings['max_age_seconds']
+            )
+            components.state_snapshot.register("plugins", components.plugin_loader)
+            components.state_snapshot.restore()
+        
         # Load all plugins
         components.plugin_loader.load_all_plugins()
         
@@ -10,14 +10,16 @@ import os
 import mmap
 import threading
 import time
+from concurrent.futures import Future
 from pathlib import Path
 from typing import Dict, List, Optional, Union, Iterator, BinaryIO, TextIO, Any
 from dataclasses import dataclass
 from collections import deque
 import structlog
 
+from .atomic_write import AtomicBatchWriter, atomic_write
 from .logging_config import get_scribe_logger
-from cache_manager import get_cache_manager, memoize
+from .cache_manager import get_cache_manager, memoize
 from .telemetry import get_telemetry_manager
 
 logger = get_scribe_logger(__name__)
@@ -32,10 +34,27 @@ class FileOperation:
     encoding: str = 'utf-8'
     callback: Optional[callable] = None
     created_at: float = None
+    future: Optional[Future] = None
     
     def __post_init__(self):
         if self.created_at is None:
             self.created_at = time.time()
+    
+    def resolve(self, result: Any, error: Optional[BaseException] = None):
+        """Complete the operation's future and invoke the legacy callback, if any."""
+        if self.future is not None and not self.future.done():
+            if error is None:
+                self.future.set_result(result)
+            else:
+                self.future.set_exception(error)
+        if self.callback:
+            try:
+                self.callback(result, error)
+            except Exception as e:
+                logger.error("File operation callback failed",
+                           file_path=str(self.file_path),
+                           operation_type=self.operation_type,
+                           error=str(e))
 
 
 class FileStreamReader:
@@ -181,32 +200,53 @@ class MemoryMappedFile:
 
 
 class BatchFileProcessor:
-    """Batches file operations for improved I/O performance."""
+    """
+    Batches file operations for improved I/O performance.
+    
+    ``submit_operation`` returns a ``concurrent.futures.Future`` for the
+    operation's result. A single worker thread sleeps on a condition
+    variable while the queue is empty, so an idle processor uses no CPU.
+    Once an operation arrives the worker waits at most ``batch_timeout`` for
+    the batch to fill to ``batch_size``, then processes it:
+    
+    - concurrent reads of the same path (and encoding) share one read
+    - concurrent stats of the same path share one ``os.stat``
+    - writes to the same path collapse to the last one, committed together
+      through ``AtomicBatchWriter``
+    - deletes of the same path are attempted once
+    
+    Within a batch, reads run before writes, then stats, then deletes.
+    """
     
     def __init__(self,
                  batch_size: int = 50,
-                 batch_timeout: float = 1.0,
+                 batch_timeout: float = 0.05,
                  max_concurrent: int = 5):
         """
         Initialize batch processor.
         
         Args:
             batch_size: Maximum operations per batch
-            batch_timeout: Maximum time to wait for batch
+            batch_timeout: Maximum time an operation waits for its batch to fill
             max_concurrent: Maximum concurrent batches
         """
         self.batch_size = batch_size
         self.batch_timeout = batch_timeout
         self.max_concurrent = max_concurrent
+        self.max_pending = batch_size * 10  # Prevent unbounded growth
         
         self._operations: deque = deque()
         self._lock = threading.RLock()
+        self._condition = threading.Condition(self._lock)
+        self._unfinished = 0
         self._batch_thread: Optional[threading.Thread] = None
         self._running = False
         
         # Statistics
         self._stats = {
             "operations_batched": 0,
+            "operations_coalesced": 0,
+            "operations_rejected": 0,
             "batches_processed": 0,
             "total_processing_time": 0.0,
             "avg_batch_size": 0.0
@@ -229,39 +269,45 @@ class BatchFileProcessor:
         self._batch_thread.start()
     
     def _batch_worker(self):
-        """Process batches of file operations."""
-        try:
-            while self._running:
-                batch = self._collect_batch()
-                if batch:
-                    self._process_batch(batch)
-                else:
-                    time.sleep(0.1)  # No operations, brief pause
-                    
-        except Exception as e:
-            logger.error("Batch processor error", error=str(e), exc_info=True)
-    
-    def _collect_batch(self) -> List[FileOperation]:
-        """Collect operations for a batch."""
-        batch = []
-        start_time = time.time()
+        """Process batches of file operations until shut down and drained."""
+        while True:
+            batch = self._collect_batch()
+            if batch is None:
+                return
+            try:
+                self._process_batch(batch)
+            except Exception as e:
+                logger.error("Batch processor error", error=str(e), exc_info=True)
+                for op in batch:
+                    op.resolve(None, e)
+            finally:
+                with self._condition:
+                    self._unfinished -= len(batch)
+                    self._condition.notify_all()
+    
+    def _collect_batch(self) -> Optional[List[FileOperation]]:
+        """
+        Block until a batch is ready; returns None once shut down and drained.
         
-        with self._lock:
-            # Collect operations until batch size or timeout
-            while (len(batch) < self.batch_size and 
-                   time.time() - start_time < self.batch_timeout):
-                
-                if self._operations:
-                    batch.append(self._operations.popleft())
-                else:
-                    # No more operations, wait briefly
-                    time.sleep(0.01)
-                
-                # Check if we should continue waiting
-                if not self._operations and batch:
+        The condition is released while waiting, so submitters never block
+        on the worker.
+        """
+        with self._condition:
+            while not self._operations:
+                if not self._running:
+                    return None
+                self._condition.wait()
+            
+            # Wait for the batch to fill, bounded by the oldest operation's deadline
+            deadline = time.monotonic() + self.batch_timeout
+            while len(self._operations) < self.batch_size and self._running:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
                     break
-        
-        return batch
+                self._condition.wait(remaining)
+            
+            count = min(self.batch_size, len(self._operations))
+            return [self._operations.popleft() for _ in range(count)]
     
     def _process_batch(self, batch: List[FileOperation]):
         """Process a batch of file operations."""
@@ -270,145 +316,202 @@ class BatchFileProcessor:
         
         start_time = time.time()
         
-        try:
-            # Group operations by type for efficiency
-            read_ops = []
-            write_ops = []
-            stat_ops = []
-            delete_ops = []
-            
-            for op in batch:
-                if op.operation_type == 'read':
-                    read_ops.append(op)
-                elif op.operation_type == 'write':
-                    write_ops.append(op)
-                elif op.operation_type == 'stat':
-                    stat_ops.append(op)
-                elif op.operation_type == 'delete':
-                    delete_ops.append(op)
-            
-            # Process each type in batch
-            self._process_read_batch(read_ops)
-            self._process_write_batch(write_ops)
-            self._process_stat_batch(stat_ops)
-            self._process_delete_batch(delete_ops)
-            
-            # Update statistics
-            processing_time = time.time() - start_time
-            with self._lock:
-                self._stats["operations_batched"] += len(batch)
-                self._stats["batches_processed"] += 1
-                self._stats["total_processing_time"] += processing_time
-                self._stats["avg_batch_size"] = (
-                    self._stats["operations_batched"] / self._stats["batches_processed"]
-                )
-            
-            logger.debug("Batch processed",
-                        batch_size=len(batch),
-                        processing_time=processing_time,
-                        read_ops=len(read_ops),
-                        write_ops=len(write_ops),
-                        stat_ops=len(stat_ops),
-                        delete_ops=len(delete_ops))
+        # Group operations by type for efficiency
+        read_ops = []
+        write_ops = []
+        stat_ops = []
+        delete_ops = []
+        
+        for op in batch:
+            if op.operation_type == 'read':
+                read_ops.append(op)
+            elif op.operation_type == 'write':
+                write_ops.append(op)
+            elif op.operation_type == 'stat':
+                stat_ops.append(op)
+            elif op.operation_type == 'delete':
+                delete_ops.append(op)
+            else:
+                op.resolve(None, ValueError(f"Unknown operation type: {op.operation_type}"))
+        
+        # Process each type in batch; each returns the number of syscall groups run
+        executed = (self._process_read_batch(read_ops) +
+                    self._process_write_batch(write_ops) +
+                    self._process_stat_batch(stat_ops) +
+                    self._process_delete_batch(delete_ops))
+        
+        # Update statistics
+        processing_time = time.time() - start_time
+        with self._lock:
+            self._stats["operations_batched"] += len(batch)
+            self._stats["operations_coalesced"] += (
+                len(read_ops) + len(write_ops) + len(stat_ops) + len(delete_ops) - executed
+            )
+            self._stats["batches_processed"] += 1
+            self._stats["total_processing_time"] += processing_time
+            self._stats["avg_batch_size"] = (
+                self._stats["operations_batched"] / self._stats["batches_processed"]
+            )
         
-        except Exception as e:
-            logger.error("Error processing batch",
-                        batch_size=len(batch),
-                        error=str(e),
-                        exc_info=True)
-    
-    def _process_read_batch(self, operations: List[FileOperation]):
-        """Process batch of read operations."""
+        logger.debug("Batch processed",
+                    batch_size=len(batch),
+                    processing_time=processing_time,
+                    read_ops=len(read_ops),
+                    write_ops=len(write_ops),
+                    stat_ops=len(stat_ops),
+                    delete_ops=len(delete_ops))
+    
+    @staticmethod
+    def _group_by(operations: List[FileOperation], key) -> Dict[Any, List[FileOperation]]:
+        groups: Dict[Any, List[FileOperation]] = {}
         for op in operations:
+            groups.setdefault(key(op), []).append(op)
+        return groups
+    
+    def _process_read_batch(self, operations: List[FileOperation]) -> int:
+        """Process batch of read operations, one read per distinct path."""
+        groups = self._group_by(operations, lambda op: (op.file_path, op.encoding))
+        for (file_path, encoding), ops in groups.items():
             try:
-                if op.file_path.exists():
-                    with open(op.file_path, 'r', encoding=op.encoding) as f:
-                        content = f.read()
-                    
-                    if op.callback:
-                        op.callback(content, None)
-                else:
-                    error = FileNotFoundError(f"File not found: {op.file_path}")
-                    if op.callback:
-                        op.callback(None, error)
-                        
+                with open(file_path, 'r', encoding=encoding) as f:
+                    content = f.read()
+            except FileNotFoundError:
+                error = FileNotFoundError(f"File not found: {file_path}")
+                for op in ops:
+                    op.resolve(None, error)
+                continue
             except Exception as e:
                 logger.error("Read operation failed",
-                           file_path=str(op.file_path),
+                           file_path=str(file_path),
                            error=str(e))
-                if op.callback:
-                    op.callback(None, e)
-    
-    def _process_write_batch(self, operations: List[FileOperation]):
-        """Process batch of write operations."""
-        for op in operations:
-            try:
-                # Ensure parent directory exists
-                op.file_path.parent.mkdir(parents=True, exist_ok=True)
-                
-                with open(op.file_path, 'w', encoding=op.encoding) as f:
-                    f.write(op.data)
-                
-                if op.callback:
-                    op.callback(True, None)
-                    
-            except Exception as e:
+                for op in ops:
+                    op.resolve(None, e)
+                continue
+            
+            for op in ops:
+                op.resolve(content, None)
+        return len(groups)
+    
+    def _process_write_batch(self, operations: List[FileOperation]) -> int:
+        """Process batch of write operations; the last write to each path wins."""
+        groups = self._group_by(operations, lambda op: op.file_path)
+        if not groups:
+            return 0
+        
+        writer = AtomicBatchWriter(skip_unchanged=False)
+        for file_path, ops in groups.items():
+            last = ops[-1]
+            data = last.data if isinstance(last.data, bytes) else (last.data or '').encode(last.encoding)
+            writer.stage(file_path, data)
+        
+        try:
+            result = writer.commit()
+            failed = result.failed
+        except Exception as e:
+            logger.error("Write batch failed",
+                       operations=len(operations),
+                       error=str(e))
+            failed = {str(path): str(e) for path in groups}
+        
+        for file_path, ops in groups.items():
+            error_message = failed.get(str(file_path))
+            if error_message is None:
+                for op in ops:
+                    op.resolve(True, None)
+            else:
                 logger.error("Write operation failed",
-                           file_path=str(op.file_path),
-                           error=str(e))
-                if op.callback:
-                    op.callback(False, e)
-    
-    def _process_stat_batch(self, operations: List[FileOperation]):
-        """Process batch of stat operations."""
-        for op in operations:
+                           file_path=str(file_path),
+                           error=error_message)
+                error = OSError(error_message)
+                for op in ops:
+                    op.resolve(False, error)
+        return len(groups)
+    
+    def _process_stat_batch(self, operations: List[FileOperation]) -> int:
+        """Process batch of stat operations, one stat per distinct path."""
+        groups = self._group_by(operations, lambda op: op.file_path)
+        for file_path, ops in groups.items():
             try:
-                stat_result = op.file_path.stat() if op.file_path.exists() else None
-                
-                if op.callback:
-                    op.callback(stat_result, None)
-                    
+                stat_result = os.stat(file_path)
+            except FileNotFoundError:
+                stat_result = None
             except Exception as e:
                 logger.error("Stat operation failed",
-                           file_path=str(op.file_path),
+                           file_path=str(file_path),
                            error=str(e))
-                if op.callback:
-                    op.callback(None, e)
-    
-    def _process_delete_batch(self, operations: List[FileOperation]):
-        """Process batch of delete operations."""
-        for op in operations:
+                for op in ops:
+                    op.resolve(None, e)
+                continue
+            
+            for op in ops:
+                op.resolve(stat_result, None)
+        return len(groups)
+    
+    def _process_delete_batch(self, operations: List[FileOperation]) -> int:
+        """Process batch of delete operations, one attempt per distinct path."""
+        groups = self._group_by(operations, lambda op: op.file_path)
+        for file_path, ops in groups.items():
             try:
                 success = False
-                if op.file_path.exists():
-                    if op.file_path.is_file():
-                        op.file_path.unlink()
-                        success = True
-                    elif op.file_path.is_dir():
-                        op.file_path.rmdir()
-                        success = True
-                
-                if op.callback:
-                    op.callback(success, None)
-                    
+                if file_path.is_dir():
+                    file_path.rmdir()
+                    success = True
+                elif file_path.exists():
+                    file_path.unlink()
+                    success = True
             except Exception as e:
                 logger.error("Delete operation failed",
-                           file_path=str(op.file_path),
+                           file_path=str(file_path),
                            error=str(e))
-                if op.callback:
-                    op.callback(False, e)
-    
-    def submit_operation(self, operation: FileOperation) -> bool:
-        """Submit file operation for batch processing."""
-        with self._lock:
-            if len(self._operations) >= self.batch_size * 10:  # Prevent unbounded growth
-                logger.warning("Operation queue full, dropping operation",
-                             file_path=str(operation.file_path),
-                             operation_type=operation.operation_type)
-                return False
+                for op in ops:
+                    op.resolve(False, e)
+                continue
             
-            self._operations.append(operation)
-            return True
+            for op in ops:
+                op.resolve(success, None)
+        return len(groups)
+    
+    def submit_operation(self, operation: FileOperation) -> Future:
+        """
+        Submit file operation for batch processing.
+        
+        Returns:
+            Future for the operation's result. It fails immediately with
+            RuntimeError if the queue is full or the processor is shut down.
+        """
+        if operation.future is None:
+            operation.future = Future()
+        
+        with self._condition:
+            if not self._running:
+                rejection = "Batch processor is shut down"
+            elif len(self._operations) >= self.max_pending:
+                rejection = "Operation queue full"
+            else:
+                self._operations.append(operation)
+                self._unfinished += 1
+                # Wake the worker for the first operation and when a batch is full
+                if len(self._operations) == 1 or len(self._operations) >= self.batch_size:
+                    self._condition.notify_all()
+                return operation.future
+            self._stats["operations_rejected"] += 1
+        
+        logger.warning("Rejected file operation",
+                     file_path=str(operation.file_path),
+                     operation_type=operation.operation_type,
+                     reason=rejection)
+        operation.future.set_exception(RuntimeError(rejection))
+        return operation.future
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every submitted operation has completed.
+        
+        Returns:
+            True if the queue drained within ``timeout``
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self._unfinished == 0, timeout)
     
     def get_stats(self) -> Dict[str, Any]:
         """Get batch processor statistics."""
@@ -420,8 +523,10 @@ class BatchFileProcessor:
             }
     
     def shutdown(self):
-        """Shutdown batch processor."""
-        self._running = False
+        """Shutdown batch processor after completing queued operations."""
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
         if self._batch_thread and self._batch_thread.is_alive():
             self._batch_thread.join(timeout=5.0)
         logger.debug("Batch processor shutdown completed")
@@ -584,7 +689,10 @@ class FileOptimizer:
                 data=content,
                 encoding=encoding
             )
-            return self._batch_processor.submit_operation(operation)
+            future = self._batch_processor.submit_operation(operation)
+            # Queued successfully unless rejected outright; callers needing the
+            # outcome can use submit_operation() directly
+            return not (future.done() and future.exception() is not None)
         
         try:
             # Record telemetry
@@ -594,7 +702,6 @@ class FileOptimizer:
                 
                 if atomic:
                     # Use atomic write for safety
-                    from atomic_write import atomic_write
                     success = atomic_write(path, content, encoding=encoding)
                 else:
                     # Direct write for performance
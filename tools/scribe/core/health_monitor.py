@@ -6,6 +6,7 @@ Implements comprehensive health monitoring, metrics collection, and alerting
 for production deployment with proactive issue detection and self-healing.
 """
 
+import os
 import time
 import threading
 import psutil
@@ -13,13 +14,16 @@ import socket
 from typing import Dict, Any, List, Optional, Callable, Union
 from dataclasses import dataclass, field
 from enum import Enum
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import parse_qs, urlsplit
+import asyncio
 import json
 import structlog
 
 from .logging_config import get_scribe_logger
 from .telemetry import get_telemetry_manager
 from .error_recovery import get_error_recovery_manager
+from .stack_sampler import EventLoopRegistry, StackSampler, dump_asyncio_tasks, dump_threads
 
 logger = get_scribe_logger(__name__)
 
@@ -136,14 +140,23 @@ class HealthHTTPHandler(BaseHTTPRequestHandler):
     def do_GET(self):
         """Handle GET requests."""
         try:
-            if self.path == "/health":
+            url = urlsplit(self.path)
+            path = url.path
+            if path == "/health":
                 self._handle_health_check()
-            elif self.path == "/health/detailed":
+            elif path == "/health/detailed":
                 self._handle_detailed_health()
-            elif self.path == "/metrics":
+            elif path == "/metrics":
                 self._handle_metrics()
-            elif self.path == "/alerts":
+            elif path == "/alerts":
                 self._handle_alerts()
+            elif path.startswith("/debug/") and not self.health_monitor.debug_endpoints:
+                # Debug endpoints are not advertised unless enabled in config
+                self._send_response(404, {"error": "Not found"})
+            elif path == "/debug/profile":
+                self._handle_profile(parse_qs(url.query))
+            elif path == "/debug/tasks":
+                self._handle_tasks()
             else:
                 self._send_response(404, {"error": "Not found"})
                 
@@ -188,6 +201,54 @@ class HealthHTTPHandler(BaseHTTPRequestHandler):
         alerts = self.health_monitor.get_active_alerts()
         self._send_response(200, {"alerts": alerts})
     
+    def _handle_profile(self, query: Dict[str, List[str]]):
+        """Handle /debug/profile?seconds=N&format=collapsed|speedscope."""
+        try:
+            seconds = float(query.get("seconds", ["5"])[0])
+        except ValueError:
+            self._send_response(400, {"error": "seconds must be a number"})
+            return
+        max_seconds = self.health_monitor.max_profile_seconds
+        if not 0 < seconds <= max_seconds:
+            self._send_response(400, {"error": f"seconds must be in (0, {max_seconds}]"})
+            return
+        output_format = query.get("format", ["collapsed"])[0]
+        if output_format not in ("collapsed", "speedscope"):
+            self._send_response(400, {"error": "format must be 'collapsed' or 'speedscope'"})
+            return
+
+        try:
+            result = self.health_monitor.profile(seconds)
+        except RuntimeError as e:
+            self._send_response(409, {"error": str(e)})
+            return
+
+        if output_format == "speedscope":
+            self._send_response(200, result.to_speedscope(name=f"scribe-{os.getpid()}"))
+            return
+
+        summary = result.summary()
+        self._send_text(200, result.to_collapsed(), headers={
+            "X-Profile-Samples": str(summary["samples"]),
+            "X-Profile-Duration-Seconds": str(summary["duration_seconds"]),
+            "X-Sampler-Overhead-Percent": str(summary["sampler_overhead_percent"]),
+        })
+
+    def _handle_tasks(self):
+        """Handle /debug/tasks: thread stacks and registered asyncio tasks."""
+        self._send_response(200, self.health_monitor.get_task_dump())
+
+    def _send_text(self, status_code: int, text: str, headers: Optional[Dict[str, str]] = None):
+        """Send plain-text response."""
+        body = text.encode('utf-8')
+        self.send_response(status_code)
+        self.send_header('Content-Type', 'text/plain; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
     def _send_response(self, status_code: int, data: Dict[str, Any]):
         """Send JSON response."""
         self.send_response(status_code)
@@ -215,17 +276,26 @@ class HealthMonitor:
     - System resource monitoring
     - Alert management
     - HTTP health endpoints
+    - On-demand stack profiling and task dumps (/debug/*, off by default)
     - Self-healing integration
     """
     
-    def __init__(self, port: int = 9469):
+    def __init__(self, port: int = 9469, debug_endpoints: bool = False,
+                 max_profile_seconds: float = 30.0, profile_interval: float = 0.005):
         """
         Initialize health monitor.
         
         Args:
             port: Port for health check HTTP server
+            debug_endpoints: Serve /debug/profile and /debug/tasks
+            max_profile_seconds: Longest profile a request may ask for
+            profile_interval: Seconds between stack samples
         """
         self.port = port
+        self.debug_endpoints = debug_endpoints
+        self.max_profile_seconds = max_profile_seconds
+        self._sampler = StackSampler(interval=profile_interval)
+        self._event_loops = EventLoopRegistry()
         
         # Health checks registry
         self._health_checks: Dict[str, HealthCheck] = {}
@@ -239,13 +309,13 @@ class HealthMonitor:
         # System monitoring
         self._system_stats = {}
         self._monitor_thread: Optional[threading.Thread] = None
-        self._http_server: Optional[HTTPServer] = None
+        self._http_server: Optional[ThreadingHTTPServer] = None
         self._running = False
         
         # Register default health checks
         self._register_default_checks()
         
-        logger.info("HealthMonitor initialized", port=port)
+        logger.info("HealthMonitor initialized", port=port, debug_endpoints=debug_endpoints)
     
     def _register_default_checks(self):
         """Register default system health checks."""
@@ -506,7 +576,9 @@ class HealthMonitor:
             def handler_factory(*args, **kwargs):
                 return HealthHTTPHandler(self, *args, **kwargs)
             
-            self._http_server = HTTPServer(('0.0.0.0', self.port), handler_factory)
+            # Threaded so a running profile does not block health probes
+            self._http_server = ThreadingHTTPServer(('0.0.0.0', self.port), handler_factory)
+            self._http_server.daemon_threads = True
             
             server_thread = threading.Thread(
                 target=self._http_server.serve_forever,
@@ -726,10 +798,36 @@ class HealthMonitor:
                 "active_alerts": len([a for a in self._alerts.values() if not a.resolved]),
                 "system_info": {
                     "uptime": time.time() - (self._monitor_thread.ident if self._monitor_thread else time.time()),
-                    "process_id": os.getpid() if 'os' in globals() else 0
+                    "process_id": os.getpid()
                 }
             }
     
+    def register_event_loop(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        """Include ``loop`` (default: the running loop) in /debug/tasks."""
+        self._event_loops.register(loop)
+    
+    def profile(self, seconds: float):
+        """
+        Sample all thread stacks for ``seconds``.
+        
+        Returns:
+            ProfileResult with collapsed/speedscope output and sampler overhead
+            
+        Raises:
+            RuntimeError: If a profile is already running
+        """
+        return self._sampler.profile(min(seconds, self.max_profile_seconds))
+    
+    def get_task_dump(self) -> Dict[str, Any]:
+        """Get stacks of all threads and pending tasks of registered event loops."""
+        return {
+            "timestamp": time.time(),
+            "process_id": os.getpid(),
+            "profile_running": self._sampler.running,
+            "threads": dump_threads(),
+            "asyncio_tasks": dump_asyncio_tasks(self._event_loops.loops()),
+        }
+    
     def get_metrics(self) -> Dict[str, Any]:
         """Get health metrics."""
         return self._metrics.get_all_metrics()
@@ -793,21 +891,29 @@ def get_health_monitor() -> Optional[HealthMonitor]:
     return _health_monitor
 
 
-def initialize_health_monitor(port: int = 9469) -> HealthMonitor:
+def initialize_health_monitor(port: int = 9469,
+                              debug_config: Optional[Dict[str, Any]] = None) -> HealthMonitor:
     """
     Initialize global health monitor.
     
     Args:
         port: Port for health check HTTP server
+        debug_config: The engine.debug_endpoints config section
         
     Returns:
         HealthMonitor instance
     """
     global _health_monitor
     
+    debug_config = debug_config or {}
     with _monitor_lock:
         if _health_monitor is None:
-            _health_monitor = HealthMonitor(port=port)
+            _health_monitor = HealthMonitor(
+                port=port,
+                debug_endpoints=debug_config.get("enabled", False),
+                max_profile_seconds=debug_config.get("max_profile_seconds", 30.0),
+                profile_interval=debug_config.get("sample_interval_ms", 5) / 1000.0
+            )
             _health_monitor.start()
         
         return _health_monitor
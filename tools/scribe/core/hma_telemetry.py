@@ -6,6 +6,7 @@ Implements mandatory OpenTelemetry boundary telemetry with HMA resource attribut
 and compliance tracking for all boundary crossings.
 """
 
+import importlib.util
 import time
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
@@ -24,27 +25,19 @@ def fallback_span():
     """Fallback span context manager"""
     yield FallbackSpan()
 
-# Optional OpenTelemetry imports with fallbacks
+# Optional OpenTelemetry imports with fallbacks. Only the API is imported
+# here; the SDK and Prometheus exporter are imported by HMATelemetry when
+# an instance is created.
 try:
     from opentelemetry import trace, metrics
-    from opentelemetry.sdk.trace import TracerProvider
-    from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
-    from opentelemetry.sdk.resources import Resource
-    from opentelemetry.sdk.metrics import MeterProvider
-    from opentelemetry.exporter.prometheus import PrometheusMetricReader
-    from prometheus_client import start_http_server
-    HAS_OPENTELEMETRY = True
+    HAS_OPENTELEMETRY = all(
+        importlib.util.find_spec(name) is not None
+        for name in ("opentelemetry.sdk", "opentelemetry.exporter.prometheus", "prometheus_client")
+    )
 except ImportError:
     # Fallback implementations for when OpenTelemetry is not available
     trace = None
     metrics = None
-    TracerProvider = None
-    BatchSpanProcessor = None
-    ConsoleSpanExporter = None
-    Resource = None
-    MeterProvider = None
-    PrometheusMetricReader = None
-    start_http_server = None
     HAS_OPENTELEMETRY = False
 
 from .logging_config import get_scribe_logger
@@ -101,6 +94,10 @@ class HMATelemetry(ObservabilityPort):
     
     def _setup_tracing(self, jaeger_endpoint: Optional[str]):
         """Setup distributed tracing with HMA resource attributes"""
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+        
         # Create HMA-compliant resource
         resource = Resource.create({
             # HMA v2.1 mandatory resource attributes
@@ -140,6 +137,11 @@ class HMATelemetry(ObservabilityPort):
     def _setup_metrics(self):
         """Setup metrics with Prometheus"""
         try:
+            from opentelemetry.exporter.prometheus import PrometheusMetricReader
+            from opentelemetry.sdk.metrics import MeterProvider
+            from opentelemetry.sdk.resources import Resource
+            from prometheus_client import start_http_server
+            
             # Create metric reader for Prometheus
             metric_reader = PrometheusMetricReader()
             
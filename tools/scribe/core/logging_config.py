@@ -4,12 +4,454 @@ Scribe Engine - Structured Logging Configuration
 This module configures structlog for machine-parsable JSON log output.
 All logs are emitted as JSON lines to stdout for easy ingestion into
 monitoring systems like Grafana Loki or ELK stack.
+
+By default each event is rendered and written synchronously on the calling
+thread. With the asynchronous pipeline enabled (``configure_log_pipeline`` or
+the ``logging.async`` config section) callers only enqueue the event dict and
+a background writer renders and flushes batches to stdout or a rotating
+file. DEBUG/INFO events can additionally be sampled and rate limited per
+logger; dropped events are counted and reported by ``get_logging_stats``.
 """
 
+import atexit
+import os
+import queue
+import random
 import sys
 import logging
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
 import structlog
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Callable, List, TextIO, Union
+
+# Levels that sampling and rate limiting may drop; warnings and above always pass
+SAMPLED_LEVELS = ("debug", "info")
+
+
+class LogSampler:
+    """
+    structlog processor applying probabilistic sampling and per-logger rate
+    limiting to DEBUG/INFO events.
+
+    Settings are updated in place through ``configure`` so loggers that were
+    cached before reconfiguration pick up the new policy.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._random = random.Random()
+        self._sample_rates: Dict[str, float] = {}
+        self._rate: Optional[float] = None
+        self._burst = 0.0
+        self._buckets: Dict[str, List[float]] = {}
+        self.dropped: Counter = Counter()
+
+    @property
+    def active(self) -> bool:
+        return bool(self._sample_rates) or self._rate is not None
+
+    def configure(self,
+                  sample_rates: Optional[Dict[str, float]] = None,
+                  rate_limit_per_second: Optional[float] = None,
+                  rate_limit_burst: Optional[int] = None) -> None:
+        """
+        Args:
+            sample_rates: Keep-probability per level, e.g. {"debug": 0.01, "info": 0.25}
+            rate_limit_per_second: Sustained DEBUG/INFO events allowed per logger
+            rate_limit_burst: Bucket size; defaults to one second of events
+        """
+        rates = {}
+        for level, rate in (sample_rates or {}).items():
+            level = level.lower()
+            if level in SAMPLED_LEVELS and rate < 1.0:
+                rates[level] = max(0.0, float(rate))
+        with self._lock:
+            self._sample_rates = rates
+            self._rate = float(rate_limit_per_second) if rate_limit_per_second else None
+            self._burst = float(rate_limit_burst or rate_limit_per_second or 0)
+            self._buckets = {}
+
+    def __call__(self, logger: Any, method_name: str, event_dict: Dict[str, Any]) -> Dict[str, Any]:
+        level = event_dict.get("level", method_name)
+        if level not in SAMPLED_LEVELS:
+            return event_dict
+
+        name = event_dict.get("logger") or getattr(logger, "name", "") or ""
+        rate = self._sample_rates.get(level)
+        if rate is not None and self._random.random() >= rate:
+            self.dropped[("sampled", name)] += 1
+            raise structlog.DropEvent
+
+        if self._rate is not None and not self._take_token(name):
+            self.dropped[("rate_limited", name)] += 1
+            raise structlog.DropEvent
+
+        return event_dict
+
+    def _take_token(self, name: str) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(name)
+            if bucket is None:
+                bucket = self._buckets[name] = [self._burst, now]
+            tokens = min(self._burst, bucket[0] + (now - bucket[1]) * self._rate)
+            bucket[1] = now
+            if tokens < 1.0:
+                bucket[0] = tokens
+                return False
+            bucket[0] = tokens - 1.0
+            return True
+
+    def stats(self) -> Dict[str, Any]:
+        by_reason: Counter = Counter()
+        by_logger: Dict[str, Dict[str, int]] = {}
+        for (reason, name), count in list(self.dropped.items()):
+            by_reason[reason] += count
+            by_logger.setdefault(name, {})[reason] = count
+        return {
+            "dropped_sampled": by_reason["sampled"],
+            "dropped_rate_limited": by_reason["rate_limited"],
+            "dropped_by_logger": by_logger,
+        }
+
+
+class AsyncLogWriter:
+    """
+    Background writer that renders queued event dicts and writes them in
+    batches to a stream or a size-rotated file.
+
+    ``submit`` never blocks: when the queue is full the event is dropped and
+    counted. Event dicts are rendered after the call returns, so values bound
+    into them should not be mutated by the caller afterwards.
+    """
+
+    def __init__(self,
+                 render: Callable[[Dict[str, Any]], str],
+                 stream: Optional[TextIO] = None,
+                 output_path: Optional[Union[str, os.PathLike]] = None,
+                 max_bytes: int = 0,
+                 backup_count: int = 5,
+                 batch_size: int = 256,
+                 flush_interval: float = 0.05,
+                 max_queue_size: int = 10000):
+        self._render = render
+        self._stream = stream if stream is not None else sys.stdout
+        self._output_path = os.fspath(output_path) if output_path else None
+        self._max_bytes = max_bytes
+        self._backup_count = backup_count
+        self._batch_size = max(1, batch_size)
+        self._flush_interval = flush_interval
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue_size)
+        self._file: Optional[TextIO] = None
+        self._stop = threading.Event()
+
+        self.enqueued = 0
+        self.written = 0
+        self.batches = 0
+        self.dropped_queue_full = 0
+        self.render_errors = 0
+
+        if self._output_path:
+            directory = os.path.dirname(self._output_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = open(self._output_path, "a", encoding="utf-8")
+
+        self._thread = threading.Thread(target=self._run, name="scribe-log-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, event_dict: Dict[str, Any]) -> bool:
+        try:
+            self._queue.put_nowait(event_dict)
+        except queue.Full:
+            self.dropped_queue_full += 1
+            return False
+        self.enqueued += 1
+        return True
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Block until everything queued before this call has been written."""
+        if not self._thread.is_alive():
+            return self._queue.empty()
+        marker = threading.Event()
+        try:
+            self._queue.put(marker, timeout=timeout)
+        except queue.Full:
+            return False
+        return marker.wait(timeout)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Drain the queue, stop the writer thread and close the output file."""
+        if self._thread.is_alive():
+            self.flush(timeout)
+            self._stop.set()
+            self._thread.join(timeout)
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "batches": self.batches,
+            "queued": self._queue.qsize(),
+            "dropped_queue_full": self.dropped_queue_full,
+            "render_errors": self.render_errors,
+        }
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                first = self._queue.get(timeout=self._flush_interval)
+            except queue.Empty:
+                continue
+            batch = [first]
+            while len(batch) < self._batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._write_batch(batch)
+
+    def _write_batch(self, batch: List[Any]) -> None:
+        lines = []
+        markers = []
+        for item in batch:
+            if isinstance(item, threading.Event):
+                markers.append(item)
+                continue
+            try:
+                lines.append(self._render(item))
+            except Exception:
+                self.render_errors += 1
+                lines.append(repr(item))
+
+        if lines:
+            lines.append("")
+            try:
+                self._emit("\n".join(lines))
+                self.written += len(lines) - 1
+                self.batches += 1
+            except Exception:
+                # Never let the writer thread die; the events are lost
+                self.render_errors += len(lines) - 1
+
+        for marker in markers:
+            marker.set()
+
+    def _emit(self, text: str) -> None:
+        if self._file is None:
+            self._stream.write(text)
+            self._stream.flush()
+            return
+        self._file.write(text)
+        self._file.flush()
+        if self._max_bytes and self._file.tell() >= self._max_bytes:
+            self._rotate()
+
+    def _rotate(self) -> None:
+        self._file.close()
+        if self._backup_count > 0:
+            for index in range(self._backup_count - 1, 0, -1):
+                source = f"{self._output_path}.{index}"
+                if os.path.exists(source):
+                    os.replace(source, f"{self._output_path}.{index + 1}")
+            os.replace(self._output_path, f"{self._output_path}.1")
+        else:
+            os.remove(self._output_path)
+        self._file = open(self._output_path, "a", encoding="utf-8")
+
+
+def _iso_timestamp(logger: Any, method_name: str, event_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """Render the epoch captured at call time like ``TimeStamper(fmt="iso")``."""
+    ts = event_dict.get("timestamp")
+    if isinstance(ts, float):
+        event_dict["timestamp"] = datetime.fromtimestamp(ts, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+    return event_dict
+
+
+class LogPipeline:
+    """
+    Final structlog processor: renders synchronously, or captures the few
+    call-time values (timestamp, active exception) and hands the event dict
+    to an ``AsyncLogWriter``.
+    """
+
+    def __init__(self):
+        self._render_processors = self._build_render_processors(timestamper=structlog.processors.TimeStamper(fmt="iso"))
+        self._async_render_processors = self._build_render_processors(timestamper=_iso_timestamp)
+        self.writer: Optional[AsyncLogWriter] = None
+
+    @staticmethod
+    def _build_render_processors(timestamper: Callable) -> List[Callable]:
+        return [
+            # Add ISO timestamp
+            timestamper,
+
+            # Format exception info
+            structlog.processors.format_exc_info,
+
+            # Handle Unicode properly
+            structlog.processors.UnicodeDecoder(),
+
+            # Final JSON renderer
+            structlog.processors.JSONRenderer(),
+        ]
+
+    def render(self, event_dict: Dict[str, Any], processors: Optional[List[Callable]] = None) -> str:
+        result: Any = event_dict
+        for processor in processors or self._render_processors:
+            result = processor(None, "", result)
+        return result
+
+    def render_queued(self, event_dict: Dict[str, Any]) -> str:
+        return self.render(event_dict, self._async_render_processors)
+
+    def __call__(self, logger: Any, method_name: str, event_dict: Dict[str, Any]) -> Any:
+        writer = self.writer
+        if writer is None:
+            return self.render(event_dict)
+
+        event_dict.setdefault("timestamp", time.time())
+        exc_info = event_dict.get("exc_info")
+        if exc_info is True:
+            event_dict["exc_info"] = sys.exc_info()
+        writer.submit(event_dict)
+        raise structlog.DropEvent
+
+
+_SAMPLER = LogSampler()
+_PIPELINE = LogPipeline()
+
+
+def _parse_size(value: Union[int, str, None]) -> int:
+    """Parse sizes like ``10MB`` or ``512KB`` into bytes."""
+    if value is None:
+        return 0
+    if isinstance(value, int):
+        return value
+    text = str(value).strip().upper()
+    for suffix, factor in (("GB", 1024 ** 3), ("MB", 1024 ** 2), ("KB", 1024), ("B", 1)):
+        if text.endswith(suffix):
+            return int(float(text[:-len(suffix)]) * factor)
+    return int(text)
+
+
+def configure_log_pipeline(
+    async_enabled: bool = False,
+    output_path: Optional[str] = None,
+    max_bytes: int = 0,
+    backup_count: int = 5,
+    batch_size: int = 256,
+    flush_interval: float = 0.05,
+    max_queue_size: int = 10000,
+    sample_rates: Optional[Dict[str, float]] = None,
+    rate_limit_per_second: Optional[float] = None,
+    rate_limit_burst: Optional[int] = None,
+    stream: Optional[TextIO] = None
+) -> None:
+    """
+    Switch the output stage between synchronous and asynchronous rendering
+    and set the sampling/rate-limit policy.
+
+    Safe to call at any time, including after loggers have been cached: the
+    sampler and pipeline processors are reconfigured in place.
+
+    Args:
+        async_enabled: Enqueue events and render them on a background writer
+        output_path: File for the async writer (stdout when omitted)
+        max_bytes: Rotate the output file once it reaches this size (0 disables)
+        backup_count: Number of rotated files to keep
+        batch_size: Maximum events rendered per write
+        flush_interval: Seconds the writer waits for the first event of a batch
+        max_queue_size: Events buffered before new ones are dropped
+        sample_rates: Keep-probability for "debug"/"info" events
+        rate_limit_per_second: Sustained DEBUG/INFO events per logger
+        rate_limit_burst: Token bucket size for the rate limit
+        stream: Stream for the async writer when no output_path is given
+    """
+    _SAMPLER.configure(sample_rates, rate_limit_per_second, rate_limit_burst)
+
+    old_writer = _PIPELINE.writer
+    if async_enabled:
+        _PIPELINE.writer = AsyncLogWriter(
+            render=_PIPELINE.render_queued,
+            stream=stream,
+            output_path=output_path,
+            max_bytes=max_bytes,
+            backup_count=backup_count,
+            batch_size=batch_size,
+            flush_interval=flush_interval,
+            max_queue_size=max_queue_size,
+        )
+    else:
+        _PIPELINE.writer = None
+
+    if old_writer is not None:
+        old_writer.close()
+
+
+def configure_logging_from_config(logging_settings: Optional[Dict[str, Any]]) -> None:
+    """
+    Apply the ``logging`` section of the Scribe configuration to the pipeline.
+
+    Args:
+        logging_settings: The ``logging`` config section (may be empty)
+    """
+    if not isinstance(logging_settings, dict):
+        return
+    settings = logging_settings
+    async_settings = settings.get("async", {})
+    sampling = settings.get("sampling", {})
+    rate_limit = settings.get("rate_limit", {})
+
+    if "max_file_size_mb" in settings:
+        max_bytes = int(settings["max_file_size_mb"]) * 1024 * 1024
+    else:
+        max_bytes = _parse_size(settings.get("max_file_size"))
+
+    configure_log_pipeline(
+        async_enabled=async_settings.get("enabled", False),
+        output_path=settings.get("output_file") or settings.get("output_path"),
+        max_bytes=max_bytes,
+        backup_count=settings.get("backup_count", 5),
+        batch_size=async_settings.get("batch_size", 256),
+        flush_interval=async_settings.get("flush_interval_ms", 50) / 1000.0,
+        max_queue_size=async_settings.get("queue_size", 10000),
+        sample_rates=sampling,
+        rate_limit_per_second=rate_limit.get("per_logger_per_second"),
+        rate_limit_burst=rate_limit.get("burst"),
+    )
+
+
+def flush_logs(timeout: float = 5.0) -> bool:
+    """Wait until queued log events have been written (no-op when synchronous)."""
+    writer = _PIPELINE.writer
+    return writer.flush(timeout) if writer is not None else True
+
+
+def shutdown_logging(timeout: float = 5.0) -> None:
+    """Drain and stop the asynchronous writer, reverting to synchronous output."""
+    writer = _PIPELINE.writer
+    _PIPELINE.writer = None
+    if writer is not None:
+        writer.close(timeout)
+
+
+def get_logging_stats() -> Dict[str, Any]:
+    """Drop counters from sampling/rate limiting and async writer statistics."""
+    writer = _PIPELINE.writer
+    return {
+        "async_enabled": writer is not None,
+        **_SAMPLER.stats(),
+        "writer": writer.stats() if writer is not None else None,
+    }
+
+
+atexit.register(shutdown_logging)
 
 
 def configure_structured_logging(
@@ -47,32 +489,27 @@ def configure_structured_logging(
         # Add log level
         structlog.stdlib.add_log_level,
         
+        # Sample / rate limit DEBUG and INFO before doing any further work
+        _SAMPLER,
+        
         # Handle positional arguments
         structlog.stdlib.PositionalArgumentsFormatter(),
         
-        # Add ISO timestamp
-        structlog.processors.TimeStamper(fmt="iso"),
-        
         # Add stack info for exceptions
         structlog.processors.StackInfoRenderer(),
-        
-        # Format exception info
-        structlog.processors.format_exc_info,
-        
-        # Handle Unicode properly
-        structlog.processors.UnicodeDecoder(),
     ]
     
     # Add caller info if requested (useful for debugging)
     if add_caller_info:
-        processors.insert(-1, structlog.processors.CallsiteParameterAdder(
+        processors.append(structlog.processors.CallsiteParameterAdder(
             parameters=[structlog.processors.CallsiteParameter.FILENAME,
                        structlog.processors.CallsiteParameter.LINENO,
                        structlog.processors.CallsiteParameter.FUNC_NAME]
         ))
     
-    # Final JSON renderer
-    processors.append(structlog.processors.JSONRenderer())
+    # Timestamp, exception formatting and JSON rendering, either inline or
+    # on the background writer
+    processors.append(_PIPELINE)
     
     # Configure structlog
     structlog.configure(
@@ -110,14 +547,7 @@ def add_global_context(**context) -> None:
     Args:
         **context: Key-value pairs to add to global context
     """
-    structlog.configure(
-        processors=structlog.get_config()["processors"],
-        context_class=dict,
-        logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
-        cache_logger_on_first_use=True,
-        initial_values=context
-    )
+    structlog.configure(initial_values=context)
 
 
 def create_request_logger(request_id: str, **context) -> structlog.stdlib.BoundLogger:
@@ -9,11 +9,13 @@ as required by HMA v2.2 mandatory Tier 1 technologies.
 import ssl
 import socket
 import threading
-import urllib3
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any, Union, List
+from typing import TYPE_CHECKING, Optional, Dict, Any, Union, List
 import structlog
-import requests
+
+if TYPE_CHECKING:
+    import requests
 
 from .logging_config import get_scribe_logger
 
@@ -114,27 +116,40 @@ class MTLSConfig:
             raise
 
 
-class MTLSHTTPAdapter(requests.adapters.HTTPAdapter):
-    """Custom HTTP adapter with mTLS support for requests library."""
+@lru_cache(maxsize=None)
+def _mtls_http_adapter_class():
+    """Build the requests adapter class; requests is imported on first use."""
+    import requests
     
-    def __init__(self, mtls_config: MTLSConfig, *args, **kwargs):
-        """
-        Initialize mTLS HTTP adapter.
+    class MTLSHTTPAdapter(requests.adapters.HTTPAdapter):
+        """Custom HTTP adapter with mTLS support for requests library."""
+    
+        def __init__(self, mtls_config: MTLSConfig, *args, **kwargs):
+            """
+            Initialize mTLS HTTP adapter.
         
-        Args:
-            mtls_config: mTLS configuration
-        """
-        self.mtls_config = mtls_config
-        super().__init__(*args, **kwargs)
+            Args:
+                mtls_config: mTLS configuration
+            """
+            self.mtls_config = mtls_config
+            super().__init__(*args, **kwargs)
         
-        logger.debug("mTLS HTTP adapter initialized")
+            logger.debug("mTLS HTTP adapter initialized")
     
-    def init_poolmanager(self, *args, **kwargs):
-        """Initialize urllib3 pool manager with mTLS SSL context."""
-        ssl_context = self.mtls_config.create_ssl_context()
-        kwargs['ssl_context'] = ssl_context
+        def init_poolmanager(self, *args, **kwargs):
+            """Initialize urllib3 pool manager with mTLS SSL context."""
+            ssl_context = self.mtls_config.create_ssl_context()
+            kwargs['ssl_context'] = ssl_context
         
-        return super().init_poolmanager(*args, **kwargs)
+            return super().init_poolmanager(*args, **kwargs)
+    
+    return MTLSHTTPAdapter
+
+
+def __getattr__(name):
+    if name == "MTLSHTTPAdapter":
+        return _mtls_http_adapter_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class MTLSSession:
@@ -147,32 +162,34 @@ class MTLSSession:
         Args:
             mtls_config: mTLS configuration
         """
+        import requests
+        
         self.mtls_config = mtls_config
         self.session = requests.Session()
         
         # Mount mTLS adapter for HTTPS URLs
-        adapter = MTLSHTTPAdapter(mtls_config)
+        adapter = _mtls_http_adapter_class()(mtls_config)
         self.session.mount('https://', adapter)
         
         logger.debug("mTLS session initialized")
     
-    def get(self, url: str, **kwargs) -> requests.Response:
+    def get(self, url: str, **kwargs) -> "requests.Response":
         """Make GET request with mTLS authentication."""
         return self._request('GET', url, **kwargs)
     
-    def post(self, url: str, **kwargs) -> requests.Response:
+    def post(self, url: str, **kwargs) -> "requests.Response":
         """Make POST request with mTLS authentication."""
         return self._request('POST', url, **kwargs)
     
-    def put(self, url: str, **kwargs) -> requests.Response:
+    def put(self, url: str, **kwargs) -> "requests.Response":
         """Make PUT request with mTLS authentication."""
         return self._request('PUT', url, **kwargs)
     
-    def delete(self, url: str, **kwargs) -> requests.Response:
+    def delete(self, url: str, **kwargs) -> "requests.Response":
         """Make DELETE request with mTLS authentication."""
         return self._request('DELETE', url, **kwargs)
     
-    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+    def _request(self, method: str, url: str, **kwargs) -> "requests.Response":
         """
         Make HTTP request with mTLS authentication and error handling.
         
@@ -184,6 +201,8 @@ class MTLSSession:
         Returns:
             HTTP response
         """
+        import requests
+        
         try:
             logger.debug("Making mTLS request",
                         method=method,
@@ -6,15 +6,23 @@ Handles dynamic discovery and loading of action plugins.
 Implements secure plugin loading with error handling and validation.
 """
 
+import ast
+import hashlib
 import importlib.util
 import inspect
+import os
+import re
 import sys
 import json
+import threading
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Type, Optional, Any
+from typing import Callable, Dict, List, Type, Optional, Any, Tuple
 import structlog
 import jsonschema
 
+from .atomic_write import atomic_write_json
+from .boundary_validator import CompiledSchema
 from .logging_config import get_scribe_logger
 from tools.scribe.actions.base import BaseAction
 from .config_manager import ConfigManager
@@ -24,6 +32,19 @@ from .port_adapters import ScribePluginContextAdapter
 
 logger = get_scribe_logger(__name__)
 
+# Bump when the security scan changes so cached verdicts are discarded
+SCAN_CACHE_VERSION = 1
+
+DANGEROUS_IMPORTS = [
+    'subprocess', 'os.system', 'eval', 'exec', '__import__',
+    'importlib.import_module', 'open', 'file'
+]
+
+DANGEROUS_FUNCTIONS = [
+    'eval(', 'exec(', 'compile(', '__import__(',
+    'getattr(', 'setattr(', 'delattr(', 'globals(', 'locals('
+]
+
 
 class PluginLoadError(Exception):
     """Exception raised when a plugin fails to load."""
@@ -47,29 +68,56 @@ class PluginLoadError(Exception):
 
 
 class PluginInfo:
-    """Information about a loaded plugin with HMA v2.2 manifest support."""
+    """
+    Information about a plugin with HMA v2.2 manifest support.
+    
+    A plugin registered from its manifest alone has no action class yet;
+    ``resolver`` imports the module and returns the class on first access
+    to ``action_class``.
+    """
     
     def __init__(self, 
-                 action_class: Type[BaseAction], 
+                 action_class: Optional[Type[BaseAction]], 
                  module_path: str, 
                  action_type: str,
-                 manifest: Optional[Dict[str, Any]] = None):
+                 manifest: Optional[Dict[str, Any]] = None,
+                 class_name: Optional[str] = None,
+                 resolver: Optional[Callable[[], Type[BaseAction]]] = None):
         """
         Initialize plugin information.
         
         Args:
-            action_class: The action class
+            action_class: The action class, or None to resolve it lazily
             module_path: Path to the module file
             action_type: The action type identifier
             manifest: Plugin manifest data (HMA v2.2)
+            class_name: Class name, required when action_class is None
+            resolver: Callable returning the action class on first use
         """
-        self.action_class = action_class
+        if action_class is None and resolver is None:
+            raise ValueError("PluginInfo needs an action_class or a resolver")
+        self._action_class = action_class
+        self._resolver = resolver
         self.module_path = module_path
         self.action_type = action_type
-        self.class_name = action_class.__name__
-        self.module_name = action_class.__module__
+        self.class_name = action_class.__name__ if action_class is not None else class_name
+        self.module_name = action_class.__module__ if action_class is not None else None
         self.manifest = manifest or {}
     
+    @property
+    def action_class(self) -> Type[BaseAction]:
+        """The action class, importing the plugin module on first access."""
+        if self._action_class is None:
+            action_class = self._resolver()
+            self.module_name = action_class.__module__
+            self._action_class = action_class
+        return self._action_class
+    
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the plugin module has been imported."""
+        return self._action_class is not None
+    
     def create_instance(self, params: Dict[str, Any],
                         port_registry,
                         execution_context: Optional[Dict[str, Any]] = None) -> BaseAction:
@@ -110,15 +158,24 @@ class PluginLoader:
     
     Discovers Python files in the actions directory, loads them as modules,
     and finds classes that inherit from BaseAction.
+    
+    With ``lazy`` enabled, plugins that have a manifest declaring an
+    ``entry_point`` are registered from the manifest alone and their modules
+    are imported on first use (or by ``prewarm()``). Security-scan verdicts
+    and discovered action classes are cached by file content hash, and
+    persisted to ``cache_path`` when one is given.
     """
     
-    def __init__(self, plugin_directories: List[str] = None, load_order: List[str] = None):
+    def __init__(self, plugin_directories: List[str] = None, load_order: List[str] = None,
+                 lazy: bool = True, cache_path: Optional[str] = None):
         """
         Initialize the plugin loader.
         
         Args:
             plugin_directories: List of directories containing plugin files (relative to scribe root)
             load_order: Order in which to load plugin directories (optional)
+            lazy: Register manifest-described plugins without importing them
+            cache_path: JSON file persisting scan results across restarts (optional)
         """
         # Determine the absolute path to the plugins directories
         scribe_root = Path(__file__).parent.parent
@@ -148,9 +205,88 @@ class PluginLoader:
         self._file_watchers = {}
         self._auto_reload = False
         
+        # Lazy loading and scan caching
+        self.lazy = lazy
+        self.cache_path = Path(cache_path) if cache_path else None
+        self._scan_cache: Dict[str, Dict[str, Any]] = self._load_scan_cache()
+        self._scan_cache_dirty = False
+        self._source_cache: Dict[str, Tuple[int, int, str, str]] = {}
+        self._sys_path_cache: Tuple[Tuple[str, ...], List[Path]] = ((), [])
+        self._resolve_lock = threading.RLock()
+        self._prewarm_thread: Optional[threading.Thread] = None
+        self._manifest_schema: Optional[CompiledSchema] = None
+        self._restored_from_snapshot = False
+        
         logger.info("PluginLoader initialized",
                    plugin_directories=[str(d) for d in self.plugin_directories],
-                   load_order=self.load_order)
+                   load_order=self.load_order,
+                   lazy=lazy)
+    
+    def _resolved_sys_path(self) -> List[Path]:
+        """sys.path entries resolved once per distinct sys.path."""
+        key = tuple(sys.path)
+        if self._sys_path_cache[0] != key:
+            self._sys_path_cache = (key, [Path(p).resolve() for p in key])
+        return self._sys_path_cache[1]
+    
+    def _read_source(self, file_path: str) -> Tuple[str, str]:
+        """Return (content, sha256) of a plugin file, re-reading only when it changes."""
+        stat = os.stat(file_path)
+        cached = self._source_cache.get(file_path)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2], cached[3]
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        content = data.decode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        self._source_cache[file_path] = (stat.st_mtime_ns, stat.st_size, content, digest)
+        return content, digest
+    
+    def _scan_record(self, digest: str) -> Dict[str, Any]:
+        record = self._scan_cache.get(digest)
+        if record is None:
+            record = self._scan_cache[digest] = {}
+        return record
+    
+    def _load_scan_cache(self) -> Dict[str, Dict[str, Any]]:
+        if self.cache_path is None or not self.cache_path.exists():
+            return {}
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") != SCAN_CACHE_VERSION:
+                return {}
+            return data.get("entries", {})
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning("Plugin scan cache unreadable, ignoring", cache_path=str(self.cache_path), error=str(e))
+            return {}
+    
+    def _save_scan_cache(self) -> None:
+        if self.cache_path is None or not self._scan_cache_dirty:
+            return
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_json(self.cache_path, {"version": SCAN_CACHE_VERSION, "entries": self._scan_cache})
+            self._scan_cache_dirty = False
+        except Exception as e:
+            logger.warning("Failed to save plugin scan cache", cache_path=str(self.cache_path), error=str(e))
+    
+    def _remember_classes(self, file_path: str, classes: List[Tuple[str, str]]) -> None:
+        """Cache the (class_name, action_type) pairs found in a plugin file."""
+        _, digest = self._read_source(file_path)
+        record = self._scan_record(digest)
+        if record.get("classes") != [list(c) for c in classes]:
+            record["classes"] = [list(c) for c in classes]
+            self._scan_cache_dirty = True
+    
+    def _plugin_directory_for(self, file_path: str) -> str:
+        plugin_file_path = Path(file_path)
+        for rel_dir, abs_dir in self.directory_map.items():
+            if plugin_file_path.is_relative_to(abs_dir):
+                return rel_dir
+        logger.warning("Plugin file not in any configured directory", 
+                      file_path=file_path)
+        return "unknown"
     
     def discover_plugins(self) -> List[str]:
         """
@@ -205,8 +341,7 @@ class PluginLoader:
 
             # Find the longest sys.path entry that is an ancestor of this file
             longest_ancestor_path = None
-            for p_str in sys.path:
-                p_path = Path(p_str).resolve()
+            for p_path in self._resolved_sys_path():
                 if abs_file_path.is_relative_to(p_path): # Requires Python 3.9+
                     if longest_ancestor_path is None or len(str(p_path)) > len(str(longest_ancestor_path)):
                         longest_ancestor_path = p_path
@@ -326,13 +461,7 @@ class PluginLoader:
                 return action_type.strip()
         
         # Strategy 2: Convert class name to snake_case
-        class_name = action_class.__name__
-        if class_name.endswith('Action'):
-            class_name = class_name[:-6]  # Remove 'Action' suffix
-        
-        # Convert CamelCase to snake_case
-        import re
-        snake_case = re.sub(r'(?<!^)(?=[A-Z])', '_', class_name).lower()
+        snake_case = self.action_type_from_class_name(action_class.__name__)
         
         if snake_case:
             logger.debug("Using snake_case class name",
@@ -347,6 +476,13 @@ class PluginLoader:
                     action_type=file_name)
         return file_name
     
+    @staticmethod
+    def action_type_from_class_name(class_name: str) -> str:
+        """CamelCase class name without its 'Action' suffix, in snake_case."""
+        if class_name.endswith('Action'):
+            class_name = class_name[:-6]  # Remove 'Action' suffix
+        return re.sub(r'(?<!^)(?=[A-Z])', '_', class_name).lower()
+    
     def load_plugin_manifest(self, plugin_directory: Path) -> Optional[Dict[str, Any]]:
         """
         Load and validate plugin manifest file.
@@ -372,7 +508,6 @@ class PluginLoader:
             hma_version = manifest_data.get("hma_compliance", {}).get("hma_version")
             
             # Enforce HMA v2.2 compliance with pattern matching (allows 2.2.x)
-            import re
             version_pattern = r"^2\.2(\.\d+)?$"
             if not manifest_version or not re.match(version_pattern, manifest_version):
                 raise jsonschema.ValidationError(
@@ -397,11 +532,18 @@ class PluginLoader:
             # Load schema for validation
             schema_path = Path(__file__).parent.parent / "schemas" / "plugin_manifest.schema.json"
             if schema_path.exists():
-                with open(schema_path, 'r', encoding='utf-8') as f:
-                    schema = json.load(f)
+                # Compiled once per loader; checking the metaschema on every
+                # manifest dominated registration time
+                if self._manifest_schema is None:
+                    with open(schema_path, 'r', encoding='utf-8') as f:
+                        self._manifest_schema = CompiledSchema(json.load(f))
+                if self._manifest_schema.schema_error:
+                    raise jsonschema.SchemaError(self._manifest_schema.schema_error)
                 
                 # Validate manifest against schema
-                jsonschema.validate(manifest_data, schema)
+                error = self._manifest_schema.first_error(manifest_data)
+                if error is not None:
+                    raise error
                 logger.debug("Plugin manifest HMA v2.2 validation passed", 
                            plugin_directory=str(plugin_directory),
                            manifest_version=manifest_version,
@@ -462,18 +604,7 @@ class PluginLoader:
                                hma_version=manifest.get('hma_compliance', {}).get('hma_version'))
             
             # Determine which directory this plugin belongs to
-            plugin_file_path = Path(file_path)
-            plugin_directory = None
-            
-            for rel_dir, abs_dir in self.directory_map.items():
-                if plugin_file_path.is_relative_to(abs_dir):
-                    plugin_directory = rel_dir
-                    break
-            
-            if plugin_directory is None:
-                logger.warning("Plugin file not in any configured directory", 
-                              file_path=file_path)
-                plugin_directory = "unknown"
+            plugin_directory = self._plugin_directory_for(file_path)
             
             # Load the module
             module = self.load_plugin_module(file_path)
@@ -481,6 +612,8 @@ class PluginLoader:
             
             # Extract action classes
             action_classes = self.extract_action_classes(module, file_path)
+            self._remember_classes(file_path, [(c.__name__, self.determine_action_type(c, file_path))
+                                               for c in action_classes])
             
             if not action_classes:
                 logger.warning("No action classes found in plugin", file_path=file_path)
@@ -523,6 +656,231 @@ class PluginLoader:
         except Exception as e:
             raise PluginLoadError(file_path, f"Unexpected error during plugin loading", e)
     
+    def register_plugin_from_manifest(self, file_path: str) -> Optional[List[PluginInfo]]:
+        """
+        Register a plugin from its manifest without importing its module.
+        
+        The manifest's ``interface_contracts.action_interface.entry_point``
+        ("module.ClassName") names the action class. Action types come from
+        the scan cache when this exact file content has been imported before,
+        otherwise from a string ``ACTION_TYPE`` in the class body or the class
+        name. Other action classes in the module are registered once it is
+        imported (see ``_reconcile_plugins``).
+        
+        Args:
+            file_path: Path to the plugin file
+            
+        Returns:
+            List of registered PluginInfo objects, or None if the plugin has
+            no usable manifest and must be loaded eagerly
+            
+        Raises:
+            PluginLoadError: If the plugin fails security validation
+        """
+        plugin_file_path = Path(file_path)
+        manifest_directory = plugin_file_path.parent / plugin_file_path.stem
+        if not (manifest_directory / "manifest.json").exists():
+            return None
+        
+        if not self.validate_plugin_security(file_path):
+            raise PluginLoadError(file_path, "Plugin failed security validation")
+        
+        manifest = self.load_plugin_manifest(manifest_directory)
+        entry_point = (manifest or {}).get("interface_contracts", {}).get("action_interface", {}).get("entry_point", "")
+        module_name, _, class_name = entry_point.rpartition(".")
+        if not class_name or module_name.split(".")[-1] != plugin_file_path.stem:
+            return None
+        
+        _, digest = self._read_source(file_path)
+        cached_classes = self._scan_cache.get(digest, {}).get("classes")
+        if cached_classes is not None:
+            classes = [tuple(c) for c in cached_classes]
+        else:
+            content, _ = self._read_source(file_path)
+            action_type = self._declared_action_type(content, class_name) or self.action_type_from_class_name(class_name)
+            classes = [(class_name, action_type)]
+        
+        plugin_directory = self._plugin_directory_for(file_path)
+        plugin_infos = []
+        for cls_name, action_type in classes:
+            if action_type in self._plugins:
+                logger.warning("Plugin action type conflict",
+                              action_type=action_type,
+                              new_plugin=file_path,
+                              existing_plugin=self._plugins[action_type].module_path)
+                continue
+            
+            plugin_info = PluginInfo(None, file_path, action_type, manifest, class_name=cls_name,
+                                     resolver=partial(self._resolve_class, file_path, cls_name))
+            plugin_infos.append(plugin_info)
+            self._plugins[action_type] = plugin_info
+            self._plugin_directory_map[action_type] = plugin_directory
+            logger.info("Plugin action registered from manifest",
+                       action_type=action_type,
+                       action_class=cls_name,
+                       plugin_file=file_path,
+                       plugin_directory=plugin_directory)
+        
+        return plugin_infos
+    
+    def _resolve_class(self, file_path: str, class_name: str) -> Type[BaseAction]:
+        """Import a lazily registered plugin and return its action class."""
+        with self._resolve_lock:
+            module = self._loaded_modules.get(file_path)
+            if module is None:
+                # The file may have changed since registration
+                if not self.validate_plugin_security(file_path):
+                    raise PluginLoadError(file_path, "Plugin failed security validation")
+                module = self.load_plugin_module(file_path)
+                self._loaded_modules[file_path] = module
+                action_classes = self.extract_action_classes(module, file_path)
+                classes = [(c.__name__, self.determine_action_type(c, file_path)) for c in action_classes]
+                self._remember_classes(file_path, classes)
+                self._save_scan_cache()
+                self._reconcile_plugins(file_path, module, classes)
+                logger.info("Plugin module imported on first use", plugin_file=file_path)
+            
+            action_class = getattr(module, class_name, None)
+            if not (inspect.isclass(action_class) and issubclass(action_class, BaseAction)):
+                raise PluginLoadError(file_path, f"Manifest entry point class '{class_name}' not found")
+            return action_class
+    
+    @staticmethod
+    def _declared_action_type(content: str, class_name: str) -> Optional[str]:
+        """A string literal ``ACTION_TYPE`` assigned in the body of ``class_name``, if any."""
+        try:
+            tree = ast.parse(content)
+        except SyntaxError:
+            return None
+        for node in tree.body:
+            if not (isinstance(node, ast.ClassDef) and node.name == class_name):
+                continue
+            for statement in node.body:
+                if isinstance(statement, ast.Assign):
+                    targets, value = statement.targets, statement.value
+                elif isinstance(statement, ast.AnnAssign) and statement.value is not None:
+                    targets, value = [statement.target], statement.value
+                else:
+                    continue
+                if any(isinstance(t, ast.Name) and t.id == 'ACTION_TYPE' for t in targets) \
+                        and isinstance(value, ast.Constant) and isinstance(value.value, str) and value.value.strip():
+                    return value.value.strip()
+        return None
+    
+    def _reconcile_plugins(self, file_path: str, module: Any, classes: List[Tuple[str, str]]) -> None:
+        """
+        Bring registrations made before a lazy import in line with the classes
+        the module actually defines, so action types match an eager load.
+        """
+        registered = {info.class_name: (action_type, info)
+                      for action_type, info in self._plugins.items() if info.module_path == file_path}
+        manifest = next((info.manifest for _, info in registered.values()), None)
+        for cls_name, action_type in classes:
+            current = registered.get(cls_name)
+            if current is not None and current[0] == action_type:
+                continue
+            if action_type in self._plugins:
+                logger.warning("Plugin action type conflict",
+                              action_type=action_type,
+                              new_plugin=file_path,
+                              existing_plugin=self._plugins[action_type].module_path)
+                continue
+            
+            if current is not None:
+                old_type, plugin_info = current
+                del self._plugins[old_type]
+                plugin_directory = self._plugin_directory_map.pop(old_type, None)
+                plugin_info.action_type = action_type
+            else:
+                plugin_info = PluginInfo(getattr(module, cls_name), file_path, action_type, manifest)
+                plugin_directory = self._plugin_directory_for(file_path)
+            self._plugins[action_type] = plugin_info
+            if plugin_directory is not None:
+                self._plugin_directory_map[action_type] = plugin_directory
+            logger.info("Plugin action type updated after import",
+                       action_type=action_type,
+                       action_class=cls_name,
+                       plugin_file=file_path)
+    
+    def prewarm(self, background: bool = True) -> Optional[threading.Thread]:
+        """
+        Import every lazily registered plugin module.
+        
+        Args:
+            background: Run in a daemon thread and return it, instead of blocking
+            
+        Returns:
+            The pre-warm thread when running in the background, otherwise None
+        """
+        pending = [info for info in self._plugins.values() if not info.is_loaded]
+        
+        def run():
+            for plugin_info in pending:
+                try:
+                    plugin_info.action_class
+                except Exception as e:
+                    logger.error("Plugin pre-warm failed",
+                                action_type=plugin_info.action_type,
+                                plugin_file=plugin_info.module_path,
+                                error=str(e))
+            logger.info("Plugin pre-warm completed", plugins=len(pending))
+        
+        if not pending:
+            return None
+        if not background:
+            run()
+            return None
+        self._prewarm_thread = threading.Thread(target=run, name="scribe-plugin-prewarm", daemon=True)
+        self._prewarm_thread.start()
+        return self._prewarm_thread
+    
+    def snapshot_state(self) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Registry state for the engine state snapshot.
+        
+        Sources are the plugin directories, every discovered plugin file and
+        its manifest path, so adding, removing or editing any plugin
+        invalidates the saved registry.
+        """
+        plugins = [{
+            "action_type": info.action_type,
+            "module_path": info.module_path,
+            "class_name": info.class_name,
+            "manifest": info.manifest,
+            "plugin_directory": self._plugin_directory_map.get(action_type),
+        } for action_type, info in self._plugins.items()]
+        
+        sources = [str(d) for d in self.plugin_directories]
+        for file_path in self.discover_plugins():
+            plugin_file_path = Path(file_path)
+            sources.append(file_path)
+            sources.append(str(plugin_file_path.parent / plugin_file_path.stem / "manifest.json"))
+        
+        data = {"directories": [str(d) for d in self.plugin_directories], "lazy": self.lazy, "plugins": plugins}
+        return data, sources
+    
+    def restore_state(self, data: Dict[str, Any]) -> bool:
+        """
+        Adopt a saved registry; the next ``load_all_plugins()`` returns it
+        without scanning or validating manifests. Modules are imported on
+        first use, as for lazily registered plugins.
+        """
+        if not self.lazy or data.get("directories") != [str(d) for d in self.plugin_directories]:
+            return False
+        
+        self._plugins.clear()
+        self._loaded_modules.clear()
+        self._plugin_directory_map.clear()
+        for entry in data["plugins"]:
+            action_type, file_path, class_name = entry["action_type"], entry["module_path"], entry["class_name"]
+            self._plugins[action_type] = PluginInfo(
+                None, file_path, action_type, entry["manifest"], class_name=class_name,
+                resolver=partial(self._resolve_class, file_path, class_name))
+            if entry.get("plugin_directory"):
+                self._plugin_directory_map[action_type] = entry["plugin_directory"]
+        self._restored_from_snapshot = True
+        return True
+    
     def load_all_plugins(self) -> Dict[str, PluginInfo]:
         """
         Discover and load all plugins with dependency resolution.
@@ -530,6 +888,14 @@ class PluginLoader:
         Returns:
             Dictionary mapping action types to PluginInfo objects
         """
+        if self._restored_from_snapshot:
+            # Only the first load after a restore skips discovery
+            self._restored_from_snapshot = False
+            logger.info("Plugin registry restored from state snapshot",
+                       plugins=len(self._plugins),
+                       action_types=list(self._plugins.keys()))
+            return self._plugins
+        
         logger.info("Starting plugin loading process")
         
         # Clear existing plugins
@@ -549,7 +915,9 @@ class PluginLoader:
         
         for plugin_file in plugin_files:
             try:
-                plugin_infos = self.load_plugin(plugin_file)
+                plugin_infos = self.register_plugin_from_manifest(plugin_file) if self.lazy else None
+                if plugin_infos is None:
+                    plugin_infos = self.load_plugin(plugin_file)
                 
                 for plugin_info in plugin_infos:
                     self._plugins[plugin_info.action_type] = plugin_info
@@ -567,10 +935,13 @@ class PluginLoader:
                             exc_info=True)
                 failed_count += 1
         
+        self._save_scan_cache()
+        
         logger.info("Plugin loading completed",
                    total_discovered=len(plugin_files),
                    successfully_loaded=loaded_count,
                    failed_to_load=failed_count,
+                   deferred_imports=sum(not info.is_loaded for info in self._plugins.values()),
                    action_types=list(self._plugins.keys()))
         
         return self._plugins
@@ -651,9 +1022,12 @@ class PluginLoader:
         return {
             'total_plugins': len(self._plugins),
             'loaded_modules': len(self._loaded_modules),
+            'deferred_plugins': sum(not info.is_loaded for info in self._plugins.values()),
             'action_types': list(self._plugins.keys()),
             'plugin_files': len(self._loaded_modules),
-            'plugins_directory': [str(d) for d in self.plugin_directories]
+            'plugins_directory': [str(d) for d in self.plugin_directories],
+            'lazy': self.lazy,
+            'scan_cache_entries': len(self._scan_cache)
         }
     
     def enable_hot_reload(self) -> None:
@@ -721,36 +1095,20 @@ class PluginLoader:
             True if plugin passes security validation
         """
         try:
-            # Read plugin file content
-            with open(plugin_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Security checks
-            dangerous_imports = [
-                'subprocess', 'os.system', 'eval', 'exec', '__import__',
-                'importlib.import_module', 'open', 'file'
-            ]
-            
-            dangerous_functions = [
-                'eval(', 'exec(', 'compile(', '__import__(',
-                'getattr(', 'setattr(', 'delattr(', 'globals(', 'locals('
-            ]
-            
-            # Check for dangerous imports
-            for dangerous_import in dangerous_imports:
-                if dangerous_import in content:
-                    logger.warning("Plugin contains potentially dangerous import",
-                                  plugin_path=plugin_path,
-                                  dangerous_pattern=dangerous_import)
-                    return False
-            
-            # Check for dangerous function calls
-            for dangerous_func in dangerous_functions:
-                if dangerous_func in content:
-                    logger.warning("Plugin contains potentially dangerous function",
-                                  plugin_path=plugin_path,
-                                  dangerous_pattern=dangerous_func)
-                    return False
+            # Content scan results are cached by file hash
+            content, digest = self._read_source(plugin_path)
+            record = self._scan_record(digest)
+            if "security" not in record:
+                record["security"] = self._scan_source(content)
+                self._scan_cache_dirty = True
+            
+            finding = record["security"]
+            if finding:
+                kind, pattern = finding
+                logger.warning(f"Plugin contains potentially dangerous {kind}",
+                              plugin_path=plugin_path,
+                              dangerous_pattern=pattern)
+                return False
             
             # Check file permissions (should not be world-writable)
             plugin_file = Path(plugin_path)
@@ -769,6 +1127,20 @@ class PluginLoader:
                         error=str(e))
             return False
     
+    @staticmethod
+    def _scan_source(content: str) -> Optional[List[str]]:
+        """Return [kind, pattern] for the first dangerous pattern in content, or None."""
+        # Check for dangerous imports
+        for dangerous_import in DANGEROUS_IMPORTS:
+            if dangerous_import in content:
+                return ["import", dangerous_import]
+        
+        # Check for dangerous function calls
+        for dangerous_func in DANGEROUS_FUNCTIONS:
+            if dangerous_func in content:
+                return ["function", dangerous_func]
+        return None
+    
     def add_plugin_directory(self, directory: str, position: int = -1) -> bool:
         """
         Add a new plugin directory at runtime.
@@ -888,12 +1260,10 @@ class PluginLoader:
         """
         dependencies = []
         try:
-            with open(plugin_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content, _ = self._read_source(plugin_path)
             
             # Look for dependency declarations in comments
             # Format: # DEPENDENCIES: plugin1, plugin2, plugin3
-            import re
             dep_pattern = r'#\s*DEPENDENCIES:\s*([^\n]+)'
             matches = re.findall(dep_pattern, content, re.IGNORECASE)
             
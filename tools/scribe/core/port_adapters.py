@@ -25,7 +25,6 @@ from .hma_ports import (
 from .boundary_validator import BoundaryValidator
 from .hma_telemetry import HMATelemetry
 from .mtls import get_mtls_manager, MTLSConfig
-from .vault_certificate_manager import get_vault_certificate_manager
 from .logging_config import get_scribe_logger
 
 logger = get_scribe_logger(__name__)
@@ -75,6 +74,7 @@ class ScribePluginExecutionAdapter(PluginExecutionPort):
                 # Try Vault certificates first if Vault is enabled
                 if self.config_manager and self.config_manager.is_vault_enabled():
                     try:
+                        from .vault_certificate_manager import get_vault_certificate_manager
                         vault_cert_manager = get_vault_certificate_manager(self.config_manager)
                         mtls_config = vault_cert_manager.get_mtls_config(
                             common_name="scribe.local",
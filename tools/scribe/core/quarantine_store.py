@@ -0,0 +1,267 @@
+"""
+Scribe Quarantine Store
+
+Content-addressed storage for files quarantined by the ActionDispatcher:
+
+    <root>/blobs/ab/ab12...ef     one blob per SHA-256 of the file content
+    <root>/index.jsonl            append-only (hash, path, rule, reason, time) entries
+
+A file whose content is already stored costs one index append instead of a
+copy. Retention (age of the newest reference) and a total size quota are
+enforced by evicting least-recently quarantined blobs and compacting the
+index.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .atomic_write import atomic_write
+from .logging_config import get_scribe_logger
+
+logger = get_scribe_logger(__name__)
+
+INDEX_FILE = "index.jsonl"
+BLOB_DIR = "blobs"
+CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass
+class QuarantineConfig:
+    """Retention and quota settings for the quarantine store."""
+    max_bytes: int = 1024 * 1024 * 1024
+    retention_seconds: float = 30 * 24 * 3600
+    # Check quotas every N index appends (0 disables automatic enforcement)
+    enforce_every: int = 100
+
+
+@dataclass
+class QuarantineEntry:
+    """One quarantine event; many entries may share a blob."""
+    hash: str
+    size: int
+    path: str
+    rule_id: str
+    reason: str
+    ts: float
+
+
+@dataclass
+class _Blob:
+    size: int
+    first_seen: float
+    last_seen: float
+    refs: int = 0
+
+
+class QuarantineStore:
+    """
+    Deduplicating quarantine store rooted at ``root``.
+
+    The index is loaded into memory on creation, so ``contains()`` is a set
+    lookup. Directories are created on the first write.
+    """
+
+    def __init__(self, root: os.PathLike, config: Optional[QuarantineConfig] = None):
+        self.root = Path(root)
+        self.config = config or QuarantineConfig()
+        self.index_path = self.root / INDEX_FILE
+        self._lock = threading.RLock()
+        self._blobs: Dict[str, _Blob] = {}
+        self._entries: List[QuarantineEntry] = []
+        self._total_bytes = 0
+        self._appends_since_enforce = 0
+        self._stats = {
+            "quarantined": 0,
+            "blobs_written": 0,
+            "deduplicated": 0,
+            "bytes_saved": 0,
+            "blobs_evicted": 0,
+            "compactions": 0,
+        }
+        self._load_index()
+
+    # -- public API -------------------------------------------------------
+
+    def contains(self, digest: str) -> bool:
+        """True if a blob with this SHA-256 hex digest is stored."""
+        return digest in self._blobs
+
+    def contains_file(self, file_path: os.PathLike) -> bool:
+        """True if the current content of ``file_path`` is already quarantined."""
+        return self.contains(self.hash_file(file_path))
+
+    def blob_path(self, digest: str) -> Path:
+        return self.root / BLOB_DIR / digest[:2] / digest
+
+    def entries(self, digest: Optional[str] = None, path: Optional[str] = None) -> List[QuarantineEntry]:
+        """Index entries, optionally for one blob or one original path."""
+        with self._lock:
+            return [e for e in self._entries
+                    if (digest is None or e.hash == digest) and (path is None or e.path == path)]
+
+    def quarantine(self, file_path: os.PathLike, rule_id: str, reason: str) -> Tuple[QuarantineEntry, bool]:
+        """
+        Store the content of ``file_path`` and record why.
+
+        Returns the index entry and whether the content was already stored
+        (in which case no blob was written).
+        """
+        source = Path(file_path)
+        with self._lock:
+            digest, size = self.hash_file(source), source.stat().st_size
+            deduplicated = digest in self._blobs
+            if deduplicated:
+                self._stats["deduplicated"] += 1
+                self._stats["bytes_saved"] += size
+            else:
+                self._write_blob(source, digest)
+                self._stats["blobs_written"] += 1
+
+            entry = QuarantineEntry(digest, size, str(source), rule_id, reason, time.time())
+            self._append(entry)
+            self._stats["quarantined"] += 1
+
+            self._appends_since_enforce += 1
+            if self.config.enforce_every and (self._appends_since_enforce >= self.config.enforce_every
+                                              or self._total_bytes > self.config.max_bytes):
+                self.enforce_retention()
+            return entry, deduplicated
+
+    def restore(self, digest: str, destination: os.PathLike) -> Path:
+        """Write a stored blob back to ``destination``."""
+        blob = self.blob_path(digest)
+        if not blob.exists():
+            raise FileNotFoundError(f"No quarantined content with hash {digest}")
+        with open(blob, "rb") as f:
+            atomic_write(destination, f.read(), mode="wb")
+        return Path(destination)
+
+    def enforce_retention(self, now: Optional[float] = None) -> int:
+        """
+        Drop index entries older than ``retention_seconds`` and the blobs left
+        without entries, then evict the least recently quarantined blobs until
+        under ``max_bytes``. Returns the number of blobs evicted.
+        """
+        now = now if now is not None else time.time()
+        with self._lock:
+            self._appends_since_enforce = 0
+            cutoff = now - self.config.retention_seconds
+            expired = [d for d, blob in self._blobs.items() if blob.last_seen < cutoff]
+            total = self._total_bytes - sum(self._blobs[d].size for d in expired)
+            if total > self.config.max_bytes:
+                evicted = set(expired)
+                survivors = sorted((d for d in self._blobs if d not in evicted),
+                                   key=lambda d: self._blobs[d].last_seen)
+                for digest in survivors:
+                    if total <= self.config.max_bytes:
+                        break
+                    expired.append(digest)
+                    total -= self._blobs[digest].size
+            stale_entries = any(e.ts < cutoff for e in self._entries)
+            if not expired and not stale_entries:
+                return 0
+
+            for digest in expired:
+                blob = self._blobs.pop(digest)
+                self._total_bytes -= blob.size
+                try:
+                    self.blob_path(digest).unlink()
+                except FileNotFoundError:
+                    pass
+            self._stats["blobs_evicted"] += len(expired)
+            self._compact(cutoff)
+            logger.info("Quarantine retention enforced", evicted=len(expired),
+                        blobs=len(self._blobs), entries=len(self._entries), total_bytes=self._total_bytes)
+            return len(expired)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._stats,
+                "blobs": len(self._blobs),
+                "entries": len(self._entries),
+                "total_bytes": self._total_bytes,
+                "max_bytes": self.config.max_bytes,
+            }
+
+    @staticmethod
+    def hash_file(file_path: os.PathLike) -> str:
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    # -- internals --------------------------------------------------------
+
+    def _write_blob(self, source: Path, digest: str) -> None:
+        target = self.blob_path(digest)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=target.parent, prefix=f".{digest[:8]}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as out, open(source, "rb") as src:
+                for chunk in iter(lambda: src.read(CHUNK_SIZE), b""):
+                    out.write(chunk)
+            os.replace(temp_path, target)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except FileNotFoundError:
+                pass
+            raise
+
+    def _append(self, entry: QuarantineEntry) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        with open(self.index_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(asdict(entry), separators=(",", ":")) + "\n")
+        self._track(entry)
+
+    def _track(self, entry: QuarantineEntry) -> None:
+        blob = self._blobs.get(entry.hash)
+        if blob is None:
+            blob = self._blobs[entry.hash] = _Blob(entry.size, entry.ts, entry.ts)
+            self._total_bytes += entry.size
+        blob.first_seen = min(blob.first_seen, entry.ts)
+        blob.last_seen = max(blob.last_seen, entry.ts)
+        blob.refs += 1
+        self._entries.append(entry)
+
+    def _compact(self, cutoff: float) -> None:
+        """Rewrite the index without expired entries or entries for evicted blobs."""
+        self._entries = [e for e in self._entries if e.hash in self._blobs and e.ts >= cutoff]
+        for blob in self._blobs.values():
+            blob.refs = 0
+        for entry in self._entries:
+            self._blobs[entry.hash].refs += 1
+        data = "".join(json.dumps(asdict(e), separators=(",", ":")) + "\n" for e in self._entries)
+        atomic_write(self.index_path, data)
+        self._stats["compactions"] += 1
+
+    def _load_index(self) -> None:
+        if not self.index_path.exists():
+            return
+        skipped = 0
+        present: Dict[str, bool] = {}
+        with open(self.index_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = QuarantineEntry(**json.loads(line))
+                except (ValueError, TypeError):
+                    skipped += 1  # torn final append
+                    continue
+                if entry.hash not in present:
+                    present[entry.hash] = self.blob_path(entry.hash).exists()
+                if present[entry.hash]:
+                    self._track(entry)
+                else:
+                    skipped += 1
+        if skipped:
+            logger.warning("Skipped unusable quarantine index entries", skipped=skipped,
+                           index_path=str(self.index_path))
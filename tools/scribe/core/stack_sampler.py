@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Scribe Engine Stack Sampler
+
+In-process, thread-based wall-clock sampling profiler used by the health
+server's /debug endpoints. A sampler thread snapshots every thread's Python
+stack with sys._current_frames() at a fixed interval; nothing is installed
+in the profiled threads, so the engine runs unmodified between requests.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+import traceback
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .logging_config import get_scribe_logger
+
+logger = get_scribe_logger(__name__)
+
+# (function name, file name, first line of the function)
+FrameKey = Tuple[str, str, int]
+StackKey = Tuple[str, Tuple[FrameKey, ...]]
+
+
+@dataclass
+class ProfileResult:
+    """Aggregated samples from one profiling window."""
+    interval: float
+    duration: float = 0.0
+    samples: int = 0
+    sampler_cpu_seconds: float = 0.0
+    stacks: Dict[StackKey, int] = field(default_factory=dict)
+
+    @property
+    def overhead_percent(self) -> float:
+        """CPU used by the sampler thread as a percentage of one core."""
+        if not self.duration:
+            return 0.0
+        return round(self.sampler_cpu_seconds / self.duration * 100, 3)
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "duration_seconds": round(self.duration, 3),
+            "interval_seconds": self.interval,
+            "samples": self.samples,
+            "unique_stacks": len(self.stacks),
+            "sampler_cpu_seconds": round(self.sampler_cpu_seconds, 4),
+            "sampler_overhead_percent": self.overhead_percent,
+        }
+
+    def to_collapsed(self) -> str:
+        """Brendan Gregg collapsed format: ``thread;outer;...;inner count`` per line."""
+        lines = []
+        for (thread_name, frames), count in sorted(self.stacks.items(), key=lambda item: -item[1]):
+            names = [_collapsed_name(thread_name)]
+            names.extend(_collapsed_name(f"{name} ({filename}:{line})") for name, filename, line in frames)
+            lines.append(f"{';'.join(names)} {count}")
+        return "\n".join(lines) + ("\n" if lines else "")
+
+    def to_speedscope(self, name: str = "scribe") -> Dict[str, Any]:
+        """Speedscope file format with one sampled profile per thread."""
+        frame_index: Dict[FrameKey, int] = {}
+        frames: List[Dict[str, Any]] = []
+        profiles: Dict[str, Dict[str, Any]] = {}
+
+        for (thread_name, stack), count in self.stacks.items():
+            indices = []
+            for key in stack:
+                index = frame_index.get(key)
+                if index is None:
+                    index = frame_index[key] = len(frames)
+                    frames.append({"name": key[0], "file": key[1], "line": key[2]})
+                indices.append(index)
+            profile = profiles.get(thread_name)
+            if profile is None:
+                profile = profiles[thread_name] = {
+                    "type": "sampled",
+                    "name": thread_name,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": round(self.duration, 6),
+                    "samples": [],
+                    "weights": [],
+                }
+            profile["samples"].append(indices)
+            profile["weights"].append(round(count * self.interval, 6))
+
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "scribe-stack-sampler",
+            "activeProfileIndex": 0,
+            "shared": {"frames": frames},
+            "profiles": list(profiles.values()),
+            "scribe_sampler": self.summary(),
+        }
+
+
+def _collapsed_name(name: str) -> str:
+    # ';' separates frames and the last space separates the count
+    return name.replace(";", ":").replace(" ", "_") if (";" in name or " " in name) else name
+
+
+class StackSampler:
+    """
+    Samples all Python thread stacks for a bounded window.
+
+    Only one profile runs at a time; the sampler thread and the thread that
+    requested the profile are excluded from the samples.
+    """
+
+    def __init__(self, interval: float = 0.005, max_depth: int = 128):
+        """
+        Args:
+            interval: Seconds between samples
+            max_depth: Frames kept per stack, innermost first
+        """
+        self.interval = interval
+        self.max_depth = max_depth
+        self._busy = threading.Lock()
+        self._frame_keys: Dict[Any, FrameKey] = {}
+
+    @property
+    def running(self) -> bool:
+        return self._busy.locked()
+
+    def profile(self, seconds: float) -> ProfileResult:
+        """
+        Sample for ``seconds`` and return the aggregated stacks.
+
+        Raises:
+            RuntimeError: If another profile is already running
+        """
+        if not self._busy.acquire(blocking=False):
+            raise RuntimeError("A profile is already running")
+        try:
+            result = ProfileResult(interval=self.interval)
+            caller = threading.get_ident()
+            sampler = threading.Thread(target=self._run, args=(seconds, caller, result),
+                                       name="ScribeStackSampler", daemon=True)
+            sampler.start()
+            sampler.join()
+            logger.info("Stack profile captured", **result.summary())
+            return result
+        finally:
+            self._busy.release()
+
+    def _run(self, seconds: float, caller: int, result: ProfileResult) -> None:
+        own = threading.get_ident()
+        excluded = {own, caller}
+        thread_names: Dict[int, str] = {}
+        stacks = result.stacks
+        cpu_start = time.thread_time()
+        start = time.perf_counter()
+        deadline = start + seconds
+        next_sample = start
+
+        while True:
+            now = time.perf_counter()
+            if now >= deadline:
+                break
+            for ident, frame in sys._current_frames().items():
+                if ident in excluded:
+                    continue
+                thread_name = thread_names.get(ident)
+                if thread_name is None:
+                    thread_names.update((t.ident, t.name) for t in threading.enumerate())
+                    thread_name = thread_names.setdefault(ident, f"thread-{ident}")
+                key = (thread_name, self._stack_key(frame))
+                stacks[key] = stacks.get(key, 0) + 1
+            result.samples += 1
+            frame = None
+
+            next_sample += self.interval
+            delay = next_sample - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # Fell behind; resynchronise rather than sampling in a burst
+                next_sample = time.perf_counter()
+
+        result.duration = time.perf_counter() - start
+        result.sampler_cpu_seconds = time.thread_time() - cpu_start
+
+    def _stack_key(self, frame) -> Tuple[FrameKey, ...]:
+        keys = []
+        frame_keys = self._frame_keys
+        while frame is not None and len(keys) < self.max_depth:
+            code = frame.f_code
+            key = frame_keys.get(code)
+            if key is None:
+                key = frame_keys[code] = (code.co_name, code.co_filename, code.co_firstlineno)
+            keys.append(key)
+            frame = frame.f_back
+        keys.reverse()
+        return tuple(keys)
+
+
+def dump_threads(limit: int = 64) -> List[Dict[str, Any]]:
+    """Current stack of every Python thread, outermost frame first."""
+    names = {thread.ident: thread for thread in threading.enumerate()}
+    threads = []
+    for ident, frame in sys._current_frames().items():
+        thread = names.get(ident)
+        stack = traceback.extract_stack(frame, limit=limit)
+        threads.append({
+            "ident": ident,
+            "name": thread.name if thread else f"thread-{ident}",
+            "daemon": thread.daemon if thread else None,
+            "stack": [f"{entry.filename}:{entry.lineno} in {entry.name}" for entry in stack],
+        })
+    return threads
+
+
+def dump_asyncio_tasks(loops: Iterable[asyncio.AbstractEventLoop], limit: int = 32) -> List[Dict[str, Any]]:
+    """Pending tasks of the given event loops with their coroutine stacks."""
+    tasks = []
+    for loop in loops:
+        if loop.is_closed():
+            continue
+        try:
+            loop_tasks = list(asyncio.all_tasks(loop))
+        except RuntimeError:
+            # The loop's task set changed size while being read from another thread
+            continue
+        for task in loop_tasks:
+            coro = task.get_coro()
+            entry = {
+                "loop": f"{type(loop).__name__}@{id(loop):#x}",
+                "name": task.get_name(),
+                "coroutine": getattr(coro, "__qualname__", repr(coro)),
+                "done": task.done(),
+                "cancelled": task.cancelled(),
+                "stack": [],
+            }
+            for frame in task.get_stack(limit=limit):
+                entry["stack"].append(f"{frame.f_code.co_filename}:{frame.f_lineno} in {frame.f_code.co_name}")
+            tasks.append(entry)
+    return tasks
+
+
+class EventLoopRegistry:
+    """Weak registry of event loops whose tasks /debug/tasks should report."""
+
+    def __init__(self):
+        self._loops: "weakref.WeakSet[asyncio.AbstractEventLoop]" = weakref.WeakSet()
+        self._lock = threading.Lock()
+
+    def register(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        """Register ``loop``, or the running loop when called from a coroutine."""
+        loop = loop or asyncio.get_running_loop()
+        with self._lock:
+            self._loops.add(loop)
+
+    def loops(self) -> List[asyncio.AbstractEventLoop]:
+        with self._lock:
+            return list(self._loops)
@@ -0,0 +1,287 @@
+"""
+Scribe Engine State Snapshot
+
+Persists derived engine state so a restart can resume warm instead of
+rebuilding it. Components take part by implementing:
+
+    snapshot_state() -> (data, source_paths)   JSON-serialisable data and the
+                                                files/directories it derives from
+    restore_state(data) -> bool                 adopt previously saved data
+
+The snapshot is one versioned JSON file. Each section records a fingerprint
+(size, mtime_ns, SHA-256) of every source path; on restore a section is only
+handed back to its component if all of its sources are unchanged. Sources
+whose size and mtime match are trusted without rehashing; directories are
+compared by their sorted listing.
+
+``FileStatManifest`` is the same idea for a large file set: a persisted
+(size, mtime_ns) -> content hash map that lets scanners skip reading files
+that have not changed since the last run.
+
+Such files live in the state directory (``SCRIBE_STATE_DIR``, default
+``.scribe-state`` at the repository root), which is gitignored.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Protocol, Tuple
+
+from .atomic_write import atomic_write_json
+from .logging_config import get_scribe_logger
+
+logger = get_scribe_logger(__name__)
+
+SNAPSHOT_VERSION = 1
+CHUNK_SIZE = 1024 * 1024
+
+# Files modified this recently are not recorded in a FileStatManifest, since a
+# same-size rewrite within the same mtime tick would go unnoticed on the next run
+MTIME_SAFETY_WINDOW_NS = 2_000_000_000
+
+# tools/scribe/core/state_snapshot.py -> repository root
+_REPO_ROOT = Path(__file__).resolve().parents[3]
+
+
+def state_dir() -> Path:
+    """Directory for derived state kept across restarts (not tracked by git)."""
+    return Path(os.environ.get("SCRIBE_STATE_DIR") or _REPO_ROOT / ".scribe-state")
+
+
+class SnapshotParticipant(Protocol):
+    def snapshot_state(self) -> Tuple[Dict[str, Any], List[str]]: ...
+
+    def restore_state(self, data: Dict[str, Any]) -> bool: ...
+
+
+def hash_file(path: os.PathLike) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _listing_digest(path: Path) -> str:
+    return hashlib.sha256("\n".join(sorted(os.listdir(path))).encode("utf-8")).hexdigest()
+
+
+def fingerprint(path: os.PathLike) -> Optional[Dict[str, Any]]:
+    """Size, mtime and content (or directory listing) hash; None if missing."""
+    source = Path(path)
+    try:
+        st = source.stat()
+        digest = _listing_digest(source) if source.is_dir() else hash_file(source)
+    except FileNotFoundError:
+        return None
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": digest}
+
+
+def source_unchanged(path: os.PathLike, recorded: Optional[Dict[str, Any]]) -> bool:
+    """Whether ``path`` still matches the fingerprint recorded for it."""
+    source = Path(path)
+    try:
+        st = source.stat()
+    except FileNotFoundError:
+        return recorded is None
+    if recorded is None:
+        return False
+    if source.is_dir():
+        return _listing_digest(source) == recorded["sha256"]
+    if st.st_size != recorded["size"]:
+        return False
+    if st.st_mtime_ns == recorded["mtime_ns"]:
+        return True
+    # Touched but possibly identical content
+    return hash_file(source) == recorded["sha256"]
+
+
+class EngineStateSnapshot:
+    """
+    Versioned snapshot of registered components' derived state.
+
+    ``save()`` is called on graceful shutdown and by the periodic writer;
+    ``restore()`` on start, before the components rebuild their state. Each
+    participant is offered its section once, so participants registered
+    after an earlier ``restore()`` can be restored by calling it again.
+    """
+
+    def __init__(self, path: os.PathLike, max_age_seconds: Optional[float] = None):
+        self.path = Path(path)
+        self.max_age_seconds = max_age_seconds
+        self._participants: Dict[str, SnapshotParticipant] = {}
+        self._offered: set = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stats = {
+            "saves": 0,
+            "save_failures": 0,
+            "restored_sections": 0,
+            "stale_sections": 0,
+            "last_save_ms": None,
+            "last_restore_ms": None,
+        }
+
+    def register(self, name: str, participant: SnapshotParticipant) -> None:
+        self._participants[name] = participant
+
+    def save(self) -> bool:
+        """Write every participant's state; returns False if the write failed."""
+        started = time.perf_counter()
+        sections = {}
+        for name, participant in list(self._participants.items()):
+            try:
+                data, sources = participant.snapshot_state()
+                sections[name] = {"sources": {str(p): fingerprint(p) for p in sources}, "data": data}
+            except Exception as e:
+                logger.error("State snapshot section failed", section=name, error=str(e))
+
+        snapshot = {"version": SNAPSHOT_VERSION, "created_at": time.time(), "sections": sections}
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            ok = atomic_write_json(self.path, snapshot, indent=None)
+            self._stats["saves" if ok else "save_failures"] += 1
+            self._stats["last_save_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        if ok:
+            logger.info("Engine state snapshot saved", path=str(self.path), sections=list(sections),
+                        duration_ms=self._stats["last_save_ms"])
+        return ok
+
+    def restore(self) -> Dict[str, str]:
+        """
+        Hand each participant not offered a section yet its section if the
+        section's sources are unchanged. Returns section name -> "restored",
+        "stale", "missing" or "failed" for those participants.
+        """
+        started = time.perf_counter()
+        pending = {name: p for name, p in self._participants.items() if name not in self._offered}
+        self._offered.update(pending)
+        results = {name: "missing" for name in pending}
+        if not pending:
+            return results
+        snapshot = self._load()
+        if snapshot is None:
+            return results
+
+        for name, participant in pending.items():
+            section = snapshot["sections"].get(name)
+            if section is None:
+                continue
+            stale = [p for p, recorded in section["sources"].items() if not source_unchanged(p, recorded)]
+            if stale:
+                results[name] = "stale"
+                self._stats["stale_sections"] += 1
+                logger.info("State snapshot section is stale", section=name, changed_sources=stale[:10])
+                continue
+            try:
+                restored = participant.restore_state(section["data"])
+            except Exception as e:
+                logger.error("State snapshot restore failed", section=name, error=str(e))
+                restored = False
+            results[name] = "restored" if restored else "failed"
+            self._stats["restored_sections"] += restored
+
+        self._stats["last_restore_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        logger.info("Engine state snapshot restored", path=str(self.path), sections=results,
+                    duration_ms=self._stats["last_restore_ms"])
+        return results
+
+    def start_periodic(self, interval_seconds: float) -> threading.Thread:
+        """Save every ``interval_seconds`` on a daemon thread until ``stop_periodic()``."""
+        self._stop.clear()
+
+        def run():
+            while not self._stop.wait(interval_seconds):
+                self.save()
+
+        self._thread = threading.Thread(target=run, name="scribe-state-snapshot", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop_periodic(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self._stats, "path": str(self.path), "sections": list(self._participants)}
+
+    def _load(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Unreadable engine state snapshot ignored", path=str(self.path), error=str(e))
+            return None
+
+        if snapshot.get("version") != SNAPSHOT_VERSION:
+            logger.info("Engine state snapshot version mismatch, ignoring",
+                        found=snapshot.get("version"), expected=SNAPSHOT_VERSION)
+            return None
+        age = time.time() - snapshot.get("created_at", 0)
+        if self.max_age_seconds is not None and age > self.max_age_seconds:
+            logger.info("Engine state snapshot too old, ignoring", age_seconds=round(age),
+                        max_age_seconds=self.max_age_seconds)
+            return None
+        return snapshot
+
+
+class FileStatManifest:
+    """
+    Persisted map of path -> (size, mtime_ns, content hash).
+
+    ``lookup()`` returns the recorded hash when a file's size and mtime are
+    unchanged, so the caller can skip reading it. Entries not recorded again
+    since ``load()`` are dropped on ``save()``, and files modified within
+    ``MTIME_SAFETY_WINDOW_NS`` are not recorded.
+    """
+
+    def __init__(self, path: os.PathLike):
+        self.path = Path(path)
+        self._entries: Dict[str, List[Any]] = {}
+        self._seen: set = set()
+        self.hits = 0
+        self.misses = 0
+        self.load()
+
+    def load(self) -> None:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning("Unreadable file stat manifest ignored", path=str(self.path), error=str(e))
+            return
+        if data.get("version") == SNAPSHOT_VERSION:
+            self._entries = data.get("files", {})
+
+    def lookup(self, key: str, st: os.stat_result) -> Optional[str]:
+        """The recorded content hash if ``st`` matches the recorded stat."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+            self._seen.add(key)
+            self.hits += 1
+            return entry[2]
+        self.misses += 1
+        return None
+
+    def record(self, key: str, st: os.stat_result, content_hash: str) -> None:
+        if time.time_ns() - st.st_mtime_ns < MTIME_SAFETY_WINDOW_NS:
+            self._entries.pop(key, None)
+            self._seen.discard(key)
+            return
+        self._entries[key] = [st.st_size, st.st_mtime_ns, content_hash]
+        self._seen.add(key)
+
+    def save(self) -> bool:
+        files = {k: v for k, v in self._entries.items() if k in self._seen}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        return atomic_write_json(self.path, {"version": SNAPSHOT_VERSION, "files": files}, indent=None)
@@ -6,25 +6,19 @@ Implements HMA v2.2 mandatory boundary telemetry requirements using OpenTelemetr
 Provides tracing, metrics, and logging for all boundary interfaces.
 """
 
+import importlib.util
+import random
 import time
 import threading
 from typing import Dict, Any, Optional, List, Union
 from contextlib import contextmanager
 import structlog
 
+# Only the OpenTelemetry API is imported here. The SDK, OTLP exporters and
+# instrumentations cost ~200ms and are imported when telemetry is enabled.
 try:
     from opentelemetry import trace, metrics
-    from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
-    from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import OTLPMetricExporter
-    from opentelemetry.sdk.trace import TracerProvider
-    from opentelemetry.sdk.trace.export import BatchSpanProcessor
-    from opentelemetry.sdk.metrics import MeterProvider
-    from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
-    from opentelemetry.sdk.resources import Resource
-    from opentelemetry.semconv.resource import ResourceAttributes
-    from opentelemetry.instrumentation.requests import RequestsInstrumentor
-    from opentelemetry.instrumentation.threading import ThreadingInstrumentor
-    OTEL_AVAILABLE = True
+    OTEL_AVAILABLE = importlib.util.find_spec("opentelemetry.sdk") is not None
 except ImportError:
     OTEL_AVAILABLE = False
 
@@ -96,6 +90,66 @@ class MockGauge:
         pass
 
 
+# Shared span handed to unsampled boundary calls; every method is a no-op
+_NOOP_SPAN = MockSpan()
+
+
+def _mark_span_error(span, exception: Exception) -> None:
+    """Record an exception on a span and flag it as failed."""
+    span.record_exception(exception)
+    if OTEL_AVAILABLE:
+        span.set_status(trace.Status(trace.StatusCode.ERROR, str(exception)))
+
+
+class _BoundaryLabels:
+    """
+    Metric attribute sets and span name for one (interface, protocol,
+    operation) triple, built once and reused by every call.
+    """
+
+    __slots__ = ("span_name", "calls", "success", "error", "span_attributes", "unsampled")
+
+    def __init__(self, manager: 'TelemetryManager', interface_type: str, protocol: str, operation: str):
+        self.span_name = f"{interface_type}_{protocol}_{operation}"
+        self.calls = {
+            "interface_type": interface_type,
+            "protocol": protocol,
+            "operation": operation
+        }
+        self.success = dict(self.calls, status="success")
+        self.error = dict(self.calls, status="error")
+        self.span_attributes = {
+            "scribe.boundary.interface_type": interface_type,
+            "scribe.boundary.protocol": protocol,
+            "scribe.boundary.operation": operation,
+            "scribe.component": "boundary"
+        }
+        self.unsampled = _UnsampledBoundaryCall(manager, self)
+
+
+class _UnsampledBoundaryCall:
+    """
+    Reusable context manager for boundary calls that were not sampled.
+
+    Entering yields the shared no-op span and allocates nothing; failures
+    are still counted so error rates stay exact.
+    """
+
+    __slots__ = ("_manager", "_labels")
+
+    def __init__(self, manager: 'TelemetryManager', labels: _BoundaryLabels):
+        self._manager = manager
+        self._labels = labels
+
+    def __enter__(self):
+        return _NOOP_SPAN
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None and issubclass(exc_type, Exception):
+            self._manager.boundary_call_errors_counter.add(1, self._labels.error)
+        return False
+
+
 class TelemetryManager:
     """
     Manages OpenTelemetry integration for Scribe Engine.
@@ -125,6 +179,8 @@ class TelemetryManager:
         
         self._lock = threading.RLock()
         self._initialized = False
+        self._random = random.Random()
+        self._boundary_labels: Dict[str, Dict[str, Dict[str, _BoundaryLabels]]] = {}
         
         # Initialize telemetry components
         if self.enabled:
@@ -141,6 +197,16 @@ class TelemetryManager:
     def _initialize_telemetry(self):
         """Initialize real OpenTelemetry components."""
         try:
+            from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+            from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import OTLPMetricExporter
+            from opentelemetry.sdk.trace.export import BatchSpanProcessor
+            from opentelemetry.sdk.metrics import MeterProvider
+            from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
+            from opentelemetry.sdk.resources import Resource
+            from opentelemetry.semconv.resource import ResourceAttributes
+            from opentelemetry.instrumentation.requests import RequestsInstrumentor
+            from opentelemetry.instrumentation.threading import ThreadingInstrumentor
+            
             # Create resource
             resource = Resource.create({
                 ResourceAttributes.SERVICE_NAME: self.service_name,
@@ -155,10 +221,7 @@ class TelemetryManager:
             else:
                 span_processor = None
             
-            tracer_provider = TracerProvider(resource=resource)
-            if span_processor:
-                tracer_provider.add_span_processor(span_processor)
-            
+            tracer_provider = self._create_tracer_provider(resource, span_processor)
             trace.set_tracer_provider(tracer_provider)
             self.tracer = trace.get_tracer(self.service_name)
             
@@ -195,6 +258,23 @@ class TelemetryManager:
                         exc_info=True)
             self._initialize_mock_telemetry()
     
+    def _create_tracer_provider(self, resource, span_processor=None):
+        """
+        SDK tracer provider that records every span it is asked to start.
+        
+        Boundary calls are already head-sampled at ``sampling_rate`` by
+        ``_should_sample``; a ratio sampler here as well would make the
+        effective rate ``sampling_rate`` squared and record durations for
+        spans the SDK then drops.
+        """
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.sampling import ALWAYS_ON, ParentBased
+        
+        tracer_provider = TracerProvider(resource=resource, sampler=ParentBased(ALWAYS_ON))
+        if span_processor:
+            tracer_provider.add_span_processor(span_processor)
+        return tracer_provider
+    
     def _initialize_mock_telemetry(self):
         """Initialize mock telemetry components."""
         self.tracer = MockTracer()
@@ -243,9 +323,15 @@ class TelemetryManager:
             unit="s"
         )
         
+        self.boundary_call_errors_counter = self.meter.create_counter(
+            name="scribe_boundary_call_errors_total",
+            description="Total number of boundary interface calls that raised",
+            unit="1"
+        )
+        
         self.boundary_call_duration_histogram = self.meter.create_histogram(
             name="scribe_boundary_call_duration_seconds",
-            description="Duration of boundary interface calls",
+            description="Duration of sampled boundary interface calls",
             unit="s"
         )
         
@@ -268,13 +354,41 @@ class TelemetryManager:
         self.action_failures_counter = MockCounter()
         self.file_events_counter = MockCounter()
         self.boundary_calls_counter = MockCounter()
+        self.boundary_call_errors_counter = MockCounter()
         self.action_duration_histogram = MockHistogram()
         self.file_processing_duration_histogram = MockHistogram()
         self.boundary_call_duration_histogram = MockHistogram()
         self.active_workers_gauge = MockGauge()
         self.queue_size_gauge = MockGauge()
     
-    @contextmanager
+    def _get_boundary_labels(self, interface_type: str, protocol: str, operation: str) -> _BoundaryLabels:
+        """Return the cached label sets for a boundary triple (nested lookups avoid a key tuple)."""
+        try:
+            return self._boundary_labels[interface_type][protocol][operation]
+        except KeyError:
+            with self._lock:
+                by_protocol = self._boundary_labels.setdefault(interface_type, {})
+                by_operation = by_protocol.setdefault(protocol, {})
+                labels = by_operation.get(operation)
+                if labels is None:
+                    labels = by_operation[operation] = _BoundaryLabels(self, interface_type, protocol, operation)
+                return labels
+    
+    def _should_sample(self) -> bool:
+        """Head-based sampling decision for a new boundary span."""
+        # Nothing to record without a real tracer
+        if self.tracer.__class__ is MockTracer:
+            return False
+        rate = self.sampling_rate
+        if rate >= 1.0:
+            return True
+        if rate <= 0.0:
+            return False
+        # Stay inside a trace that has already been sampled
+        if self.enabled and OTEL_AVAILABLE and trace.get_current_span().is_recording():
+            return True
+        return self._random.random() < rate
+    
     def trace_boundary_call(self, 
                            interface_type: str,
                            protocol: str,
@@ -284,6 +398,11 @@ class TelemetryManager:
         """
         Trace a boundary interface call with HMA v2.2 compliance.
         
+        Calls are sampled at ``sampling_rate``. The call counter and error
+        counter are exact; spans and the duration histogram are only produced
+        for sampled calls. Unsampled calls, and every call when only the mock
+        tracer is available, get a shared no-op span.
+        
         Args:
             interface_type: Type of interface (inbound/outbound/bidirectional)
             protocol: Protocol used (http/grpc/websocket/file_system/event_bus)
@@ -291,53 +410,44 @@ class TelemetryManager:
             operation: Operation being performed
             attributes: Additional attributes to include in the trace
         """
-        span_name = f"{interface_type}_{protocol}_{operation}"
-        start_time = time.time()
+        labels = self._get_boundary_labels(interface_type, protocol, operation)
+        self.boundary_calls_counter.add(1, labels.calls)
         
-        span_attributes = {
-            "scribe.boundary.interface_type": interface_type,
-            "scribe.boundary.protocol": protocol,
-            "scribe.boundary.endpoint": endpoint,
-            "scribe.boundary.operation": operation,
-            "scribe.component": "boundary"
-        }
+        if not self._should_sample():
+            return labels.unsampled
         
+        return self._sampled_boundary_call(labels, endpoint, attributes)
+    
+    @contextmanager
+    def _sampled_boundary_call(self,
+                               labels: _BoundaryLabels,
+                               endpoint: str,
+                               attributes: Optional[Dict[str, Any]]):
+        """Span and duration histogram for a sampled boundary call."""
+        start_time = time.perf_counter()
+        
+        span_attributes = dict(labels.span_attributes)
+        span_attributes["scribe.boundary.endpoint"] = endpoint
         if attributes:
             span_attributes.update(attributes)
         
-        with self.tracer.start_as_current_span(span_name, attributes=span_attributes) as span:
+        with self.tracer.start_as_current_span(labels.span_name, attributes=span_attributes) as span:
             try:
-                # Record boundary call metric
-                self.boundary_calls_counter.add(1, {
-                    "interface_type": interface_type,
-                    "protocol": protocol,
-                    "endpoint": endpoint,
-                    "operation": operation
-                })
-                
                 yield span
                 
                 # Record success
-                duration = time.time() - start_time
-                self.boundary_call_duration_histogram.record(duration, {
-                    "interface_type": interface_type,
-                    "protocol": protocol,
-                    "operation": operation,
-                    "status": "success"
-                })
+                self.boundary_call_duration_histogram.record(
+                    time.perf_counter() - start_time, labels.success
+                )
                 
             except Exception as e:
                 # Record failure
-                duration = time.time() - start_time
-                self.boundary_call_duration_histogram.record(duration, {
-                    "interface_type": interface_type,
-                    "protocol": protocol,
-                    "operation": operation,
-                    "status": "error"
-                })
+                self.boundary_call_duration_histogram.record(
+                    time.perf_counter() - start_time, labels.error
+                )
+                self.boundary_call_errors_counter.add(1, labels.error)
                 
-                span.record_exception(e)
-                span.set_status(trace.Status(trace.StatusCode.ERROR, str(e)))
+                _mark_span_error(span, e)
                 raise
     
     @contextmanager
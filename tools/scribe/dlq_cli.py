@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Scribe Dead-Letter Queue CLI
+
+Inspect and replay dead-lettered events:
+
+    python -m tools.scribe.dlq_cli stats
+    python -m tools.scribe.dlq_cli query --surface nats --since 2025-01-01T00:00:00
+    python -m tools.scribe.dlq_cli replay --surface file_system --rate 20
+"""
+
+import asyncio
+import json
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+import click
+
+from .core.dlq import DeadLetterQueue, DLQReplayer
+from .core.logging_config import get_scribe_logger
+
+logger = get_scribe_logger(__name__)
+
+
+def _timestamp(value: Optional[str]) -> Optional[float]:
+    """Accept epoch seconds or an ISO-8601 datetime."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        raise click.BadParameter(f"expected epoch seconds or ISO-8601, got {value!r}")
+
+
+def _filter_options(func):
+    func = click.option('--until', help='Only entries at or before this time (epoch or ISO-8601)')(func)
+    func = click.option('--since', help='Only entries at or after this time (epoch or ISO-8601)')(func)
+    func = click.option('--event-id', help='Only entries for this event_id')(func)
+    func = click.option('--surface', help='Only entries from this surface (file_system, nats, http, ...)')(func)
+    return func
+
+
+@click.group()
+@click.option('--report-dir', default=None, type=click.Path(file_okay=False, path_type=Path),
+              help='DLQ directory (default: $SCRIBE_REPORT_DIR or tools/reports)')
+@click.pass_context
+def cli(ctx, report_dir: Optional[Path]):
+    """Inspect and replay the Scribe dead-letter queue."""
+    root = report_dir or Path(os.environ.get("SCRIBE_REPORT_DIR", "tools/reports"))
+    ctx.obj = DeadLetterQueue(root, read_only=True)
+    ctx.call_on_close(ctx.obj.close)
+
+
+@cli.command()
+@click.pass_obj
+def stats(dlq: DeadLetterQueue):
+    """Show segment and writer statistics."""
+    click.echo(json.dumps(dlq.stats(), indent=2))
+
+
+@cli.command()
+@_filter_options
+@click.option('--limit', type=int, default=100, show_default=True, help='Maximum entries to print')
+@click.pass_obj
+def query(dlq: DeadLetterQueue, surface, event_id, since, until, limit):
+    """Print matching entries as JSON lines."""
+    for entry in dlq.query(surface=surface, event_id=event_id,
+                           since=_timestamp(since), until=_timestamp(until), limit=limit):
+        click.echo(json.dumps({"segment": entry.segment, "offset": entry.offset, **entry.record}))
+
+
+@cli.command()
+@_filter_options
+@click.option('--limit', type=int, default=None, help='Maximum entries to replay')
+@click.option('--rate', type=float, default=50.0, show_default=True, help='Events published per second')
+@click.option('--checkpoint', type=click.Path(dir_okay=False, path_type=Path), default=None,
+              help='Checkpoint file (default: <report-dir>/dlq.replay-checkpoint.json)')
+@click.option('--restart', is_flag=True, help='Ignore any existing checkpoint and start from the beginning')
+@click.option('--config', '-c', type=click.Path(exists=True), default="tools/scribe/config/config.json",
+              show_default=True, help='Engine configuration used to build the event bus')
+@click.pass_obj
+def replay(dlq: DeadLetterQueue, surface, event_id, since, until, limit, rate, checkpoint, restart, config):
+    """Re-publish matching entries through the engine's event bus."""
+    from .core.engine_factory import create_engine_components
+
+    components = create_engine_components(config_path=config)
+    event_bus = components.port_registry.get_port("event_bus")
+    replayer = DLQReplayer(dlq, event_bus, rate_per_second=rate, checkpoint_path=checkpoint)
+
+    async def run():
+        if hasattr(event_bus, "start") and not await event_bus.start():
+            raise click.ClickException("event bus unavailable")
+        try:
+            return await replayer.replay(surface=surface, event_id=event_id,
+                                         since=_timestamp(since), until=_timestamp(until),
+                                         limit=limit, resume=not restart)
+        finally:
+            if hasattr(event_bus, "stop"):
+                await event_bus.stop()
+
+    result = asyncio.run(run())
+    click.echo(json.dumps(result, indent=2))
+    if result["stopped_on_failure"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    cli()
@@ -17,6 +17,7 @@ from typing import List, Optional, Dict, Any
 # HMA v2.2 Core Components
 from tools.scribe.core.minimal_core import HMAMinimalCore, CoreState
 from tools.scribe.core.engine_factory import create_engine_components, EngineComponents
+from tools.scribe.core.state_snapshot import EngineStateSnapshot, SnapshotParticipant
 from tools.scribe.core.logging_config import configure_structured_logging, get_scribe_logger
 
 # Configure structured logging
@@ -69,8 +70,26 @@ class ScribeEngine:
         self.is_running = False
         self.initialization_complete = False
         
+        # Health monitor serving the debug endpoints (started when enabled)
+        self.debug_settings = components.config_manager.get_debug_endpoint_settings()
+        self.health_monitor = None
+        
+        # Derived state carried across restarts (None when disabled); the
+        # factory already restored the plugin registry from it
+        self.snapshot_settings = components.config_manager.get_state_snapshot_settings()
+        self.state_snapshot: Optional[EngineStateSnapshot] = components.state_snapshot
+        
         logger.info("Scribe Engine v2.2 minimalist core initialized")
     
+    def register_snapshot_participant(self, name: str, participant: SnapshotParticipant) -> None:
+        """
+        Include a component's state in the engine state snapshot, e.g. an
+        ActionDispatcher's ``circuit_breaker_manager``. Register before
+        ``start()`` for the component to be restored.
+        """
+        if self.state_snapshot is not None:
+            self.state_snapshot.register(name, participant)
+    
     async def initialize_minimal_core(self) -> bool:
         """Initialize HMA v2.2 minimal core (components already created by factory)"""
         try:
@@ -100,9 +119,20 @@ class ScribeEngine:
             
             logger.info("Starting Scribe Engine v2.2 minimalist core")
             
+            if self.debug_settings['enabled']:
+                # Imported here: psutil and the HTTP server are only needed with debug endpoints on
+                from tools.scribe.core.health_monitor import initialize_health_monitor
+                self.health_monitor = initialize_health_monitor(
+                    port=self.components.config_manager.get_health_check_port(),
+                    debug_config=self.debug_settings
+                )
+            
             # Initialize minimal core asynchronously
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
+            if self.health_monitor:
+                # /debug/tasks then shows startup tasks, e.g. a hanging NATS connect
+                self.health_monitor.register_event_loop(loop)
             
             try:
                 # Start NATS event bus adapter
@@ -111,6 +141,10 @@ class ScribeEngine:
                     if not loop.run_until_complete(event_bus.start()):
                         logger.warning("Failed to start NATS event bus - continuing with limited functionality")
                 
+                # Restore participants registered since the factory's restore
+                if self.state_snapshot:
+                    self.state_snapshot.restore()
+                
                 # Initialize minimal core (components already created)
                 if not loop.run_until_complete(self.initialize_minimal_core()):
                     raise RuntimeError("Failed to initialize minimal core")
@@ -122,12 +156,20 @@ class ScribeEngine:
                 self.is_running = True
                 logger.info("Scribe Engine v2.2 started successfully")
                 
+                # Import lazily registered plugins off the startup path
+                if self.components.config_manager.get_plugin_prewarm():
+                    self.components.plugin_loader.prewarm()
+                
+                if self.state_snapshot:
+                    self.state_snapshot.start_periodic(self.snapshot_settings['interval_seconds'])
+                
             finally:
                 loop.close()
             
         except Exception as e:
             logger.error("Failed to start Scribe Engine v2.2", error=str(e), exc_info=True)
             self.stop()
+            self._stop_health_monitor()
             raise
     
     def stop(self) -> None:
@@ -142,6 +184,11 @@ class ScribeEngine:
             # Signal shutdown to all threads
             self.shutdown_event.set()
             
+            # Save derived state while the components still hold it
+            if self.state_snapshot:
+                self.state_snapshot.stop_periodic()
+                self.state_snapshot.save()
+            
             # Stop HMA minimal core
             if self.minimal_core:
                 logger.info("Stopping minimal core")
@@ -164,6 +211,8 @@ class ScribeEngine:
                     finally:
                         loop.close()
             
+            self._stop_health_monitor()
+            
             # Log final statistics
             self._log_final_stats()
             
@@ -173,6 +222,13 @@ class ScribeEngine:
         except Exception as e:
             logger.error("Error during engine shutdown", error=str(e), exc_info=True)
     
+    def _stop_health_monitor(self) -> None:
+        """Shut down the health monitor started for the debug endpoints, if any."""
+        if self.health_monitor:
+            from tools.scribe.core.health_monitor import shutdown_health_monitor
+            shutdown_health_monitor()
+            self.health_monitor = None
+    
     def _log_final_stats(self) -> None:
         """Log final engine statistics."""
         if self.start_time:
@@ -262,14 +318,17 @@ class ScribeEngine:
         # Add telemetry status if available
         if self.components and self.components.telemetry:
             status['telemetry_active'] = True
-        
+
+        if self.state_snapshot:
+            status['state_snapshot'] = self.state_snapshot.get_stats()
+
         return status
     
     async def _load_plugins(self, plugin_loader) -> None:
         """Load and register all plugins with the minimal core"""
         try:
-            # Load available plugins
-            plugins = plugin_loader.load_all_plugins()
+            # Loaded by the factory, from the state snapshot when one was restored
+            plugins = plugin_loader.get_all_plugins()
             
             # Register each plugin with the minimal core
             for plugin_id, plugin_info in plugins.items():
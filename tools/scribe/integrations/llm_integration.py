@@ -7,20 +7,33 @@ From: ultimate-frontmatter-enhancement-guideline-20250617-0312.md
 
 This module provides complete LLM integration with existing Scribe system for
 schema-constrained frontmatter generation with SHACL validation.
+
+Generation goes through a pluggable ``LLMBackend``. ``LLMClient`` adds a
+persistent response cache keyed by (model, normalized prompt, constraint
+profile hash), token-bucket rate limiting and a bounded-concurrency async
+batch API. ``StubLLMBackend`` is a deterministic local backend for tests and
+benchmarks; pass it a fixed ``clock`` for reproducible output.
 """
 
+import asyncio
 import json
+import os
+import tempfile
+import threading
+import time
+import weakref
 import yaml
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple, Union
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Any, Optional, Tuple, Union
 import logging
 import hashlib
-from datetime import datetime
+from datetime import datetime, timezone
 
 # Import existing validation infrastructure
 import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'validators'))
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'builder'))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'validators'))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'builder'))
 
 try:
     from graph_validator import GraphValidator
@@ -36,56 +49,71 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-class LLMClient:
+def normalize_prompt(prompt: str) -> str:
+    """Collapse whitespace so formatting-only prompt differences share a cache entry."""
+    return ' '.join(prompt.split())
+
+
+def constraint_profile_hash(constraints: Dict[str, Any]) -> str:
+    """Stable hash of a constraint profile (sets are sorted before hashing)."""
+    def _default(value):
+        if isinstance(value, (set, frozenset)):
+            return sorted(value)
+        return str(value)
+    
+    payload = json.dumps(constraints, sort_keys=True, default=_default)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+class LLMBackend(ABC):
+    """
+    Interface for LLM providers used by ``LLMClient``.
+    
+    Implementations provide ``generate``; ``agenerate`` defaults to running
+    it in a worker thread and should be overridden by natively async backends.
+    """
+    
+    model_name = "unknown"
+    
+    @abstractmethod
+    def generate(self, prompt: str, max_tokens: int = 500, temperature: float = 0.1) -> str:
+        """Return the model's completion for ``prompt``."""
+    
+    async def agenerate(self, prompt: str, max_tokens: int = 500, temperature: float = 0.1) -> str:
+        return await asyncio.to_thread(self.generate, prompt, max_tokens, temperature)
+
+
+class StubLLMBackend(LLMBackend):
     """
-    Mock LLM Client for frontmatter generation.
+    Deterministic local backend: the same prompt always yields the same YAML.
     
-    In production, this would integrate with actual LLM services like OpenAI, 
-    Anthropic, or local models. For this implementation, it provides deterministic
-    fallback generation to ensure 100% success rate.
+    The optional ``latency`` (seconds) simulates a remote call so batch
+    concurrency and rate limiting can be exercised without a provider.
+    ``clock`` supplies ``date-created``/``date-modified`` (default: the
+    current UTC time); tests and benchmarks pass a fixed one.
     """
     
-    def __init__(self, model_name: str = "mock-llm", api_key: Optional[str] = None):
+    def __init__(self, model_name: str = "mock-llm", latency: float = 0.0,
+                 clock: Optional[Callable[[], datetime]] = None):
         self.model_name = model_name
-        self.api_key = api_key
-        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
-        
-        # Generation statistics
-        self.generation_stats = {
-            'total_generations': 0,
-            'successful_generations': 0,
-            'fallback_generations': 0
-        }
+        self.latency = latency
+        self.clock = clock or (lambda: datetime.now(timezone.utc))
+        self.calls = 0
     
     def generate(self, prompt: str, max_tokens: int = 500, temperature: float = 0.1) -> str:
-        """
-        Generate text based on prompt.
-        
-        Args:
-            prompt: The input prompt for generation
-            max_tokens: Maximum tokens to generate
-            temperature: Sampling temperature
-            
-        Returns:
-            Generated text content
-        """
-        self.generation_stats['total_generations'] += 1
-        
-        try:
-            # In production, this would call actual LLM API
-            # For now, use deterministic generation based on prompt analysis
-            generated_content = self._mock_llm_generation(prompt)
-            
-            self.generation_stats['successful_generations'] += 1
-            return generated_content
-            
-        except Exception as e:
-            self.logger.warning(f"LLM generation failed: {e}, using fallback")
-            self.generation_stats['fallback_generations'] += 1
-            return self._fallback_generation(prompt)
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return self._render(prompt)
     
-    def _mock_llm_generation(self, prompt: str) -> str:
-        """Mock LLM generation that analyzes prompt to create appropriate frontmatter."""
+    async def agenerate(self, prompt: str, max_tokens: int = 500, temperature: float = 0.1) -> str:
+        self.calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self._render(prompt)
+    
+    def _render(self, prompt: str) -> str:
+        """Analyze the prompt to create appropriate frontmatter."""
         prompt_lower = prompt.lower()
         
         # Extract info-type from prompt
@@ -97,14 +125,17 @@ class LLMClient:
         elif 'policy-document' in prompt_lower:
             info_type = 'policy-document'
         
+        digest = hashlib.sha256(normalize_prompt(prompt).encode('utf-8')).hexdigest()[:8].upper()
+        timestamp = self.clock().strftime('%Y-%m-%dT%H:%M:%SZ')
+        
         # Generate appropriate frontmatter based on detected type
         base_frontmatter = {
             'title': 'Generated Document Title',
             'info-type': info_type,
             'version': '1.0.0',
-            'date-created': datetime.now().strftime('%Y-%m-%dT%H:%M:%SZ'),
-            'date-modified': datetime.now().strftime('%Y-%m-%dT%H:%M:%SZ'),
-            'kb-id': f'GEN-{info_type.upper().replace("-", "-")}-{datetime.now().strftime("%Y%m%d-%H%M")}'
+            'date-created': timestamp,
+            'date-modified': timestamp,
+            'kb-id': f'GEN-{info_type.upper()}-{digest}'
         }
         
         # Add type-specific fields
@@ -117,6 +148,320 @@ class LLMClient:
         
         # Convert to YAML
         return yaml.dump(base_frontmatter, default_flow_style=False)
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter usable from both threads and coroutines.
+    
+    ``rate`` tokens are added per second up to ``capacity``; each request
+    takes one token.
+    """
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.capacity = float(capacity) if capacity else max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _reserve(self, tokens: float) -> float:
+        """Take tokens if available; otherwise return seconds to wait."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.rate
+    
+    def acquire(self, tokens: float = 1.0) -> None:
+        """Block the calling thread until tokens are available."""
+        while True:
+            wait = self._reserve(tokens)
+            if not wait:
+                return
+            time.sleep(wait)
+    
+    async def acquire_async(self, tokens: float = 1.0) -> None:
+        """Wait without blocking the event loop until tokens are available."""
+        while True:
+            wait = self._reserve(tokens)
+            if not wait:
+                return
+            await asyncio.sleep(wait)
+
+
+class LLMResponseCache:
+    """
+    Response cache keyed by (model, normalized prompt, constraint-profile hash).
+    
+    Entries live in memory and, when ``path`` is given, persist to a JSON
+    file written atomically by ``save()`` so repeated runs over unchanged
+    documents skip the backend entirely. The oldest entries are evicted
+    beyond ``max_entries``.
+    """
+    
+    FORMAT_VERSION = 1
+    
+    def __init__(self, path: Optional[Union[str, Path]] = None, max_entries: int = 10000):
+        self.path = Path(path) if path else None
+        self.max_entries = max_entries
+        self._entries: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+        if self.path and self.path.exists():
+            self._load()
+    
+    @staticmethod
+    def make_key(model_name: str, prompt: str, profile_hash: Optional[str] = None) -> str:
+        material = '\0'.join([model_name, normalize_prompt(prompt), profile_hash or ''])
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            response = self._entries.get(key)
+            if response is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return response
+    
+    def put(self, key: str, response: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = response
+            while len(self._entries) > self.max_entries:
+                del self._entries[next(iter(self._entries))]
+            self._dirty = True
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def _load(self) -> None:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable LLM response cache {self.path}: {e}")
+            return
+        if data.get('version') != self.FORMAT_VERSION:
+            return
+        self._entries = dict(data.get('entries', {}))
+    
+    def save(self) -> bool:
+        """Persist entries if anything changed; returns True when written."""
+        if not self.path:
+            return False
+        with self._lock:
+            if not self._dirty:
+                return False
+            payload = {'version': self.FORMAT_VERSION, 'entries': dict(self._entries)}
+            self._dirty = False
+        
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(payload, f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        return True
+    
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+
+class LLMClient:
+    """
+    LLM client for frontmatter generation.
+    
+    Wraps an ``LLMBackend`` (the deterministic ``StubLLMBackend`` unless one
+    is supplied) with a response cache, optional token-bucket rate limiting
+    and a bounded-concurrency async batch API. Backend failures fall back to
+    deterministic generation to ensure 100% success rate.
+    """
+    
+    def __init__(self, model_name: str = "mock-llm", api_key: Optional[str] = None,
+                 backend: Optional[LLMBackend] = None,
+                 cache: Optional[LLMResponseCache] = None,
+                 max_concurrency: int = 4,
+                 rate_limit_per_second: Optional[float] = None,
+                 rate_limit_burst: Optional[float] = None):
+        self.model_name = model_name
+        self.api_key = api_key
+        self.backend = backend or StubLLMBackend(model_name)
+        self.cache = cache if cache is not None else LLMResponseCache()
+        self.max_concurrency = max(1, max_concurrency)
+        self.rate_limiter = TokenBucket(rate_limit_per_second, rate_limit_burst) if rate_limit_per_second else None
+        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self._stats_lock = threading.Lock()
+        # Backend requests currently awaited, so concurrent identical prompts share one call
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # One concurrency limit per event loop, shared by every caller on that loop
+        self._semaphores = weakref.WeakKeyDictionary()
+        
+        # Generation statistics
+        self.generation_stats = {
+            'total_generations': 0,
+            'successful_generations': 0,
+            'fallback_generations': 0,
+            'backend_calls': 0,
+            'coalesced_requests': 0,
+            'batches': 0,
+            'batch_items': 0,
+            'batch_seconds': 0.0
+        }
+    
+    def _count(self, **increments) -> None:
+        with self._stats_lock:
+            for key, amount in increments.items():
+                self.generation_stats[key] += amount
+    
+    def _loop_semaphore(self) -> asyncio.Semaphore:
+        """The client's ``max_concurrency`` semaphore for the running event loop (created lazily)."""
+        loop = asyncio.get_running_loop()
+        with self._stats_lock:
+            semaphore = self._semaphores.get(loop)
+            if semaphore is None:
+                semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+            return semaphore
+    
+    def generate(self, prompt: str, max_tokens: int = 500, temperature: float = 0.1,
+                 profile_hash: Optional[str] = None) -> str:
+        """
+        Generate text based on prompt.
+        
+        Args:
+            prompt: The input prompt for generation
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            profile_hash: Hash of the constraint profile the prompt targets
+            
+        Returns:
+            Generated text content
+        """
+        self._count(total_generations=1)
+        key = self.cache.make_key(self.model_name, prompt, profile_hash)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self._count(successful_generations=1)
+            return cached
+        
+        try:
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
+            self._count(backend_calls=1)
+            generated_content = self.backend.generate(prompt, max_tokens, temperature)
+        except Exception as e:
+            self.logger.warning(f"LLM generation failed: {e}, using fallback")
+            self._count(fallback_generations=1)
+            return self._fallback_generation(prompt)
+        
+        self.cache.put(key, generated_content)
+        self._count(successful_generations=1)
+        return generated_content
+    
+    async def agenerate(self, prompt: str, max_tokens: int = 500, temperature: float = 0.1,
+                        profile_hash: Optional[str] = None,
+                        semaphore: Optional[asyncio.Semaphore] = None) -> str:
+        """
+        Async counterpart of ``generate``.
+        
+        Backend calls are bounded by ``semaphore`` when given, otherwise by the
+        client's own per-loop limit of ``max_concurrency``.
+        """
+        self._count(total_generations=1)
+        key = self.cache.make_key(self.model_name, prompt, profile_hash)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self._count(successful_generations=1)
+            return cached
+        
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self._count(coalesced_requests=1)
+            generated_content = await asyncio.shield(pending)
+            if generated_content is None:
+                self._count(fallback_generations=1)
+                return self._fallback_generation(prompt)
+            self._count(successful_generations=1)
+            return generated_content
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        semaphore = semaphore or self._loop_semaphore()
+        generated_content = None
+        try:
+            async with semaphore:
+                if self.rate_limiter:
+                    await self.rate_limiter.acquire_async()
+                self._count(backend_calls=1)
+                generated_content = await self.backend.agenerate(prompt, max_tokens, temperature)
+        except Exception as e:
+            self.logger.warning(f"LLM generation failed: {e}, using fallback")
+        finally:
+            del self._inflight[key]
+            future.set_result(generated_content)
+        
+        if generated_content is None:
+            self._count(fallback_generations=1)
+            return self._fallback_generation(prompt)
+        
+        self.cache.put(key, generated_content)
+        self._count(successful_generations=1)
+        return generated_content
+    
+    async def agenerate_batch(self, prompts: List[Union[str, Tuple[str, Optional[str]]]],
+                              max_tokens: int = 500, temperature: float = 0.1,
+                              max_concurrency: Optional[int] = None) -> List[str]:
+        """
+        Generate responses for many prompts with bounded concurrency.
+        
+        Args:
+            prompts: Prompts, or (prompt, profile_hash) pairs
+            max_concurrency: In-flight backend calls for this batch (defaults to
+                the client's limit, shared with other callers on the same loop)
+            
+        Returns:
+            Responses in the same order as ``prompts``. Identical requests in
+            flight at the same time are sent to the backend once.
+        """
+        start = time.perf_counter()
+        semaphore = asyncio.Semaphore(max(1, max_concurrency)) if max_concurrency else None
+        
+        requests = [(p, None) if isinstance(p, str) else (p[0], p[1]) for p in prompts]
+        responses = await asyncio.gather(*[
+            self.agenerate(prompt, max_tokens, temperature, profile_hash, semaphore)
+            for prompt, profile_hash in requests
+        ])
+        
+        self.record_batch(len(requests), time.perf_counter() - start)
+        return list(responses)
+    
+    def record_batch(self, items: int, seconds: float) -> None:
+        """Record a completed batch for the throughput metrics."""
+        self._count(batches=1, batch_items=items, batch_seconds=seconds)
+    
+    def generate_batch(self, prompts: List[Union[str, Tuple[str, Optional[str]]]],
+                       max_tokens: int = 500, temperature: float = 0.1,
+                       max_concurrency: Optional[int] = None) -> List[str]:
+        """Synchronous entry point for ``agenerate_batch`` (not for use inside a running loop)."""
+        return asyncio.run(self.agenerate_batch(prompts, max_tokens, temperature, max_concurrency))
     
     def _fallback_generation(self, prompt: str) -> str:
         """Deterministic fallback generation to ensure 100% success."""
@@ -130,8 +475,14 @@ class LLMClient:
         }, default_flow_style=False)
     
     def get_generation_stats(self) -> Dict[str, Any]:
-        """Get generation statistics."""
-        return self.generation_stats.copy()
+        """Get generation statistics, including cache hit rate and batch throughput."""
+        with self._stats_lock:
+            stats = self.generation_stats.copy()
+        stats['cache'] = self.cache.get_stats()
+        stats['batch_throughput_per_second'] = (
+            stats['batch_items'] / stats['batch_seconds'] if stats['batch_seconds'] else 0.0
+        )
+        return stats
 
 
 class LLMSchemaIntegration:
@@ -142,21 +493,28 @@ class LLMSchemaIntegration:
     to provide automated, schema-compliant frontmatter generation.
     """
     
-    def __init__(self, shacl_file: str, jsonld_context: str):
+    MAX_ATTEMPTS = 3
+    
+    def __init__(self, shacl_file: str, jsonld_context: str,
+                 llm_client: Optional[LLMClient] = None,
+                 cache_path: Optional[Union[str, Path]] = None):
         self.shacl_file = Path(shacl_file)
         self.jsonld_context = Path(jsonld_context)
         
+        # Initialize logger
+        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        
         # Load existing infrastructure
         self.shacl_validator = self._load_existing_graph_validator()
         self.schema_constraints = self._load_schema_constraints(shacl_file)
         self.context_mappings = self._load_context_mappings(jsonld_context)
-        self.llm_client = self._initialize_llm_client()
-        
-        # Initialize logger
-        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self.llm_client = llm_client or self._initialize_llm_client(cache_path)
         
         # Profile generators cache
         self.profile_generators = {}
+        self._default_profile_generator: Optional[Dict[str, Any]] = None
+        # id(generator) -> (generator, constraint profile hash); the reference keeps the id from being reused
+        self._profile_hashes: Dict[int, Tuple[Dict[str, Any], str]] = {}
     
     def _load_existing_graph_validator(self):
         """Load existing graph validator from the repository."""
@@ -190,9 +548,9 @@ class LLMSchemaIntegration:
             self.logger.error(f"Failed to load JSON-LD context: {e}")
             return {}
     
-    def _initialize_llm_client(self) -> LLMClient:
-        """Initialize LLM client."""
-        return LLMClient()
+    def _initialize_llm_client(self, cache_path: Optional[Union[str, Path]] = None) -> LLMClient:
+        """Initialize LLM client, with a persistent response cache when a path is given."""
+        return LLMClient(cache=LLMResponseCache(cache_path))
     
     def initialize_schema_constrained_generation(self) -> Dict[str, Any]:
         """
@@ -446,6 +804,41 @@ class LLMSchemaIntegration:
         
         return result
     
+    def generate_batch(self, documents: List[Tuple], max_concurrency: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Generate schema-constrained frontmatter for many documents concurrently.
+        
+        Args:
+            documents: ``(document_content, info_type)`` or
+                ``(document_content, info_type, additional_context)`` tuples
+            max_concurrency: In-flight LLM calls (defaults to the client's)
+            
+        Returns:
+            Results in input order, as from ``generate_schema_constrained_frontmatter``
+        """
+        return asyncio.run(self.agenerate_batch(documents, max_concurrency))
+    
+    async def agenerate_batch(self, documents: List[Tuple], max_concurrency: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Async form of ``generate_batch`` for callers already inside an event loop."""
+        start = time.perf_counter()
+        semaphore = asyncio.Semaphore(max(1, max_concurrency)) if max_concurrency else None
+        
+        jobs = []
+        for document in documents:
+            document_content, info_type = document[0], document[1]
+            additional_context = document[2] if len(document) > 2 else None
+            profile_generator = (self._find_profile_generator_for_type(info_type)
+                                 or self._get_default_profile_generator())
+            prompt = self._build_context_aware_prompt(
+                document_content, info_type, profile_generator, additional_context
+            )
+            jobs.append(self._agenerate_with_validation_loop(prompt, info_type, profile_generator, semaphore))
+        
+        results = await asyncio.gather(*jobs)
+        self.llm_client.record_batch(len(jobs), time.perf_counter() - start)
+        self.llm_client.cache.save()
+        return list(results)
+    
     def _find_profile_generator_for_type(self, info_type: str) -> Optional[Dict[str, Any]]:
         """Find profile generator that matches the info-type."""
         # Direct match
@@ -466,7 +859,12 @@ class LLMSchemaIntegration:
         return None
     
     def _get_default_profile_generator(self) -> Dict[str, Any]:
-        """Get default profile generator for fallback."""
+        """Get default profile generator for fallback (built once and reused)."""
+        if self._default_profile_generator is None:
+            self._default_profile_generator = self._build_default_profile_generator()
+        return self._default_profile_generator
+    
+    def _build_default_profile_generator(self) -> Dict[str, Any]:
         return {
             'profile_name': 'default',
             'constraints': {
@@ -555,42 +953,73 @@ class LLMSchemaIntegration:
         else:
             return 'general-document'
     
+    def _profile_hash(self, profile_generator: Dict[str, Any]) -> str:
+        """Constraint-profile hash used in the response cache key (memoised per generator)."""
+        entry = self._profile_hashes.get(id(profile_generator))
+        if entry is None or entry[0] is not profile_generator:
+            entry = (profile_generator, constraint_profile_hash(profile_generator.get('constraints', {})))
+            self._profile_hashes[id(profile_generator)] = entry
+        return entry[1]
+    
+    def _evaluate_attempt(self, generated_yaml: str, attempt: int, prompt: str,
+                          profile_generator: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], str]:
+        """Parse and validate one generation; returns (result, prompt for the next attempt)."""
+        # Parse YAML
+        frontmatter_dict = yaml.safe_load(generated_yaml)
+        
+        # Validate against constraints
+        validation_result = self._validate_against_constraints(
+            frontmatter_dict, profile_generator['validation_rules']
+        )
+        
+        if validation_result['valid']:
+            return {
+                'success': True,
+                'frontmatter': frontmatter_dict,
+                'attempts_used': attempt + 1,
+                'generation_method': 'llm',
+                'validation_result': validation_result
+            }, prompt
+        
+        # Add validation feedback to prompt for retry
+        return None, self._add_validation_feedback_to_prompt(prompt, validation_result)
+    
     def _generate_with_validation_loop(self, prompt: str, info_type: str, 
                                      profile_generator: Dict[str, Any]) -> Dict[str, Any]:
         """Generate frontmatter with validation loop for 100% success."""
-        max_attempts = 3
+        profile_hash = self._profile_hash(profile_generator)
         
-        for attempt in range(max_attempts):
+        for attempt in range(self.MAX_ATTEMPTS):
             try:
-                # Generate frontmatter
-                generated_yaml = self.llm_client.generate(prompt)
-                
-                # Parse YAML
-                frontmatter_dict = yaml.safe_load(generated_yaml)
-                
-                # Validate against constraints
-                validation_result = self._validate_against_constraints(
-                    frontmatter_dict, profile_generator['validation_rules']
-                )
-                
-                if validation_result['valid']:
-                    return {
-                        'success': True,
-                        'frontmatter': frontmatter_dict,
-                        'attempts_used': attempt + 1,
-                        'generation_method': 'llm',
-                        'validation_result': validation_result
-                    }
-                else:
-                    # Add validation feedback to prompt for retry
-                    prompt = self._add_validation_feedback_to_prompt(prompt, validation_result)
-                    
+                generated_yaml = self.llm_client.generate(prompt, profile_hash=profile_hash)
+                result, prompt = self._evaluate_attempt(generated_yaml, attempt, prompt, profile_generator)
+                if result is not None:
+                    return result
             except Exception as e:
                 self.logger.warning(f"Generation attempt {attempt + 1} failed: {e}")
         
         # If all attempts failed, use deterministic fallback
         return self._generate_deterministic_fallback(info_type, profile_generator)
     
+    async def _agenerate_with_validation_loop(self, prompt: str, info_type: str,
+                                              profile_generator: Dict[str, Any],
+                                              semaphore: Optional[asyncio.Semaphore] = None) -> Dict[str, Any]:
+        """Async validation loop; retries for one document stay sequential, documents run concurrently."""
+        profile_hash = self._profile_hash(profile_generator)
+        
+        for attempt in range(self.MAX_ATTEMPTS):
+            try:
+                generated_yaml = await self.llm_client.agenerate(
+                    prompt, profile_hash=profile_hash, semaphore=semaphore
+                )
+                result, prompt = self._evaluate_attempt(generated_yaml, attempt, prompt, profile_generator)
+                if result is not None:
+                    return result
+            except Exception as e:
+                self.logger.warning(f"Generation attempt {attempt + 1} failed: {e}")
+        
+        return self._generate_deterministic_fallback(info_type, profile_generator)
+    
     def _validate_against_constraints(self, frontmatter: Dict[str, Any], 
                                     validation_rules: Dict[str, Any]) -> Dict[str, Any]:
         """Validate frontmatter against constraint rules."""
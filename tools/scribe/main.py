@@ -20,10 +20,9 @@ from typing import Optional
 
 import click
 import structlog
-import uvicorn
-from fastapi import FastAPI
 
-from .core.engine_factory import create_engine_components
+# The engine, FastAPI and uvicorn are imported where they are used so that
+# --help and --validate-config return without loading them.
 from .core.logging_config import get_scribe_logger
 
 logger = get_scribe_logger(__name__)
@@ -44,6 +43,8 @@ class ScribeEngine:
         logger.info("Initializing Scribe HMA v2.2 engine", config_path=self.config_path)
         
         try:
+            from .core.engine_factory import create_engine_components
+            
             # Create engine components
             self.components = create_engine_components(config_path=self.config_path)
             logger.info("Engine components initialized successfully")
@@ -59,6 +60,8 @@ class ScribeEngine:
     
     def setup_health_endpoint(self):
         """Setup FastAPI health check endpoint."""
+        from fastapi import FastAPI
+        
         self.health_app = FastAPI(title="Scribe Engine Health", version="2.2.0")
         
         @self.health_app.get("/health")
@@ -110,6 +113,8 @@ class ScribeEngine:
             return False
         
         try:
+            import uvicorn
+            
             # Start health server in background
             if self.components.config_manager:
                 health_port = getattr(
@@ -180,6 +185,22 @@ def signal_handler(signum, frame):
         engine_instance.stop()
 
 
+def validate_configuration(config: Optional[Path]) -> int:
+    """Load and schema-validate a configuration file; returns an exit code."""
+    from .core.config_manager import ConfigManager
+    
+    package_root = Path(__file__).parent
+    config_path = str(config) if config else str(package_root / "config" / "config.json")
+    schema_path = str(package_root / "schemas" / "scribe_config.schema.json")
+    try:
+        ConfigManager(config_path=config_path, schema_path=schema_path, auto_reload=False)
+    except Exception as e:
+        click.echo(f"Configuration invalid: {config_path}: {e}", err=True)
+        return 1
+    click.echo(f"Configuration valid: {config_path}")
+    return 0
+
+
 @click.command()
 @click.option('--config', '-c', 
               help='Path to configuration file',
@@ -188,7 +209,10 @@ def signal_handler(signum, frame):
               default='INFO',
               help='Logging level',
               type=click.Choice(['DEBUG', 'INFO', 'WARNING', 'ERROR']))
-def main(config: Optional[Path], log_level: str):
+@click.option('--validate-config',
+              is_flag=True,
+              help='Validate the configuration file against its schema and exit')
+def main(config: Optional[Path], log_level: str, validate_config: bool):
     """
     Scribe HMA v2.2 Engine
     
@@ -197,6 +221,9 @@ def main(config: Optional[Path], log_level: str):
     """
     global engine_instance
     
+    if validate_config:
+        sys.exit(validate_configuration(config))
+    
     # Configure logging
     structlog.configure(
         wrapper_class=structlog.stdlib.BoundLogger,
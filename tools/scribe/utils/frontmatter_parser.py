@@ -3,17 +3,185 @@
 Scribe Frontmatter Parser Utility
 
 Consolidated YAML frontmatter parsing functionality for use across
-action plugins. Provides standardized parsing with error handling
-and preprocessing for special keys.
+action plugins and the standalone KB tools. Provides standardized parsing
+with error handling and preprocessing for special keys.
+
+The block is located with offsets into the original string (the body is
+only sliced when requested), YAML is parsed with libyaml's CSafeLoader when
+available, and parsed results are memoized by content hash in a bounded
+LRU cache shared by all callers in the process.
 """
 
+import copy
+import hashlib
+import threading
 import yaml
 import re
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# libyaml-backed loader is ~10x faster than the pure-Python SafeLoader
+YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_OPENING_DELIMITER = re.compile(r"---[ \t]*\r?\n")
+_CLOSING_DELIMITER = re.compile(r"^---[ \t]*\r?$", re.MULTILINE)
+_AT_KEY_LINE = re.compile(r"^(\s*)(@\w+):\s*(.*)$", re.MULTILINE)
+
+DEFAULT_CACHE_SIZE = 4096
+
+
+class FrontmatterDocument:
+    """
+    Offsets of the frontmatter block within a document.
+
+    Holds a reference to the original content rather than copies of the
+    frontmatter and body; ``frontmatter_text`` and ``body`` slice on access.
+    """
+
+    __slots__ = ("content", "fm_start", "fm_end", "body_start")
+
+    def __init__(self, content: str, fm_start: int = -1, fm_end: int = -1, body_start: int = 0):
+        self.content = content
+        self.fm_start = fm_start
+        self.fm_end = fm_end
+        self.body_start = body_start
+
+    @property
+    def has_frontmatter(self) -> bool:
+        return self.fm_start >= 0
+
+    @property
+    def frontmatter_text(self) -> Optional[str]:
+        """Raw YAML between the delimiters, or None if there is no block."""
+        if not self.has_frontmatter:
+            return None
+        return self.content[self.fm_start:self.fm_end]
+
+    @property
+    def body(self) -> str:
+        """Content after the closing delimiter (the whole content if there is no block)."""
+        return self.content[self.body_start:] if self.body_start else self.content
+
+    @property
+    def start_line(self) -> int:
+        """1-based line number of the first frontmatter line."""
+        return 2 if self.has_frontmatter else 0
+
+    @property
+    def end_line(self) -> int:
+        """1-based line number of the closing delimiter."""
+        if not self.has_frontmatter:
+            return 0
+        return self.content.count("\n", 0, self.fm_end) + 1
+
+    def parse(self, quote_at_keys: bool = False, copy_result: bool = True) -> Any:
+        """Parse the block via load_frontmatter_yaml; None if there is no block."""
+        text = self.frontmatter_text
+        if text is None:
+            return None
+        return load_frontmatter_yaml(text, quote_at_keys=quote_at_keys, copy_result=copy_result)
+
+
+def split_frontmatter(content: str) -> FrontmatterDocument:
+    """
+    Locate a ``---`` delimited frontmatter block at the start of content.
+
+    The opening delimiter must be the first line; the block ends at the next
+    line consisting only of ``---``. No substrings are created.
+    """
+    opening = _OPENING_DELIMITER.match(content)
+    if not opening:
+        return FrontmatterDocument(content)
+    fm_start = opening.end()
+    closing = _CLOSING_DELIMITER.search(content, fm_start)
+    if not closing:
+        return FrontmatterDocument(content)
+    body_start = closing.end()
+    if content.startswith("\n", body_start):
+        body_start += 1
+    return FrontmatterDocument(content, fm_start, closing.start(), body_start)
+
+
+class _ParseCache:
+    """Thread-safe bounded LRU of parsed YAML keyed by a digest of the source text."""
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Tuple[bytes, bool], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple[bytes, bool]) -> Tuple[bool, Any]:
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, value
+
+    def put(self, key: Tuple[bytes, bool], value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries), "maxsize": self.maxsize}
+
+
+_parse_cache = _ParseCache()
+
+
+def quote_at_key_lines(frontmatter_str: str) -> str:
+    """Quote ``@key:`` mapping keys (JSON-LD style) so they are valid YAML."""
+    if "@" not in frontmatter_str:
+        return frontmatter_str
+    return _AT_KEY_LINE.sub(r'\1"\2": \3', frontmatter_str)
+
+
+def load_frontmatter_yaml(frontmatter_str: str, quote_at_keys: bool = False, copy_result: bool = True) -> Any:
+    """
+    Parse a frontmatter YAML string, memoized by content hash.
+
+    Raises yaml.YAMLError on invalid input (errors are not cached). Cached
+    results are deep-copied unless ``copy_result`` is False, so callers that
+    only read the data can skip the copy.
+    """
+    key = (hashlib.blake2b(frontmatter_str.encode("utf-8"), digest_size=16).digest(), quote_at_keys)
+    found, data = _parse_cache.get(key)
+    if not found:
+        text = quote_at_key_lines(frontmatter_str) if quote_at_keys else frontmatter_str
+        data = yaml.load(text, Loader=YAML_SAFE_LOADER)
+        _parse_cache.put(key, data)
+    if copy_result and isinstance(data, (dict, list)):
+        return copy.deepcopy(data)
+    return data
+
+
+def clear_frontmatter_cache() -> None:
+    """Drop all memoized parse results."""
+    _parse_cache.clear()
+
+
+def frontmatter_cache_info() -> Dict[str, int]:
+    """Hit/miss counters and current size of the parse cache."""
+    return _parse_cache.info()
+
 
 def parse_frontmatter(content: str) -> Optional[Dict[str, Any]]:
     """
@@ -33,11 +201,8 @@ def parse_frontmatter(content: str) -> Optional[Dict[str, Any]]:
         return None
     
     try:
-        # Preprocess for keys starting with @ (common in JSON-LD contexts)
-        processed_frontmatter_str = _preprocess_special_keys(frontmatter_str)
-        
-        # Parse YAML
-        frontmatter_data = yaml.safe_load(processed_frontmatter_str)
+        # Keys starting with @ (common in JSON-LD contexts) are quoted before parsing
+        frontmatter_data = load_frontmatter_yaml(frontmatter_str, quote_at_keys=True)
         
         # Ensure we return a dict (not None, string, etc.)
         return frontmatter_data if isinstance(frontmatter_data, dict) else None
@@ -62,16 +227,10 @@ def _extract_frontmatter_block(content: str) -> Optional[str]:
     Returns:
         Raw frontmatter string or None if not found
     """
-    if not content.strip().startswith('---'):
-        return None
-    
-    # Find the end marker
-    end_marker = content.find('---', 4)  # Start search after first ---
-    if end_marker == -1:
+    frontmatter_str = split_frontmatter(content).frontmatter_text
+    if frontmatter_str is None:
         return None
-    
-    # Extract frontmatter content between markers
-    frontmatter_str = content[4:end_marker].strip()
+    frontmatter_str = frontmatter_str.strip()
     return frontmatter_str if frontmatter_str else None
 
 
@@ -88,22 +247,7 @@ def _preprocess_special_keys(frontmatter_str: str) -> str:
     Returns:
         Preprocessed frontmatter string
     """
-    processed_lines = []
-    
-    for line in frontmatter_str.splitlines():
-        # Check if line starts with @ and contains a colon
-        if line.strip().startswith('@') and ':' in line:
-            # Split on first colon
-            key_part, value_part = line.split(':', 1)
-            key = key_part.strip()
-            value = value_part.strip()
-            
-            # Quote the key to make it valid YAML
-            processed_lines.append(f'"{key}": {value}')
-        else:
-            processed_lines.append(line)
-    
-    return "\n".join(processed_lines)
+    return quote_at_key_lines(frontmatter_str)
 
 
 def has_frontmatter(content: str) -> bool:
@@ -129,17 +273,12 @@ def remove_frontmatter(content: str) -> str:
     Returns:
         Content with frontmatter removed
     """
-    if not content.strip().startswith('---'):
-        return content
-    
-    # Find the end marker
-    end_marker = content.find('---', 4)
-    if end_marker == -1:
+    document = split_frontmatter(content)
+    if not document.has_frontmatter:
         return content
     
     # Return content after the closing ---
-    remaining_content = content[end_marker + 3:]
-    return remaining_content.lstrip('\n')
+    return document.body.lstrip('\n')
 
 
 def apply_frontmatter(content: str, frontmatter: Dict[str, Any]) -> str:
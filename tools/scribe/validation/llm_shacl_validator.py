@@ -9,6 +9,7 @@ This module provides validation loop with retry mechanisms and deterministic fal
 to ensure 100% success rate for frontmatter generation.
 """
 
+import asyncio
 import yaml
 import logging
 from typing import Dict, List, Any, Optional, Tuple, Union
@@ -47,7 +48,7 @@ class LLMSHACLValidator:
     fallback to ensure no scenario where automation fails.
     """
     
-    def __init__(self, shacl_shapes_path='standards/registry/shacl-shapes.ttl'):
+    def __init__(self, shacl_shapes_path='standards/registry/shacl-shapes.ttl', llm_client=None):
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         self.shacl_shapes_path = shacl_shapes_path
         
@@ -58,8 +59,8 @@ class LLMSHACLValidator:
             self.logger.warning(f"Could not initialize GraphValidator: {e}")
             self.shacl_validator = None
         
-        # Initialize mock LLM client (replace with actual implementation)
-        self.llm_client = self._initialize_mock_llm_client()
+        # Generation goes through the supplied client (e.g. the cached LLMClient); mock otherwise
+        self.llm_client = llm_client or self._initialize_mock_llm_client()
         
         # Field defaults for deterministic fallback
         self.field_defaults = self._initialize_field_defaults()
@@ -83,7 +84,6 @@ class LLMSHACLValidator:
         self.logger.info(f"Starting validation loop for info-type: {info_type}")
         
         current_prompt = initial_prompt
-        validation_errors = []
         
         for attempt in range(max_attempts):
             self.logger.info(f"Validation attempt {attempt + 1}/{max_attempts}")
@@ -91,35 +91,9 @@ class LLMSHACLValidator:
             try:
                 # Sub-step 3.1: Generate frontmatter
                 generated_frontmatter = self._generate_frontmatter_with_llm(current_prompt)
-                
-                # Sub-step 3.2: Parse YAML
-                try:
-                    frontmatter_dict = yaml.safe_load(generated_frontmatter)
-                    if not isinstance(frontmatter_dict, dict):
-                        raise yaml.YAMLError("Generated content is not a valid YAML dictionary")
-                        
-                except yaml.YAMLError as e:
-                    self.logger.warning(f"YAML parsing error on attempt {attempt + 1}: {e}")
-                    current_prompt = self._add_yaml_error_feedback(current_prompt, str(e))
-                    continue
-                
-                # Sub-step 3.3: Validate against SHACL
-                validation_result = self._validate_against_shacl(frontmatter_dict, info_type)
-                
-                # Sub-step 3.4: Check for success
-                if validation_result['conforms']:
-                    self.logger.info(f"Validation successful on attempt {attempt + 1}")
-                    return {
-                        'success': True,
-                        'frontmatter': frontmatter_dict,
-                        'attempts_used': attempt + 1,
-                        'validation_method': 'llm_generation'
-                    }
-                
-                # Sub-step 3.5: Add validation errors to prompt for retry
-                validation_errors = validation_result['violations']
-                current_prompt = self._add_validation_feedback(current_prompt, validation_errors)
-                
+                result, current_prompt = self._evaluate_attempt(generated_frontmatter, attempt, current_prompt, info_type)
+                if result is not None:
+                    return result
             except Exception as e:
                 self.logger.warning(f"Unexpected error on attempt {attempt + 1}: {e}")
                 current_prompt = self._add_error_feedback(current_prompt, str(e))
@@ -128,15 +102,78 @@ class LLMSHACLValidator:
         self.logger.warning(f"All {max_attempts} attempts failed, using deterministic fallback")
         return self._generate_deterministic_fallback(info_type)
     
+    async def avalidate_with_retry_loop(self, initial_prompt: str, info_type: str,
+                                        max_attempts: int = 5,
+                                        semaphore: Optional[asyncio.Semaphore] = None) -> Dict[str, Any]:
+        """
+        Async form of ``validate_with_retry_loop``.
+        
+        Retries for one document stay sequential while separate documents run
+        concurrently; ``semaphore`` bounds the in-flight LLM calls.
+        """
+        current_prompt = initial_prompt
+        
+        for attempt in range(max_attempts):
+            try:
+                generated_frontmatter = await self._agenerate_frontmatter_with_llm(current_prompt, semaphore)
+                result, current_prompt = self._evaluate_attempt(generated_frontmatter, attempt, current_prompt, info_type)
+                if result is not None:
+                    return result
+            except Exception as e:
+                self.logger.warning(f"Unexpected error on attempt {attempt + 1}: {e}")
+                current_prompt = self._add_error_feedback(current_prompt, str(e))
+        
+        self.logger.warning(f"All {max_attempts} attempts failed, using deterministic fallback")
+        return self._generate_deterministic_fallback(info_type)
+    
+    def _evaluate_attempt(self, generated_frontmatter: str, attempt: int, current_prompt: str,
+                          info_type: str) -> Tuple[Optional[Dict[str, Any]], str]:
+        """Parse and validate one generation; returns (result, prompt for the next attempt)."""
+        # Sub-step 3.2: Parse YAML
+        try:
+            frontmatter_dict = yaml.safe_load(generated_frontmatter)
+            if not isinstance(frontmatter_dict, dict):
+                raise yaml.YAMLError("Generated content is not a valid YAML dictionary")
+                
+        except yaml.YAMLError as e:
+            self.logger.warning(f"YAML parsing error on attempt {attempt + 1}: {e}")
+            return None, self._add_yaml_error_feedback(current_prompt, str(e))
+        
+        # Sub-step 3.3: Validate against SHACL
+        validation_result = self._validate_against_shacl(frontmatter_dict, info_type)
+        
+        # Sub-step 3.4: Check for success
+        if validation_result['conforms']:
+            self.logger.info(f"Validation successful on attempt {attempt + 1}")
+            return {
+                'success': True,
+                'frontmatter': frontmatter_dict,
+                'attempts_used': attempt + 1,
+                'validation_method': 'llm_generation'
+            }, current_prompt
+        
+        # Sub-step 3.5: Add validation errors to prompt for retry
+        return None, self._add_validation_feedback(current_prompt, validation_result['violations'])
+    
     def _generate_frontmatter_with_llm(self, prompt: str) -> str:
         """Generate frontmatter using LLM client."""
         try:
-            # Mock LLM generation - replace with actual LLM client
             return self.llm_client.generate(prompt)
         except Exception as e:
             self.logger.error(f"LLM generation failed: {e}")
             raise
     
+    async def _agenerate_frontmatter_with_llm(self, prompt: str,
+                                              semaphore: Optional[asyncio.Semaphore] = None) -> str:
+        """Generate frontmatter without blocking the event loop (clients without ``agenerate`` run in a thread)."""
+        try:
+            if hasattr(self.llm_client, 'agenerate'):
+                return await self.llm_client.agenerate(prompt, semaphore=semaphore)
+            return await asyncio.to_thread(self.llm_client.generate, prompt)
+        except Exception as e:
+            self.logger.error(f"LLM generation failed: {e}")
+            raise
+    
     def _validate_against_shacl(self, frontmatter_dict: Dict[str, Any], 
                                info_type: str) -> Dict[str, Any]:
         """Sub-step 3.3: Validate frontmatter against SHACL constraints."""
@@ -77,9 +77,11 @@ class ScribeEventHandler(FileSystemEventHandler):
             'event_id': event_id,
             'type': event_type,
             'file_path': file_path,
-            'old_path': old_path,
             'timestamp': time.time()
         }
+        if old_path is not None:
+            # Only moves carry a source path; the L1 schema types old_path as a string
+            event_data['old_path'] = old_path
         
         # HMA v2.2 L1 Boundary Validation BEFORE processing
         with self.telemetry_manager.trace_boundary_call(
@@ -8,20 +8,40 @@ Generates a formatted repository tree structure using configuration files:
 - .treeaddtext: Annotations for specific paths
 - .treeicon: Icons for specific paths
 
-Usage: python main_repo_tree.py
+Each directory is listed with a single os.scandir pass and lines are streamed
+to the output file. With --incremental, directory listings are cached in
+.repo-tree.cache keyed by directory mtime, so unchanged directories are not
+re-scanned when repo-tree.md is regenerated.
+
+Usage: python main_repo_tree.py [--incremental]
 Output: repo-tree.md in root directory
 """
 
+import argparse
+import hashlib
+import json
 import os
+import re
 import fnmatch
+import tempfile
+import time
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 from datetime import datetime
 
+# Listings of directories modified this recently are not cached, since a
+# change within the same mtime tick would go unnoticed on the next run
+MTIME_SAFETY_WINDOW_NS = 2_000_000_000
+
 class RepositoryTreeGenerator:
-    def __init__(self, root_path: str = "."):
+    CACHE_VERSION = 1
+
+    def __init__(self, root_path: str = ".", incremental: bool = False,
+                 cache_file: Optional[Path] = None):
         self.root_path = Path(root_path).resolve()
         self.output_file = self.root_path / "repo-tree.md"
+        self.incremental = incremental
+        self.cache_file = Path(cache_file) if cache_file else self.root_path / ".repo-tree.cache"
         
         # Configuration files are now in repo-tree folder
         # If we're already in the repo-tree folder, use current directory
@@ -44,6 +64,39 @@ class RepositoryTreeGenerator:
             '.html', '.css', '.sh', '.bat', '.ps1', '.xml', '.toml'
         }
 
+        self._compile_ignore_matchers()
+
+        # Incremental mode: relative dir path -> [mtime_ns, child dir names, file names]
+        self._listing_cache: Dict[str, list] = {}
+        self._fresh_listings: Dict[str, list] = {}
+        self.scan_stats = {"directories_scanned": 0, "directories_reused": 0}
+        if self.incremental:
+            self._load_listing_cache()
+
+    def _compile_ignore_matchers(self):
+        """Precompile .treeignore patterns into one regex plus substring checks."""
+        if self.ignore_patterns:
+            combined = "|".join(
+                f"(?:{fnmatch.translate(os.path.normcase(pattern))})" for pattern in self.ignore_patterns
+            )
+            self._ignore_regex = re.compile(combined)
+        else:
+            self._ignore_regex = None
+        self._ignore_substrings = tuple(self.ignore_patterns)
+        self._name_ignore_cache: Dict[str, bool] = {}
+
+    def _is_ignored(self, name: str, relative_path: str) -> bool:
+        """Match a name and its relative path against the compiled .treeignore patterns."""
+        name_ignored = self._name_ignore_cache.get(name)
+        if name_ignored is None:
+            name_ignored = bool(self._ignore_regex and self._ignore_regex.match(os.path.normcase(name)))
+            self._name_ignore_cache[name] = name_ignored
+        if name_ignored:
+            return True
+        if self._ignore_regex and self._ignore_regex.match(os.path.normcase(relative_path)):
+            return True
+        return any(pattern in relative_path for pattern in self._ignore_substrings)
+
     def _load_ignore_patterns(self) -> List[str]:
         """Load ignore patterns from .treeignore file."""
         ignore_file = self.config_path / ".treeignore"
@@ -183,21 +236,7 @@ class RepositoryTreeGenerator:
 
     def should_ignore_completely(self, path: Path) -> bool:
         """Check if a path should be completely ignored based on .treeignore patterns."""
-        path_name = path.name
-        relative_path = self.get_relative_path(path)
-        
-        for pattern in self.ignore_patterns:
-            # Check against folder name
-            if fnmatch.fnmatch(path_name, pattern):
-                return True
-            # Check against relative path
-            if fnmatch.fnmatch(relative_path, pattern):
-                return True
-            # Check against absolute pattern
-            if pattern in relative_path:
-                return True
-        
-        return False
+        return self._is_ignored(path.name, self.get_relative_path(path))
 
     def should_ignore_subtree(self, path: Path) -> bool:
         """Check if a path should be shown but contents ignored."""
@@ -235,18 +274,23 @@ class RepositoryTreeGenerator:
 
     def should_include_file(self, file_path: Path) -> bool:
         """Determine if a file should be included in the tree."""
+        return self._should_include_file_name(file_path.name, self.get_relative_path(file_path))
+
+    def _should_include_file_name(self, name: str, relative_path: str) -> bool:
         # Check if file is ignored
-        if self.should_ignore_completely(file_path):
+        if self._is_ignored(name, relative_path):
             return False
-            
+
+        suffix = os.path.splitext(name)[1]
+
         # Include files with specific extensions
-        if file_path.suffix.lower() in self.included_extensions:
+        if suffix.lower() in self.included_extensions:
             return True
-            
+
         # Include files without extensions (like .gitignore, .cursorignore)
-        if file_path.suffix == '' and file_path.name.startswith('.'):
+        if suffix == '' and name.startswith('.'):
             return True
-            
+
         return False
 
     def get_relative_path(self, path: Path) -> str:
@@ -257,86 +301,153 @@ class RepositoryTreeGenerator:
         except ValueError:
             return str(path).replace('\\', '/')
 
-    def generate_tree_recursive(self, current_path: Path, prefix: str = "", is_last: bool = True) -> List[str]:
-        """Recursively generate tree structure."""
-        lines = []
-        
+    @staticmethod
+    def _child_relative_path(relative_path: str, name: str) -> str:
+        return name if relative_path == "." else f"{relative_path}/{name}"
+
+    def _config_fingerprint(self) -> str:
+        """Hash of everything that decides which entries a listing contains."""
+        material = json.dumps([self.ignore_patterns, sorted(self.included_extensions)])
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    def _load_listing_cache(self):
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if (data.get("version") == self.CACHE_VERSION
+                and data.get("root") == str(self.root_path)
+                and data.get("config") == self._config_fingerprint()):
+            self._listing_cache = data.get("directories", {})
+
+    def save_listing_cache(self):
+        """Persist directory listings gathered during the last generation."""
+        payload = {
+            "version": self.CACHE_VERSION,
+            "root": str(self.root_path),
+            "config": self._config_fingerprint(),
+            "directories": self._fresh_listings,
+        }
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_file.parent, prefix=f"{self.cache_file.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(payload, f)
+            os.replace(tmp_path, self.cache_file)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def _list_directory(self, current_path: Path, relative_path: str) -> Tuple[List[str], List[str]]:
+        """
+        Return sorted (child directory names, included file names).
+
+        Uses one os.scandir pass with the DirEntry's cached type information.
+        In incremental mode, a cached listing is reused when the directory's
+        mtime is unchanged.
+        """
+        mtime_ns = None
+        if self.incremental:
+            try:
+                mtime_ns = os.stat(current_path).st_mtime_ns
+            except OSError:
+                mtime_ns = None
+            cached = self._listing_cache.get(relative_path)
+            if cached is not None and mtime_ns is not None and cached[0] == mtime_ns:
+                self.scan_stats["directories_reused"] += 1
+                self._fresh_listings[relative_path] = cached
+                return cached[1], cached[2]
+
+        dirs = []
+        files = []
+        with os.scandir(current_path) as entries:
+            for entry in entries:
+                child_relative = self._child_relative_path(relative_path, entry.name)
+                try:
+                    if entry.is_dir():
+                        if not self._is_ignored(entry.name, child_relative):
+                            dirs.append(entry.name)
+                    elif entry.is_file():
+                        if self._should_include_file_name(entry.name, child_relative):
+                            files.append(entry.name)
+                except OSError:
+                    continue
+        dirs.sort(key=os.path.normcase)
+        files.sort(key=os.path.normcase)
+        self.scan_stats["directories_scanned"] += 1
+
+        if mtime_ns is not None and time.time_ns() - mtime_ns > MTIME_SAFETY_WINDOW_NS:
+            self._fresh_listings[relative_path] = [mtime_ns, dirs, files]
+        return dirs, files
+
+    def iter_tree_lines(self, current_path: Path, prefix: str = "", is_last: bool = True,
+                        relative_path: Optional[str] = None) -> Iterator[str]:
+        """Yield tree lines for current_path and its descendants, depth first."""
+        if relative_path is None:
+            relative_path = self.get_relative_path(current_path)
+
         # Check if path should be completely ignored
-        if self.should_ignore_completely(current_path):
-            return lines
-        
-        relative_path = self.get_relative_path(current_path)
-        
+        if self._is_ignored(current_path.name, relative_path):
+            return
+
         # Skip the root directory itself
         if current_path != self.root_path:
             icon = self.get_folder_icon(current_path, relative_path)
             annotation = self.get_folder_annotation(current_path, relative_path)
-            
-            lines.append(f"{prefix}{icon} {current_path.name}{annotation}")
-            
+
+            yield f"{prefix}{icon} {current_path.name}{annotation}"
+
             # Check if we should ignore the subtree (show folder but not contents)
-            if self.should_ignore_subtree(current_path):
-                return lines
-            
+            if relative_path in self.subtree_ignore_paths:
+                return
+
             # Update prefix for children
             new_prefix = prefix + ("    " if is_last else "│   ")
         else:
             new_prefix = ""
-        
-        # Get children (directories and files)
+
         try:
-            children = []
-            
-            # Add directories first
-            dirs = []
-            for d in current_path.iterdir():
-                if d.is_dir() and not self.should_ignore_completely(d):
-                    dirs.append(d)
-            dirs.sort()
-            
-            # Add files
-            files = []
-            for f in current_path.iterdir():
-                if f.is_file() and self.should_include_file(f):
-                    files.append(f)
-            files.sort()
-            
-            children = dirs + files
-            
-            for i, child in enumerate(children):
-                is_last_child = (i == len(children) - 1)
-                child_prefix = new_prefix
-                
-                if child.is_dir():
-                    # Recursively process directory
-                    child_lines = self.generate_tree_recursive(child, child_prefix, is_last_child)
-                    lines.extend(child_lines)
-                else:
-                    # Add file
-                    lines.append(f"{child_prefix}📄 {child.name}")
-        
+            dirs, files = self._list_directory(current_path, relative_path)
         except PermissionError:
             # Skip directories we can't access
-            pass
-        
-        return lines
+            return
 
-    def generate_tree(self) -> str:
-        """Generate the complete repository tree."""
+        # Directories first, then files
+        last_index = len(dirs) + len(files) - 1
+        for i, name in enumerate(dirs):
+            yield from self.iter_tree_lines(current_path / name, new_prefix, i == last_index,
+                                            self._child_relative_path(relative_path, name))
+        for name in files:
+            yield f"{new_prefix}📄 {name}"
+
+    def generate_tree_recursive(self, current_path: Path, prefix: str = "", is_last: bool = True) -> List[str]:
+        """Recursively generate tree structure."""
+        return list(self.iter_tree_lines(current_path, prefix, is_last))
+
+    def iter_document(self) -> Iterator[str]:
+        """Yield the complete repo-tree.md content in chunks."""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
-        # Start with root directory
-        lines = [
-            "```",
-            "📁 master-knowledge-base"
-        ]
-        
-        # Generate tree starting from root, but show master-knowledge-base as root
-        tree_lines = self.generate_tree_recursive(self.root_path, "    ")
-        lines.extend(tree_lines)
-        
-        lines.append("```")
-        
+
+        header = f"""# Repository Tree Structure
+
+**Generated**: {timestamp}  
+**Script**: `tools/utilities/repo-tree/main_repo_tree.py`  
+**Output**: Automated repository structure overview  
+
+---
+
+## Repository Structure
+
+"""
+        yield header
+
+        # Start with root directory, shown as master-knowledge-base
+        yield "```\n📁 master-knowledge-base"
+        for line in self.iter_tree_lines(self.root_path, "    "):
+            yield "\n" + line
+        yield "\n```"
+
         # Generate legend and configuration sections
         legend_section = f"""## Legend
 
@@ -351,39 +462,42 @@ class RepositoryTreeGenerator:
 
 **Configuration Location**: `tools/utilities/repo-tree/`"""
 
-        header = f"""# Repository Tree Structure
-
-**Generated**: {timestamp}  
-**Script**: `tools/utilities/repo-tree/main_repo_tree.py`  
-**Output**: Automated repository structure overview  
+        # Legend and config at the bottom
+        yield f"\n\n---\n\n{legend_section}\n\n---\n\n{config_section}\n"
 
----
-
-## Repository Structure
-
-"""
-        
-        # Combine everything with legend and config at the bottom
-        content = header + "\n".join(lines) + f"\n\n---\n\n{legend_section}\n\n---\n\n{config_section}\n"
-        
-        return content
+    def generate_tree(self) -> str:
+        """Generate the complete repository tree."""
+        return "".join(self.iter_document())
 
     def write_tree(self):
-        """Generate and write the repository tree to file."""
-        tree_content = self.generate_tree()
-        
+        """Stream the repository tree to a temporary file and move it into place."""
+        total_lines = 0
+        tmp_path = None
+
         try:
-            with open(self.output_file, 'w', encoding='utf-8', errors='replace') as f:
-                f.write(tree_content)
-            
+            fd, tmp_path = tempfile.mkstemp(dir=self.output_file.parent,
+                                            prefix=f".{self.output_file.name}.", suffix=".tmp")
+            with os.fdopen(fd, 'w', encoding='utf-8', errors='replace') as f:
+                for chunk in self.iter_document():
+                    f.write(chunk)
+                    total_lines += chunk.count("\n")
+            os.replace(tmp_path, self.output_file)
+            tmp_path = None
+
+            if self.incremental:
+                self.save_listing_cache()
+
             try:
                 print(f"✅ Repository tree generated successfully!")
                 print(f"📄 Output file: {self.output_file}")
-                print(f"📊 Total lines: {len(tree_content.splitlines())}")
+                print(f"📊 Total lines: {total_lines}")
             except UnicodeEncodeError:
                 print(f"Repository tree generated successfully!")
                 print(f"Output file: {self.output_file}")
-                print(f"Total lines: {len(tree_content.splitlines())}")
+                print(f"Total lines: {total_lines}")
+            if self.incremental:
+                print(f"Directories scanned: {self.scan_stats['directories_scanned']}, "
+                      f"reused from cache: {self.scan_stats['directories_reused']}")
             
         except Exception as e:
             try:
@@ -391,11 +505,19 @@ class RepositoryTreeGenerator:
             except UnicodeEncodeError:
                 print(f"Error writing tree file: {e}")
             return False
+        finally:
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
         
         return True
 
 def main():
     """Main function to generate repository tree."""
+    parser = argparse.ArgumentParser(description="Generate repo-tree.md for the repository.")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Reuse cached listings of directories whose mtime is unchanged (.repo-tree.cache)")
+    args = parser.parse_args()
+
     try:
         print("🎯 Generating Repository Tree Structure...")
     except UnicodeEncodeError:
@@ -426,7 +548,7 @@ def main():
     except UnicodeEncodeError:
         print(f"Repository root: {repo_root}")
     
-    generator = RepositoryTreeGenerator(repo_root)
+    generator = RepositoryTreeGenerator(repo_root, incremental=args.incremental)
     success = generator.write_tree()
     
     if success:
@@ -4,6 +4,10 @@ TODO Tracking Script for Knowledge Base
 
 Scans for > [!TODO] markers in markdown files and generates reports.
 Compatible with Obsidian callout syntax.
+
+Scan results are cached per file keyed by (mtime_ns, size), so repeated
+scans only re-read files that changed; changed files are scanned in
+parallel worker processes.
 """
 
 import os
@@ -14,7 +18,17 @@ import re
 from pathlib import Path
 from datetime import datetime
 from dataclasses import dataclass, asdict
-from typing import List, Dict, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Optional, Tuple
+
+TODO_PATTERN = re.compile(r'^>\s*\[!TODO\](.*)$', re.MULTILINE | re.IGNORECASE)
+# Byte-level pre-check: files without the marker are skipped before decoding or line splitting
+TODO_MARKER_BYTES = re.compile(rb'\[!todo\]', re.IGNORECASE)
+
+CACHE_VERSION = 1
+DEFAULT_CACHE_FILE = ".todo-scan-cache.json"
+# Below this many changed files, worker process start-up costs more than it saves
+PARALLEL_SCAN_THRESHOLD = 64
 
 @dataclass
 class TodoItem:
@@ -25,77 +39,202 @@ class TodoItem:
     context_after: List[str]
     created_date: str
 
+def extract_context(lines: List[str], todo_line_idx: int, context_lines: int = 2) -> tuple:
+    """Extract context lines before and after TODO"""
+    start_idx = max(0, todo_line_idx - context_lines)
+    end_idx = min(len(lines), todo_line_idx + context_lines + 1)
+    
+    context_before = lines[start_idx:todo_line_idx]
+    context_after = lines[todo_line_idx + 1:end_idx]
+    
+    return context_before, context_after
+
+
+def _read_todos(file_path: Path, root_dir: Path, created_date: str) -> List[TodoItem]:
+    """Scan a single file for TODO items, raising if it cannot be read or decoded"""
+    todos = []
+    with open(file_path, 'rb') as f:
+        raw = f.read()
+    if not TODO_MARKER_BYTES.search(raw):
+        return todos
+    
+    # Same newline normalisation as reading in text mode
+    content = raw.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+    lines = content.split('\n')
+    
+    # Find all TODO matches, counting newlines incrementally instead of from the start each time
+    line_start = 0
+    last_offset = 0
+    for match in TODO_PATTERN.finditer(content):
+        line_start += content.count('\n', last_offset, match.start())
+        last_offset = match.start()
+        todo_content = match.group(1).strip()
+        
+        # Get context
+        context_before, context_after = extract_context(lines, line_start)
+        
+        todos.append(TodoItem(
+            file_path=str(file_path.relative_to(root_dir)),
+            line_number=line_start + 1,  # 1-indexed
+            content=todo_content,
+            context_before=context_before,
+            context_after=context_after,
+            created_date=created_date
+        ))
+    
+    return todos
+
+
+def scan_file_for_todos(file_path: Path, root_dir: Path, created_date: str) -> List[TodoItem]:
+    """Scan a single file for TODO items"""
+    try:
+        return _read_todos(file_path, root_dir, created_date)
+    except Exception as e:
+        print(f"Error scanning {file_path}: {e}")
+        return []
+
+
+def _scan_files_worker(file_paths: List[str], root_dir: str, created_date: str) -> Dict[str, Optional[List[dict]]]:
+    """
+    Process-pool entry point: scan a partition of files, returning plain dicts.
+    Files that could not be read map to None so they are not cached as TODO-free.
+    """
+    root = Path(root_dir)
+    results: Dict[str, Optional[List[dict]]] = {}
+    for file_path in file_paths:
+        try:
+            results[file_path] = [asdict(todo) for todo in _read_todos(Path(file_path), root, created_date)]
+        except Exception as e:
+            print(f"Error scanning {file_path}: {e}")
+            results[file_path] = None
+    return results
+
+
 class TodoTracker:
-    def init(self, root_dir="."):
+    def __init__(self, root_dir="."):
         self.root_dir = Path(root_dir)
-        self.todo_pattern = re.compile(r'^>\s*\[!TODO\](.*)$', re.MULTILINE | re.IGNORECASE)
+        self.todo_pattern = TODO_PATTERN
         self.todos: List[TodoItem] = []
+        self.scan_stats: Dict[str, int] = {}
     
     def extract_context(self, lines: List[str], todo_line_idx: int, context_lines: int = 2) -> tuple:
         """Extract context lines before and after TODO"""
-        start_idx = max(0, todo_line_idx - context_lines)
-        end_idx = min(len(lines), todo_line_idx + context_lines + 1)
-        
-        context_before = lines[start_idx:todo_line_idx]
-        context_after = lines[todo_line_idx + 1:end_idx]
-        
-        return context_before, context_after
+        return extract_context(lines, todo_line_idx, context_lines)
     
     def scan_file(self, file_path: Path) -> List[TodoItem]:
         """Scan a single file for TODO items"""
-        todos = []
-        
+        return scan_file_for_todos(file_path, self.root_dir, datetime.now().strftime('%Y-%m-%d'))
+    
+    def load_scan_cache(self, cache_file: Path) -> Dict[str, dict]:
+        """Load per-file scan results keyed by absolute path."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                lines = content.split('\n')
-            
-            # Find all TODO matches
-            for match in self.todo_pattern.finditer(content):
-                # Find line number
-                line_start = content[:match.start()].count('\n')
-                todo_content = match.group(1).strip()
-                
-                # Get context
-                context_before, context_after = self.extract_context(lines, line_start)
-                
-                todo = TodoItem(
-                    file_path=str(file_path.relative_to(self.root_dir)),
-                    line_number=line_start + 1,  # 1-indexed
-                    content=todo_content,
-                    context_before=context_before,
-                    context_after=context_after,
-                    created_date=datetime.now().strftime('%Y-%m-%d')
-                )
-                
-                todos.append(todo)
-        
-        except Exception as e:
-            print(f"Error scanning {file_path}: {e}")
-        
-        return todos
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (json.JSONDecodeError, OSError) as e:
+            print(f"Ignoring unreadable scan cache {cache_file}: {e}")
+            return {}
+        if data.get("version") != CACHE_VERSION or data.get("root_directory") != str(self.root_dir.resolve()):
+            return {}
+        return data.get("files", {})
+    
+    def save_scan_cache(self, cache_file: Path, entries: Dict[str, dict]):
+        """Write the scan cache atomically."""
+        data = {
+            "version": CACHE_VERSION,
+            "root_directory": str(self.root_dir.resolve()),
+            "files": entries
+        }
+        temp_file = cache_file.with_name(cache_file.name + ".tmp")
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(temp_file, cache_file)
     
-    def scan_directory(self, directory: Path = None, exclude_patterns: List[str] = None) -> int:
-        """Scan directory for TODO items"""
+    def scan_directory(self, directory: Path = None, exclude_patterns: List[str] = None,
+                       cache_file: Optional[Path] = None, max_workers: Optional[int] = None) -> int:
+        """
+        Scan directory for TODO items.
+        
+        With cache_file, files whose (mtime_ns, size) match the cached entry are
+        not re-read; only changed files are scanned, in parallel when there are
+        enough of them. Cached entries outside ``directory`` are kept, and files
+        that fail to read are left out of the cache. Returns the number of files
+        considered.
+        """
         if directory is None:
             directory = self.root_dir
         
         if exclude_patterns is None:
             exclude_patterns = ['.git', '__pycache__', 'node_modules', '.vscode']
         
-        self.todos = []
-        scanned_count = 0
+        cached = self.load_scan_cache(cache_file) if cache_file else {}
+        entries: Dict[str, dict] = {}
+        to_scan: List[Tuple[str, int, int]] = []
         
         for md_file in directory.rglob("*.md"):
             # Check if file should be excluded
             if any(pattern in str(md_file) for pattern in exclude_patterns):
                 continue
             
-            file_todos = self.scan_file(md_file)
-            self.todos.extend(file_todos)
-            scanned_count += 1
+            try:
+                stat = md_file.stat()
+            except OSError as e:
+                print(f"Error scanning {md_file}: {e}")
+                continue
+            key = str(md_file.resolve())
+            entry = cached.get(key)
+            if entry and entry.get("mtime_ns") == stat.st_mtime_ns and entry.get("size") == stat.st_size:
+                entries[key] = entry
+            else:
+                to_scan.append((key, stat.st_mtime_ns, stat.st_size))
+        
+        created_date = datetime.now().strftime('%Y-%m-%d')
+        root_dir = str(self.root_dir.resolve())
+        paths = [path for path, _, _ in to_scan]
+        workers = max_workers or os.cpu_count() or 1
+        if workers > 1 and len(paths) >= PARALLEL_SCAN_THRESHOLD:
+            partitions = [paths[i::workers] for i in range(workers)]
+            scanned: Dict[str, Optional[List[dict]]] = {}
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for partial in executor.map(_scan_files_worker, partitions,
+                                            [root_dir] * workers, [created_date] * workers):
+                    scanned.update(partial)
+        else:
+            scanned = _scan_files_worker(paths, root_dir, created_date)
+        
+        failed = 0
+        for path, mtime_ns, size in to_scan:
+            todos = scanned.get(path)
+            if todos is None:
+                failed += 1
+                continue
+            # Keep the date a TODO was first seen rather than restamping it on every scan
+            previous = {(t["line_number"], t["content"]): t["created_date"] for t in cached.get(path, {}).get("todos", [])}
+            for todo in todos:
+                todo["created_date"] = previous.get((todo["line_number"], todo["content"]), todo["created_date"])
+            entries[path] = {"mtime_ns": mtime_ns, "size": size, "todos": todos}
+        
+        self.todos = [
+            TodoItem(**todo)
+            for path in sorted(entries)
+            for todo in entries[path]["todos"]
+        ]
+        self.scan_stats = {
+            "files_considered": len(entries) + failed,
+            "files_rescanned": len(to_scan),
+            "files_from_cache": len(entries) + failed - len(to_scan),
+            "files_failed": failed,
+        }
+        
+        if cache_file:
+            # A subdirectory scan must not drop the rest of the root's cache
+            scanned_root = directory.resolve()
+            outside = {path: entry for path, entry in cached.items()
+                       if path not in entries and not Path(path).is_relative_to(scanned_root)}
+            self.save_scan_cache(cache_file, {**outside, **entries})
         
-        return scanned_count
+        return len(entries) + failed
     
     def save_todos_json(self, output_file: Path):
         """Save TODOs to JSON file"""
@@ -224,6 +363,10 @@ class TodoTracker:
 def main():
     parser = argparse.ArgumentParser(description="Track TODO items in markdown files")
     parser.add_argument("--root", "-r", default=".", help="Root directory to scan")
+    parser.add_argument("--cache-file", default=DEFAULT_CACHE_FILE,
+                        help="Per-file scan cache, relative to root (default: %(default)s)")
+    parser.add_argument("--no-cache", action="store_true", help="Rescan every file and do not write the cache")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes for changed files")
     
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
     
@@ -252,11 +395,13 @@ def main():
         return
     
     tracker = TodoTracker(args.root)
+    cache_file = None if args.no_cache else tracker.root_dir / args.cache_file
     
     if args.command == "scan":
         scan_dir = Path(args.directory) if args.directory else tracker.root_dir
-        count = tracker.scan_directory(scan_dir, args.exclude)
-        print(f"Scanned {count} files, found {len(tracker.todos)} TODOs")
+        count = tracker.scan_directory(scan_dir, args.exclude, cache_file=cache_file, max_workers=args.workers)
+        print(f"Scanned {count} files ({tracker.scan_stats['files_rescanned']} changed, "
+              f"{tracker.scan_stats['files_from_cache']} from cache), found {len(tracker.todos)} TODOs")
         
         tracker.save_todos_json(Path(args.output))
         print(f"Saved TODOs to {args.output}")
@@ -272,7 +417,7 @@ def main():
                 tracker.todos = [TodoItem(**todo) for todo in data["todos"]]
         else:
             # Scan first
-            tracker.scan_directory()
+            tracker.scan_directory(cache_file=cache_file, max_workers=args.workers)
         
         if args.format == "console":
             tracker.generate_console_report()
@@ -291,7 +436,7 @@ def main():
                 data = json.load(f)
                 tracker.todos = [TodoItem(**todo) for todo in data["todos"]]
         else:
-            tracker.scan_directory()
+            tracker.scan_directory(cache_file=cache_file, max_workers=args.workers)
         
         stats = tracker.get_stats()
         print(json.dumps(stats, indent=2))
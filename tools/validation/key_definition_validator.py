@@ -27,6 +27,7 @@ class KeyDefinitionValidator:
         self.errors = []
         self.warnings = []
         self.key_definitions = {}
+        self.key_usage = {}
         
     def validate_all(self) -> Dict[str, Any]:
         """Run comprehensive key definition validation."""
@@ -37,6 +38,7 @@ class KeyDefinitionValidator:
             "validation_type": "key_definition_validation",
             "errors": [],
             "warnings": [],
+            "key_usage": {},
             "summary": {}
         }
         
@@ -62,11 +64,16 @@ class KeyDefinitionValidator:
         # Compile results
         results["errors"] = self.errors
         results["warnings"] = self.warnings
+        results["key_usage"] = {
+            key: {"files": files, "total_references": sum(files.values())}
+            for key, files in self.key_usage.items()
+        }
         results["summary"] = {
             "total_errors": len(self.errors),
             "total_warnings": len(self.warnings),
             "status": "PASS" if len(self.errors) == 0 else "FAIL",
             "keys_analyzed": len(self.key_definitions),
+            "keys_used": sum(1 for files in self.key_usage.values() if files),
             "categories_found": len(set(key.split('-')[0] for key in self.key_definitions.keys() if '-' in key))
         }
         
@@ -225,35 +232,52 @@ class KeyDefinitionValidator:
                 if abbrev in key.lower():
                     self.warnings.append(f"Unclear abbreviation in key '{key}': {abbrev}")
     
+    # Single tokeniser for the three keyref syntaxes: [[key]], `key` and {{...key...}}.
+    # Each standards file is scanned once; matched tokens are resolved with dict lookups.
+    KEY_REFERENCE_PATTERN = re.compile(
+        r'\[\[(?P<wiki>[^\]\n]+)\]\]'
+        r'|`(?P<code>[^`\n]+)`'
+        r'|\{\{(?P<template>[^\n]*?)\}\}'
+    )
+    TEMPLATE_TOKEN_PATTERN = re.compile(r'[A-Za-z0-9_-]+')
+
+    def _scan_key_references(self, content: str, known_keys: Set[str]) -> Dict[str, int]:
+        """Count references to known keys in one linear pass over the content."""
+        counts = defaultdict(int)
+        for match in self.KEY_REFERENCE_PATTERN.finditer(content):
+            kind = match.lastgroup
+            token = match.group(kind)
+            if kind == 'template':
+                # {{key.name}} style templates may wrap the key in other text
+                for candidate in set(self.TEMPLATE_TOKEN_PATTERN.findall(token)):
+                    if candidate in known_keys:
+                        counts[candidate] += 1
+            elif token in known_keys:
+                counts[token] += 1
+        return counts
+
     def _cross_validate_key_usage(self) -> None:
         """Cross-validate key usage across standards files."""
         print("🔄 Cross-validating key usage...")
         
-        # Find key references in other files
-        used_keys = set()
-        unused_keys = set(self.key_definitions.keys())
+        known_keys = set(self.key_definitions.keys())
+        # key -> {file name -> reference count}
+        self.key_usage = {key: {} for key in sorted(known_keys)}
         
-        for file_path in self.standards_dir.glob("*.md"):
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                # Look for key references in various formats
-                for key in self.key_definitions.keys():
-                    patterns = [
-                        rf'\[\[{re.escape(key)}\]\]',  # [[key]] format
-                        rf'`{re.escape(key)}`',        # `key` format
-                        rf'{{{{.*{re.escape(key)}.*}}}}'  # {{key}} template format
-                    ]
+        if known_keys:
+            for file_path in sorted(self.standards_dir.glob("*.md")):
+                try:
+                    with open(file_path, 'r', encoding='utf-8') as f:
+                        content = f.read()
                     
-                    for pattern in patterns:
-                        if re.search(pattern, content):
-                            used_keys.add(key)
-                            unused_keys.discard(key)
-                            break
-                            
-            except Exception as e:
-                self.warnings.append(f"Failed to read {file_path} for key usage: {str(e)}")
+                    for key, count in self._scan_key_references(content, known_keys).items():
+                        self.key_usage[key][file_path.name] = count
+                                
+                except Exception as e:
+                    self.warnings.append(f"Failed to read {file_path} for key usage: {str(e)}")
+        
+        used_keys = {key for key, files in self.key_usage.items() if files}
+        unused_keys = known_keys - used_keys
         
         # Report unused keys
         if unused_keys:
@@ -325,6 +349,20 @@ status: '{results["summary"]["status"]}'
                 if len(keys) > 5:
                     report_content += f"  - ... and {len(keys) - 5} more\n"
         
+        # Add key usage index
+        if results.get("key_usage"):
+            report_content += """
+
+### Key Usage Index
+
+| Key | References | Files |
+|-----|------------|-------|
+"""
+            for key, usage in sorted(results["key_usage"].items(),
+                                     key=lambda item: -item[1]["total_references"]):
+                files = ", ".join(sorted(usage["files"])) or "-"
+                report_content += f"| `{key}` | {usage['total_references']} | {files} |\n"
+        
         report_content += f"""
 
 ## Validation Details
@@ -20,6 +20,8 @@ import json
 
 # Add tools path for importing
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from tools.scribe.utils.frontmatter_parser import split_frontmatter
 
 try:
     from validators.graph_validator import GraphValidator
@@ -309,14 +311,7 @@ class OnDemandValidator:
     def _extract_frontmatter(self, content: str) -> Optional[Dict[str, Any]]:
         """Extract YAML frontmatter from markdown content."""
         try:
-            import yaml
-            
-            if content.startswith('---\n'):
-                end_marker = content.find('\n---\n', 4)
-                if end_marker != -1:
-                    frontmatter_yaml = content[4:end_marker]
-                    return yaml.safe_load(frontmatter_yaml)
-            return None
+            return split_frontmatter(content).parse()
         except Exception as e:
             self.logger.warning(f"Could not parse frontmatter: {e}")
             return None